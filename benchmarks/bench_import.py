@@ -0,0 +1,30 @@
+import sys
+import subprocess
+
+IMPORTTARGET = 0.05
+"""Seconds import qchem may Take (Interpreter Startup not Included)"""
+
+HEAVYMODULES = ("pandas", "matplotlib", "multiprocessing", "sqlite3")
+"""Modules import qchem must not Load, Symbols that need them Load them on first Access"""
+
+MEASURE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import qchem\n"
+    "print(time.perf_counter() - start)\n"
+    f"print(','.join(module for module in {HEAVYMODULES!r} if module in sys.modules))\n"
+)
+
+
+def measureImport() -> tuple[float, str]:
+    """Imports qchem in a Fresh Interpreter, giving the Seconds it Took and the Heavy Modules it Loaded"""
+    output = subprocess.run([sys.executable, "-c", MEASURE], capture_output=True, text=True, check=True).stdout
+    seconds, loaded = output.split("\n")[:2]
+    return float(seconds), loaded
+
+
+def testImportTime(benchmark):
+    """Import the Package in a Fresh Interpreter"""
+    seconds, loaded = benchmark.pedantic(measureImport, rounds=5)
+    assert loaded == ""
+    assert seconds < IMPORTTARGET
@@ -0,0 +1,50 @@
+import pytest
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.InputSweep import InputSweep
+from benchmarks.generators import CAFFEINE_XYZ, replicateMolecule
+
+
+@pytest.mark.parametrize("copies", [1, 32])
+def testRenderInputFile(benchmark, tmp_path, copies):
+    """Render an Input File with the Molecule Pasted in"""
+    # Only the Body of the Replicated XYZ File is Pasted, Bonds of the Copies aren't needed
+    with open(replicateMolecule(Molecule("Caffeine", CAFFEINE_XYZ), copies, str(tmp_path)), "r") as file:
+        xyz = "".join(file.readlines()[2:])
+
+    inputFile = benchmark(
+        OrcaInputFile,
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation="OPT FREQ",
+        basis="DEF2-SVP",
+        functional="B3LYP",
+        cores=8,
+        xyz=xyz,
+    )
+    assert "%pal nprocs 8 end" in inputFile.inputFileContents
+
+
+def testRenderTemplateFile(benchmark, tmp_path):
+    """Render an Input File from a Template File, Compiled once and Reused while the File is Unchanged"""
+    template = tmp_path / "template.inp"
+    template.write_text("!&{calculation} &{basis} &{functional}\n%pal nprocs &{cores} end\n*xyzfile 0 1 &{xyzfile}\n")
+
+    inputFile = benchmark(
+        OrcaInputFile,
+        str(template),
+        calculation="FREQ",
+        basis="DEF2-SVP",
+        functional="B3LYP",
+        cores=4,
+        xyzfile=CAFFEINE_XYZ,
+    )
+    assert CAFFEINE_XYZ in inputFile.inputFileContents
+
+
+def testSweepInputs(benchmark, tmp_path):
+    """Create and Write the Inputs of a Sweep of 16 Molecules over 2 Calculations, Basis Sets and Functionals"""
+    sweep = InputSweep([CAFFEINE_XYZ] * 16, ["OPT", "FREQ"], ["DEF2-SVP", "DEF2-TZVP"], ["B3LYP", "PBE"], cores=4)
+
+    paths = benchmark(sweep.saveInputs, str(tmp_path))
+    assert len(paths) == len(sweep.createInputs()) == 128
@@ -0,0 +1,45 @@
+import random
+import pytest
+from qchem.XYZFile import XYZFile
+from qchem.Molecule import Molecule
+from benchmarks.generators import CAFFEINE_XYZ, replicateMolecule
+
+
+@pytest.fixture(scope="module")
+def caffeine() -> Molecule:
+    return Molecule("Caffeine", CAFFEINE_XYZ)
+
+
+@pytest.mark.parametrize("copies", [1, 8, 32])
+def testLoadXYZFile(benchmark, tmp_path, caffeine, copies):
+    """Load and Sort the Atoms of a XYZ File"""
+    path = replicateMolecule(caffeine, copies, str(tmp_path))
+    xyzFile = benchmark(XYZFile, path)
+    assert len(xyzFile.atomPositions) == caffeine.atomCount * copies
+
+
+@pytest.mark.parametrize("copies", [1, 2, 4])
+def testCreateMolecule(benchmark, tmp_path, caffeine, copies):
+    """Construct a Molecule, which Finds its Bonds and Rotatable Bonds"""
+    path = replicateMolecule(caffeine, copies, str(tmp_path))
+    molecule = benchmark.pedantic(Molecule, ("Caffeine", path), rounds=3)
+    assert molecule.atomCount == caffeine.atomCount * copies
+
+
+def testGetConformers(benchmark, caffeine):
+    """Rotate a Bond of the Molecule in 12 Steps"""
+    bonds = caffeine.bonds
+    atomIndex1 = next(i for i, rotatable in enumerate(bonds["Rotatable"]) if any(rotatable))
+    atomIndex2 = bonds["Bonds"][atomIndex1][bonds["Rotatable"][atomIndex1].index(True)]
+
+    conformers = benchmark(caffeine.getConformers, atomIndex1, atomIndex2, 12)
+    assert len(conformers) == 12
+
+
+@pytest.mark.parametrize("copies", [1, 4])
+def testCreateZMatrixFile(benchmark, tmp_path, caffeine, copies):
+    """Convert a Molecule to a Z Matrix"""
+    molecule = Molecule("Caffeine", replicateMolecule(caffeine, copies, str(tmp_path)))
+    random.seed(0)
+    zMatrix = benchmark(molecule.createZMatrixFile)
+    assert len(zMatrix) == molecule.atomCount + 2
@@ -0,0 +1,27 @@
+import os
+import pytest
+from qchem.Parser import OrcaOutput
+from benchmarks.generators import OUTPUT_FILES, concatenateOutput
+
+
+@pytest.mark.parametrize("outputFilePath", OUTPUT_FILES, ids=os.path.basename)
+def testParseOutput(benchmark, outputFilePath):
+    """Parse each Test Output"""
+    output = benchmark(OrcaOutput, outputFilePath)
+    assert output.energy is not None
+
+
+@pytest.mark.parametrize("copies", [4, 16])
+@pytest.mark.parametrize("outputFilePath", OUTPUT_FILES, ids=os.path.basename)
+def testParseConcatenatedOutput(benchmark, tmp_path, outputFilePath, copies):
+    """Parse Outputs many Times the Size of the Test Outputs"""
+    path = concatenateOutput(outputFilePath, copies, str(tmp_path))
+    output = benchmark(OrcaOutput, path)
+    assert output.energy is not None
+
+
+def testGetTables(benchmark):
+    """Flatten a Parsed Optimization into the Export Tables"""
+    output = OrcaOutput([path for path in OUTPUT_FILES if "opt" in path][0])
+    tables = benchmark(output.getTables)
+    assert "summary" in tables
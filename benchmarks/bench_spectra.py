@@ -0,0 +1,29 @@
+import os
+import pytest
+import pandas as pd
+from qchem.Parser import OrcaOutput
+from qchem.Pipelines.Spectra import Spectra
+from benchmarks.generators import OUTPUT_FILES_DIR
+
+
+@pytest.fixture(scope="module")
+def sticks() -> pd.DataFrame:
+    IRFrequencies = OrcaOutput(os.path.join(OUTPUT_FILES_DIR, "aspirin_ftir.out")).getIRFrequencies()
+    return pd.DataFrame(
+        {"Wavenumber": IRFrequencies["frequency"].values, "IRIntensity": IRFrequencies["IRIntensity"].values}
+    )
+
+
+@pytest.mark.parametrize("conformers", [1, 50])
+def testBroadenSpectra(benchmark, sticks, conformers):
+    """Broaden the Sticks of an Ensemble of Conformers onto the Wavenumber Grid"""
+    ensemble = pd.concat([sticks] * conformers, ignore_index=True)
+    broadened = benchmark(Spectra.broadenSpectra, ensemble)
+    assert len(broadened) > 0
+
+
+def testPlotSpectra(benchmark, tmp_path, sticks):
+    """Broaden, Plot and Save a Spectrum"""
+    plotName = str(tmp_path / "Spectra")
+    benchmark(Spectra.plotSpectra, sticks, plotName, showPlot=False)
+    assert os.path.exists(f"{plotName}.png")
@@ -0,0 +1,14 @@
+import os
+import matplotlib
+
+# Plots are Rendered without a Window
+matplotlib.use("Agg")
+
+BASELINES_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+"""Folder the Benchmark Results are Saved to and Compared against"""
+
+
+def pytest_configure(config):
+    # Keep Saved Runs next to the Benchmarks unless another Storage is Given
+    if getattr(config.option, "benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINES_DIR}"
@@ -0,0 +1,63 @@
+import os
+import numpy as np
+from qchem.Molecule import Molecule
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+OUTPUT_FILES_DIR = os.path.join(TEST_FILES_DIR, "output_files")
+CAFFEINE_XYZ = os.path.join(TEST_FILES_DIR, "caffeine.xyz")
+
+OUTPUT_FILES = sorted(
+    os.path.join(OUTPUT_FILES_DIR, file) for file in os.listdir(OUTPUT_FILES_DIR) if file.endswith(".out")
+)
+"""Every Orca Output of the Test Files"""
+
+
+def replicateMolecule(molecule: Molecule, copies: int, directory: str, spacing: float = 15) -> str:
+    """Writes a XYZ File of Copies of a Molecule laid out on a Line, far enough apart not to Bond to each other
+
+    ## Parameters : \n
+        molecule : Molecule - The Molecule to Replicate \n
+        copies : int - Number of Copies \n
+        directory : str - Folder the XYZ File is Written to \n
+        spacing : float - Distance between the Copies in Angstroms
+
+    ## Returns : \n
+        str - Path to the XYZ File
+    """
+    positions = molecule.XYZCoordinates[["X", "Y", "Z"]].values.astype(float)
+    lines = [f"{molecule.atomCount * copies}", f"{molecule.name} x{copies}"]
+
+    for copy in range(copies):
+        shifted = positions + np.array([spacing * copy, 0, 0])
+        lines += [
+            f"{atom} {x:.6f} {y:.6f} {z:.6f}"
+            for atom, (x, y, z) in zip(molecule.XYZCoordinates["Atom"], shifted)
+        ]
+
+    path = os.path.join(directory, f"{molecule.name}_x{copies}.xyz")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+    return path
+
+
+def concatenateOutput(outputFilePath: str, copies: int, directory: str) -> str:
+    """Writes an Output File made of Copies of an Orca Output one after the other, like a Long Multi Step Job
+
+    ## Parameters : \n
+        outputFilePath : str - The Output to Replicate \n
+        copies : int - Number of Copies \n
+        directory : str - Folder the Output is Written to
+
+    ## Returns : \n
+        str - Path to the Concatenated Output
+    """
+    with open(outputFilePath, "r") as file:
+        contents = file.read()
+
+    name = os.path.splitext(os.path.basename(outputFilePath))[0]
+    path = os.path.join(directory, f"{name}_x{copies}.out")
+    with open(path, "w") as file:
+        file.write(contents * copies)
+
+    return path
@@ -0,0 +1,755 @@
+import os
+import sys
+import csv
+import json
+import math
+import argparse
+import contextlib
+from typing import Callable, Iterator
+
+# Only the Standard Library is Imported here, each Command Imports what it needs so the CLI Starts fast
+
+OUTPUTEXTENSIONS = (".out", ".out.gz", ".out.zst")
+"""Extensions of the Orca Output Files found in a Folder (Plain or Compressed)"""
+
+STREAMFORMATS = ("jsonl", "csv")
+"""Formats Records are Streamed to Standard Output in"""
+
+
+def main(argv: list[str] = None) -> int:
+    """Entry Point of the qchem Command. Records are Streamed to Standard Output one per Line as soon as they are Ready, Logs and Errors go to Standard Error, so the Commands can be used in Pipelines and Job Scripts
+
+    ## Parameters : \n
+        argv : list[str] - Arguments of the Command (None = The Arguments of the Process)
+
+    ## Returns : \n
+        int - Exit Status (0 = Success, 1 = Some Items Failed, 2 = Invalid Arguments)
+    """
+    parser = createParser()
+    args = parser.parse_args(argv)
+
+    try:
+        return args.function(args)
+    except BrokenPipeError:
+        # The Reader Closed the Pipe early (Ex. | head), Python would Fail again Flushing at Exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except (ValueError, OSError, ImportError) as error:
+        print(f"qchem {args.command}: error: {error}", file=sys.stderr)
+        return 2
+
+
+def createParser() -> argparse.ArgumentParser:
+    """Creates the Parser of the qchem Command and its Sub Commands
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        argparse.ArgumentParser - The Parser
+    """
+    parser = argparse.ArgumentParser(prog="qchem", description="Batch Orca Calculations, Output Parsing, Spectra Rendering and Cache Management")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    parse = commands.add_parser("parse", help="Parse Orca Output Files in Parallel", description="Parses every Orca Output File (.out, .out.gz, .out.zst) of the Paths. Streams a Summary Record per Output, or Exports every Table to a Dataset and Streams the Path of each Output")
+    parse.add_argument("paths", nargs="+", help="Output Files or Folders to Search (Ex. OrcaCache/)")
+    parse.add_argument("--workers", type=positiveInt, default=1, help="Number of Processes Parsing at the same Time (Default 1)")
+    parse.add_argument("--format", choices=(*STREAMFORMATS, "parquet", "hdf5"), default="jsonl", help="jsonl / csv Stream the Summaries, parquet / hdf5 Export every Table to --output (Default jsonl)")
+    parse.add_argument("--output", help="Folder of the Parquet Dataset or Path of the HDF5 File")
+    parse.add_argument("--batch-size", type=positiveInt, default=256, help="Number of Outputs Written to the Dataset at once (Default 256)")
+    parse.add_argument("--replace", action="store_true", help="Replace the Tables of an Existing Dataset instead of Appending")
+    parse.set_defaults(function=parseCommand)
+
+    run = commands.add_parser("run", help="Run a Calculation on each Molecule", description="Fills the Template for each XYZ File and each Combination of the Calculations, Basis Sets and Functionals (&{xyz} = Coordinates, &{xyzfile} = Path) and Runs the Calculations in a ClusterCalculation. Streams a Record per Calculation as soon as it Completes, Logs go to Standard Error")
+    run.add_argument("molecules", nargs="+", help="XYZ Files of the Molecules")
+    run.add_argument("--template", required=True, help="Name of an OrcaInputTemplate (Ex. BASICXYZPARALLEL), Path to a .inp Template File or the Template itself")
+    run.add_argument("--calculation", action="append", help="Calculation Keyword (Ex. OPT, FREQ), Repeat to Sweep several")
+    run.add_argument("--basis", action="append", help="Basis Set (Ex. DEF2-SVP), Repeat to Sweep several")
+    run.add_argument("--functional", action="append", help="Density Functional (Ex. B3LYP), Repeat to Sweep several")
+    run.add_argument("--var", dest="variables", action="append", default=[], metavar="KEY=VALUE", help="Value of another Template Placeholder (Repeatable)")
+    run.add_argument("--cores", type=positiveInt, default=1, help="Total Cores the Calculations Share (Default 1)")
+    run.add_argument("--cores-per-calculation", type=positiveInt, default=1, help="Cores of each Calculation (Default 1)")
+    run.add_argument("--allocate", action="store_true", help="Choose the Cores of each Calculation from the Predicted Speedup of its Molecule")
+    run.add_argument("--name", default="qchem", help="Name of the Cluster, Folder in OrcaCache the Calculations are Saved to (Default qchem)")
+    run.add_argument("--local", action="store_true", help="Run a Local Orca Installation instead of Docker")
+    run.add_argument("--host", dest="hosts", action="append", default=[], metavar="HOST[:CORES]", help="Spread the Calculations over Workers Reached with SSH, at most CORES at a time on each (Repeatable)")
+    run.add_argument("--transfer", action="store_true", help="Copy each Work Folder to its Worker and back instead of Sharing the File System")
+    run.add_argument("--database", help="Results Database to Record to (Default OrcaCache/Results.db)")
+    run.add_argument("--no-record", action="store_true", help="Don't Record the Calculations to the Results Database")
+    run.add_argument("--format", choices=STREAMFORMATS, default="jsonl", help="Format of the Streamed Records (Default jsonl)")
+    run.add_argument("--verbose", action="store_true", help="Log the Progress of each Calculation to Standard Error")
+    run.add_argument("--scheduler", action="store_true", help="Lease the Cores of each Calculation from the Scheduler, Sharing the Machine with every other Client (--cores still Limits this Run)")
+    run.add_argument("--priority", type=int, default=0, help="Priority of the Calculations at the Scheduler, Higher Start first (Default 0)")
+    run.add_argument("--timeout", type=float, metavar="SECONDS", help="Kill a Calculation that Runs longer than this, it Fails with a Timeout (Default No Limit)")
+    run.add_argument("--reuse", action="store_true", help="Reuse the Result of Calculations whose Input (and the XYZ File it Reads) already Completed and was Recorded to the Results Database, instead of Running them again")
+    run.add_argument("--retry", action="store_true", help="Retry Failed Calculations with an Input Changed for why they Failed (Slower SCF, more Cycles or Memory)")
+    run.set_defaults(function=runCommand)
+
+    spectra = commands.add_parser("spectra", help="Render IR Spectra to Images", description="Renders each Stick Spectrum (CSV of Wavenumber, IRIntensity or an Orca Frequency Output) to an Image and Streams the Path of each Image")
+    spectra.add_argument("spectra", nargs="+", help="CSV Files or Orca Output Files")
+    spectra.add_argument("--output", default=".", help="Folder to Save the Images to (Default .)")
+    spectra.add_argument("--format", choices=("png", "svg"), default="png", help="Image Format (Default png)")
+    spectra.add_argument("--sigma", type=float, default=10, help="Standard Deviation of each Line in Wavenumbers (Default 10)")
+    spectra.add_argument("--max-wavenumber", type=float, default=4000, help="Upper bound Wavenumber (Default 4000)")
+    spectra.add_argument("--spacing", type=float, default=1, help="Spacing in Wavenumbers between Points (Default 1)")
+    spectra.add_argument("--line-shape", type=str.capitalize, choices=("Gaussian", "Lorentzian", "Voigt"), default="Gaussian", help="Line Shape of each Line (Default Gaussian)")
+    spectra.add_argument("--workers", type=positiveInt, default=1, help="Number of Processes Rendering at the same Time (Default 1)")
+    spectra.set_defaults(function=spectraCommand)
+
+    cache = commands.add_parser("cache", help="Inspect and Clean the OrcaCache", description="Lists Recorded Calculations, Measures the Cache and Removes the Folders of Failed or old Calculations")
+    cacheCommands = cache.add_subparsers(dest="action", required=True, metavar="action")
+
+    cacheList = cacheCommands.add_parser("list", help="Stream the Recorded Calculations, Newest first")
+    cacheList.add_argument("--formula", help="Molecular Formula in Hill Order (Ex. C2H6)")
+    cacheList.add_argument("--calculation", help="Calculation Keyword")
+    cacheList.add_argument("--basis", help="Basis Set")
+    cacheList.add_argument("--functional", help="Density Functional")
+    cacheList.add_argument("--status", help="Only Calculations that Ended with this Status (Ex. Completed, Failed)")
+    cacheList.add_argument("--format", choices=STREAMFORMATS, default="jsonl", help="Format of the Streamed Records (Default jsonl)")
+    cacheList.set_defaults(function=cacheListCommand)
+
+    cacheSize = cacheCommands.add_parser("size", help="Stream the Disk Usage of each Folder in the Cache, Largest first")
+    cacheSize.add_argument("--format", choices=STREAMFORMATS, default="jsonl", help="Format of the Streamed Records (Default jsonl)")
+    cacheSize.set_defaults(function=cacheSizeCommand)
+
+    cacheClean = cacheCommands.add_parser("clean", help="Remove the Folders of Failed or old Calculations", description="Removes the Cache Folder of every Recorded Calculation that matches, and Streams what was Removed. Records are kept, they still Train the Runtime Estimates")
+    cacheClean.add_argument("--status", default="Failed", help='Status of the Calculations to Remove, "any" for every Status (Default Failed)')
+    cacheClean.add_argument("--older-than", type=float, metavar="DAYS", help="Only Calculations that Finished more than this many Days ago")
+    cacheClean.add_argument("--dry-run", action="store_true", help="Stream what would be Removed without Removing it")
+    cacheClean.add_argument("--format", choices=STREAMFORMATS, default="jsonl", help="Format of the Streamed Records (Default jsonl)")
+    cacheClean.set_defaults(function=cacheCleanCommand)
+
+    for command in (cacheList, cacheSize, cacheClean):
+        command.add_argument("--cache", default="OrcaCache", help="Cache Folder (Default OrcaCache)")
+        command.add_argument("--database", help="Results Database (Default Results.db in the Cache Folder)")
+
+    scheduler = commands.add_parser("scheduler", help="Share the Cores of the Machine between Runs", description="Runs or Queries the Local Scheduler that Owns the Core Budget of the Machine. Runs with --scheduler Lease the Cores of each Calculation from it, by Priority and then Fair Share between Users")
+    schedulerCommands = scheduler.add_subparsers(dest="action", required=True, metavar="action")
+
+    schedulerStart = schedulerCommands.add_parser("start", help="Run the Scheduler in the Foreground until Interrupted")
+    schedulerStart.add_argument("--cores", type=positiveInt, required=True, help="Total Cores Shared by every Client")
+    schedulerStart.add_argument("--share", dest="shares", action="append", default=[], metavar="USER=WEIGHT", help="Weight of a Users Share of the Machine, Users not Listed have a Weight of 1 (Repeatable)")
+    schedulerStart.add_argument("--half-life", type=float, default=1, metavar="HOURS", help="Hours after which Half of a Users Past Usage is Forgotten (Default 1)")
+    schedulerStart.add_argument("--max-priority", dest="maxPriorities", action="append", default=[], metavar="USER=PRIORITY", help="Highest Priority a User may Request, Users not Listed are Limited to 0 (Repeatable)")
+    schedulerStart.add_argument("--shared", action="store_true", help="Let every User of the Machine Submit to the Scheduler (Default Only the User running it)")
+    schedulerStart.set_defaults(function=schedulerStartCommand)
+
+    schedulerStatus = schedulerCommands.add_parser("status", help="Stream the Running and Waiting Jobs, Free Cores go to Standard Error")
+    schedulerStatus.add_argument("--format", choices=STREAMFORMATS, default="jsonl", help="Format of the Streamed Records (Default jsonl)")
+    schedulerStatus.set_defaults(function=schedulerStatusCommand)
+
+    for command in (run, schedulerStart, schedulerStatus):
+        command.add_argument("--socket", help="Socket of the Scheduler (Default $QCHEM_SCHEDULER_SOCKET or qchem-scheduler.sock in the Temporary Folder)")
+
+    return parser
+
+
+def positiveInt(value: str) -> int:
+    """Converts an Argument to a Positive Integer
+
+    ## Parameters : \n
+        value : str - The Argument
+
+    ## Returns : \n
+        int - The Integer
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value}")
+
+    return number
+
+
+def createWriter(format: str, stream=None) -> Callable[[dict], None]:
+    """Creates a Function Writing Records to a Stream one Line at a Time, Flushed so Pipelines see each Record as soon as it is Ready
+
+    ## Parameters : \n
+        format : str - "jsonl" (One JSON Object per Line) or "csv" (Header from the First Record) \n
+        stream : IO - Stream to Write to (None = Standard Output)
+
+    ## Returns : \n
+        Callable[[dict], None] - Function Writing a Record
+    """
+    stream = stream if stream is not None else sys.stdout
+    writers = []
+
+    def write(record: dict):
+        record = {key: toPlainValue(value) for key, value in record.items()}
+
+        if format == "jsonl":
+            stream.write(json.dumps(record, default=str) + "\n")
+        else:
+            if len(writers) == 0:
+                writers.append(csv.DictWriter(stream, fieldnames=list(record), extrasaction="ignore"))
+                writers[0].writeheader()
+            writers[0].writerow(record)
+
+        stream.flush()
+
+    return write
+
+
+def toPlainValue(value):
+    """Converts a Value to one JSON and CSV can Write (numpy Scalars to Python, NaN to None)
+
+    ## Parameters : \n
+        value - The Value
+
+    ## Returns : \n
+        The Plain Value
+    """
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        value = value.item()
+
+    if isinstance(value, float) and math.isnan(value):
+        return None
+
+    return value
+
+
+def findOutputFiles(paths: list[str]) -> list[str]:
+    """Finds the Orca Output Files of Files and Folders (Searched Recursively, in Name Order)
+
+    ## Parameters : \n
+        paths : list[str] - Output Files or Folders
+
+    ## Returns : \n
+        list[str] - Path of every Output File
+    """
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, folders, names in os.walk(path):
+                folders.sort()
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(OUTPUTEXTENSIONS))
+        elif os.path.exists(path):
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"No such File or Folder: {path}")
+
+    return files
+
+
+def mapItems(function: Callable, items: list, workers: int, *args) -> Iterator:
+    """Calls a Function on each Item in a Pool of Processes, Yielding the Results in Item Order as they Arrive
+
+    ## Parameters : \n
+        function : Callable - Function Called with each Item and the Additional Arguments (Must be Importable by the Workers) \n
+        items : list - The Items \n
+        workers : int - Number of Processes (1 = Call in this Process) \n
+        *args - Additional Arguments of every Call
+
+    ## Returns : \n
+        Iterator - The Result of each Item
+    """
+    if workers == 1 or len(items) <= 1:
+        for item in items:
+            yield function(item, *args)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Small Chunks keep the Stream flowing, Large enough to not pay a Round Trip per Item
+    chunkSize = max(1, min(16, len(items) // (workers * 4)))
+    with ProcessPoolExecutor(workers) as executor:
+        yield from executor.map(function, items, *[[arg] * len(items) for arg in args], chunksize=chunkSize)
+
+
+def parseOutputFile(filePath: str, keepTables: bool) -> tuple[str, dict, dict, str]:
+    """Parses an Output File in a Worker Process, Failures are Returned rather than Raised so one Output doesn't stop the Batch
+
+    ## Parameters : \n
+        filePath : str - Path to the Output File \n
+        keepTables : bool - Return every Table of the Output, not only the Summary
+
+    ## Returns : \n
+        tuple[str, dict, dict, str] - Path, Summary Record, Tables (None unless Kept) and Error (None if Parsed)
+    """
+    from qchem.Parser import OrcaOutput
+
+    try:
+        tables = OrcaOutput(filePath).getTables()
+    except Exception as error:
+        return filePath, None, None, f"{type(error).__name__}: {error}"
+
+    summary = tables["summary"].iloc[0].to_dict()
+    return filePath, summary, tables if keepTables else None, None
+
+
+def parseCommand(args: argparse.Namespace) -> int:
+    """Parses Orca Output Files, Streaming their Summaries or Exporting their Tables in Batches
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    export = args.format not in STREAMFORMATS
+    if export and args.output is None:
+        raise ValueError(f"--output is required for the {args.format} format")
+
+    filePaths = findOutputFiles(args.paths)
+    write = createWriter(args.format) if not export else None
+
+    if export:
+        from qchem.Export import writeTables
+
+    failures = 0
+    batch: dict[str, list] = {}
+    batchCount = 0
+    append = not args.replace
+
+    for filePath, summary, tables, error in mapItems(parseOutputFile, filePaths, args.workers, export):
+        if error is not None:
+            print(f"qchem parse: {filePath}: {error}", file=sys.stderr)
+            failures += 1
+            continue
+
+        if not export:
+            write(summary)
+            continue
+
+        for key, table in tables.items():
+            batch.setdefault(key, []).append(table)
+        batchCount += 1
+
+        if batchCount >= args.batch_size:
+            writeTables(batch, args.output, args.format, append)
+            batch, batchCount, append = {}, 0, True
+
+        print(filePath, flush=True)
+
+    if export and batchCount > 0:
+        writeTables(batch, args.output, args.format, append)
+
+    return 1 if failures > 0 else 0
+
+
+def getTemplate(template: str):
+    """Finds the Template of the run Command
+
+    ## Parameters : \n
+        template : str - Name of an OrcaInputTemplate, Path to a .inp File or the Template itself
+
+    ## Returns : \n
+        str | OrcaInputTemplate - The Template
+    """
+    from qchem.Data.Enums import OrcaInputTemplate
+
+    if template.upper() in OrcaInputTemplate.__members__:
+        return OrcaInputTemplate[template.upper()]
+
+    if template.endswith(".inp") and not os.path.exists(template):
+        raise FileNotFoundError(f"No such Template File: {template}")
+
+    return template
+
+
+def runCommand(args: argparse.Namespace) -> int:
+    """Runs the Template on each Molecule in a ClusterCalculation, Streaming a Record per Calculation as it Completes
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    from qchem.Calculation.InputSweep import InputSweep
+    from qchem.Calculation.ClusterCalculation import ClusterCalculation
+    from qchem.Calculation.ResultsDatabase import ResultsDatabase, getOutputValues
+    from qchem.Calculation.Scheduler import SchedulerClient
+    from qchem.Calculation.Executors import RemoteExecutor
+    from qchem.Calculation.Failures import RetryPolicy
+    from qchem.Data.Enums import CalculationStatus
+
+    if args.cores_per_calculation > args.cores:
+        raise ValueError("--cores-per-calculation can't be more than --cores")
+
+    if args.timeout is not None and args.timeout <= 0:
+        raise ValueError("--timeout must be a positive number of seconds")
+
+    variables = {}
+    for variable in args.variables:
+        key, separator, value = variable.partition("=")
+        if not separator or not key:
+            raise ValueError(f"--var must be KEY=VALUE, not {variable}")
+        variables[key] = value
+
+    sweep = InputSweep(
+        args.molecules,
+        args.calculation,
+        args.basis,
+        args.functional,
+        getTemplate(args.template),
+        args.cores_per_calculation,
+        **variables,
+    )
+
+    missing = sweep.getMissingVariables()
+    if missing:
+        raise ValueError(f"No Value for the Template Placeholders {', '.join(missing)} (Use --var KEY=VALUE)")
+
+    executors = []
+    for host in args.hosts:
+        name, separator, cores = host.rpartition(":")
+        if separator and cores.isdigit():
+            executors.append(RemoteExecutor(name, int(cores), sharedFileSystem=not args.transfer))
+        else:
+            executors.append(RemoteExecutor(host, sharedFileSystem=not args.transfer))
+
+    scheduler = None
+    if args.scheduler:
+        scheduler = SchedulerClient(args.socket)
+        if not scheduler.isRunning():
+            raise ConnectionError(f"No Scheduler is Running on {scheduler.socketPath} (Start one with qchem scheduler start)")
+
+    combinations = sweep.getCombinations()
+    calculations = sweep.createInputs()
+
+    stdout = sys.stdout
+    write = createWriter(args.format, stdout)
+    statuses = []
+
+    def writeResult(result):
+        values = getOutputValues(result)
+        statuses.append(values["status"])
+        write(
+            {
+                "index": result.index,
+                "molecule": combinations[result.index]["molecule"],
+                "calculation": combinations[result.index]["calculation"],
+                "basis": combinations[result.index]["basis"],
+                "functional": combinations[result.index]["functional"],
+                "name": result.name,
+                "status": values["status"],
+                "returnCode": result.returnCode,
+                "failure": result.failure.value if result.failure is not None else None,
+                "wallTime": result.calculationTime,
+                "energy": values["energy"],
+                "outputFilePath": result.outputFilePath,
+                "deduplicated": result.deduplicated,
+            }
+        )
+
+    cluster = ClusterCalculation(
+        calculations,
+        maxCores=args.cores,
+        name=args.name,
+        isLocal=args.local,
+        STDOut=args.verbose,
+        recordResults=not args.no_record,
+        database=ResultsDatabase(args.database) if args.database and not args.no_record else None,
+        allocateCores=args.allocate,
+        onComplete=writeResult,
+        scheduler=scheduler,
+        priority=args.priority,
+        executors=executors or None,
+        timeout=args.timeout,
+        retryPolicy=RetryPolicy() if args.retry else None,
+        reuseResults=args.reuse,
+    )
+
+    # Anything the Calculations Print is a Log, Standard Output only Carries the Records
+    with contextlib.redirect_stdout(sys.stderr):
+        cluster.runCalculations()
+
+    # The Cluster Empties the List of Calculations as it Starts them
+    completed = statuses.count(CalculationStatus.COMPLETED.value)
+    return 0 if completed == len(combinations) else 1
+
+
+def loadSpectrum(filePath: str):
+    """Loads a Stick Spectrum from a CSV File or the IR Spectrum of an Orca Frequency Output
+
+    ## Parameters : \n
+        filePath : str - Path to the CSV or Output File
+
+    ## Returns : \n
+        str | pd.DataFrame - The CSV Path or the Spectrum with Wavenumber and IRIntensity
+    """
+    if not filePath.endswith(OUTPUTEXTENSIONS):
+        return filePath
+
+    from qchem.Parser import OrcaOutput
+
+    IRFrequencies = OrcaOutput(filePath).IRFrequencies
+    if IRFrequencies is None or IRFrequencies.empty:
+        raise ValueError("The Output has no IR Spectrum")
+
+    return IRFrequencies.rename(columns={"frequency": "Wavenumber"})[["Wavenumber", "IRIntensity"]]
+
+
+def getSpectrumName(filePath: str) -> str:
+    """Gives the Name of a Spectrum from its File, without the Folder and Extensions
+
+    ## Parameters : \n
+        filePath : str - Path to the CSV or Output File
+
+    ## Returns : \n
+        str - The Name
+    """
+    name = os.path.basename(filePath)
+    for extension in (*OUTPUTEXTENSIONS, ".csv"):
+        if name.endswith(extension):
+            return name[: -len(extension)]
+
+    return os.path.splitext(name)[0]
+
+
+def renderSpectrumFile(renderer, filePath: str, imagePath: str) -> tuple[str, str, str]:
+    """Renders a Spectrum File, Failures are Returned rather than Raised so one File doesn't stop the Batch
+
+    ## Parameters : \n
+        renderer : SpectrumRenderer - The Renderer \n
+        filePath : str - Path to the CSV or Output File \n
+        imagePath : str - Path of the Image to Save
+
+    ## Returns : \n
+        tuple[str, str, str] - Spectrum File, Image Path (None if it Failed) and Error (None if Rendered)
+    """
+    try:
+        renderer.render(loadSpectrum(filePath), imagePath, getSpectrumName(filePath))
+    except Exception as error:
+        return filePath, None, f"{type(error).__name__}: {error}"
+
+    return filePath, imagePath, None
+
+
+def renderSpectrumFiles(jobs: list[tuple[str, str]], settings: dict) -> list[tuple[str, str, str]]:
+    """Renders a Chunk of Spectrum Files in a Worker Process with its own Renderer
+
+    ## Parameters : \n
+        jobs : list[tuple[str, str]] - Spectrum File and Image Path of each Spectrum \n
+        settings : dict - The Renderers Constructor Arguments
+
+    ## Returns : \n
+        list[tuple[str, str, str]] - Result of each Spectrum (See renderSpectrumFile)
+    """
+    from qchem.Spectroscopy.SpectrumRenderer import SpectrumRenderer
+
+    with SpectrumRenderer(**settings) as renderer:
+        return [renderSpectrumFile(renderer, filePath, imagePath) for filePath, imagePath in jobs]
+
+
+def renderSpectraInProcess(jobs: list[tuple[str, str]], settings: dict) -> Iterator:
+    """Renders the Spectrum Files in this Process with a single Renderer, Yielding each Result once Rendered
+
+    ## Parameters : \n
+        jobs : list[tuple[str, str]] - Spectrum File and Image Path of each Spectrum \n
+        settings : dict - The Renderers Constructor Arguments
+
+    ## Returns : \n
+        Iterator - Result of each Spectrum, in a Chunk of its own (See renderSpectrumFile)
+    """
+    from qchem.Spectroscopy.SpectrumRenderer import SpectrumRenderer
+
+    with SpectrumRenderer(**settings) as renderer:
+        for filePath, imagePath in jobs:
+            yield [renderSpectrumFile(renderer, filePath, imagePath)]
+
+
+def spectraCommand(args: argparse.Namespace) -> int:
+    """Renders each Spectrum to an Image, Streaming the Path of each Image
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    settings = {
+        "sigma": args.sigma,
+        "maxWaveNum": args.max_wavenumber,
+        "spacing": args.spacing,
+        "lineShape": args.line_shape,
+        "format": args.format,
+    }
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs = [(filePath, os.path.join(args.output, f"{getSpectrumName(filePath)}.{args.format}")) for filePath in args.spectra]
+
+    if args.workers == 1:
+        results = renderSpectraInProcess(jobs, settings)
+    else:
+        # Chunks Share a Renderer, several per Worker so Images Stream in while the Rest Render
+        chunkSize = max(1, min(16, len(jobs) // (args.workers * 4)))
+        chunks = [jobs[i : i + chunkSize] for i in range(0, len(jobs), chunkSize)]
+        results = mapItems(renderSpectrumFiles, chunks, args.workers, settings)
+
+    failures = 0
+    for chunk in results:
+        for filePath, imagePath, error in chunk:
+            if error is not None:
+                print(f"qchem spectra: {filePath}: {error}", file=sys.stderr)
+                failures += 1
+            else:
+                print(imagePath, flush=True)
+
+    return 1 if failures > 0 else 0
+
+
+def openDatabase(args: argparse.Namespace):
+    """Opens the Results Database of a Cache Command
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        ResultsDatabase - The Database
+    """
+    from qchem.Calculation.ResultsDatabase import ResultsDatabase
+
+    path = args.database if args.database is not None else os.path.join(args.cache, "Results.db")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No Results Database at {path}")
+
+    return ResultsDatabase(path)
+
+
+def cacheListCommand(args: argparse.Namespace) -> int:
+    """Streams the Recorded Calculations, Newest first
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    with openDatabase(args) as database:
+        records = database.query(args.formula, args.calculation, args.basis, args.functional, args.status)
+
+    write = createWriter(args.format)
+    for record in records.to_dict("records"):
+        write(record)
+
+    return 0
+
+
+def cacheSizeCommand(args: argparse.Namespace) -> int:
+    """Streams the Disk Usage of each Folder in the Cache, Largest first, and the Total to Standard Error
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    from qchem.Calculation.OrcaScratch import getFolderSize
+
+    if not os.path.isdir(args.cache):
+        raise FileNotFoundError(f"No Cache Folder at {args.cache}")
+
+    folders = [os.path.join(args.cache, name) for name in os.listdir(args.cache)]
+    sizes = [
+        {"name": os.path.basename(folder), "path": folder, "bytes": getFolderSize(folder)}
+        for folder in folders
+        if os.path.isdir(folder)
+    ]
+    sizes.sort(key=lambda record: record["bytes"], reverse=True)
+
+    write = createWriter(args.format)
+    for record in sizes:
+        write(record)
+
+    print(f"Total : {sum(record['bytes'] for record in sizes)} bytes", file=sys.stderr)
+    return 0
+
+
+def cacheCleanCommand(args: argparse.Namespace) -> int:
+    """Removes the Cache Folders of the Recorded Calculations with the Status (and Age), Streaming each Removed Folder
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    import time
+    import shutil
+    from qchem.Calculation.OrcaScratch import getFolderSize
+
+    with openDatabase(args) as database:
+        records = database.query(status=None if args.status.lower() == "any" else args.status)
+
+    if args.older_than is not None:
+        records = records[records["finishedAt"] < time.time() - args.older_than * 86400]
+
+    # Only Folders inside the Cache are ever Removed, whatever the Records Point to
+    cacheRoot = os.path.realpath(args.cache)
+    write = createWriter(args.format)
+
+    for record in records.drop_duplicates("orcaCachePath").to_dict("records"):
+        folder = record["orcaCachePath"]
+        if not folder or not os.path.isdir(folder):
+            continue
+
+        realFolder = os.path.realpath(folder)
+        if realFolder == cacheRoot or os.path.commonpath([cacheRoot, realFolder]) != cacheRoot:
+            continue
+
+        size = getFolderSize(folder)
+        if not args.dry_run:
+            shutil.rmtree(folder)
+
+        write({"name": record["name"], "status": record["status"], "path": folder, "bytes": size, "removed": not args.dry_run})
+
+    return 0
+
+
+def schedulerStartCommand(args: argparse.Namespace) -> int:
+    """Runs the Scheduler until it is Interrupted
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    from qchem.Calculation.Scheduler import SchedulerDaemon
+
+    shares = {}
+    for share in args.shares:
+        user, separator, weight = share.partition("=")
+        if not separator or not user:
+            raise ValueError(f"--share must be USER=WEIGHT, not {share}")
+        shares[user] = float(weight)
+
+    maxPriorities = {}
+    for maxPriority in args.maxPriorities:
+        user, separator, priority = maxPriority.partition("=")
+        if not separator or not user:
+            raise ValueError(f"--max-priority must be USER=PRIORITY, not {maxPriority}")
+        maxPriorities[user] = int(priority)
+
+    daemon = SchedulerDaemon(args.cores, args.socket, shares, args.half_life * 3600, maxPriorities, args.shared)
+    print(f"Scheduling {args.cores} Cores on {daemon.socketPath}", file=sys.stderr, flush=True)
+    daemon.run()
+
+    return 0
+
+
+def schedulerStatusCommand(args: argparse.Namespace) -> int:
+    """Streams the Running Jobs and then the Waiting Jobs in Dispatch Order
+
+    ## Parameters : \n
+        args : argparse.Namespace - Arguments of the Command
+
+    ## Returns : \n
+        int - Exit Status
+    """
+    from qchem.Calculation.Scheduler import SchedulerClient
+
+    status = SchedulerClient(args.socket).getStatus()
+
+    write = createWriter(args.format)
+    for state in ("running", "pending"):
+        for job in status[state]:
+            write({"state": state, **job})
+
+    print(f"Free Cores : {status['freeCores']} / {status['totalCores']}", file=sys.stderr)
+    return 0
@@ -1,8 +1,14 @@
 import os
-from typing import Any
-from qchem.Data.Enums import OrcaInputTemplate
+import asyncio
+from typing import Any, Callable
+from qchem.Data.Enums import OrcaInputTemplate, CalculationStatus, FailureType
+from .CoreBudget import CoreBudget
+from .OrcaScratch import OrcaScratch
+from .Executors import OrcaExecutor
+from .OrcaCalculation import OrcaCalcResult
 from .OrcaInputFile import OrcaInputFile
 from ..Molecule import Molecule
+from ..Compression import openCompressed, findCompressedFile
 from abc import ABC, abstractmethod
 
 
@@ -51,6 +57,21 @@ class BaseOrcaCalculation(ABC):
     cores: int
     """Number of CPU Cores allocated to the calculation"""
 
+    scratch: OrcaScratch = None
+    """Settings for Running the Calculation in a Scratch Folder and which Files to Keep (None = Run in the Cache Folder and Keep every File)"""
+
+    executor: OrcaExecutor = None
+    """Where Orca Runs, Locally, in Docker, on a Remote Worker or through a Batch Queue (None = Locally or in Docker depending on isLocal)"""
+
+    timeout: float = None
+    """Seconds each Orca Run of the Calculation may take before it is Killed and Fails with a Timeout (None = No Limit)"""
+
+    reuseResults: bool = False
+    """Boolean flag to indicate if an Orca Run whose Identical Input Completed before (In any Process) and was Recorded to the Results Database gives that Result instead of Running again"""
+
+    failure: FailureType = None
+    """Why the Calculation Failed, Classified from its last Orca Run (None if it Completed)"""
+
     defaultName: str = "Molecule"
     """Default Calculation Name to use if unspecified. Will check if Molecule Object already has a name first."""
 
@@ -139,6 +160,21 @@ class BaseOrcaCalculation(ABC):
         # Create the Input File
         self.createInputFile()
 
+    def inheritExecutor(self, calculation: "BaseOrcaCalculation") -> "BaseOrcaCalculation":
+        """Gives a Calculation Created by this one (Pipeline Steps) the same Executor, Timeout and Result Reuse, so the whole Pipeline Runs where and how this Calculation Runs
+
+        ## Parameters:\n
+            self - Default Parameter for the Class Instance \n
+            calculation : BaseOrcaCalculation - The Created Calculation
+
+        ## Returns: \n
+            BaseOrcaCalculation - The same Calculation
+        """
+        calculation.executor = self.executor
+        calculation.timeout = self.timeout
+        calculation.reuseResults = self.reuseResults
+        return calculation
+
     @abstractmethod
     def runCalculation(self):
         """Runs the Calculation Algorithm, is an Abstract Method/Function that needs to be overridden.
@@ -151,6 +187,37 @@ class BaseOrcaCalculation(ABC):
         """
         pass
 
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. The Default runs the Blocking Calculation in a Worker Thread while holding the Calculations Cores, Calculations override this with a native Async Implementation
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        if coreBudget is None:
+            coreBudget = CoreBudget(max(1, self.cores))
+
+        async with coreBudget.reserve(self.cores):
+            if progress is not None:
+                progress(self.name, CalculationStatus.RUNNING)
+            try:
+                await asyncio.to_thread(self.runCalculation)
+            except Exception:
+                if progress is not None:
+                    progress(self.name, CalculationStatus.FAILED)
+                raise
+
+        if progress is not None:
+            progress(self.name, CalculationStatus.COMPLETED)
+
     def isFileReference(self):
         """Checks if the Molecule is defined as a File Reference as a str or a Molecule Object
 
@@ -186,6 +253,17 @@ class BaseOrcaCalculation(ABC):
             str - Name of the file with the file extension"""
         return f"{self.name}.out"
 
+    def getCachePath(self) -> str:
+        """Gives the Folder the Calculations Orca Runs are Stored in, the Cache Folder of the Directory the Calculation was Created in
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            str - Path to the Cache Folder
+        """
+        return os.path.dirname(self.orcaCachePath)
+
     def getOutput(self) -> str:
         """Opens the Output File and returns the entire Output File as a single String
 
@@ -196,9 +274,26 @@ class BaseOrcaCalculation(ABC):
             str - The entire content of the Output File as a String
         """
         # Open the Output File and Grab the Content
-        with open(self.outputFilePath, "r") as file:
+        with openCompressed(findCompressedFile(self.outputFilePath)) as file:
             self.CalculationOutput = file.read()
 
+    def checkCalculation(self, calculation: OrcaCalcResult):
+        """Checks the Orca Run of the Calculation Terminated Normally, a Failed Run raises an Error instead of its Results being Extracted so that Workflows Mark the Step as Failed
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Finished Orca Run
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        self.failure = calculation.failure
+
+        if self.failure is not None:
+            raise RuntimeError(
+                f"{self.calculationType} on {self.name} Failed ({self.failure.value}, Return Code {calculation.returnCode})"
+            )
+
     def createDirectories(self):
         """Creates the Folder to Store Temporary and Resulting Calculation Files
 
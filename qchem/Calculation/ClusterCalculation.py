@@ -1,7 +1,19 @@
 import os
+import copy
+import contextlib
+from typing import Callable
 from qchem.Calculation.OrcaCalculation import OrcaCalcResult
 from qchem.Calculation.OrcaInputFile import OrcaInputFile
-from qchem.Calculation.OrcaCalculation import runOrcaCalculation
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, findCachedResult
+from qchem.Calculation.OrcaScratch import OrcaScratch
+from qchem.Calculation.ResultsDatabase import ResultsDatabase, getDefaultDatabase, getInputHash
+from qchem.Calculation.RuntimeEstimator import RuntimeEstimator
+from qchem.Calculation.CoreAllocator import CoreAllocator
+from qchem.Calculation.Scheduler import SchedulerClient
+from qchem.Calculation.Executors import OrcaExecutor
+from qchem.Calculation.Failures import RetryPolicy
+from qchem.Data.Enums import FailureType
+from qchem.Instrumentation import Span, span, traced, getActiveTracer, addAttributes
 import multiprocessing
 import time
 
@@ -35,6 +47,60 @@ class ClusterCalculation:
     orcaCachePath: str
     """Path to the folder that stores temporary and resulting Calculation Files"""
 
+    scratch: OrcaScratch
+    """Settings for Running the Calculations in a Scratch Folder and which Files to Keep (None = Run in the Cache Folder and Keep every File)"""
+
+    database: ResultsDatabase
+    """Database the Completed Calculations are Recorded to in Batches (None = Don't Record)"""
+
+    submittedCalculations: dict[int, OrcaInputFile]
+    """Input File of each Started Calculation by its Index, used to Record the Results"""
+
+    estimator: RuntimeEstimator
+    """Model Predicting the Runtime of each Calculation, the Longest are Started first"""
+
+    startTimes: dict[int, float]
+    """Time each Running Calculation Started by its Index"""
+
+    submitTime: float
+    """Time the Calculations were Queued, Calculations that Start later Waited in the Queue"""
+
+    allocateCores: bool
+    """Boolean Flag to Indicate if the Cores of each Calculation are Chosen from the Predicted Parallel Speedup of its Molecule (Only for Templates with a Cores Placeholder)"""
+
+    onComplete: Callable[[OrcaCalcResult], None]
+    """Function Called with the Result of each Calculation as soon as it Completes, in Completion Order (None = No Callback)"""
+
+    inFlight: dict[str, int]
+    """Index of the Running Calculation of each Input Hash, Identical Inputs Attach to it instead of Running again"""
+
+    duplicates: dict[int, list[OrcaInputFile]]
+    """Calculations waiting on the Result of an Identical Running Calculation, by the Index of the Running Calculation"""
+
+    scheduler: SchedulerClient
+    """Scheduler each Calculation Leases its Cores from before Running, so Clusters in other Processes never Oversubscribe the Machine (None = Only Limited by Max Cores)"""
+
+    priority: int
+    """Priority of the Calculations at the Scheduler, Higher Priorities Start first"""
+
+    executors: list[OrcaExecutor]
+    """Executors (Machines) the Calculations are Spread across, each Calculation Starts on the first with enough Free Cores (None = Locally or in Docker depending on isLocal)"""
+
+    executorCores: list[int]
+    """Cores in use on each Executor"""
+
+    timeout: float
+    """Seconds each Calculation may Run before it is Killed and Fails with a Timeout (None = No Limit)"""
+
+    retryPolicy: RetryPolicy
+    """Decides which Failed Calculations are Retried and with which Input, Retries go to the Front of the Queue while the other Calculations keep Running (None = Never Retry)"""
+
+    failures: dict[int, list[FailureType]]
+    """Why each Earlier Attempt of a Retried Calculation Failed, by its Index"""
+
+    reuseResults: bool
+    """Boolean Flag to Indicate if Calculations whose Input Completed before (In any Process) and was Recorded to the Database give that Result instead of Running again"""
+
     def __init__(
         self,
         calculations: list[OrcaInputFile],
@@ -42,6 +108,18 @@ class ClusterCalculation:
         name: str = "ClusterCalculation",
         isLocal: bool = False,
         STDOut: bool = True,
+        scratch: OrcaScratch = None,
+        recordResults: bool = True,
+        database: ResultsDatabase = None,
+        estimator: RuntimeEstimator = None,
+        allocateCores: bool = False,
+        onComplete: Callable[[OrcaCalcResult], None] = None,
+        scheduler: SchedulerClient = None,
+        priority: int = 0,
+        executors: list[OrcaExecutor] = None,
+        timeout: float = None,
+        retryPolicy: RetryPolicy = None,
+        reuseResults: bool = False,
     ):
         # Set the Variables
         self.name = name
@@ -53,7 +131,111 @@ class ClusterCalculation:
         self.calculations = calculations
         self.completedCalculations = []
         self.orcaCachePath = os.path.join(os.getcwd(), "OrcaCache", name)
-        
+        self.scratch = scratch
+        self.database = (database or getDefaultDatabase()) if recordResults else None
+        self.submittedCalculations = {}
+        self.estimator = estimator
+        self.startTimes = {}
+        self.submitTime = None
+        self.allocateCores = allocateCores
+        self.onComplete = onComplete
+        self.inFlight = {}
+        self.duplicates = {}
+        self.scheduler = scheduler
+        self.priority = priority
+        self.executors = executors
+        self.executorCores = [0] * len(executors or [])
+        self.timeout = timeout
+        self.retryPolicy = retryPolicy
+        self.failures = {}
+        self.reuseResults = reuseResults
+
+    def orderCalculations(self):
+        """Numbers and Hashes the Calculations in the Order they were Submitted (Results keep this Order), Chooses their Cores if Allocating, then Sorts them Longest Predicted Runtime first, so Long Calculations don't Start last and leave the other Cores Idle
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        self.submitTime = time.time()
+
+        # Learn from the Calculations Recorded so far
+        if self.estimator is None:
+            self.estimator = RuntimeEstimator(self.database)
+
+        if self.allocateCores:
+            allocator = CoreAllocator(self.maxCores, self.estimator)
+            for calculation, cores in zip(self.calculations, allocator.allocate(self.calculations)):
+                calculation.setCores(cores)
+
+        for calculation in self.calculations:
+            calculation.index = self.index
+            calculation.inputHash = getInputHash(calculation)
+            calculation.predictedRuntime = self.estimator.predict(calculation)
+            self.index += 1
+
+        self.calculations.sort(key=lambda calculation: calculation.predictedRuntime, reverse=True)
+
+        # A Calculation no Executor can Fit would Wait forever
+        if self.executors and all(executor.cores is not None for executor in self.executors):
+            largest = max(executor.cores for executor in self.executors)
+            for calculation in self.calculations:
+                if calculation.variables["cores"] > largest:
+                    raise ValueError(f"Calculation #{calculation.index} needs {calculation.variables['cores']} Cores, the largest Executor has {largest}")
+
+    def findExecutor(self, cores: int) -> int:
+        """Finds the first Executor with enough Free Cores for a Calculation
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+            cores - int: Number of Cores of the Calculation
+
+        ## Returns: \n
+            int - Index of the Executor (0 without Executors, None if no Executor has enough Free Cores)
+        """
+        if not self.executors:
+            return 0
+
+        for index, executor in enumerate(self.executors):
+            if executor.cores is None or self.executorCores[index] + cores <= executor.cores:
+                return index
+
+        return None
+
+    def getETA(self) -> float:
+        """Estimates the Seconds until every Calculation is Completed, Simulating the Remaining Schedule with the Predicted Runtimes
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+
+        ## Returns: \n
+            float - Estimated Seconds Remaining
+        """
+        now = time.time()
+
+        # Finish Time and Cores of each Running Calculation, Overdue ones are Assumed to Finish now
+        running = [
+            (max(self.submittedCalculations[index].predictedRuntime - (now - start), 0), self.submittedCalculations[index].variables["cores"])
+            for index, start in self.startTimes.items()
+        ]
+        freeCores = self.maxCores - sum(cores for _, cores in running)
+        clock = 0
+
+        # Calculations Start in Queue Order once Enough Cores are Free, like runCalculations
+        for calculation in self.calculations:
+            cores = min(calculation.variables["cores"], self.maxCores)
+            running.sort()
+            while freeCores < cores:
+                clock, freed = running.pop(0)
+                freeCores += freed
+            running.append((clock + calculation.predictedRuntime, cores))
+            freeCores -= cores
+
+        return max([finish for finish, _ in running], default=0)
+
+    @traced("cluster")
     def runCalculations(self):
         """Starts, Runs and Manages all Calculations assigned to the Cluster
         
@@ -66,29 +248,51 @@ class ClusterCalculation:
         processes:list[multiprocessing.Process] = []
         message_queue = multiprocessing.Queue()  # Create a message queue
 
-        while self.calculations or any(p.is_alive() for p in processes):
+        self.orderCalculations()
+
+        # Inputs that Completed before (In any Process) aren't Run again
+        if self.reuseResults and self.database is not None:
+            self.calculations = [calculation for calculation in self.calculations if not self.completeCached(calculation)]
+
+        # Finished Processes are Released before the Messages are Read, so the Last Results (and the Retries they Queue) are Handled in the Loop
+        while self.calculations or processes:
             # Clean up finished processes
-            for p in processes[:]:
-                if not p.is_alive():
-                    p.join()
-                    processes.remove(p)
-                    self.usedCores -= p.calculation.variables["cores"]
+            self.releaseProcesses(processes)
 
             # Start new calculations if there are available cores
-            while self.calculations and self.usedCores < self.maxCores:
+            started = False
+            while self.calculations:
                 calculation = self.calculations[0]
+                executorIndex = self.findExecutor(calculation.variables["cores"])
+                # An Identical Input is Running, the Duplicate gets its Result instead of Running Orca again (A Retry is still In Flight under its own Index)
+                if self.inFlight.get(calculation.inputHash, calculation.index) != calculation.index:
+                    self.duplicates.setdefault(self.inFlight[calculation.inputHash], []).append(calculation)
+                    self.calculations.pop(0)
                 # Check if we have Enough Cores to Spare for the Next Calculation
-                if self.usedCores + calculation.variables["cores"] <= self.maxCores:
+                elif self.usedCores + calculation.variables["cores"] <= self.maxCores and executorIndex is not None:
                     # Prepare and Start the Calculation
-                    calculation.index = self.index
-                    self.index += 1
-                    p = multiprocessing.Process(target=self.runIndividualCalculation, args=(calculation,message_queue))
+                    self.submittedCalculations[calculation.index] = calculation
+                    self.inFlight[calculation.inputHash] = calculation.index
+                    self.startTimes[calculation.index] = time.time()
+                    queueWait = self.startTimes[calculation.index] - self.submitTime
+                    executor = self.executors[executorIndex] if self.executors else None
+                    p = multiprocessing.Process(target=self.runIndividualCalculation, args=(calculation,message_queue,queueWait,executor))
                     p.calculation = calculation  # Store calculation in the process
+                    p.executorIndex = executorIndex
                     p.start()
                     p.is_alive()
                     processes.append(p)
                     self.usedCores += calculation.variables["cores"]
+                    if self.executors:
+                        self.executorCores[executorIndex] += calculation.variables["cores"]
                     self.calculations.pop(0) # Maybe move this back to the top
+                    started = True
+                else:
+                    # Wait for Cores to Free up rather than Skipping ahead of the Queue
+                    break
+
+            if started and self.STDOut:
+                print(f"{self.name} Estimated Time Remaining : {self.getETA():.0f} s")
             
             # Check for messages from the processes
             self.postMessages(message_queue)
@@ -97,22 +301,72 @@ class ClusterCalculation:
             time.sleep(0.5)
         
         self.postMessages(message_queue)
+        self.releaseProcesses(processes)
+
+        # Insert the Records still Buffered in one Batch
+        if self.database is not None:
+            self.database.flush()
+
+        # Order the Results the same way the Calculations were Submitted
+        self.completedCalculations.sort(key=lambda result: result.index)
                 
-    def runIndividualCalculation(self, calculation: OrcaInputFile, messageQueue: multiprocessing.Queue):
+    def releaseProcesses(self, processes: list[multiprocessing.Process]):
+        """Joins the Finished Calculation Processes and Frees their Cores
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+            processes - list[multiprocessing.Process]: The Running Processes, Finished ones are Removed
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        for p in processes[:]:
+            if not p.is_alive():
+                p.join()
+                processes.remove(p)
+                self.usedCores -= p.calculation.variables["cores"]
+                if self.executors:
+                    self.executorCores[p.executorIndex] -= p.calculation.variables["cores"]
+                self.startTimes.pop(p.calculation.index, None)
+
+    def runIndividualCalculation(self, calculation: OrcaInputFile, messageQueue: multiprocessing.Queue, queueWait: float = 0, executor: OrcaExecutor = None):
         """Runs an Individual Calculation assigned to the Cluster. Spawns the Orca instance and waits until completion. Adds the results to the Message Queue to be released.
         
         ## Parameters: \n
             self - ClusterCalculation: Default Parameter for the Class Instance
             calculation - OrcaInputFile: The Calculations Input file
             messageQueue - multiprocessing.Queue: The Message Queue where results and the completion message will be added
+            queueWait - float: Seconds the Calculation Waited in the Queue before Starting
+            executor - OrcaExecutor: Where Orca Runs (None = Locally or in Docker depending on isLocal)
             
         ## Returns: \n
             None - No Return Value
         """
-        messageQueue.put(f"Starting Calculation #{self.index}")
-        calcResults = runOrcaCalculation(self.name + f"_{self.index}", calculation, self.index, self.isLocal, self.STDOut, self.orcaCachePath)
+        messageQueue.put(f"Starting Calculation #{calculation.index}")
+
+        # Spans Recorded in this Worker Process are sent back to the Clusters Tracer
+        tracer = getActiveTracer()
+        recordedSpans = len(tracer.spans) if tracer is not None else 0
+
+        name = self.name + f"_{calculation.index}"
+        lease = contextlib.nullcontext()
+        if self.scheduler is not None:
+            # The Scheduler Orders Calculations of the same Priority and Share by when it Receives them
+            lease = self.scheduler.lease(calculation.variables["cores"], self.priority, name)
+
+        with span("ClusterCalculation.runIndividualCalculation", "cluster", index=calculation.index, queueWait=queueWait):
+            leaseStart = time.time()
+            with lease:
+                addAttributes(schedulerWait=time.time() - leaseStart)
+
+                # Results are Recorded by the Cluster, Worker Processes never Write to the Database
+                calcResults = runOrcaCalculation(name, calculation, calculation.index, self.isLocal, self.STDOut, self.orcaCachePath, self.scratch, False, executor=executor, timeout=self.timeout)
+                calcResults.index = calculation.index
+
+        if tracer is not None:
+            messageQueue.put(tracer.spans[recordedSpans:])
         messageQueue.put(calcResults) # Store the Results in the Message Queue
-        messageQueue.put(f"Completed Calculation {self.index}")
+        messageQueue.put(f"Completed Calculation {calculation.index}")
         
     def postMessages (self, messageQueue: multiprocessing.Queue):
         """Releases the Content from the Message Queue, adds Completed calculations to the appropriate property and prints the completion messages to the Terminal
@@ -128,6 +382,73 @@ class ClusterCalculation:
         while not messageQueue.empty():
             message = messageQueue.get()
             if isinstance(message, OrcaCalcResult):
-                self.completedCalculations.append(message)
+                if self.database is not None:
+                    self.database.record(message, self.submittedCalculations[message.index])
+
+                # The Retry keeps the Calculations Place In Flight, Duplicates get the Result of the Last Attempt
+                if self.retryCalculation(message):
+                    continue
+
+                self.inFlight.pop(self.submittedCalculations[message.index].inputHash, None)
+
+                # Duplicates Share the Files of the Calculation that Ran, they aren't Recorded again
+                results = [message]
+                for duplicate in self.duplicates.pop(message.index, []):
+                    result = copy.copy(message)
+                    result.index = duplicate.index
+                    result.deduplicated = True
+                    results.append(result)
+
+                for result in results:
+                    self.completedCalculations.append(result)
+                    if self.onComplete is not None:
+                        self.onComplete(result)
+            elif isinstance(message, list) and all(isinstance(record, Span) for record in message):
+                if getActiveTracer() is not None:
+                    getActiveTracer().addSpans(message)
             else:
-                print(message)
\ No newline at end of file
+                print(message)
+
+    def completeCached(self, calculation: OrcaInputFile) -> bool:
+        """Completes a Calculation with the Recorded Result of an Identical Input that Completed before, in this or another Process
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+            calculation - OrcaInputFile: The Calculations Input file
+
+        ## Returns: \n
+            bool - True if a Recorded Result was Found
+        """
+        result = findCachedResult(self.database, calculation)
+        if result is None:
+            return False
+
+        result.index = calculation.index
+        self.completedCalculations.append(result)
+        if self.onComplete is not None:
+            self.onComplete(result)
+
+        return True
+
+    def retryCalculation(self, result: OrcaCalcResult) -> bool:
+        """Queues the Next Attempt of a Failed Calculation if the Retry Policy Allows it, at the Front of the Queue so it Starts as soon as Cores are Free
+
+        ## Parameters: \n
+            self - ClusterCalculation: Default Parameter for the Class Instance
+            result - OrcaCalcResult: Result of the Calculation
+
+        ## Returns: \n
+            bool - True if the Calculation is Retried
+        """
+        previousFailures = self.failures.setdefault(result.index, [])
+        if self.retryPolicy is None or not self.retryPolicy.shouldRetry(result.failure, previousFailures):
+            return False
+
+        attempt = previousFailures.count(result.failure) + 1
+        retry = self.retryPolicy.createRetry(self.submittedCalculations[result.index], result, result.failure, attempt)
+        previousFailures.append(result.failure)
+
+        print(f"Calculation #{result.index} Failed ({result.failure.value}), Retry {attempt} of {self.retryPolicy.maxRetries[result.failure]}")
+        self.calculations.insert(0, retry)
+
+        return True
\ No newline at end of file
@@ -0,0 +1,210 @@
+import numpy as np
+from .OrcaInputFile import OrcaInputFile
+from .ResultsDatabase import ResultsDatabase, getInputAtoms, getInputElectrons
+from .RuntimeEstimator import RuntimeEstimator, DEFAULTELECTRONS
+from ..Molecule import Molecule
+from ..Data.Constants import AtomicNumberConstants
+from ..Data.Enums import CalculationStatus
+
+SERIALFRACTIONS = {"OPT": 0.06, "FREQ": 0.10, "NMR": 0.08, "GOAT": 0.15, "DEFAULT": 0.08}
+"""Fraction of the Runtime of a Molecule of REFERENCEELECTRONS Electrons that doesn't Parallelize, for each Calculation Keyword"""
+
+REFERENCEELECTRONS = 100
+"""Number of Electrons the Serial Fractions are Given for, Larger Molecules Parallelize Better"""
+
+
+class CoreAllocator:
+    """Chooses how many Cores each Calculation of a Batch gets from a Total Budget. Speedups follow Amdahls Law, with a Serial Fraction per Calculation Type that Shrinks as the Molecule Grows (Modelled, or Measured from the Results Database). Cores go one at a time to the Calculation Predicted to Finish last, as long as each extra Core still runs at the Minimum Parallel Efficiency, so Small Molecules don't Waste Cores that Large ones or other Calculations can use
+
+    ## Example:
+
+    allocator = CoreAllocator(16)
+    allocator.allocate([ethaneFreq, caffeineFreq])  # [5, 11]
+    """
+
+    totalCores: int
+    """Number of Cores Shared by the Batch"""
+
+    estimator: RuntimeEstimator
+    """Model Predicting the Single Core Runtime of each Calculation"""
+
+    serialFractions: dict[str, float]
+    """Serial Fraction of each Calculation Keyword at REFERENCEELECTRONS Electrons"""
+
+    minEfficiency: float
+    """Lowest Parallel Efficiency (Speedup / Cores) a Calculation is Allowed to Run at"""
+
+    def __init__(
+        self,
+        totalCores: int,
+        estimator: RuntimeEstimator = None,
+        serialFractions: dict[str, float] = None,
+        minEfficiency: float = 0.5,
+    ):
+        if not isinstance(totalCores, int) or totalCores < 1:
+            raise ValueError("Total Cores must be a positive integer")
+
+        if not 0 < minEfficiency <= 1:
+            raise ValueError("Minimum Efficiency must be between 0 and 1")
+
+        self.totalCores = totalCores
+        self.estimator = estimator if estimator is not None else RuntimeEstimator()
+        self.serialFractions = {**SERIALFRACTIONS, **(serialFractions or {})}
+        self.minEfficiency = minEfficiency
+
+    def getSerialFraction(self, electrons: int, calculation: str = None) -> float:
+        """Gives the Fraction of a Calculations Runtime that doesn't Parallelize, Shrinking with the Square Root of the Number of Electrons
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            electrons : int - Number of Electrons of the Molecule \n
+            calculation : str - Calculation Keyword (The First Word is the Calculation Type)
+
+        ## Returns : \n
+            float - The Serial Fraction
+        """
+        keyword = str(calculation).split()[0].upper() if calculation else "DEFAULT"
+        fraction = self.serialFractions.get(keyword, self.serialFractions["DEFAULT"])
+
+        return float(np.clip(fraction * np.sqrt(REFERENCEELECTRONS / max(electrons, 1)), 1e-3, 1))
+
+    def getSpeedup(self, electrons: int, cores: int, calculation: str = None) -> float:
+        """Gives the Speedup of a Calculation on several Cores over a single Core (Amdahls Law)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            electrons : int - Number of Electrons of the Molecule \n
+            cores : int - Number of Cores \n
+            calculation : str - Calculation Keyword
+
+        ## Returns : \n
+            float - The Speedup
+        """
+        fraction = self.getSerialFraction(electrons, calculation)
+        return 1 / (fraction + (1 - fraction) / cores)
+
+    def allocateJobs(self, jobs: list[dict]) -> list[int]:
+        """Chooses the Cores of each Job. With more Jobs than Cores every Job gets a single Core, the most Efficient. Otherwise every Job Starts with one Core and the Spare Cores go one by one to the Job Predicted to Finish last, until no Job can use another Core at the Minimum Efficiency
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            jobs : list[dict] - Electrons, Atoms, Basis, Functional and Calculation of each Job
+
+        ## Returns : \n
+            list[int] - Number of Cores of each Job, in Job Order
+        """
+        cores = [1] * len(jobs)
+        spareCores = self.totalCores - len(jobs)
+
+        singleCoreRuntimes = [
+            self.estimator.predictFeatures(
+                job["electrons"], job["atoms"], 1, job.get("basis"), job.get("functional"), job.get("calculation")
+            )
+            for job in jobs
+        ]
+
+        while spareCores > 0:
+            candidates = [
+                i for i, job in enumerate(jobs)
+                if self.getSpeedup(job["electrons"], cores[i] + 1, job.get("calculation")) / (cores[i] + 1) >= self.minEfficiency
+            ]
+            if len(candidates) == 0:
+                break
+
+            slowest = max(
+                candidates,
+                key=lambda i: singleCoreRuntimes[i] / self.getSpeedup(jobs[i]["electrons"], cores[i], jobs[i].get("calculation")),
+            )
+            cores[slowest] += 1
+            spareCores -= 1
+
+        return cores
+
+    def allocate(self, calculations: list[OrcaInputFile]) -> list[int]:
+        """Chooses the Cores of each Calculation of a Batch of Input Files
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculations : list[OrcaInputFile] - Input Files of the Batch
+
+        ## Returns : \n
+            list[int] - Number of Cores of each Calculation, in Input Order
+        """
+        jobs = []
+        for calculation in calculations:
+            atoms, _ = getInputAtoms(calculation)
+            jobs.append(
+                {
+                    "electrons": getInputElectrons(calculation) or DEFAULTELECTRONS,
+                    "atoms": len(atoms) or 1,
+                    "basis": calculation.variables.get("basis"),
+                    "functional": calculation.variables.get("functional"),
+                    "calculation": calculation.variables.get("calculation"),
+                }
+            )
+
+        return self.allocateJobs(jobs)
+
+    def allocateMolecules(
+        self,
+        molecules: list[Molecule],
+        calculation: str,
+        basis: str = None,
+        functional: str = None,
+    ) -> list[int]:
+        """Chooses the Cores of the same Calculation on each Molecule of a Batch, before their Input Files are Created
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            molecules : list[Molecule] - Neutral Molecules of the Batch \n
+            calculation : str - Calculation Keyword \n
+            basis : str - Basis Set \n
+            functional : str - Density Functional
+
+        ## Returns : \n
+            list[int] - Number of Cores of each Calculation, in Molecule Order
+        """
+        jobs = [
+            {
+                "electrons": sum(AtomicNumberConstants.get(atom, 0) for atom in molecule.XYZCoordinates["Atom"]) or DEFAULTELECTRONS,
+                "atoms": len(molecule.XYZCoordinates),
+                "basis": basis,
+                "functional": functional,
+                "calculation": calculation,
+            }
+            for molecule in molecules
+        ]
+
+        return self.allocateJobs(jobs)
+
+    def measureSerialFractions(self, database: ResultsDatabase) -> dict[str, float]:
+        """Measures the Serial Fraction of each Calculation Type from Completed Calculations of the same Input Recorded on different Numbers of Cores. The Runtimes of each Input are Fit to Amdahls Law (Runtime = Serial + Parallel / Cores), then Scaled to REFERENCEELECTRONS Electrons. Calculation Types without such Records keep their Modelled Fraction
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            database : ResultsDatabase - Database of Recorded Calculations
+
+        ## Returns : \n
+            dict[str, float] - The Measured Serial Fraction of each Calculation Keyword
+        """
+        records = database.query(status=CalculationStatus.COMPLETED)
+        records = records.dropna(subset=["electronCount", "wallTime", "cores", "calculation"])
+        records = records[records["wallTime"] > 0]
+
+        measured: dict[str, list[float]] = {}
+        for _, group in records.groupby("inputHash"):
+            if group["cores"].nunique() < 2:
+                continue
+
+            system = np.column_stack([np.ones(len(group)), 1 / group["cores"].values])
+            serial, parallel = np.linalg.lstsq(system, group["wallTime"].values, rcond=None)[0]
+            fraction = np.clip(serial / (serial + parallel), 0, 1) if serial + parallel > 0 else 1.0
+
+            keyword = str(group["calculation"].iloc[0]).split()[0].upper()
+            electrons = group["electronCount"].iloc[0]
+            measured.setdefault(keyword, []).append(float(fraction * np.sqrt(electrons / REFERENCEELECTRONS)))
+
+        fractions = {keyword: float(np.median(values)) for keyword, values in measured.items()}
+        self.serialFractions.update(fractions)
+
+        return fractions
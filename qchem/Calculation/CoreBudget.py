@@ -0,0 +1,116 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+
+
+class CoreBudget:
+    """Weighted Async Semaphore that hands out CPU Cores to Calculations. Calculations wait in First In First Out order until enough Cores are free, so large Calculations are never starved by smaller ones"""
+
+    totalCores: int
+    """Total Number of Cores that can be in use at the same Time"""
+
+    usedCores: int
+    """The Current number of Cores being used"""
+
+    def __init__(self, totalCores: int = 1):
+        if not isinstance(totalCores, int) or totalCores < 1:
+            raise ValueError("Total Cores must be a positive integer")
+
+        self.totalCores = totalCores
+        self.usedCores = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+
+    @property
+    def availableCores(self) -> int:
+        """Number of Cores that are currently Free"""
+        return self.totalCores - self.usedCores
+
+    def clampCores(self, cores: int) -> int:
+        """Limits a Core Request to the Size of the Budget so that Oversized Calculations can still Run (Alone)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores Requested
+
+        ## Returns : \n
+            int - Number of Cores that will actually be Reserved
+        """
+        return max(1, min(cores, self.totalCores))
+
+    async def acquire(self, cores: int):
+        """Waits until the Requested Number of Cores is Free and Reserves them
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Reserve
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        cores = self.clampCores(cores)
+
+        # Take the Cores Immediately if Nobody is Waiting ahead of us
+        if not self._waiters and self.usedCores + cores <= self.totalCores:
+            self.usedCores += cores
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (cores, future)
+        self._waiters.append(waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Give the Cores back if they were Granted right as we were Cancelled
+            if future.done() and not future.cancelled():
+                self.release(cores)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._wakeWaiters()
+            raise
+
+    def release(self, cores: int):
+        """Frees previously Reserved Cores and wakes up Waiting Calculations
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Free
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        self.usedCores -= self.clampCores(cores)
+        self._wakeWaiters()
+
+    def _wakeWaiters(self):
+        """Grants Cores to Waiting Calculations in the Order they Arrived"""
+        while self._waiters:
+            cores, future = self._waiters[0]
+
+            if future.done():
+                self._waiters.popleft()
+                continue
+
+            if self.usedCores + cores > self.totalCores:
+                break
+
+            self._waiters.popleft()
+            self.usedCores += cores
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def reserve(self, cores: int):
+        """Async Context Manager that Reserves Cores for the Duration of the Block
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Reserve
+
+        ## Returns : \n
+            AsyncContextManager - Context that holds the Cores until it Exits
+        """
+        await self.acquire(cores)
+        try:
+            yield
+        finally:
+            self.release(cores)
@@ -0,0 +1,453 @@
+import os
+import shlex
+import asyncio
+import tarfile
+import posixpath
+import subprocess
+from abc import ABC, abstractmethod
+from .OrcaInputFile import compileTemplate
+from .OrcaCalculation import (
+    ORCAPATH,
+    DOCKERIMAGE,
+    runLocally,
+    runLocallyAsync,
+    runDockerContainer,
+    runDockerContainerAsync,
+    runProcessAsync,
+    runWithTimeout,
+    getInputFileName,
+    getOutputFileName,
+)
+
+SSHCOMMAND = ["ssh", "-o", "BatchMode=yes"]
+"""Command that Runs a Shell Command on a Remote Worker, the Host and the Command are Appended"""
+
+REMOTEROOT = "/tmp/qchem"
+"""Folder on Remote Workers that Work Folders are Copied to when the File System isn't Shared"""
+
+SLURMDIRECTIVES = "#SBATCH --job-name=&{name}\n#SBATCH --ntasks=&{cores}\n#SBATCH --output=&{name}.queue.log"
+"""Directives of the Submit Script for SLURM (&{name} = Name of the Calculation, &{cores} = Cores of the Calculation)"""
+
+
+class OrcaExecutor(ABC):
+    """Runs Orca for runOrcaCalculation and ClusterCalculation, Locally, in Docker, on a Remote Worker or through a Batch Queue. The Staging Contract is the same for every Executor : the Input File is in the Work Folder on this Machine when run is Called, and every File Orca Wrote (Output File included) must be in the Work Folder when it Returns, either because the Worker Shares the File System or because the Executor Copied the Folder there and back"""
+
+    cores: int
+    """Cores the Executor can Run at the same Time, ClusterCalculation never Starts more on it (None = Only Limited by the Clusters Max Cores)"""
+
+    def __init__(self, cores: int = None):
+        if cores is not None and (not isinstance(cores, int) or cores < 1):
+            raise ValueError("Cores must be a positive integer")
+
+        self.cores = cores
+
+    @abstractmethod
+    def run(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> subprocess.CompletedProcess:
+        """Runs Orca on the Input File in the Work Folder and waits until it Finishes, or Kills it at the Timeout (Return Code 124)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation, Name of the Input and Output File \n
+            index : int - Number to identify individual Orca Calculations running in parallel \n
+            workPath : str - Folder with the Input File, Orca's Files are in it once this Returns \n
+            cores : int - Number of Cores of the Calculation \n
+            timeout : float - Seconds Orca may Run (None = No Limit)
+
+        ## Returns : \n
+            subprocess.CompletedProcess - Return Code and Standard Error of the Calculation
+        """
+        pass
+
+    async def runAsync(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> tuple[int, str]:
+        """Async counterpart of run. The Default Runs the Blocking Executor in a Worker Thread, Executors override this with a native Async Implementation that Kills the Calculation when Cancelled
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation, Name of the Input and Output File \n
+            index : int - Number to identify individual Orca Calculations running in parallel \n
+            workPath : str - Folder with the Input File, Orca's Files are in it once this Returns \n
+            cores : int - Number of Cores of the Calculation \n
+            timeout : float - Seconds Orca may Run (None = No Limit)
+
+        ## Returns : \n
+            tuple[int, str] - Return Code of the Calculation and the Content of Standard Error
+        """
+        result = await asyncio.to_thread(self.run, name, index, workPath, cores, timeout)
+        return result.returncode, result.stderr
+
+
+class LocalExecutor(OrcaExecutor):
+    """Runs a Local Installation of Orca in the Work Folder, the same as isLocal = True"""
+
+    orcaPath: str
+    """Path to the Orca Executable (None = Found on the Path on Windows, /Orca/orca otherwise)"""
+
+    def __init__(self, orcaPath: str = None, cores: int = None):
+        super().__init__(cores)
+        self.orcaPath = orcaPath
+
+    def run(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> subprocess.CompletedProcess:
+        return runLocally(name, workPath, self.orcaPath, timeout)
+
+    async def runAsync(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> tuple[int, str]:
+        return await runWithTimeout(runLocallyAsync(name, workPath, self.orcaPath), timeout)
+
+
+class DockerExecutor(OrcaExecutor):
+    """Runs Orca in a Docker Container with the Work Folder Mounted, the same as isLocal = False"""
+
+    image: str
+    """Docker Image with Orca Installed at /Orca/orca"""
+
+    def __init__(self, image: str = DOCKERIMAGE, cores: int = None):
+        super().__init__(cores)
+        self.image = image
+
+    def run(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> subprocess.CompletedProcess:
+        return runDockerContainer(name, index, workPath, self.image, timeout)
+
+    async def runAsync(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> tuple[int, str]:
+        return await runWithTimeout(runDockerContainerAsync(name, index, workPath, self.image), timeout)
+
+
+class RemoteExecutor(OrcaExecutor):
+    """Runs Orca on another Machine over SSH (Keys must be Set Up, the Connection never Prompts). With a Shared File System (NFS, Lustre) Orca Runs in the Work Folder itself, at the same Path or under a Mapped Root. Otherwise the Work Folder is Streamed to the Worker as a Tar Archive, and Streamed back and Removed from the Worker once Orca Finishes, the Worker only needs sh and tar. Cancelling a Calculation Kills Orca on the Worker (with every Process it Spawned where the Worker has setsid) and Removes the Copied Folder
+
+    ## Example:
+
+    executors = [RemoteExecutor("node1", cores=32), RemoteExecutor("node2", cores=32, sharedFileSystem=False)]
+    ClusterCalculation(inputs, maxCores=64, executors=executors).runCalculations()
+    """
+
+    host: str
+    """Host Name of the Worker (Ex. node1, user@node1)"""
+
+    orcaPath: str
+    """Path to the Orca Executable on the Worker"""
+
+    sharedFileSystem: bool
+    """Boolean Flag to Indicate if the Worker sees the Work Folders (True = Run in place, False = Copy there and back)"""
+
+    remoteRoot: str
+    """Folder on the Worker the Work Folders are Copied to, or with a Shared File System the Mount Point of the Local Root on the Worker (None = Same Paths)"""
+
+    localRoot: str
+    """Folder on this Machine that is Mounted at the Remote Root on the Worker, with a Shared File System"""
+
+    shellCommand: list[str]
+    """Command that Runs a Shell Command on the Worker, the Host and the Command are Appended"""
+
+    def __init__(
+        self,
+        host: str,
+        cores: int = None,
+        orcaPath: str = ORCAPATH,
+        sharedFileSystem: bool = True,
+        remoteRoot: str = None,
+        localRoot: str = None,
+        shellCommand: list[str] = None,
+    ):
+        super().__init__(cores)
+
+        if not isinstance(host, str) or host == "":
+            raise ValueError("Host must be a non empty string")
+
+        if (remoteRoot is None) != (localRoot is None) and sharedFileSystem:
+            raise ValueError("A Shared File System needs both the Local and Remote Root, or neither")
+
+        self.host = host
+        self.orcaPath = orcaPath
+        self.sharedFileSystem = sharedFileSystem
+        self.remoteRoot = remoteRoot if remoteRoot is not None or sharedFileSystem else REMOTEROOT
+        self.localRoot = localRoot
+        self.shellCommand = shellCommand if shellCommand is not None else SSHCOMMAND
+
+    def getCommand(self, command: str) -> list[str]:
+        """Gives the Command that Runs a Shell Command on the Worker
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            command : str - The Shell Command
+
+        ## Returns : \n
+            list[str] - The Program and its Arguments
+        """
+        return [*self.shellCommand, self.host, command]
+
+    def getRemotePath(self, name: str, workPath: str) -> str:
+        """Gives the Folder the Calculation Runs in on the Worker
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation \n
+            workPath : str - The Work Folder on this Machine
+
+        ## Returns : \n
+            str - The Folder on the Worker
+        """
+        if not self.sharedFileSystem:
+            return posixpath.join(self.remoteRoot, f"{name}_{os.getpid()}")
+
+        if self.localRoot is None:
+            return workPath
+
+        relativePath = os.path.relpath(os.path.abspath(workPath), os.path.abspath(self.localRoot))
+        if relativePath.startswith(os.pardir):
+            raise ValueError(f"The Work Folder {workPath} isn't under the Shared Root {self.localRoot}")
+
+        return posixpath.join(self.remoteRoot, *relativePath.split(os.sep))
+
+    def getOrcaCommand(self, name: str, remotePath: str, timeout: float = None) -> str:
+        """Gives the Shell Command that Runs Orca in the Folder on the Worker. Orca Runs in its own Session (through setsid where the Worker has it), whose ID is Written to a File next to the Input while it Runs so it can be Stopped from another Connection
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation \n
+            remotePath : str - The Folder on the Worker \n
+            timeout : float - Seconds Orca may Run, the Worker Kills it (None = No Limit)
+
+        ## Returns : \n
+            str - The Shell Command
+        """
+        pidFile = shlex.quote(getPidFileName(name))
+
+        return (
+            f"cd {shlex.quote(remotePath)} || exit 1; launch=setsid; command -v setsid > /dev/null || launch=; "
+            f"$launch {getOrcaCall(self.orcaPath, name, timeout)} & echo $! > {pidFile}; "
+            f"wait $!; status=$?; rm -f {pidFile}; exit $status"
+        )
+
+    def stop(self, name: str, remotePath: str) -> tuple[int, str]:
+        """Kills Orca and every Process it Spawned on the Worker, and Removes the Folder it Ran in if the Work Folder was Copied there. Without a Terminal the Worker doesn't Stop Orca when the SSH Connection Drops
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation \n
+            remotePath : str - The Folder on the Worker
+
+        ## Returns : \n
+            tuple[int, str] - Return Code of the Command and the Content of Standard Error
+        """
+        folder = shlex.quote(remotePath)
+        pidPath = shlex.quote(posixpath.join(remotePath, getPidFileName(name)))
+
+        # The Session is only Written once Orca Started, wait a few Seconds for it
+        command = (
+            f"for attempt in 1 2 3 4 5; do [ -s {pidPath} ] && break; sleep 1; done; "
+            f'[ -s {pidPath} ] && {{ kill -s KILL -- -"$(cat {pidPath})" || kill -s KILL "$(cat {pidPath})"; }}; '
+        )
+        command += f"rm -rf {folder}" if not self.sharedFileSystem else f"rm -f {pidPath}"
+
+        result = subprocess.run(self.getCommand(command), text=True, capture_output=True)
+        return result.returncode, result.stderr
+
+    def upload(self, workPath: str, remotePath: str) -> tuple[int, str]:
+        """Streams the Work Folder to the Folder on the Worker
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            workPath : str - The Work Folder on this Machine \n
+            remotePath : str - The Folder on the Worker
+
+        ## Returns : \n
+            tuple[int, str] - Return Code of the Transfer and the Content of Standard Error
+        """
+        folder = shlex.quote(remotePath)
+        command = self.getCommand(f"mkdir -p {folder} && tar -C {folder} -xf -")
+
+        with subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            try:
+                with tarfile.open(fileobj=process.stdin, mode="w|") as archive:
+                    archive.add(workPath, arcname=".")
+                process.stdin.close()
+            except BrokenPipeError:
+                # The Worker Failed before Reading everything, its Error says why
+                pass
+            stderr = process.stderr.read()
+
+        return process.returncode, stderr.decode(errors="replace")
+
+    def download(self, remotePath: str, workPath: str) -> tuple[int, str]:
+        """Streams the Folder on the Worker back into the Work Folder, and Removes it from the Worker
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            remotePath : str - The Folder on the Worker \n
+            workPath : str - The Work Folder on this Machine
+
+        ## Returns : \n
+            tuple[int, str] - Return Code of the Transfer and the Content of Standard Error
+        """
+        folder = shlex.quote(remotePath)
+        command = self.getCommand(f"tar -C {folder} -cf - . && rm -rf {folder}")
+
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            try:
+                with tarfile.open(fileobj=process.stdout, mode="r|") as archive:
+                    extractArchive(archive, workPath)
+            except tarfile.ReadError:
+                # Nothing was Sent back, the Error of the Worker says why
+                pass
+            stderr = process.stderr.read()
+            process.wait()
+
+        return process.returncode, stderr.decode(errors="replace")
+
+    def run(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> subprocess.CompletedProcess:
+        remotePath = self.getRemotePath(name, workPath)
+        command = self.getCommand(self.getOrcaCommand(name, remotePath, timeout))
+
+        if not self.sharedFileSystem:
+            returnCode, stderr = self.upload(workPath, remotePath)
+            if returnCode != 0:
+                return subprocess.CompletedProcess(command, returnCode, "", f"Staging to {self.host} Failed : {stderr}")
+
+        result = subprocess.run(command, text=True, capture_output=True)
+
+        if not self.sharedFileSystem:
+            returnCode, stderr = self.download(remotePath, workPath)
+            if returnCode != 0:
+                result.returncode = result.returncode or returnCode
+                result.stderr += f"Retrieving from {self.host} Failed : {stderr}"
+
+        return result
+
+    async def runAsync(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> tuple[int, str]:
+        remotePath = self.getRemotePath(name, workPath)
+
+        if not self.sharedFileSystem:
+            returnCode, stderr = await asyncio.to_thread(self.upload, workPath, remotePath)
+            if returnCode != 0:
+                return returnCode, f"Staging to {self.host} Failed : {stderr}"
+
+        # Cancelling only Kills the SSH Client, Orca is Stopped (and the Folder on the Worker Removed) through another Connection
+        try:
+            returnCode, stderr = await runProcessAsync(self.getCommand(self.getOrcaCommand(name, remotePath, timeout)), workPath)
+        except asyncio.CancelledError:
+            await asyncio.to_thread(self.stop, name, remotePath)
+            raise
+
+        if not self.sharedFileSystem:
+            retrievedCode, retrievedError = await asyncio.to_thread(self.download, remotePath, workPath)
+            if retrievedCode != 0:
+                returnCode = returnCode or retrievedCode
+                stderr += f"Retrieving from {self.host} Failed : {retrievedError}"
+
+        return returnCode, stderr
+
+
+class FakeRemoteExecutor(RemoteExecutor):
+    """Remote Executor whose Worker is a Folder on this Machine, Shell Commands Run with sh instead of SSH. Exercises the whole Staging Protocol (Copy there, Run, Copy back) without a Second Machine, to Test Pipelines before Scaling them out"""
+
+    def __init__(self, workerRoot: str, cores: int = None, orcaPath: str = ORCAPATH):
+        super().__init__("localhost", cores, orcaPath, False, os.path.abspath(workerRoot))
+
+    def getCommand(self, command: str) -> list[str]:
+        return ["sh", "-c", command]
+
+
+class BatchQueueExecutor(OrcaExecutor):
+    """Submits each Calculation as a Job to a Batch Queue (SLURM by Default, PBS / LSF with their Submit Command and Directives) and waits for it to Finish. Compute Nodes must Share the File System with this Machine (Including the Scratch Folder if one is Used), the Submit Script Runs Orca in the Work Folder. The Submit Command must Block until the Job Ends (sbatch --wait, qsub -W block=true, bsub -K), Cancelling stops Waiting but leaves the Job to the Queue
+
+    ## Example:
+
+    executor = BatchQueueExecutor(directives=SLURMDIRECTIVES + "\\n#SBATCH --partition=chem --time=24:00:00")
+    """
+
+    submitCommand: list[str]
+    """Command that Submits the Script and Blocks until the Job Ends, the Path of the Script is Appended"""
+
+    directives: str
+    """Lines at the Top of the Submit Script, a Template (&{name} = Name of the Calculation, &{cores} = Cores of the Calculation)"""
+
+    orcaPath: str
+    """Path to the Orca Executable on the Compute Nodes"""
+
+    def __init__(
+        self,
+        submitCommand: list[str] = None,
+        directives: str = SLURMDIRECTIVES,
+        orcaPath: str = ORCAPATH,
+        cores: int = None,
+    ):
+        super().__init__(cores)
+        self.submitCommand = submitCommand if submitCommand is not None else ["sbatch", "--wait"]
+        self.directives = directives
+        self.orcaPath = orcaPath
+
+    def writeScript(self, name: str, workPath: str, cores: int, timeout: float = None) -> str:
+        """Writes the Submit Script of a Calculation to its Work Folder
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation \n
+            workPath : str - The Work Folder \n
+            cores : int - Number of Cores of the Calculation \n
+            timeout : float - Seconds Orca may Run once the Job Starts, Time Waiting in the Queue doesn't Count (None = No Limit)
+
+        ## Returns : \n
+            str - Path of the Submit Script
+        """
+        directives = compileTemplate(self.directives).render({"name": name, "cores": cores})
+        command = f"cd {shlex.quote(os.path.abspath(workPath))} && {getOrcaCall(self.orcaPath, name, timeout)}"
+
+        scriptPath = os.path.join(workPath, f"{name}.job.sh")
+        with open(scriptPath, "w") as script:
+            script.write(f"#!/bin/sh\n{directives}\n{command}\n")
+
+        return scriptPath
+
+    def run(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> subprocess.CompletedProcess:
+        scriptPath = self.writeScript(name, workPath, cores, timeout)
+        return subprocess.run([*self.submitCommand, scriptPath], cwd=workPath, text=True, capture_output=True)
+
+    async def runAsync(self, name: str, index: int, workPath: str, cores: int, timeout: float = None) -> tuple[int, str]:
+        scriptPath = self.writeScript(name, workPath, cores, timeout)
+        return await runProcessAsync([*self.submitCommand, scriptPath], workPath)
+
+
+def getOrcaCall(orcaPath: str, name: str, timeout: float = None) -> str:
+    """Gives the Shell Command that Runs Orca on the Input File in the Current Folder, through the timeout Command (Exit Status 124 when it Stops Orca, Killed 30 Seconds later if it Ignores the Signal) if there is a Timeout
+
+    ## Parameters : \n
+        orcaPath : str - Path to the Orca Executable \n
+        name : str - Name of the Calculation \n
+        timeout : float - Seconds Orca may Run (None = No Limit)
+
+    ## Returns : \n
+        str - The Shell Command
+    """
+    command = f"{shlex.quote(orcaPath)} {shlex.quote(getInputFileName(name))} > {shlex.quote(getOutputFileName(name))}"
+
+    if timeout is None:
+        return command
+
+    return f"timeout -k 30 {timeout:g} {command}"
+
+
+def getPidFileName(name: str) -> str:
+    """Gives the Name of the File a Remote Worker Writes the Process Group of a Running Orca to
+
+    ## Parameters : \n
+        name : str - Name of the Calculation
+
+    ## Returns : \n
+        str - The File Name
+    """
+    return f"{name}.pid"
+
+
+def extractArchive(archive: tarfile.TarFile, folder: str):
+    """Extracts a Tar Archive from a Worker, Refusing Paths outside the Folder where Python Supports it
+
+    ## Parameters : \n
+        archive : tarfile.TarFile - The Archive \n
+        folder : str - Folder to Extract to
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    if hasattr(tarfile, "data_filter"):
+        archive.extractall(folder, filter="data")
+    else:
+        archive.extractall(folder)
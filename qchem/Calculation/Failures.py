@@ -0,0 +1,350 @@
+import os
+import re
+import copy
+from typing import Callable, TYPE_CHECKING
+from .OrcaInputFile import OrcaInputFile, compileTemplate
+from ..Compression import openCompressed
+from ..Data.Enums import FailureType
+
+if TYPE_CHECKING:
+    from .OrcaCalculation import OrcaCalcResult
+
+TIMEOUTRETURNCODE = 124
+"""Return Code of a Calculation Killed at its Timeout (The same as the timeout Command)"""
+
+OUTPUTTAILBYTES = 1 << 16
+"""Bytes at the End of the Output File Searched for the Reason a Calculation Failed, Orca Stops right after the Error"""
+
+DEFAULTMAXCORE = 4000
+"""Megabytes of Memory per Core Orca uses when the Input doesn't Set %maxcore"""
+
+FAILUREPATTERNS = [
+    (FailureType.OUTOFMEMORY, re.compile(r"[Nn]ot enough memory|Please increase MaxCore|[Oo]ut of memory|std::bad_alloc|Cannot allocate memory")),
+    (FailureType.SCFNOTCONVERGED, re.compile(r"SCF NOT CONVERGED|SCF not fully converged|SCF is NOT converged")),
+    (FailureType.GEOMETRYNOTCONVERGED, re.compile(r"optimization did not converge|OPTIMIZATION DID NOT CONVERGE")),
+    (FailureType.MISSINGEXECUTABLE, re.compile(r"command not found|: not found|cannot execute|[Nn]o such file or directory.*orca|licen[cs]e|Calling Command: mpirun")),
+    (FailureType.ABORTED, re.compile(r"ABORTING THE RUN|aborting the run|error termination|Aborted|Killed|Segmentation fault")),
+]
+"""Messages in the Output or Standard Error that give the Reason a Calculation Failed, the first Match Classifies it"""
+
+DEFAULTRETRIES = {
+    FailureType.SCFNOTCONVERGED: 2,
+    FailureType.GEOMETRYNOTCONVERGED: 2,
+    FailureType.OUTOFMEMORY: 2,
+    FailureType.ABORTED: 1,
+}
+"""Number of Times a Calculation is Retried for each Failure Type by Default, Failures that would Fail again the same way (Missing Executable, Timeout) aren't Retried"""
+
+
+def readOutputTail(filePath: str, size: int = OUTPUTTAILBYTES) -> str:
+    """Reads the End of an Output File (Plain or Compressed)
+
+    ## Parameters : \n
+        filePath : str - Path to the Output File \n
+        size : int - Number of Bytes to Read from the End
+
+    ## Returns : \n
+        str - The End of the Output ("" if there is no Output File)
+    """
+    if not os.path.exists(filePath):
+        return ""
+
+    # Compressed Outputs can't Seek, they are Read through
+    if filePath.endswith(".out"):
+        with open(filePath, "rb") as file:
+            file.seek(max(0, os.path.getsize(filePath) - size))
+            return file.read().decode(errors="replace")
+
+    with openCompressed(filePath, "rb") as file:
+        return file.read()[-size:].decode(errors="replace")
+
+
+def classifyFailure(outputFilePath: str, returnCode: int, stderr: str = "") -> FailureType:
+    """Classifies why a Calculation Failed from its Return Code, the End of its Output and its Standard Error
+
+    ## Parameters : \n
+        outputFilePath : str - Path to the Output File \n
+        returnCode : int - Exit Status of Orca (Docker, SSH or the Batch Queue) \n
+        stderr : str - Content of Standard Error
+
+    ## Returns : \n
+        FailureType - The Reason the Calculation Failed (None if it Terminated Normally)
+    """
+    if returnCode == TIMEOUTRETURNCODE:
+        return FailureType.TIMEOUT
+
+    # The Shell couldn't Find or Run the Program
+    if returnCode in (126, 127):
+        return FailureType.MISSINGEXECUTABLE
+
+    tail = readOutputTail(outputFilePath)
+    if "ORCA TERMINATED NORMALLY" in tail and returnCode in (0, None):
+        return None
+
+    text = tail + stderr
+    for failure, pattern in FAILUREPATTERNS:
+        if pattern.search(text):
+            return failure
+
+    # Killed by a Signal without a Message
+    if returnCode is not None and returnCode < 0:
+        return FailureType.ABORTED
+
+    return FailureType.UNKNOWN
+
+
+class RetryPolicy:
+    """Decides which Failed Calculations are Retried and how their Input is Changed first. Each Failure Type has its own Number of Retries and Remedy : a Tighter and Slower SCF then a Different Initial Guess for SCF Failures, more Cycles from the Last Geometry for Geometry Failures, Twice the Memory per Core for Memory Failures, and the Unchanged Input for Aborted Runs. Subclass and Override a Remedy (or Add one to remedies) to Change it
+
+    ## Example:
+
+    policy = RetryPolicy({FailureType.SCFNOTCONVERGED: 3, FailureType.TIMEOUT: 1})
+    ClusterCalculation(inputs, maxCores=64, timeout=3600, retryPolicy=policy).runCalculations()
+    """
+
+    maxRetries: dict[FailureType, int]
+    """Number of Times a Calculation is Retried for each Failure Type (Failure Types not Listed are never Retried)"""
+
+    remedies: dict[FailureType, Callable[[OrcaInputFile, "OrcaCalcResult", int], OrcaInputFile]]
+    """Function giving the Input of the Next Attempt for each Failure Type, from the Failed Input, its Result and the Number of the Retry (Failure Types not Listed Retry the Unchanged Input)"""
+
+    def __init__(self, maxRetries: dict[FailureType, int] = None):
+        if any(not isinstance(retries, int) or retries < 0 for retries in (maxRetries or {}).values()):
+            raise ValueError("Retries must be non negative integers")
+
+        self.maxRetries = maxRetries if maxRetries is not None else dict(DEFAULTRETRIES)
+        self.remedies = {
+            FailureType.SCFNOTCONVERGED: self.remedySCF,
+            FailureType.GEOMETRYNOTCONVERGED: self.remedyGeometry,
+            FailureType.OUTOFMEMORY: self.remedyMemory,
+        }
+
+    def shouldRetry(self, failure: FailureType, previousFailures: list[FailureType]) -> bool:
+        """Checks if a Failed Calculation gets Another Attempt
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            failure : FailureType - Why the Last Attempt Failed (None = It didn't Fail) \n
+            previousFailures : list[FailureType] - Why each Earlier Attempt Failed
+
+        ## Returns : \n
+            bool - True if the Calculation is Retried
+        """
+        if failure is None:
+            return False
+
+        return previousFailures.count(failure) < self.maxRetries.get(failure, 0)
+
+    def createRetry(self, inputFile: OrcaInputFile, result: "OrcaCalcResult", failure: FailureType, attempt: int) -> OrcaInputFile:
+        """Gives the Input of the Next Attempt of a Failed Calculation
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - Input of the Failed Attempt \n
+            result : OrcaCalcResult - Result of the Failed Attempt \n
+            failure : FailureType - Why it Failed \n
+            attempt : int - Number of the Retry for this Failure Type (Starts at 1)
+
+        ## Returns : \n
+            OrcaInputFile - Input of the Next Attempt, keeping the Index and Cores of the Failed one
+        """
+        remedy = self.remedies.get(failure)
+        if remedy is None:
+            return amendInput(inputFile)
+
+        return remedy(inputFile, result, attempt)
+
+    def remedySCF(self, inputFile: OrcaInputFile, result: "OrcaCalcResult", attempt: int) -> OrcaInputFile:
+        """Slows the SCF down with more Iterations, and Starts it from a Different Guess after the first Retry (Inputs Reading Orbitals (MORead) keep Starting from them, Orca can't do both)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - Input of the Failed Attempt \n
+            result : OrcaCalcResult - Result of the Failed Attempt \n
+            attempt : int - Number of the Retry
+
+        ## Returns : \n
+            OrcaInputFile - Input of the Next Attempt
+        """
+        if attempt == 1:
+            return amendInput(inputFile, "! SlowConv\n", [("scf", "MaxIter", "500")])
+
+        settings = [("scf", "MaxIter", "1000")]
+        if not readsOrbitals(inputFile):
+            settings.append(("scf", "Guess", "HCore"))
+
+        return amendInput(inputFile, "! VerySlowConv\n", settings)
+
+    def remedyGeometry(self, inputFile: OrcaInputFile, result: "OrcaCalcResult", attempt: int) -> OrcaInputFile:
+        """Gives the Optimization more Cycles, Continuing from the Last Geometry it Reached when the Molecule is Pasted in the Input
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - Input of the Failed Attempt \n
+            result : OrcaCalcResult - Result of the Failed Attempt \n
+            attempt : int - Number of the Retry
+
+        ## Returns : \n
+            OrcaInputFile - Input of the Next Attempt
+        """
+        variables = dict(inputFile.variables)
+
+        lastGeometryPath = os.path.join(result.orcaCachePath, result.name + ".xyz")
+        if "xyz" in variables and os.path.exists(lastGeometryPath):
+            with open(lastGeometryPath, "r") as file:
+                lines = file.read().splitlines()
+            variables["xyz"] = "\n".join(line.strip() for line in lines[2:] if line.strip())
+
+        # At least Twice the Cycles the Failed Attempt had
+        cycles = getSetting(inputFile.inputFileContents, "geom", "MaxIter")
+        maxIter = max(200 * (attempt + 1), 2 * int(cycles) if cycles is not None and cycles.isdigit() else 0)
+
+        return amendInput(inputFile, settings=[("geom", "MaxIter", str(maxIter))], variables=variables)
+
+    def remedyMemory(self, inputFile: OrcaInputFile, result: "OrcaCalcResult", attempt: int) -> OrcaInputFile:
+        """Doubles the Memory per Core (%maxcore) the Failed Attempt Ran with
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - Input of the Failed Attempt \n
+            result : OrcaCalcResult - Result of the Failed Attempt \n
+            attempt : int - Number of the Retry
+
+        ## Returns : \n
+            OrcaInputFile - Input of the Next Attempt
+        """
+        maxCore = getSetting(inputFile.inputFileContents, "maxcore")
+        maxCore = int(maxCore) if maxCore is not None and maxCore.isdigit() else DEFAULTMAXCORE
+
+        return amendInput(inputFile, settings=[("maxcore", None, str(maxCore * 2))])
+
+
+def getSetting(text: str, block: str, option: str = None) -> str:
+    """Gives the Value of a Setting in an Input, the one Orca Uses when it is Set more than once
+
+    ## Parameters : \n
+        text : str - The Input (or its Template) \n
+        block : str - Name of the Block (Ex. geom) or of a One Line Setting (Ex. maxcore) \n
+        option : str - Name of the Option in the Block (None = One Line Setting)
+
+    ## Returns : \n
+        str - The Value (None if it isn't Set)
+    """
+    values = re.findall(getSettingPattern(block, option), text)
+    return values[-1][1] if values else None
+
+
+def setSetting(text: str, block: str, option: str, value: str) -> str:
+    """Sets a Setting in an Input, Replacing every Value it already has. A Block Option that isn't Set yet is Added to the first Block of that Name, or in a new Block at the Top
+
+    ## Parameters : \n
+        text : str - The Input (or its Template) \n
+        block : str - Name of the Block (Ex. geom) or of a One Line Setting (Ex. maxcore) \n
+        option : str - Name of the Option in the Block (None = One Line Setting) \n
+        value : str - The Value
+
+    ## Returns : \n
+        str - The Input with the Setting
+    """
+    text, count = re.subn(getSettingPattern(block, option), lambda match: match.group(1) + value, text)
+    if count > 0:
+        return text
+
+    if option is None:
+        return f"%{block} {value}\n" + text
+
+    text, count = re.subn(rf"(?im)^([ \t]*%{block}\b)", lambda match: f"{match.group(1)} {option} {value}", text, count=1)
+    if count > 0:
+        return text
+
+    return f"%{block} {option} {value} end\n" + text
+
+
+def getSettingPattern(block: str, option: str = None) -> re.Pattern:
+    """Gives the Pattern Matching a Setting, Group 1 is everything before the Value and Group 2 the Value
+
+    ## Parameters : \n
+        block : str - Name of the Block (Ex. geom) or of a One Line Setting (Ex. maxcore) \n
+        option : str - Name of the Option in the Block (None = One Line Setting)
+
+    ## Returns : \n
+        re.Pattern - The Pattern
+    """
+    if option is None:
+        return re.compile(rf"(?im)^([ \t]*%{block}[ \t]+)(\S+)")
+
+    # The Option is anywhere in the Block, before the next Block Starts
+    return re.compile(rf"(?is)(%{block}\b[^%]*?\b{option}[ \t]+)(\S+)")
+
+
+def amendInput(
+    inputFile: OrcaInputFile,
+    keywords: str = None,
+    settings: list[tuple[str, str, str]] = None,
+    variables: dict = None,
+) -> OrcaInputFile:
+    """Copies an Input for a Retry. The Settings Replace the Values the Template (and Earlier Retries) Set, so they are the ones Orca Uses, Keywords Replace those Earlier Retries Added
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input \n
+        keywords : str - Keyword Lines Added at the Top (Ex. "! SlowConv\\n", None = The Keywords of Earlier Retries) \n
+        settings : list[tuple[str, str, str]] - Block, Option (None = One Line Setting) and Value of each Setting to Change (Ex. ("geom", "MaxIter", "400"), ("maxcore", None, "8000")) \n
+        variables : dict - Variables of the Copy (None = The same Variables)
+
+    ## Returns : \n
+        OrcaInputFile - The Copy, with the Index and other Attributes the Cluster Set on the Input
+    """
+    amended = copy.copy(inputFile)
+    # The Template before any Retry, the Results Database Records its Name
+    amended.sourceTemplate = getattr(inputFile, "sourceTemplate", inputFile.template)
+    amended.keywords = keywords if keywords is not None else getattr(inputFile, "keywords", "")
+
+    # Later Retries Override the Settings of Earlier ones
+    amended.settings = dict(getattr(inputFile, "settings", {}))
+    for block, option, value in settings or []:
+        amended.settings[(block, option)] = value
+
+    template = compileTemplate(amended.sourceTemplate).text
+    for (block, option), value in amended.settings.items():
+        template = setSetting(template, block, option, value)
+
+    amended.template = amended.keywords + template
+    amended.variables = dict(variables if variables is not None else inputFile.variables)
+    amended.inputFileContents = amended.generateInputFile()
+
+    return amended
+
+
+def carryAmendments(amended: OrcaInputFile, inputFile: OrcaInputFile) -> OrcaInputFile:
+    """Applies the Keywords and Settings Retries Added to an Input to another Input, so a Remedy that Worked keeps Applying (Ex. to the Next Iteration of an Optimization). The SCF Guess isn't Carried to an Input that Reads Orbitals, they are where its SCF Starts
+
+    ## Parameters : \n
+        amended : OrcaInputFile - Input the Retries Amended \n
+        inputFile : OrcaInputFile - Input to Apply them to
+
+    ## Returns : \n
+        OrcaInputFile - The Amended Copy of the Input (The Input itself if no Retry Amended the first)
+    """
+    keywords = getattr(amended, "keywords", "")
+    settings = [
+        (block, option, value)
+        for (block, option), value in getattr(amended, "settings", {}).items()
+        if not ((block, option) == ("scf", "Guess") and readsOrbitals(inputFile))
+    ]
+
+    if not keywords and not settings:
+        return inputFile
+
+    return amendInput(inputFile, keywords, settings)
+
+
+def readsOrbitals(inputFile: OrcaInputFile) -> bool:
+    """Checks if an Input Starts its SCF from the Orbitals of an Earlier Calculation (MORead)
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input
+
+    ## Returns : \n
+        bool - True if the Input Reads Orbitals
+    """
+    return re.search(r"^[ \t]*%moinp\b|\bMORead\b", inputFile.inputFileContents, re.I | re.M) is not None
@@ -1,10 +1,13 @@
 import time
 import pandas as pd
+from typing import Callable
 from qchem.Molecule import Molecule
 from qchem.Parser import OrcaOutput
+from .CoreBudget import CoreBudget
 from .BaseOrcaCalculation import BaseOrcaCalculation
-from qchem.Calculation.OrcaCalculation import runOrcaCalculation
-from qchem.Data.Enums import OrcaCalculationType, OrcaInputTemplate
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, runOrcaCalculationAsync, OrcaCalcResult
+from qchem.Data.Enums import OrcaCalculationType, OrcaInputTemplate, CalculationStatus
+from qchem.Instrumentation import traced
 
 
 class Frequency(BaseOrcaCalculation):
@@ -41,6 +44,7 @@ class Frequency(BaseOrcaCalculation):
         # Check if the Calculation has a Basis Set and a Functional Defined (Specific to Certain Calculations)
         self.basisSetFunctionalCompliant()
 
+    @traced("calculation")
     def runCalculation(self):
         """Runs the Frequency Calculation and Saves the Vibrational Frequencies and Infra Red Frequencies
         
@@ -58,12 +62,91 @@ class Frequency(BaseOrcaCalculation):
 
         # Run the Orca Calculation
         calculation = runOrcaCalculation(
-            self.name, self.inputFile, self.index, self.isLocal, STDOut=False
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
         )
 
         # Get the Calculation Time
         self.calculationTime = time.time() - startTime
 
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Frequencies from the Output File
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the Frequency Completion
+        print(f"Finished FREQ on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the Frequency Calculation without blocking the Event Loop
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Clock
+        startTime = time.time()
+
+        # Add a Print Statement to say we are running
+        print(f"Running FREQ on {self.name}...")
+
+        # Run the Orca Calculation
+        calculation = await runOrcaCalculationAsync(
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            coreBudget=coreBudget,
+            progress=progress,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
+        )
+
+        # Get the Calculation Time
+        self.calculationTime = time.time() - startTime
+
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Frequencies from the Output File
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the Frequency Completion
+        print(f"Finished FREQ on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    def extractResults(self, calculation: OrcaCalcResult):
+        """Saves the Calculations Paths and Extracts the Vibrational and Infra Red Frequencies from the Output File
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Calculation
+
+        ## Returns: \n
+            None - No Return Value
+        """
         # Save the Output File Path
         self.outputFilePath = calculation.outputFilePath
         self.orcaCachePath = calculation.orcaCachePath
@@ -75,7 +158,4 @@ class Frequency(BaseOrcaCalculation):
         self.vibrationalFrequencies = outputFile.getVibrationalFrequencies()
 
         # Load the IR Frequency from the
-        self.IRFrequencies = outputFile.getIRFrequencies()
-
-        # Display a Print Statement for the Frequency Completion
-        print(f"Finished FREQ on {self.name}! ({self.clockTime(self.calculationTime)})")
\ No newline at end of file
+        self.IRFrequencies = outputFile.getIRFrequencies()
\ No newline at end of file
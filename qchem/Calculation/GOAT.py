@@ -1,11 +1,15 @@
 import os
 import time
+from typing import Callable
 from qchem.XYZFile import XYZFile
+from qchem.Compression import getUncompressedPath
 from qchem.Molecule import Molecule
 from qchem.Parser import OrcaOutput
-from qchem.Data.Enums import OrcaInputTemplate, OrcaCalculationType
-from qchem.Calculation.OrcaCalculation import runOrcaCalculation
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Data.Enums import OrcaInputTemplate, OrcaCalculationType, CalculationStatus
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, runOrcaCalculationAsync, OrcaCalcResult
 from qchem.Calculation.BaseOrcaCalculation import BaseOrcaCalculation
+from qchem.Instrumentation import traced
 
 
 class GOAT(BaseOrcaCalculation):
@@ -46,6 +50,7 @@ class GOAT(BaseOrcaCalculation):
         # Set the Values
         self.conformers = []
 
+    @traced("calculation")
     def runCalculation(self):
         """Runs the GOAT Calculation and Saves the list of Conformer Molecules and their Individual Contributions to the Ensemble
         
@@ -64,12 +69,91 @@ class GOAT(BaseOrcaCalculation):
 
         # Create the Calculation Object
         calculation = runOrcaCalculation(
-            self.name, self.inputFile, self.index, self.isLocal, STDOut=False
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
         )
 
         # Get the Calculation Time
         self.calculationTime = time.time() - startTime
 
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Conformers and their Contributions
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the GOAT Completion
+        print(f"Finished GOAT on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the GOAT Calculation without blocking the Event Loop
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        # Start the Clock
+        startTime = time.time()
+
+        # Add a Print Statement to say we are running
+        print(f"Running GOAT on {self.name}...")
+
+        # Run the Orca Calculation
+        calculation = await runOrcaCalculationAsync(
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            coreBudget=coreBudget,
+            progress=progress,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
+        )
+
+        # Get the Calculation Time
+        self.calculationTime = time.time() - startTime
+
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Conformers and their Contributions
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the GOAT Completion
+        print(f"Finished GOAT on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    def extractResults(self, calculation: OrcaCalcResult):
+        """Saves the Calculations Paths and Extracts the Conformers and their Contributions to the Ensemble
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Calculation
+
+        ## Returns : \n
+            None - No Return Value
+        """
         # Save the Output File Path
         self.outputFilePath = calculation.outputFilePath
         self.orcaCachePath = calculation.orcaCachePath
@@ -81,9 +165,6 @@ class GOAT(BaseOrcaCalculation):
         conformerOutput = OrcaOutput(calculation.outputFilePath).conformers
         self.conformerContribution = conformerOutput[conformerOutput.columns[3]].values
 
-        # Display a Print Statement for the GOAT Completion
-        print(f"Finished GOAT on {self.name}! ({self.clockTime(self.calculationTime)})")
-
     def extractConformers(self):
         """Extracts all the Conformer Molecules from the .finalensemble.xyz File
         
@@ -100,8 +181,10 @@ class GOAT(BaseOrcaCalculation):
             atomNum = self.molecule.atomCount
 
         # Open the File
+        # Named after the Output, which belongs to another Calculation if an Identical one Ran instead
+        outputName = os.path.splitext(os.path.basename(getUncompressedPath(self.outputFilePath)))[0]
         ensembleXYZFile = open(
-            os.path.join(self.orcaCachePath, f"{self.name}.finalensemble.xyz")
+            os.path.join(self.orcaCachePath, f"{outputName}.finalensemble.xyz")
         )
 
         # Get all the Lines from the File
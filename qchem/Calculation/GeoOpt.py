@@ -1,12 +1,18 @@
 import os
 import time
+import shutil
 import pandas as pd
+from typing import Callable
 from qchem.Molecule import Molecule
+from qchem.XYZFile import XYZFile
 from qchem.Parser import OrcaOutput
+from .CoreBudget import CoreBudget
 from .BaseOrcaCalculation import BaseOrcaCalculation
 from qchem.Calculation.OrcaInputFile import OrcaInputFile
-from qchem.Data.Enums import OrcaInputTemplate, OrcaCalculationType
-from qchem.Calculation.OrcaCalculation import runOrcaCalculation, OrcaCalcResult
+from qchem.Data.Enums import OrcaInputTemplate, OrcaCalculationType, CalculationStatus, FailureType
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, runOrcaCalculationAsync, OrcaCalcResult
+from qchem.Calculation.Failures import RetryPolicy, carryAmendments
+from qchem.Instrumentation import traced
 
 
 class GeoOpt(BaseOrcaCalculation):
@@ -32,6 +38,15 @@ class GeoOpt(BaseOrcaCalculation):
     calculation: OrcaCalcResult
     """The reference to the latest Calculation Results from the GeoOpt """
 
+    reuseOrbitals: bool
+    """A Boolean Flag determining if each Optimization Iteration starts its SCF from the Orbitals (.gbw) of the previous Iteration (True = Reads the previous Orbitals, False = Starts from a new Guess)"""
+
+    displacementStep: float
+    """Distance in Angstroms the Atom Moving the most is Displaced along an Imaginary Mode before the next Iteration (0 = Restart from the unchanged Geometry)"""
+
+    retryPolicy: RetryPolicy
+    """Decides if an Iteration that Failed (No Frequencies) is Retried and how its Input is Changed, from why it Failed"""
+
     def __init__(
         self,
         molecule: str | Molecule,
@@ -42,6 +57,9 @@ class GeoOpt(BaseOrcaCalculation):
         isLocal: bool = False,
         name: str = "Molecule",
         stdout: bool = True,
+        reuseOrbitals: bool = True,
+        displacementStep: float = 0.1,
+        retryPolicy: RetryPolicy = None,
         **variables,
     ):
 
@@ -54,7 +72,11 @@ class GeoOpt(BaseOrcaCalculation):
         self.basisSetFunctionalCompliant()
 
         self.fullOptimization = fullOptimization
+        self.reuseOrbitals = reuseOrbitals
+        self.displacementStep = displacementStep
+        self.retryPolicy = retryPolicy if retryPolicy is not None else RetryPolicy()
 
+    @traced("calculation")
     def runCalculation(self):
         """Runs the GeoOpt Calculation and Saves the Optimized Molecule and it's Path
         
@@ -71,6 +93,29 @@ class GeoOpt(BaseOrcaCalculation):
         else:
             self.completeOptimization()
 
+    @traced("calculation")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the GeoOpt Calculation without blocking the Event Loop
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+
+        # Single Optimization
+        if not self.fullOptimization:
+            await self.singleOptimizationAsync(coreBudget, progress)
+        else:
+            await self.completeOptimizationAsync(coreBudget, progress)
+
     def singleOptimization(self):
         """Runs a Single Optimization Attempt on the Molecule. If the Molecule has not Converged a warning will be sent to the Terminal
         
@@ -88,33 +133,78 @@ class GeoOpt(BaseOrcaCalculation):
 
         # Run the Calculation
         calculation = runOrcaCalculation(
-            self.name, self.inputFile, isLocal=self.isLocal, STDOut=False
+            self.name,
+            self.inputFile,
+            isLocal=self.isLocal,
+            STDOut=False,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
         )
 
-        # Get the Output File
-        outputFile = OrcaOutput(calculation.outputFilePath)
+        # Check the Results of the Optimization
+        self.finishSingleOptimization(calculation, startTime)
 
-        # Check if the Vibrational Frequencies Exist and/or is not empty
-        if outputFile.vibrationalFrequencies is None or (
-            isinstance(outputFile.vibrationalFrequencies, pd.DataFrame)
-            and outputFile.vibrationalFrequencies.empty
-        ):
-            print("No Frequencies Found! Optimization Failed!")
+    async def singleOptimizationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of singleOptimization
 
-        else:
-            # Check if the Molecule is Fully Optimized
-            if self.isOptimized(outputFile.vibrationalFrequencies["frequency"]):
-                self.calculationTime = time.time() - startTime
-                print(
-                    f"Molecule {self.name} is Optimized! ({self.clockTime(self.calculationTime)})"
-                )
-                self.calculation = calculation
-                self.optimizedMoleculePath = os.path.join(
-                    calculation.orcaCachePath, calculation.name + ".xyz"
-                )
-                self.optMolecule = Molecule(self.name, self.optimizedMoleculePath)
-            else:
-                print(f"Molecule {self.name} is not Optimized!")
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+
+        print(f"Running OPT on {self.name}...")
+
+        # Start the Timer
+        startTime = time.time()
+
+        # Run the Calculation
+        calculation = await runOrcaCalculationAsync(
+            self.name,
+            self.inputFile,
+            self.index,
+            isLocal=self.isLocal,
+            STDOut=False,
+            coreBudget=coreBudget,
+            progress=progress,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
+        )
+
+        # Check the Results of the Optimization
+        self.finishSingleOptimization(calculation, startTime)
+
+    def finishSingleOptimization(self, calculation: OrcaCalcResult, startTime: float):
+        """Checks the Result of a Single Optimization Attempt and prints the Finishing Statement
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Calculation \n
+            startTime : float - Time the Optimization Started
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        isOptimized = self.checkOptimization(calculation, startTime)
+
+        if isOptimized is None:
+            self.failOptimization(calculation.failure or FailureType.UNKNOWN, 1)
+
+        if isOptimized is False:
+            print(f"Molecule {self.name} is not Optimized!")
 
         # Stop Timer and Get Total time in Seconds
         calcTime = time.time() - startTime
@@ -133,13 +223,12 @@ class GeoOpt(BaseOrcaCalculation):
         # Start the Timer
         startTime = time.time()
 
-        # Set the Optimization Index, and Initialize the Optimization Flag
+        # Set the Optimization Index, and Initialize the Failures
         optIndex = 1
-        isOptimized = False
-        freqFailCount = 0
+        failures = []
 
         # Full Optimization Loop
-        while not isOptimized:
+        while True:
 
             # Start the Individual Iteration Timer
             iterStartTime = time.time()
@@ -147,63 +236,302 @@ class GeoOpt(BaseOrcaCalculation):
             # Generate Print Statement for User on the Optimization Attempt
             print(f"Running OPT {optIndex} on {self.name}...")
 
-            # Generate an Indexed Name for each Calculation
-            calcName = self.name if (optIndex == 1) else self.name + f"_{optIndex}"
-
             # Run the Calculation
             calculation = runOrcaCalculation(
-                calcName, self.inputFile, isLocal=self.isLocal, STDOut=False
+                self.getIterationName(optIndex),
+                self.inputFile,
+                isLocal=self.isLocal,
+                STDOut=False,
+                cachePath=self.getCachePath(),
+                scratch=self.scratch,
+                executor=self.executor,
+                timeout=self.timeout,
+                reuseResults=self.reuseResults,
             )
 
-            # Get the Output File
-            outputFile = OrcaOutput(calculation.outputFilePath)
+            # Check the Results and Prepare the Next Iteration
+            isDone = self.finishIteration(
+                calculation, optIndex, failures, startTime, iterStartTime
+            )
+
+            if isDone:
+                return
+
+            optIndex += 1
+
+    async def completeOptimizationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of completeOptimization
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value"""
+        # Start the Timer
+        startTime = time.time()
+
+        # Set the Optimization Index, and Initialize the Failures
+        optIndex = 1
+        failures = []
+
+        # Full Optimization Loop
+        while True:
+
+            # Start the Individual Iteration Timer
+            iterStartTime = time.time()
 
-            # Check if the Vibrational Frequencies Exist and/or is not empty
-            if outputFile.vibrationalFrequencies is None or (
-                isinstance(outputFile.vibrationalFrequencies, pd.DataFrame)
-                and outputFile.vibrationalFrequencies.empty
-            ):
-                print("No Frequencies Found! Optimization Failed!")
-                freqFailCount += 1
-                if freqFailCount >= 3:
-                    print(
-                        "Failed to Optimize Molecule after 3 Attempts! Aborting Optimization!"
-                    )
-                    return
-            else:
-                # Check if the Molecule is Fully Optimized
-                if self.isOptimized(outputFile.vibrationalFrequencies["frequency"]):
-                    self.calculationTime = time.time() - startTime
-                    print(
-                        f"Molecule {self.name} is Optimized! ({self.clockTime(self.calculationTime)})"
-                    )
-                    isOptimized = True
-                    self.calculation = calculation
-                    self.optimizedMoleculePath = os.path.join(
-                        calculation.orcaCachePath, calculation.name + ".xyz"
-                    )
-                    self.optMolecule = Molecule(self.name, self.optimizedMoleculePath)
-                    break
-
-            calcTime = time.time() - iterStartTime
-            print(
-                f"Finished OPT {optIndex} on {self.name} ({self.clockTime(calcTime)})"
+            # Generate Print Statement for User on the Optimization Attempt
+            print(f"Running OPT {optIndex} on {self.name}...")
+
+            # Run the Calculation
+            calculation = await runOrcaCalculationAsync(
+                self.getIterationName(optIndex),
+                self.inputFile,
+                self.index,
+                isLocal=self.isLocal,
+                STDOut=False,
+                coreBudget=coreBudget,
+                progress=progress,
+                cachePath=self.getCachePath(),
+                scratch=self.scratch,
+                executor=self.executor,
+                timeout=self.timeout,
+                reuseResults=self.reuseResults,
             )
 
-            # Update the Molecule and Optimization Template for the Next Iteration
-            self.optimizedMoleculePath = os.path.join(
-                calculation.orcaCachePath, calculation.name + ".xyz"
+            # Check the Results and Prepare the Next Iteration
+            isDone = self.finishIteration(
+                calculation, optIndex, failures, startTime, iterStartTime
             )
 
-            # Update the Molecule and Optimization Template for the Next Iteration
-            self.template = OrcaInputTemplate.BASICXYZPARALLEL
-            self.variables["xyz"] = Molecule(
-                self.name, self.optimizedMoleculePath
-            ).XYZBody()
+            if isDone:
+                return
+
             optIndex += 1
 
-            # Generate the Input File
-            self.inputFile = OrcaInputFile(self.template, **self.variables)
+    def getIterationName(self, optIndex: int) -> str:
+        """Generates an Indexed Name for each Optimization Iteration
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            optIndex : int - Index of the Optimization Iteration (Starts at 1)
+
+        ## Returns : \n
+            str - Name of the Iterations Calculation
+        """
+        return self.name if (optIndex == 1) else self.name + f"_{optIndex}"
+
+    def finishIteration(
+        self,
+        calculation: OrcaCalcResult,
+        optIndex: int,
+        failures: list[FailureType],
+        startTime: float,
+        iterStartTime: float,
+    ) -> bool:
+        """Checks the Result of an Optimization Iteration. If the Molecule isn't Optimized yet the Input File for the Next Iteration is Generated, if the Iteration Failed it is Retried as the Retry Policy Decides, otherwise the Optimization Fails with an Error
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Iterations Calculation \n
+            optIndex : int - Index of the Optimization Iteration \n
+            failures : list[FailureType] - Why each Iteration so far that had no Frequencies Failed, the Failure of this Iteration is Added \n
+            startTime : float - Time the Full Optimization Started \n
+            iterStartTime : float - Time the Iteration Started
+
+        ## Returns : \n
+            bool - True when the Optimization Loop should Stop
+        """
+        outputFile = OrcaOutput(calculation.outputFilePath)
+        isOptimized = self.checkOptimization(calculation, startTime, outputFile)
+
+        if isOptimized:
+            return True
+
+        if isOptimized is None:
+            failure = calculation.failure or FailureType.UNKNOWN
+            if not self.retryPolicy.shouldRetry(failure, failures):
+                self.failOptimization(failure, len(failures) + 1)
+
+            self.retryIteration(calculation, failure, failures, optIndex + 1)
+            return False
+
+        calcTime = time.time() - iterStartTime
+        print(f"Finished OPT {optIndex} on {self.name} ({self.clockTime(calcTime)})")
+
+        # Update the Molecule and Optimization Template for the Next Iteration
+        self.prepareNextIteration(calculation, outputFile, optIndex + 1)
+
+        return False
+
+    def failOptimization(self, failure: FailureType, attempts: int):
+        """Aborts the Optimization once an Iteration Failed and won't be Retried, the Error lets Workflows Mark the Step as Failed
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            failure : FailureType - Why the last Iteration Failed \n
+            attempts : int - Number of Iterations that Failed
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        self.failure = failure
+        print(f"Failed to Optimize Molecule ({failure.value}) after {attempts} Attempts! Aborting Optimization!")
+
+        raise RuntimeError(f"Optimization of {self.name} Failed ({failure.value}) after {attempts} Attempts")
+
+    def retryIteration(
+        self, calculation: OrcaCalcResult, failure: FailureType, failures: list[FailureType], nextIndex: int
+    ):
+        """Generates the Input File that Retries a Failed Iteration, the Retry Policy Changes the Input for the Failure (Ex. Slower SCF, more Memory)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Failed Iterations Calculation \n
+            failure : FailureType - Why the Iteration Failed \n
+            failures : list[FailureType] - Why each Earlier Iteration Failed, the Failure is Added \n
+            nextIndex : int - Index of the Next Optimization Iteration
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        attempt = failures.count(failure) + 1
+        failures.append(failure)
+        print(f"OPT on {self.name} Failed ({failure.value}), Retry {attempt} of {self.retryPolicy.maxRetries[failure]}")
+
+        self.inputFile = self.retryPolicy.createRetry(self.inputFile, calculation, failure, attempt)
+
+        # The Retry Reads the same Orbitals as the Failed Iteration, from its own Folder
+        orbitals = self.inputFile.variables.get("moinp")
+        if orbitals is not None and os.path.exists(os.path.join(calculation.orcaCachePath, orbitals)):
+            nextCachePath = os.path.join(
+                os.path.dirname(calculation.orcaCachePath), self.getIterationName(nextIndex)
+            )
+            os.makedirs(nextCachePath, exist_ok=True)
+            shutil.copyfile(os.path.join(calculation.orcaCachePath, orbitals), os.path.join(nextCachePath, orbitals))
+
+    def prepareNextIteration(
+        self, calculation: OrcaCalcResult, outputFile: OrcaOutput, nextIndex: int
+    ):
+        """Generates the Input File of the Next Optimization Iteration. The Geometry is pushed off the Saddle Point along the Imaginary Mode, the SCF starts from the Orbitals of the previous Iteration, and the Remedies Retries Applied are Kept
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Iterations Calculation \n
+            outputFile : OrcaOutput - The Parsed Output of the Completed Iteration \n
+            nextIndex : int - Index of the Next Optimization Iteration
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        self.optimizedMoleculePath = os.path.join(
+            calculation.orcaCachePath, calculation.name + ".xyz"
+        )
+
+        # Keep Orcas Atom Order so that the Normal Modes line up with the Atoms
+        with open(self.optimizedMoleculePath, "r") as file:
+            molecule = Molecule(self.name, XYZFile(file.readlines()))
+
+        # Restarting from the same Saddle Point converges back onto it, move along the most Imaginary Mode instead
+        if self.displacementStep > 0:
+            self.displaceAlongImaginaryMode(molecule, outputFile)
+
+        self.template = OrcaInputTemplate.BASICXYZPARALLEL
+        self.variables["xyz"] = molecule.XYZBody()
+
+        # Start the SCF from the previous Orbitals, they are Copied under their own Name since Orca can't read the Jobs own .gbw File
+        previousOrbitals = os.path.join(calculation.orcaCachePath, calculation.name + ".gbw")
+        if self.reuseOrbitals and os.path.exists(previousOrbitals):
+            nextCachePath = os.path.join(
+                os.path.dirname(calculation.orcaCachePath), self.getIterationName(nextIndex)
+            )
+            os.makedirs(nextCachePath, exist_ok=True)
+            shutil.copyfile(previousOrbitals, os.path.join(nextCachePath, calculation.name + ".gbw"))
+
+            self.template = OrcaInputTemplate.BASICXYZPARALLELMOREAD
+            self.variables["moinp"] = calculation.name + ".gbw"
+
+        # Generate the Input File, Remedies of Retried Iterations keep Applying (Ex. a SCF that only Converges Slowly)
+        self.inputFile = carryAmendments(self.inputFile, OrcaInputFile(self.template, **self.variables))
+
+    def displaceAlongImaginaryMode(self, molecule: Molecule, outputFile: OrcaOutput) -> bool:
+        """Displaces a Molecule along the Normal Mode of its most Imaginary (Negative) Frequency
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            molecule : Molecule - The Molecule to Displace, its Atoms must be in the same Order as in the Output File \n
+            outputFile : OrcaOutput - The Parsed Output of the Frequency Calculation on the Molecule
+
+        ## Returns : \n
+            bool - True if the Molecule was Displaced, False if there was no Imaginary Mode to Displace along
+        """
+        frequencies = outputFile.vibrationalFrequencies
+
+        if not isinstance(frequencies, pd.DataFrame) or frequencies.empty:
+            return False
+
+        lowest = frequencies.loc[frequencies["frequency"].idxmin()]
+        if lowest["frequency"] >= 0:
+            return False
+
+        normalModes = outputFile.getNormalModes()
+        mode = int(lowest["mode"])
+
+        if normalModes.shape[0] != 3 * molecule.atomCount or mode >= normalModes.shape[1]:
+            return False
+
+        print(f"Displacing {self.name} along Imaginary Mode {mode} ({lowest['frequency']} cm**-1)")
+        molecule.displaceAtoms(normalModes[:, mode], self.displacementStep)
+
+        return True
+
+    @traced("calculation")
+    def checkOptimization(
+        self, calculation: OrcaCalcResult, startTime: float, outputFile: OrcaOutput = None
+    ) -> bool | None:
+        """Checks the Vibrational Frequencies of a Completed Calculation. If the Molecule is Optimized the Resulting Molecule and its Path are Saved
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Calculation \n
+            startTime : float - Time the Optimization Started \n
+            outputFile : OrcaOutput - The Parsed Output of the Calculation (None = Parses the Calculations Output File)
+
+        ## Returns : \n
+            bool | None - True if Optimized, False if not Optimized, None if no Frequencies were Found
+        """
+        # Get the Output File
+        if outputFile is None:
+            outputFile = OrcaOutput(calculation.outputFilePath)
+
+        # Check if the Vibrational Frequencies Exist and/or is not empty
+        if outputFile.vibrationalFrequencies is None or (
+            isinstance(outputFile.vibrationalFrequencies, pd.DataFrame)
+            and outputFile.vibrationalFrequencies.empty
+        ):
+            print("No Frequencies Found! Optimization Failed!")
+            return None
+
+        # Check if the Molecule is Fully Optimized
+        if not self.isOptimized(outputFile.vibrationalFrequencies["frequency"]):
+            return False
+
+        self.calculationTime = time.time() - startTime
+        print(
+            f"Molecule {self.name} is Optimized! ({self.clockTime(self.calculationTime)})"
+        )
+        self.calculation = calculation
+        self.optimizedMoleculePath = os.path.join(
+            calculation.orcaCachePath, calculation.name + ".xyz"
+        )
+        self.optMolecule = Molecule(self.name, self.optimizedMoleculePath)
+        return True
 
     def isOptimized(self, frequencies: list[float]):
         """Checks if the Molecule has been Optimized using the Vibrational Frequencies. Returns a boolean indicating if Optimized (Fully Optimized = All Frequencies > 0)
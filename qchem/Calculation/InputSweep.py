@@ -0,0 +1,232 @@
+import os
+import re
+import itertools
+from enum import Enum
+from typing import Any
+from .OrcaInputFile import OrcaInputFile, compileTemplate
+from ..Molecule import Molecule
+from ..Data.Enums import OrcaInputTemplate
+
+WRITEBUFFERSIZE = 1 << 16
+"""Bytes Buffered before each Input File is Written, Inputs are Written in a single Call"""
+
+
+class InputSweep:
+    """Builds the Input Files of every Combination of Molecules, Calculation Types, Basis Sets and Functionals in Bulk. The XYZ Body of each Molecule is Formatted once and Shared by all its Inputs and the Template is Compiled once, so each Input only costs Filling the Template instead of a Calculation Object. The Inputs are ready to hand to a ClusterCalculation
+
+    ## Example:
+
+    sweep = InputSweep([ethane, "propane.xyz"], ["OPT", "FREQ"], ["DEF2-SVP", "DEF2-TZVP"], ["B3LYP", "PBE"], cores=4)
+    cluster = ClusterCalculation(sweep.createInputs(), maxCores=64)
+    """
+
+    molecules: list[Molecule | str]
+    """Molecule Objects or Paths to XYZ Files of the Molecules"""
+
+    moleculeNames: list[str]
+    """Name of each Molecule (Name of the Molecule Object or XYZ File)"""
+
+    XYZBodies: list[str]
+    """Body of the XYZ File of each Molecule, Shared by all its Inputs"""
+
+    calculations: list[str]
+    """Calculation Keywords to Run on each Molecule (None = Set by the Template)"""
+
+    basisSets: list[str]
+    """Basis Sets to Run each Calculation with (None = Set by the Template)"""
+
+    functionals: list[str]
+    """Density Functionals to Run each Calculation with (None = Set by the Template)"""
+
+    template: str | OrcaInputTemplate
+    """Template Filled for every Input (&{xyz} = XYZ Body, &{xyzfile} = Path of XYZ Files)"""
+
+    cores: int
+    """Number of Cores of each Calculation"""
+
+    variables: dict[str, Any]
+    """Additional Variables Filled in every Input"""
+
+    def __init__(
+        self,
+        molecules: list[Molecule | str],
+        calculations: list[str] = None,
+        basisSets: list[str] = None,
+        functionals: list[str] = None,
+        template: str | OrcaInputTemplate = None,
+        cores: int = 1,
+        **variables,
+    ):
+        if not isinstance(molecules, list) or len(molecules) == 0:
+            raise ValueError("Molecules must be a non empty list")
+
+        if not all(isinstance(molecule, (str, Molecule)) for molecule in molecules):
+            raise ValueError("Molecules must be Molecule Objects or Paths to XYZ Files")
+
+        if not isinstance(cores, int) or cores < 1:
+            raise ValueError("Cores must be a positive integer")
+
+        self.molecules = molecules
+        self.calculations = getValues(calculations, "Calculations")
+        self.basisSets = getValues(basisSets, "Basis Sets")
+        self.functionals = getValues(functionals, "Functionals")
+        self.cores = cores
+        self.variables = variables
+
+        # Same Defaults as the Calculations for Molecules Pasted into the Input
+        if template is None:
+            template = OrcaInputTemplate.BASICXYZ if cores == 1 else OrcaInputTemplate.BASICXYZPARALLEL
+        self.template = template
+
+        self.moleculeNames = []
+        self.XYZBodies = []
+        for molecule in molecules:
+            if isinstance(molecule, Molecule):
+                self.moleculeNames.append(molecule.name)
+                self.XYZBodies.append(molecule.XYZBody())
+            else:
+                self.moleculeNames.append(os.path.splitext(os.path.basename(molecule))[0])
+                self.XYZBodies.append(readXYZBody(molecule))
+
+    def __len__(self) -> int:
+        return len(self.molecules) * len(self.calculations) * len(self.basisSets) * len(self.functionals)
+
+    def getCombinations(self) -> list[dict[str, Any]]:
+        """Gives the Molecule and Level of Theory of each Input, in the Order the Inputs are Created (Molecules, then Calculations, Basis Sets and Functionals)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[dict[str, Any]] - Name, Molecule Index, Molecule Name, Calculation, Basis and Functional of each Input
+        """
+        return [
+            {
+                "name": getInputName(self.moleculeNames[index], calculation, basis, functional),
+                "moleculeIndex": index,
+                "molecule": self.moleculeNames[index],
+                "calculation": calculation,
+                "basis": basis,
+                "functional": functional,
+            }
+            for index, calculation, basis, functional in itertools.product(
+                range(len(self.molecules)), self.calculations, self.basisSets, self.functionals
+            )
+        ]
+
+    def getVariables(self, combination: dict[str, Any]) -> dict[str, Any]:
+        """Gives the Variables Filled in the Input of a Combination
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            combination : dict[str, Any] - The Combination (See getCombinations)
+
+        ## Returns : \n
+            dict[str, Any] - Variables of the Input
+        """
+        molecule = self.molecules[combination["moleculeIndex"]]
+        variables = {
+            "calculation": combination["calculation"],
+            "basis": combination["basis"],
+            "functional": combination["functional"],
+            "cores": self.cores,
+            "xyz": self.XYZBodies[combination["moleculeIndex"]],
+            "xyzfile": os.path.abspath(molecule) if isinstance(molecule, str) else None,
+            **self.variables,
+        }
+
+        return {key: value for key, value in variables.items() if value is not None}
+
+    def createInputs(self) -> list[OrcaInputFile]:
+        """Creates the Input File of every Combination
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[OrcaInputFile] - The Input Files, in Combination Order
+        """
+        return [OrcaInputFile(self.template, **self.getVariables(combination)) for combination in self.getCombinations()]
+
+    def saveInputs(self, folder: str) -> list[str]:
+        """Writes the Input File of every Combination to a Folder, named after the Combination, without Creating the Input File Objects
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            folder : str - Folder to Write the Inputs to
+
+        ## Returns : \n
+            list[str] - Paths of the Written Input Files, in Combination Order
+        """
+        os.makedirs(folder, exist_ok=True)
+        template = compileTemplate(self.template)
+
+        paths = []
+        for combination in self.getCombinations():
+            path = os.path.join(folder, f"{combination['name']}.inp")
+            with open(path, "w", buffering=WRITEBUFFERSIZE) as file:
+                file.write(template.render(self.getVariables(combination)))
+            paths.append(path)
+
+        return paths
+
+    def getMissingVariables(self) -> list[str]:
+        """Gives the Placeholders of the Template that the Sweep doesn't Fill
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[str] - Names of the Placeholders without a Value, Sorted
+        """
+        return compileTemplate(self.template).getMissing(self.getVariables(self.getCombinations()[0]))
+
+
+def getValues(values: list, label: str) -> list:
+    """Checks the Values of an Axis of the Sweep, Enums are Replaced by their Keyword
+
+    ## Parameters : \n
+        values : list - Values of the Axis (None = Left to the Template) \n
+        label : str - Name of the Axis for Error Messages
+
+    ## Returns : \n
+        list - The Keyword of each Value
+    """
+    if values is None:
+        return [None]
+
+    if not isinstance(values, list) or len(values) == 0:
+        raise ValueError(f"{label} must be a non empty list")
+
+    return [value.value if isinstance(value, Enum) else value for value in values]
+
+
+def getInputName(molecule: str, calculation: str, basis: str, functional: str) -> str:
+    """Gives the File Name of an Input of the Sweep, its Molecule and Level of Theory
+
+    ## Parameters : \n
+        molecule : str - Name of the Molecule \n
+        calculation : str - Calculation Keyword \n
+        basis : str - Basis Set \n
+        functional : str - Density Functional
+
+    ## Returns : \n
+        str - The Name (Ex. Ethane_OPT_FREQ_DEF2-SVP_B3LYP)
+    """
+    parts = [part for part in (molecule, calculation, basis, functional) if part is not None]
+    return re.sub(r"[^\w.+-]", "_", "_".join(str(part) for part in parts))
+
+
+def readXYZBody(filePath: str) -> str:
+    """Reads the Coordinates of an XYZ File, without the Atom Count and Comment Lines
+
+    ## Parameters : \n
+        filePath : str - Path to the XYZ File
+
+    ## Returns : \n
+        str - One Line per Atom
+    """
+    with open(filePath, "r") as file:
+        lines = file.read().splitlines()
+
+    return "\n".join(line.strip() for line in lines[2:] if line.strip())
@@ -0,0 +1,159 @@
+import time
+import pandas as pd
+from typing import Callable
+from qchem.Molecule import Molecule
+from qchem.Parser import OrcaOutput
+from .CoreBudget import CoreBudget
+from .BaseOrcaCalculation import BaseOrcaCalculation
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, runOrcaCalculationAsync, OrcaCalcResult
+from qchem.Data.Enums import OrcaCalculationType, OrcaInputTemplate, CalculationStatus
+from qchem.Instrumentation import traced
+
+
+class NMR(BaseOrcaCalculation):
+    """Performs a NMR Calculation on a Molecule. Will Expose the Nuclear Magnetic Shielding of every Atom"""
+
+    #
+    # Need to be Set
+    #
+    calculationType: str = OrcaCalculationType.NMR.value
+    """The Keyword for the Calculation to run on the Molecule (For Pipelines replace with name)"""
+
+    chemicalShifts: pd.DataFrame
+    """The resulting Isotropic and Anisotropic Shielding (ppm) of every Atom of the Molecule"""
+
+    energy: float
+    """The resulting Single Point Energy of the Molecule in Hartree"""
+
+    def __init__(
+        self,
+        molecule: str | Molecule,
+        template: str | OrcaInputTemplate = "",
+        index: int = 1,
+        cores: int = 1,
+        isLocal: bool = False,
+        name: str = "Molecule",
+        stdout: bool = True,
+        **variables,
+    ):
+        # Make a Super Call (Use the Base Class Init for some Boilerplate Setup)
+        super().__init__(
+            name, molecule, template, index, cores, isLocal, stdout, **variables
+        )
+
+        # Check if the Calculation has a Basis Set and a Functional Defined (Specific to Certain Calculations)
+        self.basisSetFunctionalCompliant()
+
+    @traced("calculation")
+    def runCalculation(self):
+        """Runs the NMR Calculation and Saves the Shielding of every Atom
+        
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+            
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Clock
+        startTime = time.time()
+
+        # Add a Print Statement to say we are running
+        print(f"Running NMR on {self.name}...")
+
+        # Run the Orca Calculation
+        calculation = runOrcaCalculation(
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
+        )
+
+        # Get the Calculation Time
+        self.calculationTime = time.time() - startTime
+
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Shieldings from the Output File
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the NMR Completion
+        print(f"Finished NMR on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the NMR Calculation without blocking the Event Loop
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Clock
+        startTime = time.time()
+
+        # Add a Print Statement to say we are running
+        print(f"Running NMR on {self.name}...")
+
+        # Run the Orca Calculation
+        calculation = await runOrcaCalculationAsync(
+            self.name,
+            self.inputFile,
+            self.index,
+            self.isLocal,
+            STDOut=False,
+            coreBudget=coreBudget,
+            progress=progress,
+            cachePath=self.getCachePath(),
+            scratch=self.scratch,
+            executor=self.executor,
+            timeout=self.timeout,
+            reuseResults=self.reuseResults,
+        )
+
+        # Get the Calculation Time
+        self.calculationTime = time.time() - startTime
+
+        # A Failed Run has no Results to Load
+        self.checkCalculation(calculation)
+
+        # Load the Shieldings from the Output File
+        self.extractResults(calculation)
+
+        # Display a Print Statement for the NMR Completion
+        print(f"Finished NMR on {self.name}! ({self.clockTime(self.calculationTime)})")
+
+    @traced("calculation")
+    def extractResults(self, calculation: OrcaCalcResult):
+        """Saves the Calculations Paths and Extracts the Shielding of every Atom and the Energy from the Output File
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            calculation : OrcaCalcResult - Reference to the Completed Calculation
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Save the Output File Path
+        self.outputFilePath = calculation.outputFilePath
+        self.orcaCachePath = calculation.orcaCachePath
+
+        # Load the Output File
+        outputFile = OrcaOutput(calculation.outputFilePath)
+
+        # Extract the Shielding of every Atom and the Energy of the Molecule
+        self.chemicalShifts = outputFile.getChemicalShifts()
+        self.energy = outputFile.getFinalEnergy()
@@ -1,7 +1,33 @@
 import os
+import re
+import copy
+import signal
+import shutil
+import asyncio
 import subprocess
 import time
+from typing import Callable, TYPE_CHECKING
+from .CoreBudget import CoreBudget
+from .OrcaScratch import OrcaScratch, getFolderSize
 from .OrcaInputFile import OrcaInputFile
+from .ResultsDatabase import ResultsDatabase, getDefaultDatabase, getInputHash
+from .Failures import classifyFailure, TIMEOUTRETURNCODE
+from ..Compression import findCompressedFile
+from ..Data.Enums import CalculationStatus, FailureType
+from ..Instrumentation import traced, addAttributes
+
+if TYPE_CHECKING:
+    from .Executors import OrcaExecutor
+
+ORCAPATH = "/Orca/orca"
+"""Default Location of the Orca Executable on Unix based OS (Linux, Mac) and in the Docker Image"""
+
+DOCKERIMAGE = "mrdnalex/orca"
+"""Docker Image Calculations Run in when not Local"""
+
+inFlightCalculations: dict[tuple[int, str], asyncio.Future] = {}
+"""Future of each Calculation Running Asynchronously by Event Loop and Input Hash, Identical Calculations Await it (Result None if it Stopped without a Result)"""
+
 
 class OrcaCalcResult:
 
@@ -11,12 +37,37 @@ class OrcaCalcResult:
     orcaCachePath: str
     """Path to the Calculations Directory"""
 
+    index: int = None
+    """Position of the Calculation in the Queue it was Submitted to (Set by ClusterCalculation)"""
+
+    bytesWritten: int = None
+    """Total Size in Bytes of the Files the Calculation Wrote"""
+
+    bytesRetained: int = None
+    """Size in Bytes of the Calculations Directory once Scratch Files were Removed"""
+
+    calculationTime: float = None
+    """Wall Time of the Calculation in Seconds"""
+
+    returnCode: int = None
+    """Exit Status of the Orca Process (Docker Container when not Local)"""
+
+    deduplicated: bool = False
+    """True if an Identical Calculation was Running and this is its Result, the Files are those of that Calculation"""
+
+    failure: FailureType = None
+    """Why the Calculation Failed, Classified from its Return Code and Output (None if it Terminated Normally)"""
+
     def __init__(self, name, cachePath):
         self.name = name
         self.orcaCachePath = cachePath
-        self.outputFilePath = os.path.join(self.orcaCachePath, getOutputFileName(name))
+        # The Output File may have been Compressed after the Calculation
+        self.outputFilePath = findCompressedFile(
+            os.path.join(self.orcaCachePath, getOutputFileName(name))
+        )
 
 
+@traced("orca")
 def runOrcaCalculation(
     name: str,
     inputFile: OrcaInputFile,
@@ -24,8 +75,14 @@ def runOrcaCalculation(
     isLocal: bool = False,
     STDOut: bool = True,
     cachePath: str = os.path.join(os.getcwd(), "OrcaCache"),
+    scratch: OrcaScratch = None,
+    recordResults: bool = True,
+    database: ResultsDatabase = None,
+    executor: "OrcaExecutor" = None,
+    timeout: float = None,
+    reuseResults: bool = False,
 ):
-    """Default Function that is exposed and Used to Run a Calculation using Orca. Will Dispatch the Calculation Locally or through Docker based off the provided parameters
+    """Default Function that is exposed and Used to Run a Calculation using Orca. Will Dispatch the Calculation Locally, through Docker or to the Executor based off the provided parameters
 
     ## Parameters : \n
         name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
@@ -33,11 +90,23 @@ def runOrcaCalculation(
         index : int - Number to identify individual Docker Orca Calculations running in parallel \n
         isLocal : bool - Boolean flag to indicate if the calculation runs locally or in Docker (True = Local, False = Docker) \n
         STDOut : bool - Boolean flag to indicate if Standard Output logs should be printed \n
-        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        scratch : OrcaScratch - Settings for Running in a Scratch Folder and which Files to Keep (None = Run in the Cache Folder and Keep every File) \n
+        recordResults : bool - Boolean flag to indicate if the Calculation is Recorded to the Results Database \n
+        database : ResultsDatabase - Database the Calculation is Recorded to (None = The Default Database in OrcaCache) \n
+        executor : OrcaExecutor - Where Orca Runs (None = Locally or in Docker depending on isLocal) \n
+        timeout : float - Seconds the Calculation may Run before it is Killed and Fails with a Timeout (None = No Limit) \n
+        reuseResults : bool - Boolean flag to indicate if a Completed Identical Calculation in the Results Database is Reused instead of Running (Only when Recording Results)
 
     ## Returns : \n
-        None - No Return Value
+        OrcaCalcResult - Reference to the Completed Calculations Files
     """
+    # Another Process may have Completed the same Input already
+    if reuseResults and recordResults:
+        cached = findCachedResult(database or getDefaultDatabase(), inputFile)
+        if cached is not None:
+            addAttributes(cached=True)
+            return cached
 
     # The Cache Path for Storage
     orcaCachePath = os.path.join(cachePath, name)
@@ -55,11 +124,19 @@ def runOrcaCalculation(
     if STDOut:
         print(f"Running Calulation : {getInputFileName(name)}")
 
-    # Run the Calculation Locally or through a Docker Container
-    if isLocal:
-        result = runLocally(name, orcaCachePath)
-    else:
-        result = runDockerContainer(name, index, orcaCachePath)
+    # Folder Orca Runs in, Scratch Files never reach the Cache Folder
+    workPath = scratch.stage(name, orcaCachePath) if scratch is not None else orcaCachePath
+
+    # Run the Calculation Locally, through a Docker Container or on the Executor
+    try:
+        if executor is not None:
+            result = executor.run(name, index, workPath, inputFile.variables.get("cores", 1), timeout)
+        elif isLocal:
+            result = runLocally(name, workPath, timeout=timeout)
+        else:
+            result = runDockerContainer(name, index, workPath, timeout=timeout)
+    finally:
+        bytesWritten, bytesRetained = collectFiles(scratch, workPath, orcaCachePath)
 
     # Get the Total Calculation time
     calculationTime = time.time() - startTimer
@@ -74,15 +151,74 @@ def runOrcaCalculation(
             f"Calculation Complete ({clockTime(calculationTime)}) : {getInputFileName(name)}"
         )
 
-    return OrcaCalcResult(name, orcaCachePath)
+    calcResult = createCalcResult(
+        name, orcaCachePath, bytesWritten, bytesRetained, calculationTime, result.returncode
+    )
+    calcResult.failure = classifyFailure(calcResult.outputFilePath, result.returncode, result.stderr)
+
+    addAttributes(cores=inputFile.variables.get("cores", 1), returnCode=result.returncode, outputBytes=bytesRetained, failure=getattr(calcResult.failure, "value", None))
+
+    if recordResults:
+        (database or getDefaultDatabase()).record(calcResult, inputFile)
+
+    return calcResult
 
 
-def runLocally(name: str, cachePath: str):
+def collectFiles(scratch: OrcaScratch, workPath: str, orcaCachePath: str) -> tuple[int, int]:
+    """Brings the Kept Files of a Finished Calculation back to its Cache Folder and Measures the Disk Usage
+
+    ## Parameters : \n
+        scratch : OrcaScratch - The Scratch Settings of the Calculation (None = Every File is Kept in place) \n
+        workPath : str - The Folder the Calculation Ran in \n
+        orcaCachePath : str - The Calculations Cache Folder
+
+    ## Returns : \n
+        tuple[int, int] - Bytes Written by the Calculation and Bytes Retained in the Cache Folder
+    """
+    if scratch is None:
+        size = getFolderSize(orcaCachePath)
+        return size, size
+
+    return scratch.collect(workPath, orcaCachePath)
+
+
+def createCalcResult(
+    name: str,
+    orcaCachePath: str,
+    bytesWritten: int,
+    bytesRetained: int,
+    calculationTime: float = None,
+    returnCode: int = None,
+) -> OrcaCalcResult:
+    """Creates the Reference to a Completed Calculations Files
+
+    ## Parameters : \n
+        name : str - Name of the Calculation \n
+        orcaCachePath : str - The Calculations Cache Folder \n
+        bytesWritten : int - Bytes Written by the Calculation \n
+        bytesRetained : int - Bytes Retained in the Cache Folder \n
+        calculationTime : float - Wall Time of the Calculation in Seconds \n
+        returnCode : int - Exit Status of the Orca Process
+
+    ## Returns : \n
+        OrcaCalcResult - Reference to the Completed Calculations Files
+    """
+    result = OrcaCalcResult(name, orcaCachePath)
+    result.bytesWritten = bytesWritten
+    result.bytesRetained = bytesRetained
+    result.calculationTime = calculationTime
+    result.returnCode = returnCode
+    return result
+
+
+def runLocally(name: str, cachePath: str, orcaPath: str = None, timeout: float = None):
     """Runs the Orca Calculation using a Local Installation of Orca Quantum Computing Software, Requires Orca to be Installed with all Additional Dependencies
     
     ## Parameters : \n
         name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
-        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        orcaPath : str - Path to the Orca Executable (None = Found on the Path on Windows, /Orca/orca otherwise) \n
+        timeout : float - Seconds before Orca is Killed (None = No Limit)
         
     ## Returns : \n
         subprocess.CompletedProcess - Resulting Completed Subprocess Object of the Calculation Execution
@@ -92,7 +228,9 @@ def runLocally(name: str, cachePath: str):
     command = ""
 
     # Windows OS
-    if os.name == "nt":
+    if orcaPath is not None:
+        command = f'cd {"/d " if os.name == "nt" else ""}"{cachePath}" && "{orcaPath}" "{getInputFileName(name)}" > "{getOutputFileName(name)}"'
+    elif os.name == "nt":
         orcaPath = (
             subprocess.run("where orca", shell=True, text=True, capture_output=True)
             .stdout.strip(' \n"')
@@ -101,25 +239,27 @@ def runLocally(name: str, cachePath: str):
         command = f'cd /d {cachePath} && "{orcaPath}" "{getInputFileName(name)}" > "{getOutputFileName(name)}"'
     else:
         # Unix based OS (Linux, Mac)
-        command = f'cd "{cachePath}" && /Orca/orca {getInputFileName(name)} > {getOutputFileName(name)}'
+        command = f'cd "{cachePath}" && {ORCAPATH} {getInputFileName(name)} > {getOutputFileName(name)}'
 
     # Run the Orca Calculation locally
-    return subprocess.run(command, shell=True, text=True, capture_output=True)
+    return runShellCommand(command, timeout)
 
 
-def runDockerContainer(name: str, index: int, cachePath: str):
+def runDockerContainer(name: str, index: int, cachePath: str, image: str = DOCKERIMAGE, timeout: float = None):
     """Runs the Orca Calculation using a Docker Container, Requires Docker to be Installed. If the Image is not Downloaded, it will automatically be Downloaded before the Calculation Starts
     
     ## Parameters : \n
         name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
         index : int - Number to identify individual Docker Orca Calculations running in parallel \n
-        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        image : str - Docker Image with Orca Installed at /Orca/orca \n
+        timeout : float - Seconds before the Container is Killed (None = No Limit)
     
     ## Returns : \n
         subprocess.CompletedProcess - Resulting Completed Subprocess Object of the Calculation Execution
     """
     # Create the Command String
-    command = f'docker run --name qchemorca{index} -v "{cachePath}":/home/orca mrdnalex/orca sh -c "cd /home/orca && /Orca/orca {getInputFileName(name)} > {getOutputFileName(name)}"'
+    command = f'docker run --name qchemorca{index} -v "{cachePath}":/home/orca {image} sh -c "cd /home/orca && {ORCAPATH} {getInputFileName(name)} > {getOutputFileName(name)}"'
 
     # Kill and Remove qchemorca container if it doesn't exist yet
     subprocess.run(
@@ -136,25 +276,491 @@ def runDockerContainer(name: str, index: int, cachePath: str):
     )
 
     # Run the Calculation in a Container and wait
-    result = subprocess.run(command, shell=True, text=True, capture_output=True)
+    try:
+        return runShellCommand(command, timeout)
+    finally:
+        # Kill and Remove the Container (Also Stops it after a Timeout)
+        subprocess.run(
+            f"docker kill qchemorca{index}",
+            shell=True,
+            stderr=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        subprocess.run(
+            f"docker rm qchemorca{index}",
+            shell=True,
+            stderr=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
 
-    # Kill and Remove the Container
-    subprocess.run(
-        f"docker kill qchemorca{index}",
+
+def runShellCommand(command: str, timeout: float = None) -> subprocess.CompletedProcess:
+    """Runs a Shell Command and waits for it to Finish. After the Timeout the Shell and every Process it Started are Killed, and the Command Fails with the Timeout Return Code
+
+    ## Parameters : \n
+        command : str - The Shell Command \n
+        timeout : float - Seconds before the Command is Killed (None = No Limit)
+
+    ## Returns : \n
+        subprocess.CompletedProcess - Resulting Completed Subprocess Object of the Command
+    """
+    if timeout is None:
+        return subprocess.run(command, shell=True, text=True, capture_output=True)
+
+    # Its own Process Group, so that Orca and its MPI Workers are Killed with the Shell
+    process = subprocess.Popen(
+        command,
         shell=True,
-        stderr=subprocess.DEVNULL,
-        stdout=subprocess.DEVNULL,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=os.name != "nt",
     )
-    subprocess.run(
-        f"docker rm qchemorca{index}",
-        shell=True,
-        stderr=subprocess.DEVNULL,
-        stdout=subprocess.DEVNULL,
+
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+    except subprocess.TimeoutExpired:
+        try:
+            if os.name == "nt":
+                subprocess.run(
+                    f"taskkill /F /T /PID {process.pid}",
+                    shell=True,
+                    stderr=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                )
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+        stdout, stderr = process.communicate()
+        return subprocess.CompletedProcess(command, TIMEOUTRETURNCODE, stdout, stderr + getTimeoutMessage(timeout))
+
+
+@traced("orca")
+async def runOrcaCalculationAsync(
+    name: str,
+    inputFile: OrcaInputFile,
+    index: int = 1,
+    isLocal: bool = False,
+    STDOut: bool = True,
+    cachePath: str = os.path.join(os.getcwd(), "OrcaCache"),
+    coreBudget: CoreBudget = None,
+    progress: Callable[[str, CalculationStatus], None] = None,
+    scratch: OrcaScratch = None,
+    recordResults: bool = True,
+    database: ResultsDatabase = None,
+    deduplicate: bool = True,
+    executor: "OrcaExecutor" = None,
+    timeout: float = None,
+    reuseResults: bool = False,
+):
+    """Async counterpart of runOrcaCalculation. Waits for Cores from the Core Budget, then runs Orca as a Subprocess without blocking the Event Loop. Cancelling the Task kills the entire Orca Process Tree. While an Identical Input (Ignoring the Cores) is Running in the Event Loop, the Calculation Waits for its Result instead of Running Orca again. With reuseResults an Identical Input that Completed in any Process and was Recorded to the Results Database gives its Result without Running
+
+    ## Parameters : \n
+        name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
+        inputFile : OrcaInputFile - Input file describing the information for the Orca Calculation to run \n
+        index : int - Number to identify individual Docker Orca Calculations running in parallel \n
+        isLocal : bool - Boolean flag to indicate if the calculation runs locally or in Docker (True = Local, False = Docker) \n
+        STDOut : bool - Boolean flag to indicate if Standard Output logs should be printed \n
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+        progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status \n
+        scratch : OrcaScratch - Settings for Running in a Scratch Folder and which Files to Keep (None = Run in the Cache Folder and Keep every File) \n
+        recordResults : bool - Boolean flag to indicate if the Calculation is Recorded to the Results Database \n
+        database : ResultsDatabase - Database the Calculation is Recorded to (None = The Default Database in OrcaCache) \n
+        deduplicate : bool - Boolean flag to indicate if the Calculation Attaches to an Identical Running Calculation \n
+        executor : OrcaExecutor - Where Orca Runs (None = Locally or in Docker depending on isLocal) \n
+        timeout : float - Seconds the Calculation may Run before it is Killed and Fails with a Timeout (None = No Limit) \n
+        reuseResults : bool - Boolean flag to indicate if a Completed Identical Calculation in the Results Database is Reused instead of Running (Only when Recording Results)
+
+    ## Returns : \n
+        OrcaCalcResult - Reference to the Completed Calculations Files
+    """
+    arguments = (name, inputFile, index, isLocal, STDOut, cachePath, coreBudget, progress, scratch, recordResults, database, executor, timeout)
+    if not deduplicate:
+        return await executeOrcaCalculationAsync(*arguments)
+
+    key = (id(asyncio.get_running_loop()), getInputHash(inputFile))
+
+    # Wait on the Identical Calculation, if it Stops without a Result (Cancelled / Error) this one Runs instead
+    while key in inFlightCalculations:
+        reportProgress(progress, name, CalculationStatus.QUEUED)
+        result = await asyncio.shield(inFlightCalculations[key])
+        if result is not None:
+            addAttributes(deduplicated=True)
+            reportProgress(progress, name, CalculationStatus.COMPLETED if result.returnCode == 0 else CalculationStatus.FAILED)
+            duplicate = copy.copy(result)
+            duplicate.deduplicated = True
+            return duplicate
+
+    future = asyncio.get_running_loop().create_future()
+    inFlightCalculations[key] = future
+    result = None
+
+    try:
+        # Another Process may have Completed the same Input already
+        if reuseResults and recordResults:
+            result = await asyncio.to_thread(findCachedResult, database or getDefaultDatabase(), inputFile)
+            if result is not None:
+                addAttributes(cached=True)
+                reportProgress(progress, name, CalculationStatus.COMPLETED)
+                return result
+
+        result = await executeOrcaCalculationAsync(*arguments)
+        return result
+    finally:
+        del inFlightCalculations[key]
+        future.set_result(result)
+
+
+async def executeOrcaCalculationAsync(
+    name: str,
+    inputFile: OrcaInputFile,
+    index: int,
+    isLocal: bool,
+    STDOut: bool,
+    cachePath: str,
+    coreBudget: CoreBudget,
+    progress: Callable[[str, CalculationStatus], None],
+    scratch: OrcaScratch,
+    recordResults: bool,
+    database: ResultsDatabase,
+    executor: "OrcaExecutor" = None,
+    timeout: float = None,
+):
+    """Runs an Orca Calculation as a Subprocess once Cores are Available, the Work of runOrcaCalculationAsync without the Deduplication
+
+    ## Parameters : \n
+        name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
+        inputFile : OrcaInputFile - Input file describing the information for the Orca Calculation to run \n
+        index : int - Number to identify individual Docker Orca Calculations running in parallel \n
+        isLocal : bool - Boolean flag to indicate if the calculation runs locally or in Docker (True = Local, False = Docker) \n
+        STDOut : bool - Boolean flag to indicate if Standard Output logs should be printed \n
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = No Limit) \n
+        progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as the Calculation changes Status \n
+        scratch : OrcaScratch - Settings for Running in a Scratch Folder and which Files to Keep (None = Run in the Cache Folder and Keep every File) \n
+        recordResults : bool - Boolean flag to indicate if the Calculation is Recorded to the Results Database \n
+        database : ResultsDatabase - Database the Calculation is Recorded to (None = The Default Database in OrcaCache) \n
+        executor : OrcaExecutor - Where Orca Runs (None = Locally or in Docker depending on isLocal) \n
+        timeout : float - Seconds the Calculation may Run before it is Killed and Fails with a Timeout (None = No Limit)
+
+    ## Returns : \n
+        OrcaCalcResult - Reference to the Completed Calculations Files
+    """
+    # The Cache Path for Storage
+    orcaCachePath = os.path.join(cachePath, name)
+
+    # Make Cache Folder if it doesn't Exist
+    os.makedirs(orcaCachePath, exist_ok=True)
+
+    # Save the Input File to the folder
+    inputFile.saveInputFile(os.path.join(orcaCachePath, getInputFileName(name)))
+
+    cores = int(inputFile.variables.get("cores", 1))
+
+    reportProgress(progress, name, CalculationStatus.QUEUED)
+
+    # Wait for Cores to be Available
+    queueStart = time.time()
+    if coreBudget is not None:
+        await coreBudget.acquire(cores)
+    addAttributes(queueWait=time.time() - queueStart)
+
+    try:
+        # Get the Start Time of the Calculation
+        startTimer = time.time()
+
+        if STDOut:
+            print(f"Running Calulation : {getInputFileName(name)}")
+
+        reportProgress(progress, name, CalculationStatus.RUNNING)
+
+        # Folder Orca Runs in, Scratch Files never reach the Cache Folder
+        workPath = scratch.stage(name, orcaCachePath) if scratch is not None else orcaCachePath
+
+        # Run the Calculation Locally, through a Docker Container or on the Executor
+        try:
+            if executor is not None:
+                returnCode, stderr = await executor.runAsync(name, index, workPath, cores, timeout)
+            elif isLocal:
+                returnCode, stderr = await runWithTimeout(runLocallyAsync(name, workPath), timeout)
+            else:
+                returnCode, stderr = await runWithTimeout(runDockerContainerAsync(name, index, workPath), timeout)
+        except asyncio.CancelledError:
+            reportProgress(progress, name, CalculationStatus.CANCELLED)
+            raise
+        finally:
+            bytesWritten, bytesRetained = collectFiles(scratch, workPath, orcaCachePath)
+
+        # Get the Total Calculation time
+        calculationTime = time.time() - startTimer
+    finally:
+        if coreBudget is not None:
+            coreBudget.release(cores)
+
+    # Post a message that an Error may have Occured
+    if len(stderr) > 0:
+        print(f"WARNING Errors Maybe Occured : \n\n{stderr}")
+
+    # If Standard Output Allowed post the Completion Message
+    if STDOut:
+        print(
+            f"Calculation Complete ({clockTime(calculationTime)}) : {getInputFileName(name)}"
+        )
+
+    if returnCode != 0 or len(stderr) > 0:
+        reportProgress(progress, name, CalculationStatus.FAILED)
+    else:
+        reportProgress(progress, name, CalculationStatus.COMPLETED)
+
+    calcResult = createCalcResult(
+        name, orcaCachePath, bytesWritten, bytesRetained, calculationTime, returnCode
     )
+    calcResult.failure = await asyncio.to_thread(classifyFailure, calcResult.outputFilePath, returnCode, stderr)
+
+    addAttributes(cores=cores, returnCode=returnCode, outputBytes=bytesRetained, failure=getattr(calcResult.failure, "value", None))
 
+    # Recording Parses the Output File, kept off the Event Loop
+    if recordResults:
+        await asyncio.to_thread((database or getDefaultDatabase()).record, calcResult, inputFile)
+
+    return calcResult
+
+
+def findCachedResult(database: ResultsDatabase, inputFile: OrcaInputFile) -> OrcaCalcResult:
+    """Finds the Result of a Completed Calculation of the same Input (Ignoring the Cores) Recorded to the Database, whose Output File still Exists
+
+    ## Parameters : \n
+        database : ResultsDatabase - The Results Database \n
+        inputFile : OrcaInputFile - Input File to Look for
+
+    ## Returns : \n
+        OrcaCalcResult - Reference to the Files of the Recorded Calculation, Marked Deduplicated (None if it never Completed)
+    """
+    record = database.findCached(inputFile)
+    if record is None:
+        return None
+
+    result = createCalcResult(
+        record["name"],
+        record["orcaCachePath"],
+        record["bytesRetained"],
+        record["bytesRetained"],
+        record["wallTime"],
+        record["exitStatus"],
+    )
+    result.deduplicated = True
     return result
 
 
+def reportProgress(
+    progress: Callable[[str, CalculationStatus], None],
+    name: str,
+    status: CalculationStatus,
+):
+    """Notifies the Progress Callback of a Status Change if a Callback was Provided
+
+    ## Parameters : \n
+        progress : Callable[[str, CalculationStatus], None] - The Progress Callback (Can be None) \n
+        name : str - Name of the Calculation \n
+        status : CalculationStatus - The new Status of the Calculation
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    if progress is not None:
+        progress(name, status)
+
+
+async def runWithTimeout(run, timeout: float = None) -> tuple[int, str]:
+    """Awaits an Async Run of Orca, Cancelling it after the Timeout (Which Kills its Process Tree) so that it Fails with the Timeout Return Code
+
+    ## Parameters : \n
+        run : Coroutine - The Run, Giving the Return Code and Standard Error \n
+        timeout : float - Seconds before the Run is Cancelled (None = No Limit)
+
+    ## Returns : \n
+        tuple[int, str] - Return Code of Orca and the Content of Standard Error
+    """
+    try:
+        return await asyncio.wait_for(run, timeout)
+    except asyncio.TimeoutError:
+        return TIMEOUTRETURNCODE, getTimeoutMessage(timeout)
+
+
+def getTimeoutMessage(timeout: float) -> str:
+    """Gives the Standard Error Line of a Calculation Killed at its Timeout
+
+    ## Parameters : \n
+        timeout : float - Seconds the Calculation could Run
+
+    ## Returns : \n
+        str - The Message
+    """
+    return f"Timed Out after {timeout:g} seconds, the Calculation was Killed\n"
+
+
+async def runLocallyAsync(name: str, cachePath: str, orcaPath: str = None):
+    """Async counterpart of runLocally. Runs Orca directly (No Shell) in its own Process Group so that it can be Killed with all its Child Processes
+
+    ## Parameters : \n
+        name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        orcaPath : str - Path to the Orca Executable (None = Found on the Path on Windows, /Orca/orca otherwise)
+
+    ## Returns : \n
+        tuple[int, str] - Return Code of Orca and the Content of Standard Error
+    """
+    # Windows OS finds Orca on the Path, Unix based OS (Linux, Mac) uses the Default Install Location
+    if orcaPath is None and os.name == "nt":
+        orcaPath = shutil.which("orca") or "orca"
+    elif orcaPath is None:
+        orcaPath = ORCAPATH
+
+    with open(os.path.join(cachePath, getOutputFileName(name)), "w") as outputFile:
+        return await runProcessAsync(
+            [orcaPath, getInputFileName(name)], cachePath, outputFile
+        )
+
+
+async def runDockerContainerAsync(name: str, index: int, cachePath: str, image: str = DOCKERIMAGE):
+    """Async counterpart of runDockerContainer. Container names include the Calculation name so that Calculations running at the same time never Kill each other's Containers
+
+    ## Parameters : \n
+        name : str - Name of the Calculation, used for the Name of the Directory and the Input and Output File \n
+        index : int - Number to identify individual Docker Orca Calculations running in parallel \n
+        cachePath : str - Path to the folder that stores temporary and resulting Calculation Files \n
+        image : str - Docker Image with Orca Installed at /Orca/orca
+
+    ## Returns : \n
+        tuple[int, str] - Return Code of the Container and the Content of Standard Error
+    """
+    containerName = getContainerName(name, index)
+
+    command = [
+        "docker",
+        "run",
+        "--name",
+        containerName,
+        "-v",
+        f"{cachePath}:/home/orca",
+        image,
+        "sh",
+        "-c",
+        f'cd /home/orca && {ORCAPATH} "{getInputFileName(name)}" > "{getOutputFileName(name)}"',
+    ]
+
+    # Remove a Leftover Container with the same Name
+    await removeDockerContainerAsync(containerName)
+
+    try:
+        return await runProcessAsync(command, cachePath, containerName=containerName)
+    finally:
+        await removeDockerContainerAsync(containerName)
+
+
+async def runProcessAsync(
+    command: list[str], cwd: str, stdout=None, containerName: str = None
+):
+    """Runs a Command as an Async Subprocess and waits for it to Finish. If the waiting Task is Cancelled the Process Tree (and the Docker Container) is Killed before the Cancellation propagates
+
+    ## Parameters : \n
+        command : list[str] - The Program and its Arguments \n
+        cwd : str - Directory the Command is run in \n
+        stdout : file - File Object Standard Output is written to (None = Discarded) \n
+        containerName : str - Name of the Docker Container started by the Command, if any
+
+    ## Returns : \n
+        tuple[int, str] - Return Code of the Process and the Content of Standard Error
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        stdout=stdout if stdout is not None else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=os.name != "nt",
+    )
+
+    try:
+        _, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        await killProcessTree(process, containerName)
+        raise
+
+    return process.returncode, stderr.decode(errors="replace")
+
+
+async def killProcessTree(process: asyncio.subprocess.Process, containerName: str = None):
+    """Kills a Process and every Process it Spawned (Orca launches MPI workers), along with its Docker Container
+
+    ## Parameters : \n
+        process : asyncio.subprocess.Process - The Process to Kill \n
+        containerName : str - Name of the Docker Container to Kill, if any
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    if containerName is not None:
+        await removeDockerContainerAsync(containerName)
+
+    if process.returncode is None:
+        try:
+            if os.name == "nt":
+                subprocess.run(
+                    f"taskkill /F /T /PID {process.pid}",
+                    shell=True,
+                    stderr=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                )
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    await process.wait()
+
+
+async def removeDockerContainerAsync(containerName: str):
+    """Kills and Removes a Docker Container, ignoring Errors if it doesn't Exist
+
+    ## Parameters : \n
+        containerName : str - Name of the Docker Container
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "rm",
+            "-f",
+            containerName,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        # Docker isn't Installed, so there is no Container to Remove
+        return
+
+    await process.wait()
+
+
+def getContainerName(name: str, index: int):
+    """Gives a Docker Container Name that is Unique to the Calculation
+
+    ## Parameters : \n
+        name : str - Name of the Calculation \n
+        index : int - Number to identify individual Docker Orca Calculations running in parallel
+
+    ## Returns : \n
+        str - Name of the Docker Container
+    """
+    return f"qchemorca{index}_" + re.sub(r"[^a-zA-Z0-9_.-]", "_", name)
+
+
 def clockTime(seconds):
     """Converts Calculation Time Seconds to Human Readable Clock Format
 
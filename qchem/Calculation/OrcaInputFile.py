@@ -1,6 +1,126 @@
+import os
+import re
+import functools
 from typing import Any
 from ..Data.Enums import OrcaInputTemplate
 
+PLACEHOLDER = re.compile(r"&\{(\w+)\}")
+"""Pattern of a Placeholder in a Template (Ex. &{basis})"""
+
+TEMPLATECACHESIZE = 256
+"""Number of Compiled Templates Kept (Template Strings and Template File Versions each)"""
+
+
+class CompiledTemplate:
+    """Template Parsed once into the Text between its Placeholders and the Placeholder Names, so Rendering is a single Join instead of a Replace over the whole Template per Variable. Placeholders without a Value are Rendered as they are
+
+    ## Example:
+
+    template = compileTemplate(OrcaInputTemplate.BASIC)
+    template.render({"calculation": "OPT", "basis": "DEF2-SVP", "functional": "B3LYP", "xyzfile": "ethane.xyz"})
+    """
+
+    text: str
+    """The Template with its Placeholders"""
+
+    segments: list[str]
+    """Text and Placeholder Names Alternating, Starting and Ending with Text (Ex. ["!", "basis", " PBE"])"""
+
+    placeholders: frozenset[str]
+    """Name of every Placeholder in the Template"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.segments = PLACEHOLDER.split(text)
+        self.placeholders = frozenset(self.segments[1::2])
+
+    def render(self, variables: dict[str, Any]) -> str:
+        """Fills the Placeholders with the Values of the Variables
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            variables : dict[str, Any] - Values of the Placeholders by Name
+
+        ## Returns : \n
+            str - The Filled Template
+        """
+        parts = self.segments.copy()
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = str(variables[name]) if name in variables else f"&{{{name}}}"
+
+        return "".join(parts)
+
+    def getMissing(self, variables: dict[str, Any]) -> list[str]:
+        """Gives the Placeholders that have no Value
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            variables : dict[str, Any] - Values of the Placeholders by Name
+
+        ## Returns : \n
+            list[str] - Names of the Placeholders left unfilled, Sorted
+        """
+        return sorted(self.placeholders.difference(variables))
+
+    def getUnused(self, variables: dict[str, Any]) -> list[str]:
+        """Gives the Variables that no Placeholder uses
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            variables : dict[str, Any] - Values of the Placeholders by Name
+
+        ## Returns : \n
+            list[str] - Names of the Variables not in the Template, Sorted
+        """
+        return sorted(set(variables).difference(self.placeholders))
+
+
+@functools.lru_cache(maxsize=TEMPLATECACHESIZE)
+def compileText(text: str) -> CompiledTemplate:
+    """Compiles a Template String, Cached so each Template is only Parsed once
+
+    ## Parameters : \n
+        text : str - The Template with its Placeholders
+
+    ## Returns : \n
+        CompiledTemplate - The Compiled Template
+    """
+    return CompiledTemplate(text)
+
+
+@functools.lru_cache(maxsize=TEMPLATECACHESIZE)
+def compileFile(filePath: str, modifiedTime: int) -> CompiledTemplate:
+    """Reads and Compiles a Template File, Cached by Path and Modification Time so an Edited File is Read again
+
+    ## Parameters : \n
+        filePath : str - Path to the Template File \n
+        modifiedTime : int - Modification Time of the File in Nanoseconds
+
+    ## Returns : \n
+        CompiledTemplate - The Compiled Template
+    """
+    with open(filePath, "r") as file:
+        return CompiledTemplate(file.read())
+
+
+def compileTemplate(template: str | OrcaInputTemplate) -> CompiledTemplate:
+    """Gives the Compiled Version of a Template, Parsing it only the first time (or once a Template File Changed)
+
+    ## Parameters : \n
+        template : str | OrcaInputTemplate - A Template, Path to a .inp Template File or the Template itself
+
+    ## Returns : \n
+        CompiledTemplate - The Compiled Template
+    """
+    if isinstance(template, OrcaInputTemplate):
+        return compileText(template.value)
+
+    if template[-4:] == ".inp":
+        return compileFile(template, os.stat(template).st_mtime_ns)
+
+    return compileText(template)
+
 
 class OrcaInputFile:
     """
@@ -52,18 +172,57 @@ class OrcaInputFile:
         ## Returns : \n
             str - The Input File as a Single String
         """
-        if isinstance(self.template, OrcaInputTemplate):
-            inputContent = self.template.value
-        elif self.template[-4:] == ".inp":
-            with open(self.template, "r") as file:
-                inputContent = file.read()
-        else:
-            inputContent = self.template
-
-        for key, value in self.variables.items():
-            placeholder = f"&{{{key}}}"
-            inputContent = inputContent.replace(placeholder, str(value))
-        return inputContent
+        return compileTemplate(self.template).render(self.variables)
+
+    def getTemplateContents(self) -> str:
+        """Gives the Contents of the Template, Reading it if it is a Template File
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            str - The Template with its Placeholders
+        """
+        return compileTemplate(self.template).text
+
+    def getMissingVariables(self) -> list[str]:
+        """Gives the Placeholders of the Template that no Variable Fills, they are left in the Input File as they are
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[str] - Names of the Placeholders without a Value, Sorted
+        """
+        return compileTemplate(self.template).getMissing(self.variables)
+
+    def getUnusedVariables(self) -> list[str]:
+        """Gives the Variables the Template has no Placeholder for
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[str] - Names of the Unused Variables, Sorted
+        """
+        return compileTemplate(self.template).getUnused(self.variables)
+
+    def setCores(self, cores: int) -> bool:
+        """Changes the Number of Cores of the Calculation and Generates the Input File again. Only Templates with a Cores Placeholder can Change
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Run on
+
+        ## Returns : \n
+            bool - True if the Cores were Changed, False if the Template has no Cores Placeholder
+        """
+        if "cores" not in compileTemplate(self.template).placeholders:
+            return False
+
+        self.variables["cores"] = cores
+        self.inputFileContents = self.generateInputFile()
+        return True
 
     def saveInputFile(self, filePath: str):
         """Saves the Generated Input files content to the specified path
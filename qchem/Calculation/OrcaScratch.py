@@ -0,0 +1,183 @@
+import os
+import shutil
+import fnmatch
+import tempfile
+from qchem.Compression import (
+    COMPRESSIONEXTENSIONS,
+    compressFile,
+    getUncompressedPath,
+    importZstandard,
+)
+
+
+class OrcaScratch:
+    """Settings for where Orca Runs and which of its Files are Kept. Orca can Run in a fast Scratch Folder (tmpfs, local SSD) with only the Whitelisted Files copied back to the OrcaCache, which can optionally be Compressed. Without a Scratch Path the OrcaCache Folder is Compacted in place after the Calculation
+
+    ## Example:
+
+    scratch = OrcaScratch("/dev/shm", keep=["*.out", "*.xyz"], compression="gzip")
+    runOrcaCalculation("Ethane", inputFile, scratch=scratch)
+    """
+
+    scratchPath: str
+    """Path to the Folder Calculations Run in (None = Run in the OrcaCache Folder)"""
+
+    keep: list[str]
+    """File Name Patterns (Ex. *.out) of the Files Kept once the Calculation Finishes, everything else (.tmp, .densities, ...) is Deleted"""
+
+    compression: str
+    """Compression applied to the Kept Files matching compress ("gzip", "zstd" or None = No Compression)"""
+
+    compress: list[str]
+    """File Name Patterns of the Kept Files that get Compressed"""
+
+    defaultKeep: list[str] = [
+        "*.inp",
+        "*.out",
+        "*.xyz",
+        "*.gbw",
+        "*.hess",
+        "*.property.txt",
+    ]
+    """Files Kept by Default. The .gbw is Kept so that Optimization Restarts can reuse the Orbitals"""
+
+    def __init__(
+        self,
+        scratchPath: str = None,
+        keep: list[str] = None,
+        compression: str = None,
+        compress: list[str] = None,
+    ):
+        if scratchPath is not None and not isinstance(scratchPath, str):
+            raise ValueError("Scratch Path must be a String")
+
+        if compression is not None and compression not in COMPRESSIONEXTENSIONS:
+            raise ValueError(
+                f"Compression must be one of {list(COMPRESSIONEXTENSIONS)} or None"
+            )
+
+        # Fail early rather than after the Calculation has Run
+        if compression == "zstd":
+            importZstandard()
+
+        self.scratchPath = scratchPath
+        self.keep = list(keep) if keep is not None else list(self.defaultKeep)
+        self.compression = compression
+        self.compress = list(compress) if compress is not None else ["*.out"]
+
+    def stage(self, name: str, orcaCachePath: str) -> str:
+        """Creates the Folder the Calculation Runs in and copies the Calculations Files (Input File, Orbital Guesses, ...) into it
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Calculation \n
+            orcaCachePath : str - The Calculations OrcaCache Folder
+
+        ## Returns : \n
+            str - Path to the Folder to Run the Calculation in
+        """
+        if self.scratchPath is None:
+            return orcaCachePath
+
+        os.makedirs(self.scratchPath, exist_ok=True)
+
+        # Unique Folder so that Calculations with the same Name never share Scratch
+        workPath = tempfile.mkdtemp(prefix=f"{name}_", dir=self.scratchPath)
+
+        for file in os.listdir(orcaCachePath):
+            filePath = os.path.join(orcaCachePath, file)
+            if os.path.isfile(filePath) and getUncompressedPath(file) == file:
+                shutil.copy2(filePath, os.path.join(workPath, file))
+
+        return workPath
+
+    def collect(self, workPath: str, orcaCachePath: str) -> tuple[int, int]:
+        """Copies the Kept Files back to the OrcaCache (Compressing them if Requested) and removes everything else
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            workPath : str - The Folder the Calculation Ran in \n
+            orcaCachePath : str - The Calculations OrcaCache Folder
+
+        ## Returns : \n
+            tuple[int, int] - Bytes Written by the Calculation and Bytes Retained in the OrcaCache
+        """
+        bytesWritten = getFolderSize(workPath)
+        inPlace = os.path.abspath(workPath) == os.path.abspath(orcaCachePath)
+
+        for file in os.listdir(workPath):
+            filePath = os.path.join(workPath, file)
+
+            # Leave Files Compressed by an earlier Calculation alone
+            if not os.path.isfile(filePath) or getUncompressedPath(file) != file:
+                continue
+
+            if not self.matches(file, self.keep):
+                if inPlace:
+                    os.remove(filePath)
+                continue
+
+            destinationPath = os.path.join(orcaCachePath, file)
+
+            if self.compression is not None and self.matches(file, self.compress):
+                compressFile(filePath, destinationPath, self.compression)
+                if os.path.exists(destinationPath):
+                    os.remove(destinationPath)
+            else:
+                if not inPlace:
+                    shutil.copy2(filePath, destinationPath)
+
+                # A Stale Compressed Copy would no longer match the new File
+                removeCompressedCopies(destinationPath)
+
+        if not inPlace:
+            shutil.rmtree(workPath, ignore_errors=True)
+
+        return bytesWritten, getFolderSize(orcaCachePath)
+
+    def matches(self, file: str, patterns: list[str]) -> bool:
+        """Checks if a File Name matches any of the Patterns
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            file : str - Name of the File \n
+            patterns : list[str] - File Name Patterns (Ex. *.out)
+
+        ## Returns : \n
+            bool - True if the File matches a Pattern
+        """
+        return any(fnmatch.fnmatch(file, pattern) for pattern in patterns)
+
+
+def removeCompressedCopies(filePath: str):
+    """Removes the Compressed Versions of a File
+
+    ## Parameters : \n
+        filePath : str - Path to the Uncompressed File
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    for extension in COMPRESSIONEXTENSIONS.values():
+        if os.path.exists(filePath + extension):
+            os.remove(filePath + extension)
+
+
+def getFolderSize(folderPath: str) -> int:
+    """Adds up the Size of every File in a Folder (and its Sub Folders)
+
+    ## Parameters : \n
+        folderPath : str - Path to the Folder
+
+    ## Returns : \n
+        int - Total Size in Bytes
+    """
+    size = 0
+
+    for root, _, files in os.walk(folderPath):
+        for file in files:
+            filePath = os.path.join(root, file)
+            if not os.path.islink(filePath):
+                size += os.path.getsize(filePath)
+
+    return size
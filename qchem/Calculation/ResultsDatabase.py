@@ -0,0 +1,487 @@
+import os
+import re
+import time
+import atexit
+import sqlite3
+import hashlib
+import threading
+import pandas as pd
+from .OrcaInputFile import OrcaInputFile
+from ..Parser import OrcaOutput
+from ..Data.Enums import OrcaInputTemplate, CalculationStatus
+from ..Data.Constants import AtomicNumberConstants
+
+REFERENCEPATTERN = re.compile(r'^[ \t]*\*[ \t]*xyzfile[ \t]+-?\d+[ \t]+\d+[ \t]+"?([^"\n]+?)"?[ \t]*$|^[ \t]*%moinp[ \t]+"([^"\n]+)"', re.I | re.M)
+"""Files an Input Reads (The XYZ File of the Molecule, the Orbitals of %moinp), their Contents are Part of its Hash"""
+
+RESULTCOLUMNS = {
+    "name": "TEXT",
+    "inputHash": "TEXT",
+    "formula": "TEXT",
+    "atomCount": "INTEGER",
+    "electronCount": "INTEGER",
+    "calculation": "TEXT",
+    "template": "TEXT",
+    "basis": "TEXT",
+    "functional": "TEXT",
+    "cores": "INTEGER",
+    "wallTime": "REAL",
+    "exitStatus": "INTEGER",
+    "status": "TEXT",
+    "failure": "TEXT",
+    "energy": "REAL",
+    "gibbsEnergy": "REAL",
+    "dipoleMagnitude": "REAL",
+    "calculationTypes": "TEXT",
+    "outputFilePath": "TEXT",
+    "orcaCachePath": "TEXT",
+    "bytesRetained": "INTEGER",
+    "finishedAt": "REAL",
+}
+"""Columns of the Calculations Table and their SQLite Types"""
+
+defaultDatabases: dict[str, "ResultsDatabase"] = {}
+"""Default Database of each Working Directory, Created on first use"""
+
+
+class ResultsDatabase:
+    """Local SQLite Store of every Calculation that Ran. Records the Input Hash, Molecule Formula, Level of Theory, Cores, Wall Time, Exit Status and the Key Parsed Values of each Calculation, Indexed for Lookups by Molecule and Level of Theory. Records are Buffered and Inserted in Batches, the Database uses WAL Mode so Readers never Block the Writer
+
+    ## Example:
+
+    database = ResultsDatabase("OrcaCache/Results.db")
+    runOrcaCalculation("Ethane", inputFile, database=database)
+    database.query(formula="C2H6", basis="DEF2-SVP")
+    """
+
+    path: str
+    """Path to the SQLite Database File"""
+
+    batchSize: int
+    """Number of Records Buffered before they are Inserted together"""
+
+    flushInterval: float
+    """Seconds after which Buffered Records are Inserted even if the Batch isn't Full"""
+
+    pending: list[tuple]
+    """Records waiting to be Inserted"""
+
+    def __init__(self, path: str = None, batchSize: int = 32, flushInterval: float = 5):
+        if not isinstance(batchSize, int) or batchSize < 1:
+            raise ValueError("Batch Size must be a positive integer")
+
+        self.path = path if path is not None else os.path.join(os.getcwd(), "OrcaCache", "Results.db")
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.pending = []
+        self.lastFlush = time.time()
+        self.lock = threading.Lock()
+        self.connection = None
+        self.processID = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connect()
+
+        # Buffered Records are Inserted when the Program Exits
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def __getstate__(self):
+        # Connections and Locks can't be sent to another Process, it Reconnects on its own
+        state = self.__dict__.copy()
+        state.update(connection=None, lock=None, processID=None, pending=[])
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        """Opens the Connection (Again in a Forked Process, Connections can't be Shared between Processes) and Creates the Table and Indices
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            sqlite3.Connection - The Open Connection
+        """
+        if self.connection is not None and self.processID == os.getpid():
+            return self.connection
+
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.processID = os.getpid()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        columns = ", ".join(f"{column} {sqlType}" for column, sqlType in RESULTCOLUMNS.items())
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS calculations (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})"
+            )
+
+            # Databases made by older Versions get the Columns added since
+            existing = {row[1] for row in self.connection.execute("PRAGMA table_info(calculations)")}
+            for column, sqlType in RESULTCOLUMNS.items():
+                if column not in existing:
+                    self.connection.execute(f"ALTER TABLE calculations ADD COLUMN {column} {sqlType}")
+
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS moleculeIndex ON calculations (formula, calculation, basis, functional)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS theoryIndex ON calculations (basis, functional, calculation)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS inputIndex ON calculations (inputHash)")
+
+        return self.connection
+
+    def record(self, result, inputFile: OrcaInputFile):
+        """Buffers the Record of a Finished Calculation, Inserting the Batch once it is Full or old enough
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            result : OrcaCalcResult - Reference to the Completed Calculation \n
+            inputFile : OrcaInputFile - Input File the Calculation Ran
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        formula, atomCount = getInputFormula(inputFile)
+        values = {
+            "name": result.name,
+            # The Hash from before the Calculation Ran, the Files it Read may have Changed since
+            "inputHash": getattr(inputFile, "inputHash", None) or getInputHash(inputFile),
+            "formula": formula,
+            "atomCount": atomCount,
+            "electronCount": getInputElectrons(inputFile),
+            "calculation": inputFile.variables.get("calculation"),
+            "template": getTemplateName(getattr(inputFile, "sourceTemplate", inputFile.template)),
+            "basis": inputFile.variables.get("basis"),
+            "functional": inputFile.variables.get("functional"),
+            "cores": int(inputFile.variables.get("cores", 1)),
+            "wallTime": result.calculationTime,
+            "exitStatus": result.returnCode,
+            "failure": getattr(result.failure, "value", None),
+            "outputFilePath": result.outputFilePath,
+            "orcaCachePath": result.orcaCachePath,
+            "bytesRetained": result.bytesRetained,
+            "finishedAt": time.time(),
+            **getOutputValues(result),
+        }
+
+        with self.lock:
+            self.pending.append(tuple(values[column] for column in RESULTCOLUMNS))
+            full = len(self.pending) >= self.batchSize
+            stale = time.time() - self.lastFlush >= self.flushInterval
+
+        if full or stale:
+            self.flush()
+
+    def flush(self):
+        """Inserts every Buffered Record in a single Transaction
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        with self.lock:
+            pending, self.pending = self.pending, []
+            self.lastFlush = time.time()
+
+            if len(pending) == 0:
+                return
+
+            connection = self.connect()
+            placeholders = ", ".join("?" for _ in RESULTCOLUMNS)
+            with connection:
+                connection.executemany(
+                    f"INSERT INTO calculations ({', '.join(RESULTCOLUMNS)}) VALUES ({placeholders})",
+                    pending,
+                )
+
+    def close(self):
+        """Inserts the Buffered Records and Closes the Connection
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        # A Forked Process never Writes the Parents Buffer
+        if self.processID != os.getpid():
+            return
+
+        self.flush()
+
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def query(
+        self,
+        formula: str = None,
+        calculation: str = None,
+        basis: str = None,
+        functional: str = None,
+        status: str | CalculationStatus = None,
+    ) -> pd.DataFrame:
+        """Finds the Recorded Calculations of a Molecule and / or Level of Theory, Newest first
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            formula : str - Molecular Formula in Hill Order (Ex. "C2H6") \n
+            calculation : str - Calculation Keyword (Ex. "FREQ") \n
+            basis : str - Basis Set \n
+            functional : str - Density Functional \n
+            status : str | CalculationStatus - Only Calculations that Ended with this Status
+
+        ## Returns : \n
+            pd.DataFrame - One Row per Recorded Calculation
+        """
+        if isinstance(status, CalculationStatus):
+            status = status.value
+
+        conditions = {
+            "formula": formula,
+            "calculation": calculation,
+            "basis": basis,
+            "functional": functional,
+            "status": status,
+        }
+        conditions = {column: value for column, value in conditions.items() if value is not None}
+        where = " AND ".join(f"{column} = ?" for column in conditions) or "1"
+
+        self.flush()
+
+        with self.lock:
+            return pd.read_sql_query(
+                f"SELECT * FROM calculations WHERE {where} ORDER BY id DESC",
+                self.connect(),
+                params=list(conditions.values()),
+            )
+
+    def findCached(self, inputFile: OrcaInputFile) -> dict:
+        """Finds the latest Completed Calculation of the same Input (Ignoring the Number of Cores) whose Output File still Exists. Inputs Reading a File that can't be Found here are never Matched, their Hash doesn't tell what the File Contained
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - Input File to Look for
+
+        ## Returns : \n
+            dict - The Record of the Calculation (None if it never Completed)
+        """
+        if not all(os.path.isfile(path) for path in getReferencedFiles(inputFile)):
+            return None
+
+        self.flush()
+
+        with self.lock:
+            cursor = self.connect().execute(
+                "SELECT * FROM calculations WHERE inputHash = ? AND status = ? ORDER BY id DESC",
+                (getInputHash(inputFile), CalculationStatus.COMPLETED.value),
+            )
+            columns = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+
+        for row in rows:
+            record = dict(zip(columns, row))
+            if record["outputFilePath"] and os.path.exists(record["outputFilePath"]):
+                return record
+
+        return None
+
+
+def getDefaultDatabase() -> ResultsDatabase:
+    """Gives the Default Database Calculations are Recorded to, OrcaCache/Results.db in the Working Directory
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        ResultsDatabase - The Default Database
+    """
+    path = os.path.join(os.getcwd(), "OrcaCache", "Results.db")
+
+    if path not in defaultDatabases:
+        defaultDatabases[path] = ResultsDatabase(path)
+
+    return defaultDatabases[path]
+
+
+def getInputHash(inputFile: OrcaInputFile) -> str:
+    """Hashes the Contents of an Input File and of the Files it Reads, Ignoring the Number of Cores so the same Calculation on different Cores Matches. Editing a Referenced XYZ File in Place Changes the Hash
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input File to Hash
+
+    ## Returns : \n
+        str - SHA256 Hex Digest of the Input
+    """
+    contents = re.sub(r"%pal\s+nprocs\s+\d+\s+end", "", inputFile.inputFileContents, flags=re.IGNORECASE)
+    digest = hashlib.sha256(contents.encode())
+
+    for path in getReferencedFiles(inputFile):
+        digest.update(getFileHash(path).encode())
+
+    return digest.hexdigest()
+
+
+def getReferencedFiles(inputFile: OrcaInputFile) -> list[str]:
+    """Gives the Paths of the Files an Input Reads, Relative Paths are Relative to the Working Directory
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input File
+
+    ## Returns : \n
+        list[str] - Path of each Referenced File, in the Order they Appear
+    """
+    return [match.group(1) or match.group(2) for match in REFERENCEPATTERN.finditer(inputFile.inputFileContents)]
+
+
+def getFileHash(path: str) -> str:
+    """Hashes the Contents of a File
+
+    ## Parameters : \n
+        path : str - Path to the File
+
+    ## Returns : \n
+        str - SHA256 Hex Digest of the Contents ("missing" if the File can't be Read)
+    """
+    digest = hashlib.sha256()
+
+    try:
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return "missing"
+
+    return digest.hexdigest()
+
+
+def getInputAtoms(inputFile: OrcaInputFile) -> tuple[list[str], int]:
+    """Reads the Atoms and Charge of the Molecule in an Input File, from its Pasted XYZ Block or the XYZ File it References
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input File
+
+    ## Returns : \n
+        tuple[list[str], int] - Atomic Symbol of each Atom and the Charge of the Molecule (Empty List if the Molecule can't be Read)
+    """
+    contents = inputFile.inputFileContents
+    charge = re.search(r"\*\s*xyz(?:file)?\s+(-?\d+)\s+\d+", contents, re.I)
+    charge = int(charge.group(1)) if charge else 0
+    block = re.search(r"\*\s*xyz\s+-?\d+\s+\d+\s*\n(.*?)\n\s*\*", contents, re.S | re.I)
+
+    if block:
+        lines = block.group(1).splitlines()
+    else:
+        xyzFile = inputFile.variables.get("xyzfile")
+        if not xyzFile or not os.path.exists(xyzFile):
+            return [], charge
+        with open(xyzFile, "r") as file:
+            lines = file.readlines()[2:]
+
+    return [line.split()[0].capitalize() for line in lines if line.strip()], charge
+
+
+def getInputFormula(inputFile: OrcaInputFile) -> tuple[str, int]:
+    """Gives the Molecular Formula (Hill Order, Carbon and Hydrogen first) of the Molecule in an Input File
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input File
+
+    ## Returns : \n
+        tuple[str, int] - Molecular Formula and Number of Atoms (None, None if the Molecule can't be Read)
+    """
+    atoms, _ = getInputAtoms(inputFile)
+    if len(atoms) == 0:
+        return None, None
+
+    counts = {atom: atoms.count(atom) for atom in set(atoms)}
+    order = sorted(counts, key=lambda atom: (atom != "C", atom != "H" or "C" not in counts, atom))
+    formula = "".join(atom + (str(counts[atom]) if counts[atom] > 1 else "") for atom in order)
+
+    return formula, len(atoms)
+
+
+def getInputElectrons(inputFile: OrcaInputFile) -> int:
+    """Gives the Number of Electrons of the Molecule in an Input File, the Sum of the Atomic Numbers minus the Charge
+
+    ## Parameters : \n
+        inputFile : OrcaInputFile - The Input File
+
+    ## Returns : \n
+        int - Number of Electrons (None if the Molecule can't be Read or has Unknown Atoms)
+    """
+    atoms, charge = getInputAtoms(inputFile)
+    if len(atoms) == 0 or any(atom not in AtomicNumberConstants for atom in atoms):
+        return None
+
+    return sum(AtomicNumberConstants[atom] for atom in atoms) - charge
+
+
+def getTemplateName(template: str | OrcaInputTemplate) -> str:
+    """Gives a Short Name for a Template, its Enum Name or the Path of a Template File
+
+    ## Parameters : \n
+        template : str | OrcaInputTemplate - The Template of the Input File
+
+    ## Returns : \n
+        str - Name of the Template ("CUSTOM" for Templates given as a String)
+    """
+    if isinstance(template, OrcaInputTemplate):
+        return template.name
+
+    return template if template.endswith(".inp") else "CUSTOM"
+
+
+def getOutputValues(result) -> dict:
+    """Reads the Status and Key Values of a Finished Calculation from its Output File
+
+    ## Parameters : \n
+        result : OrcaCalcResult - Reference to the Completed Calculation
+
+    ## Returns : \n
+        dict - Status, Energy, Gibbs Energy, Dipole Magnitude and Calculation Types
+    """
+    values = {
+        "status": CalculationStatus.FAILED.value,
+        "energy": None,
+        "gibbsEnergy": None,
+        "dipoleMagnitude": None,
+        "calculationTypes": None,
+    }
+
+    if not os.path.exists(result.outputFilePath):
+        return values
+
+    try:
+        output = OrcaOutput(result.outputFilePath)
+    except Exception:
+        # A Crashed Calculation can leave an Output the Parser doesn't understand
+        return values
+
+    terminated = any("ORCA TERMINATED NORMALLY" in line for line in output.lines[-20:])
+    gibbs = output.getGibbsEnergy()
+
+    values["status"] = (
+        CalculationStatus.COMPLETED.value
+        if terminated and result.returnCode in (0, None)
+        else CalculationStatus.FAILED.value
+    )
+    values["energy"] = output.energy
+    values["gibbsEnergy"] = gibbs[0] if gibbs else None
+    values["dipoleMagnitude"] = output.absolutedipole
+    values["calculationTypes"] = ",".join(output.calculationTypes)
+
+    return values
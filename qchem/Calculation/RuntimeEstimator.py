@@ -0,0 +1,231 @@
+import numpy as np
+from .OrcaInputFile import OrcaInputFile
+from .ResultsDatabase import ResultsDatabase, getInputAtoms, getInputElectrons
+from ..Data.Enums import CalculationStatus
+
+SCALINGEXPONENTS = {"electrons": 3.0, "atoms": 0.0, "cores": -0.8}
+"""Prior Exponents of the Runtime Power Law, DFT Scales about Cubically with the System Size and Parallelizes Sublinearly"""
+
+DEFAULTRUNTIME = 60.0
+"""Seconds the Prior Expects a Calculation of DEFAULTELECTRONS Electrons on a single Core to Take"""
+
+DEFAULTELECTRONS = 100
+"""Number of Electrons Assumed for an Input whose Molecule can't be Read"""
+
+
+class RuntimeEstimator:
+    """Predicts the Wall Time of a Calculation from the Size of the Molecule (Electrons and Atoms), the Level of Theory (Basis, Functional and Calculation Type) and the Number of Cores. Fits a Power Law (Linear in the Logarithms) with a Factor per Basis, Functional and Calculation Type to the Completed Calculations Recorded in a Results Database. The Fit is Pulled towards a Prior (Cubic in the Electrons, Sublinear in the Cores) so a few Observations give Sensible Predictions
+
+    ## Example:
+
+    estimator = RuntimeEstimator(getDefaultDatabase())
+    estimator.predict(inputFile)
+    """
+
+    database: ResultsDatabase
+    """Database the Past Calculations are Learnt from (None = Only the Observations Added)"""
+
+    regularization: float
+    """Strength of the Pull of the Fitted Coefficients towards the Prior"""
+
+    observations: list[dict]
+    """Past Calculations the Model is Fit to (Electrons, Atoms, Cores, Basis, Functional, Calculation and Wall Time)"""
+
+    categories: dict[str, list[str]]
+    """Values of the Basis, Functional and Calculation seen in the Observations, each gets its own Factor"""
+
+    coefficients: np.ndarray
+    """Fitted Coefficients of the Log Runtime (None = Not Fit Yet)"""
+
+    def __init__(self, database: ResultsDatabase = None, regularization: float = 1.0):
+        if regularization <= 0:
+            raise ValueError("Regularization must be positive")
+
+        self.database = database
+        self.regularization = regularization
+        self.observations = []
+        self.categories = {"basis": [], "functional": [], "calculation": []}
+        self.coefficients = None
+
+        if database is not None:
+            self.loadDatabase()
+
+    def addObservation(
+        self,
+        electrons: int,
+        atoms: int,
+        cores: int,
+        basis: str,
+        functional: str,
+        calculation: str,
+        wallTime: float,
+    ):
+        """Adds the Wall Time of a Past Calculation, the Model is Fit again on the next Prediction
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            electrons : int - Number of Electrons of the Molecule \n
+            atoms : int - Number of Atoms of the Molecule \n
+            cores : int - Number of Cores the Calculation Ran on \n
+            basis : str - Basis Set \n
+            functional : str - Density Functional \n
+            calculation : str - Calculation Keyword (Ex. "OPT FREQ") \n
+            wallTime : float - Seconds the Calculation Took
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if wallTime is None or wallTime <= 0:
+            raise ValueError("Wall Time must be positive")
+
+        self.observations.append(
+            {
+                "electrons": electrons,
+                "atoms": atoms,
+                "cores": cores,
+                "basis": basis,
+                "functional": functional,
+                "calculation": calculation,
+                "wallTime": wallTime,
+            }
+        )
+        self.coefficients = None
+
+    def loadDatabase(self):
+        """Adds every Completed Calculation of the Database with a Known Molecule and Wall Time as an Observation
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        records = self.database.query(status=CalculationStatus.COMPLETED)
+        records = records.dropna(subset=["electronCount", "atomCount", "wallTime"])
+        records = records[records["wallTime"] > 0]
+
+        for record in records.itertuples():
+            self.addObservation(
+                int(record.electronCount),
+                int(record.atomCount),
+                int(record.cores or 1),
+                record.basis,
+                record.functional,
+                record.calculation,
+                float(record.wallTime),
+            )
+
+    def getFeatures(self, electrons: int, atoms: int, cores: int, basis: str, functional: str, calculation: str) -> np.ndarray:
+        """Gives the Features the Log Runtime is Linear in. Values of the Basis, Functional or Calculation never Observed get no Factor
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            electrons : int - Number of Electrons of the Molecule \n
+            atoms : int - Number of Atoms of the Molecule \n
+            cores : int - Number of Cores \n
+            basis : str - Basis Set \n
+            functional : str - Density Functional \n
+            calculation : str - Calculation Keyword
+
+        ## Returns : \n
+            np.ndarray - Intercept, Log Electrons, Log Atoms, Log Cores then a One Hot Column per Observed Category
+        """
+        features = [1.0, np.log(max(electrons, 1)), np.log(max(atoms, 1)), np.log(max(cores, 1))]
+
+        for key, value in (("basis", basis), ("functional", functional), ("calculation", calculation)):
+            features += [1.0 if value == seen else 0.0 for seen in self.categories[key]]
+
+        return np.array(features)
+
+    def fit(self):
+        """Fits the Coefficients to the Observations, a Ridge Regression of the Log Wall Time Penalized towards the Prior Exponents (The Intercept is Free). Without Observations the Prior alone is used
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        for key in self.categories:
+            self.categories[key] = sorted({str(observation[key]) for observation in self.observations})
+
+        prior = np.zeros(4 + sum(len(values) for values in self.categories.values()))
+        prior[1:4] = [SCALINGEXPONENTS["electrons"], SCALINGEXPONENTS["atoms"], SCALINGEXPONENTS["cores"]]
+
+        if len(self.observations) == 0:
+            prior[0] = np.log(DEFAULTRUNTIME) - SCALINGEXPONENTS["electrons"] * np.log(DEFAULTELECTRONS)
+            self.coefficients = prior
+            return
+
+        features = np.array(
+            [
+                self.getFeatures(
+                    observation["electrons"],
+                    observation["atoms"],
+                    observation["cores"],
+                    str(observation["basis"]),
+                    str(observation["functional"]),
+                    str(observation["calculation"]),
+                )
+                for observation in self.observations
+            ]
+        )
+        logTimes = np.log([observation["wallTime"] for observation in self.observations])
+
+        # Penalty Rows pull every Coefficient but the Intercept towards the Prior
+        penalty = np.sqrt(self.regularization) * np.eye(len(prior))[1:]
+        system = np.vstack([features, penalty])
+        targets = np.concatenate([logTimes, penalty @ prior])
+
+        self.coefficients = np.linalg.lstsq(system, targets, rcond=None)[0]
+
+    def predictFeatures(
+        self,
+        electrons: int,
+        atoms: int,
+        cores: int,
+        basis: str = None,
+        functional: str = None,
+        calculation: str = None,
+    ) -> float:
+        """Predicts the Wall Time of a Calculation from its Features
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            electrons : int - Number of Electrons of the Molecule \n
+            atoms : int - Number of Atoms of the Molecule \n
+            cores : int - Number of Cores \n
+            basis : str - Basis Set \n
+            functional : str - Density Functional \n
+            calculation : str - Calculation Keyword
+
+        ## Returns : \n
+            float - Predicted Seconds the Calculation will Take
+        """
+        if self.coefficients is None:
+            self.fit()
+
+        features = self.getFeatures(electrons, atoms, cores, str(basis), str(functional), str(calculation))
+        return float(np.exp(features @ self.coefficients))
+
+    def predict(self, inputFile: OrcaInputFile) -> float:
+        """Predicts the Wall Time of the Calculation of an Input File. A Molecule that can't be Read is Estimated as DEFAULTELECTRONS Electrons
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            inputFile : OrcaInputFile - The Input File
+
+        ## Returns : \n
+            float - Predicted Seconds the Calculation will Take
+        """
+        atoms, _ = getInputAtoms(inputFile)
+        electrons = getInputElectrons(inputFile) or DEFAULTELECTRONS
+
+        return self.predictFeatures(
+            electrons,
+            len(atoms) or 1,
+            int(inputFile.variables.get("cores", 1)),
+            inputFile.variables.get("basis"),
+            inputFile.variables.get("functional"),
+            inputFile.variables.get("calculation"),
+        )
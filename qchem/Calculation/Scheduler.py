@@ -0,0 +1,621 @@
+import os
+import json
+import time
+import socket
+import struct
+import asyncio
+import getpass
+import tempfile
+import itertools
+from contextlib import contextmanager, asynccontextmanager
+from .CoreBudget import CoreBudget
+
+SOCKETENVIRONMENT = "QCHEM_SCHEDULER_SOCKET"
+"""Environment Variable with the Path of the Schedulers Socket"""
+
+DEFAULTSOCKETPATH = os.path.join(tempfile.gettempdir(), "qchem-scheduler.sock")
+"""Path of the Schedulers Socket when the Environment Variable isn't Set, Shared by every User of the Machine. Any User can Create this Path first, Set the Environment Variable to a Folder only Trusted Users can Write to where that Matters"""
+
+USAGEHALFLIFE = 3600
+"""Seconds after which Half of a Users Past Core Usage is Forgotten"""
+
+
+def getSocketPath(socketPath: str = None) -> str:
+    """Gives the Path of the Schedulers Socket
+
+    ## Parameters : \n
+        socketPath : str - Path to use (None = The QCHEM_SCHEDULER_SOCKET Environment Variable, or qchem-scheduler.sock in the Temporary Folder)
+
+    ## Returns : \n
+        str - Path of the Socket
+    """
+    return socketPath or os.environ.get(SOCKETENVIRONMENT) or DEFAULTSOCKETPATH
+
+
+class SchedulerJob:
+    """A Request for Cores sent to the Scheduler, Waiting or Holding its Lease until the Connection it came from Closes"""
+
+    ID: int
+    """Unique Number of the Job"""
+
+    user: str
+    """User that Submitted the Job, Fair Share is Computed per User"""
+
+    cores: int
+    """Number of Cores Requested (Limited to the Total Cores)"""
+
+    priority: int
+    """Priority of the Job, Higher Priorities are Dispatched first whatever the Users Share (Limited by the Daemon to what the User may Request)"""
+
+    name: str
+    """Name of the Calculation the Cores are for"""
+
+    submitted: float
+    """Time the Daemon Received the Job, Jobs of the same Priority and Share Start in this Order"""
+
+    started: float
+    """Time the Cores were Granted (None while Waiting)"""
+
+    def __init__(self, ID: int, user: str, cores: int, priority: int = 0, name: str = "", submitted: float = None, writer: asyncio.StreamWriter = None):
+        self.ID = ID
+        self.user = user
+        self.cores = cores
+        self.priority = priority
+        self.name = name
+        self.submitted = submitted if submitted is not None else time.time()
+        self.started = None
+        self.writer = writer
+
+    def toDict(self) -> dict:
+        """Gives the Values of the Job
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            dict - The Values of the Job by Name
+        """
+        return {
+            "ID": self.ID,
+            "user": self.user,
+            "cores": self.cores,
+            "priority": self.priority,
+            "name": self.name,
+            "submitted": self.submitted,
+            "started": self.started,
+        }
+
+
+class SchedulerDaemon:
+    """Local Scheduler that owns the Core Budget of the Machine. Clients (ClusterCalculations, Workflows, Scripts of any User) Connect over a Unix Socket and Request Cores for each Calculation, the Daemon Grants a Lease once the Cores are Free and the Job is Next, and the Lease Ends when its Connection Closes, so a Crashed Client never keeps its Cores. Jobs are Dispatched by Priority, then Fair Share (the User with the least Recent Core Usage for their Share goes first), then Submission Order. A Job that doesn't Fit Waits at the Head of the Queue rather than being Skipped, so large Jobs aren't Starved
+
+    ## Example:
+
+    SchedulerDaemon(64, shares={"alice": 2}, maxPriorities={"alice": 5}, shared=True).run()  # Or: qchem scheduler start --cores 64 --shared
+    """
+
+    totalCores: int
+    """Number of Cores Shared by every Client"""
+
+    socketPath: str
+    """Path of the Unix Socket the Daemon Listens on"""
+
+    shares: dict[str, float]
+    """Weight of each Users Share of the Machine (Users not Listed have a Weight of 1)"""
+
+    halfLife: float
+    """Seconds after which Half of a Users Past Core Usage is Forgotten"""
+
+    maxPriorities: dict[str, int]
+    """Highest Priority each User may Request, Higher Requests are Lowered to it (Users not Listed, and Clients the Kernel can't Identify, are Limited to 0)"""
+
+    shared: bool
+    """Lets every User of the Machine Connect to the Socket (False = Only the User running the Daemon)"""
+
+    freeCores: int
+    """Number of Cores not Leased"""
+
+    pending: list[SchedulerJob]
+    """Jobs Waiting for Cores"""
+
+    leases: dict[int, SchedulerJob]
+    """Jobs Holding Cores by ID"""
+
+    usage: dict[str, float]
+    """Decayed Core Seconds each User has Used"""
+
+    def __init__(
+        self,
+        totalCores: int,
+        socketPath: str = None,
+        shares: dict[str, float] = None,
+        halfLife: float = USAGEHALFLIFE,
+        maxPriorities: dict[str, int] = None,
+        shared: bool = False,
+    ):
+        if not isinstance(totalCores, int) or totalCores < 1:
+            raise ValueError("Total Cores must be a positive integer")
+
+        if any(share <= 0 for share in (shares or {}).values()):
+            raise ValueError("Shares must be positive")
+
+        self.totalCores = totalCores
+        self.socketPath = getSocketPath(socketPath)
+        self.shares = shares or {}
+        self.halfLife = halfLife
+        self.maxPriorities = maxPriorities or {}
+        self.shared = shared
+        self.freeCores = totalCores
+        self.pending = []
+        self.leases = {}
+        self.usage = {}
+        self.lastDecay = time.time()
+        self.jobIDs = itertools.count(1)
+        self.loop = None
+        self.stopped = None
+
+    def run(self):
+        """Runs the Daemon until it is Stopped or Interrupted
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        asyncio.run(self.serve())
+
+    async def serve(self):
+        """Listens for Clients until the Daemon is Stopped, then Removes the Socket
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        self.removeStaleSocket()
+        self.loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+
+        server = await asyncio.start_unix_server(self.handleClient, self.socketPath)
+        # Only a Shared Daemon Accepts the Jobs of other Users, the Kernel Identifies each of them for Fair Share and Priority Limits
+        os.chmod(self.socketPath, 0o666 if self.shared else 0o600)
+
+        try:
+            async with server:
+                await self.stopped.wait()
+        finally:
+            if os.path.exists(self.socketPath):
+                os.remove(self.socketPath)
+
+    def stop(self):
+        """Stops the Daemon, can be Called from another Thread
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.stopped.set)
+
+    def removeStaleSocket(self):
+        """Removes the Socket File left by a Daemon that didn't Exit Cleanly, Refusing to Start if a Daemon is still Listening
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if not os.path.exists(self.socketPath):
+            return
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.socketPath)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(self.socketPath)
+                return
+
+        raise FileExistsError(f"A Scheduler is already Running on {self.socketPath}")
+
+    async def handleClient(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves the Requests of a Connection (One JSON Message per Line), Releasing its Jobs once it Closes
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            reader : asyncio.StreamReader - Messages from the Client \n
+            writer : asyncio.StreamWriter - Replies to the Client
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        peerUser = getPeerUser(writer)
+        jobs: list[SchedulerJob] = []
+
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    sendMessage(writer, {"error": "Messages must be JSON"})
+                    continue
+
+                if message.get("op") == "acquire":
+                    # The Kernel tells who is on the other End, Clients only Name themselves where it can't
+                    job = SchedulerJob(
+                        next(self.jobIDs),
+                        peerUser or str(message.get("user", "unknown")),
+                        max(1, min(int(message.get("cores", 1)), self.totalCores)),
+                        self.limitPriority(peerUser, int(message.get("priority", 0))),
+                        str(message.get("name", "")),
+                        time.time(),
+                        writer,
+                    )
+                    jobs.append(job)
+                    self.pending.append(job)
+                    self.dispatch()
+                elif message.get("op") == "status":
+                    sendMessage(writer, self.getStatus())
+                else:
+                    sendMessage(writer, {"error": f"Unknown Operation {message.get('op')}"})
+        except ConnectionError:
+            pass
+        finally:
+            for job in jobs:
+                self.release(job)
+            self.dispatch()
+            writer.close()
+
+    def limitPriority(self, user: str, priority: int) -> int:
+        """Lowers a Requested Priority to the Highest the User may Request, Lower Priorities are always Allowed
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            user : str - User Identified by the Kernel (None = Unknown, Limited like an Unlisted User) \n
+            priority : int - Requested Priority
+
+        ## Returns : \n
+            int - Priority of the Job
+        """
+        return min(priority, self.maxPriorities.get(user, 0) if user is not None else 0)
+
+    def release(self, job: SchedulerJob):
+        """Ends a Job, Freeing its Cores and Charging them to its User, or Removes it from the Queue if it was still Waiting
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            job : SchedulerJob - The Job
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if job in self.pending:
+            self.pending.remove(job)
+        elif self.leases.pop(job.ID, None) is not None:
+            self.decayUsage()
+            self.usage[job.user] = self.usage.get(job.user, 0) + job.cores * (time.time() - job.started)
+            self.freeCores += job.cores
+
+    def decayUsage(self):
+        """Forgets Past Usage Exponentially, so Fair Share follows Recent Usage
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        now = time.time()
+        factor = 0.5 ** ((now - self.lastDecay) / self.halfLife)
+        self.usage = {user: usage * factor for user, usage in self.usage.items()}
+        self.lastDecay = now
+
+    def getUserLoad(self, user: str) -> float:
+        """Gives the Recent Core Usage of a User for their Share, including the Cores they Hold right now
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            user : str - The User
+
+        ## Returns : \n
+            float - Core Seconds per Unit of Share
+        """
+        now = time.time()
+        running = sum(job.cores * (now - job.started) for job in self.leases.values() if job.user == user)
+        return (self.usage.get(user, 0) + running) / self.shares.get(user, 1)
+
+    def orderPending(self) -> list[SchedulerJob]:
+        """Orders the Waiting Jobs, Highest Priority first, then the User with the Lowest Load, then the Earliest Submitted
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[SchedulerJob] - The Waiting Jobs in Dispatch Order
+        """
+        self.decayUsage()
+        loads = {user: self.getUserLoad(user) for user in {job.user for job in self.pending}}
+
+        return sorted(self.pending, key=lambda job: (-job.priority, loads[job.user], job.submitted, job.ID))
+
+    def dispatch(self):
+        """Grants Cores to the Waiting Jobs in Dispatch Order, until the Next Job doesn't Fit
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        while self.pending:
+            job = self.orderPending()[0]
+            if job.cores > self.freeCores:
+                break
+
+            self.pending.remove(job)
+            self.freeCores -= job.cores
+            job.started = time.time()
+            self.leases[job.ID] = job
+
+            if job.writer is not None:
+                sendMessage(job.writer, {"op": "granted", "lease": job.ID, "cores": job.cores, "priority": job.priority})
+
+    def getStatus(self) -> dict:
+        """Gives the State of the Scheduler
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            dict - Total and Free Cores, the Running and Waiting Jobs (In Dispatch Order) and the Usage of each User
+        """
+        self.decayUsage()
+
+        return {
+            "totalCores": self.totalCores,
+            "freeCores": self.freeCores,
+            "running": [job.toDict() for job in self.leases.values()],
+            "pending": [job.toDict() for job in self.orderPending()],
+            "usage": dict(self.usage),
+        }
+
+
+class SchedulerClient:
+    """Connection Settings to a SchedulerDaemon. Each Lease is its own Connection, Held for as long as the Calculation Runs, so Processes that Crash or are Killed give their Cores back
+
+    ## Example:
+
+    scheduler = SchedulerClient()
+    with scheduler.lease(8, priority=1, name="Caffeine_FREQ"):
+        runOrcaCalculation("Caffeine_FREQ", inputFile)
+    """
+
+    socketPath: str
+    """Path of the Schedulers Unix Socket"""
+
+    user: str
+    """Name the Client gives, only used where the Scheduler can't Identify the User on the other End of the Socket"""
+
+    def __init__(self, socketPath: str = None, user: str = None):
+        self.socketPath = getSocketPath(socketPath)
+        self.user = user or getpass.getuser()
+
+    def createRequest(self, cores: int, priority: int, name: str) -> bytes:
+        """Encodes the Request for a Lease
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores \n
+            priority : int - Priority of the Job (The Daemon Lowers it to the Highest the User may Request) \n
+            name : str - Name of the Calculation
+
+        ## Returns : \n
+            bytes - The Message
+        """
+        request = {
+            "op": "acquire",
+            "user": self.user,
+            "cores": cores,
+            "priority": priority,
+            "name": name,
+        }
+        return (json.dumps(request) + "\n").encode()
+
+    def connect(self) -> socket.socket:
+        """Opens a Connection to the Scheduler
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            socket.socket - The Connected Socket
+        """
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(self.socketPath)
+        except (ConnectionRefusedError, FileNotFoundError) as error:
+            connection.close()
+            raise ConnectionError(f"No Scheduler is Running on {self.socketPath} (Start one with qchem scheduler start)") from error
+        except PermissionError as error:
+            connection.close()
+            raise ConnectionError(f"The Scheduler on {self.socketPath} isn't Shared with this User (Start it with qchem scheduler start --shared)") from error
+
+        return connection
+
+    def isRunning(self) -> bool:
+        """Checks if a Scheduler is Listening on the Socket
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            bool - True if a Scheduler Accepted the Connection
+        """
+        try:
+            self.connect().close()
+        except ConnectionError:
+            return False
+
+        return True
+
+    def getStatus(self) -> dict:
+        """Asks the Scheduler for its State
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            dict - See SchedulerDaemon.getStatus
+        """
+        with self.connect() as connection, connection.makefile("rb") as replies:
+            connection.sendall(b'{"op": "status"}\n')
+            return json.loads(replies.readline())
+
+    @contextmanager
+    def lease(self, cores: int, priority: int = 0, name: str = ""):
+        """Context Manager that Waits until the Scheduler Grants the Cores and Holds them for the Duration of the Block
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores \n
+            priority : int - Priority of the Job (Higher Starts first) \n
+            name : str - Name of the Calculation
+
+        ## Returns : \n
+            ContextManager - Context that gives the Grant (Lease ID and Cores) and holds the Cores until it Exits
+        """
+        with self.connect() as connection, connection.makefile("rb") as replies:
+            connection.sendall(self.createRequest(cores, priority, name))
+            grant = replies.readline()
+            if not grant:
+                raise ConnectionError("The Scheduler Closed the Connection before Granting the Cores")
+
+            yield json.loads(grant)
+
+    @asynccontextmanager
+    async def leaseAsync(self, cores: int, priority: int = 0, name: str = ""):
+        """Async counterpart of lease, Waits for the Cores without Blocking the Event Loop
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores \n
+            priority : int - Priority of the Job (Higher Starts first) \n
+            name : str - Name of the Calculation
+
+        ## Returns : \n
+            AsyncContextManager - Context that gives the Grant (Lease ID and Cores) and holds the Cores until it Exits
+        """
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socketPath)
+        except (ConnectionRefusedError, FileNotFoundError) as error:
+            raise ConnectionError(f"No Scheduler is Running on {self.socketPath} (Start one with qchem scheduler start)") from error
+        except PermissionError as error:
+            raise ConnectionError(f"The Scheduler on {self.socketPath} isn't Shared with this User (Start it with qchem scheduler start --shared)") from error
+
+        try:
+            writer.write(self.createRequest(cores, priority, name))
+            await writer.drain()
+            grant = await reader.readline()
+            if not grant:
+                raise ConnectionError("The Scheduler Closed the Connection before Granting the Cores")
+
+            yield json.loads(grant)
+        finally:
+            writer.close()
+
+
+class SchedulerBudget(CoreBudget):
+    """Core Budget whose Cores are Leased from a SchedulerDaemon, so Workflows and Pipelines Share the Machine with every other Client. Use it wherever a CoreBudget is Accepted
+
+    ## Example:
+
+    spectra.runCalculationAsync(coreBudget=SchedulerBudget(SchedulerClient(), priority=1))
+    """
+
+    client: SchedulerClient
+    """Connection Settings to the Scheduler"""
+
+    priority: int
+    """Priority of every Calculation of the Budget"""
+
+    def __init__(self, client: SchedulerClient = None, priority: int = 0):
+        self.client = client if client is not None else SchedulerClient()
+        self.priority = priority
+        self.leases: dict[int, list] = {}
+
+        super().__init__(self.client.getStatus()["totalCores"])
+
+    async def acquire(self, cores: int):
+        """Waits until the Scheduler Grants the Cores
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Reserve
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        cores = self.clampCores(cores)
+        lease = self.client.leaseAsync(cores, self.priority)
+        await lease.__aenter__()
+
+        self.leases.setdefault(cores, []).append(lease)
+        self.usedCores += cores
+
+    def release(self, cores: int):
+        """Ends a Lease of the same Number of Cores
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            cores : int - Number of Cores to Free
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        cores = self.clampCores(cores)
+        lease = self.leases[cores].pop()
+        self.usedCores -= cores
+
+        # Closing the Connection Ends the Lease, the Close itself doesn't need Awaiting
+        asyncio.ensure_future(lease.__aexit__(None, None, None))
+
+
+def sendMessage(writer: asyncio.StreamWriter, message: dict):
+    """Sends a Message to a Client as a line of JSON
+
+    ## Parameters : \n
+        writer : asyncio.StreamWriter - Connection to the Client \n
+        message : dict - The Message
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    if not writer.is_closing():
+        writer.write((json.dumps(message) + "\n").encode())
+
+
+def getPeerUser(writer: asyncio.StreamWriter) -> str:
+    """Identifies the User on the other End of a Unix Socket from the Kernels Peer Credentials
+
+    ## Parameters : \n
+        writer : asyncio.StreamWriter - Connection to the Client
+
+    ## Returns : \n
+        str - Name of the User (None if the Platform doesn't Report it)
+    """
+    connection = writer.get_extra_info("socket")
+    if connection is None or not hasattr(socket, "SO_PEERCRED"):
+        return None
+
+    try:
+        import pwd
+
+        credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        return pwd.getpwuid(uid).pw_name
+    except (OSError, KeyError, ImportError):
+        return None
@@ -1,17 +1,68 @@
-from .ClusterCalculation import ClusterCalculation
-from .OrcaCalculation import runOrcaCalculation
-from .OrcaInputFile import OrcaInputFile
-from .Frequency import Frequency
-from .GeoOpt import GeoOpt
-from .GOAT import GOAT
+from ..LazyLoading import makeLazy
+
+# Calculation Modules are Imported the first time they are used
+LAZYATTRIBUTES = {
+    "BaseOrcaCalculation": (".BaseOrcaCalculation", "BaseOrcaCalculation"),
+    "ClusterCalculation": (".ClusterCalculation", "ClusterCalculation"),
+    "CoreAllocator": (".CoreAllocator", "CoreAllocator"),
+    "CoreBudget": (".CoreBudget", "CoreBudget"),
+    "runOrcaCalculation": (".OrcaCalculation", "runOrcaCalculation"),
+    "runOrcaCalculationAsync": (".OrcaCalculation", "runOrcaCalculationAsync"),
+    "OrcaInputFile": (".OrcaInputFile", "OrcaInputFile"),
+    "InputSweep": (".InputSweep", "InputSweep"),
+    "CompiledTemplate": (".OrcaInputFile", "CompiledTemplate"),
+    "compileTemplate": (".OrcaInputFile", "compileTemplate"),
+    "OrcaScratch": (".OrcaScratch", "OrcaScratch"),
+    "OrcaExecutor": (".Executors", "OrcaExecutor"),
+    "LocalExecutor": (".Executors", "LocalExecutor"),
+    "DockerExecutor": (".Executors", "DockerExecutor"),
+    "RemoteExecutor": (".Executors", "RemoteExecutor"),
+    "FakeRemoteExecutor": (".Executors", "FakeRemoteExecutor"),
+    "BatchQueueExecutor": (".Executors", "BatchQueueExecutor"),
+    "SchedulerDaemon": (".Scheduler", "SchedulerDaemon"),
+    "SchedulerClient": (".Scheduler", "SchedulerClient"),
+    "SchedulerBudget": (".Scheduler", "SchedulerBudget"),
+    "RetryPolicy": (".Failures", "RetryPolicy"),
+    "classifyFailure": (".Failures", "classifyFailure"),
+    "ResultsDatabase": (".ResultsDatabase", "ResultsDatabase"),
+    "RuntimeEstimator": (".RuntimeEstimator", "RuntimeEstimator"),
+    "Frequency": (".Frequency", "Frequency"),
+    "GeoOpt": (".GeoOpt", "GeoOpt"),
+    "GOAT": (".GOAT", "GOAT"),
+    "NMR": (".NMR", "NMR"),
+}
+"""Module and Name in it of each Public Symbol"""
 
 # Expose all Classes when importing with star (*)
 __all__ = [
     "BaseOrcaCalculation",
     "ClusterCalculation",
+    "CoreAllocator",
+    "CoreBudget",
     "runOrcaCalculation",
+    "runOrcaCalculationAsync",
     "OrcaInputFile",
+    "InputSweep",
+    "CompiledTemplate",
+    "compileTemplate",
+    "OrcaScratch",
+    "OrcaExecutor",
+    "LocalExecutor",
+    "DockerExecutor",
+    "RemoteExecutor",
+    "FakeRemoteExecutor",
+    "BatchQueueExecutor",
+    "SchedulerDaemon",
+    "SchedulerClient",
+    "SchedulerBudget",
+    "RetryPolicy",
+    "classifyFailure",
+    "ResultsDatabase",
+    "RuntimeEstimator",
     "Frequency",
     "GeoOpt",
-    "GOAT"
-]
\ No newline at end of file
+    "GOAT",
+    "NMR"
+]
+
+makeLazy(__name__, LAZYATTRIBUTES)
@@ -0,0 +1,106 @@
+import os
+import gzip
+import shutil
+
+COMPRESSIONEXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+"""File Extension added to a File by each supported Compression"""
+
+
+def importZstandard():
+    """Imports the Optional zstandard Package used for zstd Compression
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        module - The zstandard Module
+    """
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            "zstd Compression requires the zstandard Package (pip install zstandard)"
+        ) from error
+
+    return zstandard
+
+
+def openCompressed(filePath: str, mode: str = "r"):
+    """Opens a File for Reading or Writing, transparently Decompressing it if it ends in .gz or .zst
+
+    ## Parameters : \n
+        filePath : str - Path to the File (Plain, .gz or .zst) \n
+        mode : str - Mode to Open the File in (Text Mode unless "b" is in the Mode)
+
+    ## Returns : \n
+        IO - The Opened File Object
+    """
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+
+    if filePath.endswith(COMPRESSIONEXTENSIONS["gzip"]):
+        return gzip.open(filePath, mode)
+
+    if filePath.endswith(COMPRESSIONEXTENSIONS["zstd"]):
+        return importZstandard().open(filePath, mode)
+
+    return open(filePath, mode.replace("t", ""))
+
+
+def findCompressedFile(filePath: str) -> str:
+    """Finds the File on Disk, which may have been Compressed after it was Written
+
+    ## Parameters : \n
+        filePath : str - Path to the Uncompressed File
+
+    ## Returns : \n
+        str - The Path if it Exists, otherwise the Path of its Compressed Version if that Exists, otherwise the Path unchanged
+    """
+    if os.path.exists(filePath):
+        return filePath
+
+    for extension in COMPRESSIONEXTENSIONS.values():
+        if os.path.exists(filePath + extension):
+            return filePath + extension
+
+    return filePath
+
+
+def getUncompressedPath(filePath: str) -> str:
+    """Removes the Compression Extension from a File Path
+
+    ## Parameters : \n
+        filePath : str - Path to a File that may be Compressed
+
+    ## Returns : \n
+        str - The Path without the .gz or .zst Extension
+    """
+    for extension in COMPRESSIONEXTENSIONS.values():
+        if filePath.endswith(extension):
+            return filePath[: -len(extension)]
+
+    return filePath
+
+
+def compressFile(sourcePath: str, destinationPath: str, compression: str) -> str:
+    """Compresses a File, adding the Compressions Extension to the Destination
+
+    ## Parameters : \n
+        sourcePath : str - Path to the File to Compress \n
+        destinationPath : str - Path to save the Compressed File to (Without the Compression Extension) \n
+        compression : str - Compression to use ("gzip" or "zstd")
+
+    ## Returns : \n
+        str - Path to the Compressed File
+    """
+    if compression not in COMPRESSIONEXTENSIONS:
+        raise ValueError(
+            f"Compression must be one of {list(COMPRESSIONEXTENSIONS)}, not {compression}"
+        )
+
+    compressedPath = destinationPath + COMPRESSIONEXTENSIONS[compression]
+
+    with open(sourcePath, "rb") as source, openCompressed(compressedPath, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+
+    return compressedPath
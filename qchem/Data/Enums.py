@@ -21,6 +21,8 @@ class OrcaCalculationType(Enum):
     """Used for a GOAT XTB (Global Optimizer Algorithm with XTB) Calculation"""
     GOAT_XTB = "GOAT XTB"
     """Used for a GOAT XTB (Global Optimizer Algorithm with XTB) Calculation"""
+    NMR = "NMR"
+    """Used for a NMR (Nuclear Magnetic Shielding) Calculation"""
 
 # Enum for Orca Density Functionals
 class OrcaDensityFunctional(Enum):
@@ -41,6 +43,50 @@ class OrcaInputTemplate(Enum):
     """Basic Input file for Multicore Calculations using File Reference"""
     BASICXYZPARALLEL = "!&{calculation} &{basis} &{functional}\n%pal nprocs &{cores} end\n* xyz 0 1 \n&{xyz}\n*"
     """Basic Input file for Multicore Calculations using pasted XYZ Info"""
+    BASICXYZPARALLELMOREAD = "!&{calculation} &{basis} &{functional} MORead\n%moinp \"&{moinp}\"\n%pal nprocs &{cores} end\n* xyz 0 1 \n&{xyz}\n*"
+    """Basic Input file for Multicore Calculations using pasted XYZ Info, starting the SCF from the Orbitals of a previous Calculation"""
+
+# Enum for the Lifecycle of a Calculation
+class CalculationStatus(Enum):
+    """Stores the States a Calculation moves through, reported to Progress Callbacks"""
+    QUEUED = "Queued"
+    """Calculation is Waiting for Cores to become Available"""
+    RUNNING = "Running"
+    """Calculation has Started Running in Orca"""
+    COMPLETED = "Completed"
+    """Calculation has Finished"""
+    FAILED = "Failed"
+    """Calculation has Finished but Orca reported Errors"""
+    CANCELLED = "Cancelled"
+    """Calculation was Cancelled and the Orca Process was Killed"""
+
+# Enum for the Reasons a Calculation Fails
+class FailureType(Enum):
+    """Stores the Reasons a Calculation Fails, Classified from its Output and Standard Error. Retry Policies choose a Remedy for each"""
+    SCFNOTCONVERGED = "SCFNotConverged"
+    """The SCF didn't Converge within its Iterations"""
+    GEOMETRYNOTCONVERGED = "GeometryNotConverged"
+    """The Geometry Optimization didn't Converge within its Cycles"""
+    OUTOFMEMORY = "OutOfMemory"
+    """Orca didn't have enough Memory (MaxCore) for a Step"""
+    MISSINGEXECUTABLE = "MissingExecutable"
+    """Orca, one of its Programs or the MPI it Runs in Parallel with couldn't be Found or Run"""
+    TIMEOUT = "Timeout"
+    """The Calculation ran Longer than its Timeout and was Killed"""
+    ABORTED = "Aborted"
+    """Orca Aborted the Run or the Process was Killed"""
+    UNKNOWN = "Unknown"
+    """The Calculation Failed without a Recognized Reason"""
+
+# Enum for Spectral Line Shapes
+class LineShape(Enum):
+    """Stores the Line Shapes used to Broaden Stick Spectra"""
+    GAUSSIAN = "Gaussian"
+    """Gaussian Profile, Inhomogeneous Broadening"""
+    LORENTZIAN = "Lorentzian"
+    """Lorentzian Profile, Homogeneous (Lifetime) Broadening"""
+    VOIGT = "Voigt"
+    """Pseudo-Voigt Profile, a Weighted Sum of a Gaussian and a Lorentzian of the same Width"""
 
 #     Karlsruhe basis sets
 # Some of the various valence adaptations of Karlsruhe basis sets[9] are briefly described below.
@@ -1,2 +1,2 @@
-from .Constants import CovalentRadiiConstants, AtomicMassConstants
+from .Constants import CovalentRadiiConstants, AtomicMassConstants, AtomicNumberConstants
 from .Enums import OrcaBasisSet, OrcaCalculationType, OrcaDensityFunctional
\ No newline at end of file
@@ -0,0 +1,209 @@
+import os
+import uuid
+import shutil
+import pandas as pd
+from qchem.Parser import OrcaOutput
+
+RESULTTABLES = ("summary", "scf", "timings", "mayer", "loewdin", "frequencies", "ir", "shifts", "conformers")
+"""Tables a Results Dataset can hold, one per Block Parsed by OrcaOutput.getTables"""
+
+FILTEROPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in")
+"""Comparisons a Filter of readResults can use"""
+
+HDF5STRINGSIZE = 64
+"""Width Reserved for Text Columns in HDF5 Tables, Longer Values can't be Appended later"""
+
+HDF5PATHSIZE = 512
+"""Width Reserved for the File Path Column in HDF5 Tables"""
+
+
+def importPyArrow():
+    """Imports the Optional pyarrow Package used for Parquet Export
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        module - The pyarrow.parquet Module
+    """
+    try:
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Parquet Export requires the pyarrow Package (pip install pyarrow)") from error
+
+    return pyarrow.parquet
+
+
+def importTables():
+    """Imports the Optional PyTables Package used by Pandas for HDF5 Export
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        module - The tables Module
+    """
+    try:
+        import tables
+    except ImportError as error:
+        raise ImportError("HDF5 Export requires the PyTables Package (pip install tables)") from error
+
+    return tables
+
+
+def exportResults(
+    outputs: list[str | OrcaOutput] | str | OrcaOutput,
+    path: str,
+    format: str = "parquet",
+    append: bool = True,
+) -> dict[str, int]:
+    """Exports every Parsed Block of many Orca Outputs to a Columnar Dataset, one Table per Block (See RESULTTABLES) with every Row Keyed by the Output Name. Parquet Datasets are a Folder per Table, each Export adds one File to it. HDF5 Datasets are a single File with a Queryable Table per Block. Export many Outputs per Call, so Files and Row Groups stay large
+
+    ## Parameters : \n
+        outputs : list[str | OrcaOutput] | str | OrcaOutput - Parsed Outputs or Paths to Output Files \n
+        path : str - Folder of the Parquet Dataset or Path of the HDF5 File \n
+        format : str - "parquet" or "hdf5" \n
+        append : bool - Add to an Existing Dataset (False = Replace its Tables)
+
+    ## Returns : \n
+        dict[str, int] - Number of Rows Written to each Table
+    """
+    if format not in ("parquet", "hdf5"):
+        raise ValueError('Format must be "parquet" or "hdf5"')
+
+    if not isinstance(outputs, list):
+        outputs = [outputs]
+
+    # Gather every Output before Writing so each Table is Written once
+    blocks: dict[str, list[pd.DataFrame]] = {}
+    for output in outputs:
+        if isinstance(output, str):
+            output = OrcaOutput(output)
+        for key, table in output.getTables().items():
+            blocks.setdefault(key, []).append(table)
+
+    return writeTables(blocks, path, format, append)
+
+
+def writeTables(blocks: dict[str, list[pd.DataFrame]], path: str, format: str = "parquet", append: bool = True) -> dict[str, int]:
+    """Writes the Tables Gathered from many Outputs to a Dataset, each Table Concatenated and Written once. Used to Export Outputs Parsed elsewhere (Ex. in Worker Processes) in Batches
+
+    ## Parameters : \n
+        blocks : dict[str, list[pd.DataFrame]] - Tables of each Output by Table Name (See OrcaOutput.getTables) \n
+        path : str - Folder of the Parquet Dataset or Path of the HDF5 File \n
+        format : str - "parquet" or "hdf5" \n
+        append : bool - Add to an Existing Dataset (False = Replace its Tables)
+
+    ## Returns : \n
+        dict[str, int] - Number of Rows Written to each Table
+    """
+    if format not in ("parquet", "hdf5"):
+        raise ValueError('Format must be "parquet" or "hdf5"')
+
+    tables = {key: pd.concat(block, ignore_index=True) for key, block in blocks.items()}
+
+    if format == "parquet":
+        writeParquet(tables, path, append)
+    else:
+        writeHDF5(tables, path, append)
+
+    return {key: len(table) for key, table in tables.items()}
+
+
+def writeParquet(tables: dict[str, pd.DataFrame], path: str, append: bool):
+    """Writes Tables to a Parquet Dataset, as a new File in the Folder of each Table
+
+    ## Parameters : \n
+        tables : dict[str, pd.DataFrame] - Tables to Write by Name \n
+        path : str - Folder of the Dataset \n
+        append : bool - Add to the Existing Files (False = Remove the Dataset Tables first)
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    parquet = importPyArrow()
+    import pyarrow
+
+    # Only Folders of known Tables are Removed, never anything else in the Path
+    if not append:
+        for key in RESULTTABLES:
+            if os.path.isdir(os.path.join(path, key)):
+                shutil.rmtree(os.path.join(path, key))
+
+    for key, table in tables.items():
+        os.makedirs(os.path.join(path, key), exist_ok=True)
+        parquet.write_table(
+            pyarrow.Table.from_pandas(table, preserve_index=False),
+            os.path.join(path, key, f"part-{uuid.uuid4().hex}.parquet"),
+        )
+
+
+def writeHDF5(tables: dict[str, pd.DataFrame], path: str, append: bool):
+    """Writes Tables to a HDF5 File, Appending to a Queryable Table per Block where every Column can be Filtered on
+
+    ## Parameters : \n
+        tables : dict[str, pd.DataFrame] - Tables to Write by Name \n
+        path : str - Path of the HDF5 File \n
+        append : bool - Add to the Existing Tables (False = Replace the File)
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    importTables()
+
+    with pd.HDFStore(path, mode="a" if append else "w", complevel=5, complib="blosc") as store:
+        for key, table in tables.items():
+            textColumns = table.select_dtypes(include="object").columns
+            store.append(
+                key,
+                table,
+                format="table",
+                data_columns=True,
+                index=False,
+                min_itemsize={
+                    column: HDF5PATHSIZE if column == "filePath" else HDF5STRINGSIZE
+                    for column in textColumns
+                },
+            )
+
+
+def readResults(
+    path: str,
+    table: str = "summary",
+    filters: list[tuple] = None,
+    columns: list[str] = None,
+) -> pd.DataFrame:
+    """Reads a Table of a Results Dataset. Filters are Pushed down to the Storage, only Row Groups (Parquet) or Rows (HDF5) that can Match are Read
+
+    ## Parameters : \n
+        path : str - Folder of the Parquet Dataset or Path of the HDF5 File \n
+        table : str - Name of the Table to Read (See RESULTTABLES) \n
+        filters : list[tuple] - Conditions every Row must Meet, as (Column, Operator, Value) (Ex. [("energy", "<", -600)]) \n
+        columns : list[str] - Columns to Read (None = All)
+
+    ## Returns : \n
+        pd.DataFrame - The Matching Rows
+    """
+    if table not in RESULTTABLES:
+        raise ValueError(f"Table must be one of {RESULTTABLES}")
+
+    filters = filters or []
+    for condition in filters:
+        if len(condition) != 3 or condition[1] not in FILTEROPERATORS:
+            raise ValueError(f"Filters must be (Column, Operator, Value) with an Operator in {FILTEROPERATORS}")
+
+    # A Parquet Dataset is a Folder, a HDF5 Dataset is a File
+    if os.path.isdir(path):
+        importPyArrow()
+        return pd.read_parquet(
+            os.path.join(path, table), columns=columns, filters=filters or None
+        ).reset_index(drop=True)
+
+    importTables()
+
+    where = [
+        f"{column} = {list(value)!r}" if operator == "in" else f"{column} {operator} {value!r}"
+        for column, operator, value in filters
+    ]
+
+    return pd.read_hdf(path, table, where=where or None, columns=columns).reset_index(drop=True)
@@ -0,0 +1,406 @@
+import os
+import json
+import time
+import inspect
+import itertools
+import threading
+import functools
+import contextvars
+from typing import TYPE_CHECKING
+from contextlib import contextmanager
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PROCESSIOPATH = "/proc/self/io"
+"""Linux File with the Bytes the Process has Read and Written (Other Platforms Record no Bytes)"""
+
+activeTracers: list["Tracer"] = []
+"""Tracers Recording Spans, the Last one Started Records"""
+
+currentSpan: contextvars.ContextVar["Span"] = contextvars.ContextVar("currentSpan", default=None)
+"""Innermost Open Span of the Thread or Task, Parent of the next Span Opened"""
+
+spanIDs = itertools.count(1)
+"""Counter Numbering the Spans of the Process"""
+
+
+class Span:
+    """Timing of a Section of Code. Records the Wall Time, the CPU Time of the Process and of the Processes it Waited on (Orca), and the Bytes the Process Read and Wrote. CPU Time and Bytes are Process Wide, Spans running at the same Time in Threads share them"""
+
+    name: str
+    """Name of the Timed Section (Ex. "runOrcaCalculation")"""
+
+    category: str
+    """Group of the Section (Ex. "orca", "calculation", "parse")"""
+
+    ID: str
+    """Unique ID of the Span, the Process ID and a Counter (Worker Processes continue the Counter of their Parent)"""
+
+    parentID: str
+    """ID of the Span this one is Nested in (None = Top Level)"""
+
+    processID: int
+    """ID of the Process the Span Ran in"""
+
+    threadID: int
+    """ID of the Thread the Span Ran in"""
+
+    start: float
+    """Time the Span Started (Seconds since the Epoch)"""
+
+    wallTime: float
+    """Seconds the Span Took"""
+
+    CPUTime: float
+    """Seconds of CPU the Process used during the Span"""
+
+    childCPUTime: float
+    """Seconds of CPU used by Child Processes (Orca) that Finished during the Span"""
+
+    bytesRead: int
+    """Bytes the Process Read during the Span (None if Unknown)"""
+
+    bytesWritten: int
+    """Bytes the Process Wrote during the Span (None if Unknown)"""
+
+    attributes: dict
+    """Additional Values Recorded with the Span (Ex. Calculation Name, Queue Wait)"""
+
+    def __init__(self, name: str, category: str, attributes: dict):
+        parent = currentSpan.get()
+        self.name = name
+        self.category = category
+        self.processID = os.getpid()
+        self.ID = f"{self.processID}-{next(spanIDs)}"
+        self.parentID = parent.ID if parent is not None else None
+        self.threadID = threading.get_ident()
+        self.start = None
+        self.wallTime = None
+        self.CPUTime = None
+        self.childCPUTime = None
+        self.bytesRead = None
+        self.bytesWritten = None
+        self.attributes = attributes
+
+    def toDict(self) -> dict:
+        """Gives the Values of the Span
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            dict - The Values of the Span by Name
+        """
+        return {
+            "name": self.name,
+            "category": self.category,
+            "ID": self.ID,
+            "parentID": self.parentID,
+            "processID": self.processID,
+            "threadID": self.threadID,
+            "start": self.start,
+            "wallTime": self.wallTime,
+            "CPUTime": self.CPUTime,
+            "childCPUTime": self.childCPUTime,
+            "bytesRead": self.bytesRead,
+            "bytesWritten": self.bytesWritten,
+            "attributes": self.attributes,
+        }
+
+
+class Tracer:
+    """Records the Spans Opened while it is Active. Spans Opened in Worker Processes of a ClusterCalculation are sent back and Recorded too. Without an Active Tracer Spans Record nothing
+
+    ## Example:
+
+    with Tracer() as tracer:
+        spectra.runCalculation()
+
+    tracer.exportChromeTrace("Spectra.trace.json")  # Open in chrome://tracing or ui.perfetto.dev
+    tracer.getSummary()
+    """
+
+    spans: list[Span]
+    """Closed Spans in the Order they Finished"""
+
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exception):
+        self.stop()
+
+    def start(self) -> "Tracer":
+        """Starts Recording the Spans
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            Tracer - The Tracer
+        """
+        activeTracers.append(self)
+        return self
+
+    def stop(self):
+        """Stops Recording the Spans
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if self in activeTracers:
+            activeTracers.remove(self)
+
+    def addSpans(self, spans: list[Span]):
+        """Records Closed Spans
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spans : list[Span] - The Spans to Record
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        with self.lock:
+            self.spans.extend(spans)
+
+    def getSpans(self) -> "pd.DataFrame":
+        """Gives every Recorded Span
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            pd.DataFrame - One Row per Span, Ordered by Start Time
+        """
+        # Worker Processes Record Spans without Loading pandas
+        import pandas as pd
+
+        with self.lock:
+            rows = [record.toDict() for record in self.spans]
+
+        if len(rows) == 0:
+            return pd.DataFrame(columns=list(Span("", "", {}).toDict()))
+
+        return pd.DataFrame(rows).sort_values("start", ignore_index=True)
+
+    def getSummary(self) -> "pd.DataFrame":
+        """Totals the Spans of each Name, to see where the Time goes
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            pd.DataFrame - Count, Total Wall Time, CPU Time, Child CPU Time and Bytes of each Span Name, Longest Total first
+        """
+        return (
+            self.getSpans()
+            .groupby(["category", "name"], as_index=False)
+            .agg(
+                count=("ID", "size"),
+                wallTime=("wallTime", "sum"),
+                CPUTime=("CPUTime", "sum"),
+                childCPUTime=("childCPUTime", "sum"),
+                bytesRead=("bytesRead", "sum"),
+                bytesWritten=("bytesWritten", "sum"),
+            )
+            .sort_values("wallTime", ascending=False, ignore_index=True)
+        )
+
+    def exportJSONLines(self, path: str):
+        """Writes every Span as a line of JSON
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            path : str - Path of the Trace File
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        with self.lock:
+            spans = sorted(self.spans, key=lambda record: record.start)
+
+        with open(path, "w") as file:
+            for record in spans:
+                file.write(json.dumps(record.toDict(), default=str) + "\n")
+
+    def exportChromeTrace(self, path: str):
+        """Writes the Spans in the Chrome Trace Event Format, Viewable in chrome://tracing or ui.perfetto.dev
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            path : str - Path of the Trace File
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        with self.lock:
+            spans = sorted(self.spans, key=lambda record: record.start)
+
+        events = [
+            {
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.wallTime * 1e6,
+                "pid": record.processID,
+                "tid": record.threadID,
+                "args": {
+                    **record.attributes,
+                    "CPUTime": record.CPUTime,
+                    "childCPUTime": record.childCPUTime,
+                    "bytesRead": record.bytesRead,
+                    "bytesWritten": record.bytesWritten,
+                },
+            }
+            for record in spans
+        ]
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file, default=str)
+
+
+def getActiveTracer() -> Tracer:
+    """Gives the Tracer Recording Spans
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        Tracer - The Active Tracer (None if not Tracing)
+    """
+    return activeTracers[-1] if activeTracers else None
+
+
+def readProcessIO() -> tuple[int, int]:
+    """Reads the Bytes the Process has Read and Written so far
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        tuple[int, int] - Bytes Read and Written (None, None if the Platform doesn't Report them)
+    """
+    try:
+        with open(PROCESSIOPATH, "r") as file:
+            counters = dict(line.split(": ") for line in file.read().splitlines())
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def getChildCPUTime() -> float:
+    """Gives the CPU Time used by the Finished Child Processes
+
+    ## Parameters : \n
+        None - No Parameters
+
+    ## Returns : \n
+        float - Seconds of CPU
+    """
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+@contextmanager
+def span(name: str, category: str = "qchem", **attributes):
+    """Times the Code in the With Block as a Span, Nested in the Span it is Opened in. Records nothing without an Active Tracer
+
+    ## Parameters : \n
+        name : str - Name of the Timed Section \n
+        category : str - Group of the Section \n
+        **attributes - Additional Values to Record with the Span
+
+    ## Returns : \n
+        Span - The Open Span, Attributes can be Added to it in the Block
+    """
+    record = Span(name, category, attributes)
+    tracer = getActiveTracer()
+
+    if tracer is None:
+        yield record
+        return
+
+    token = currentSpan.set(record)
+    bytesRead, bytesWritten = readProcessIO()
+    childCPUTime = getChildCPUTime()
+    CPUTime = time.process_time()
+    wallTime = time.perf_counter()
+    record.start = time.time()
+
+    try:
+        yield record
+    finally:
+        record.wallTime = time.perf_counter() - wallTime
+        record.CPUTime = time.process_time() - CPUTime
+        record.childCPUTime = getChildCPUTime() - childCPUTime
+        endRead, endWritten = readProcessIO()
+        if bytesRead is not None and endRead is not None:
+            record.bytesRead = endRead - bytesRead
+            record.bytesWritten = endWritten - bytesWritten
+        currentSpan.reset(token)
+        tracer.addSpans([record])
+
+
+def addAttributes(**attributes):
+    """Adds Values to the Innermost Open Span, does nothing outside of a Span
+
+    ## Parameters : \n
+        **attributes - Values to Record with the Span
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    record = currentSpan.get()
+    if record is not None:
+        record.attributes.update(attributes)
+
+
+def traced(category: str = "qchem", name: str = None):
+    """Decorator that Times every Call of a Function or Coroutine as a Span. Calls of Methods on Objects with a Name (Calculations) Record the Name
+
+    ## Parameters : \n
+        category : str - Group of the Spans \n
+        name : str - Name of the Spans (None = The Qualified Name of the Function)
+
+    ## Returns : \n
+        Callable - The Decorator
+    """
+
+    def getAttributes(args: tuple) -> dict:
+        if len(args) == 0:
+            return {}
+        if isinstance(args[0], str):
+            return {"calculation": args[0]}
+        if isinstance(getattr(args[0], "name", None), str):
+            return {"calculation": args[0].name}
+        return {}
+
+    def decorator(function):
+        spanName = name or function.__qualname__
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def asyncWrapper(*args, **kwargs):
+                with span(spanName, category, **getAttributes(args)):
+                    return await function(*args, **kwargs)
+
+            return asyncWrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(spanName, category, **getAttributes(args)):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
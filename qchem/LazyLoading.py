@@ -0,0 +1,49 @@
+import sys
+import types
+import importlib
+
+
+class LazyPackage(types.ModuleType):
+    """Package whose Public Symbols are Imported the first time they are Accessed, so Importing the Package doesn't Load pandas, matplotlib or every Calculation Module. Each Symbol is Mapped to the Module that Defines it in LAZYATTRIBUTES"""
+
+    LAZYATTRIBUTES: dict[str, tuple[str, str]]
+    """Module (Relative to the Package) and Name in it of each Public Symbol (None = The Module itself)"""
+
+    def __getattr__(self, name: str):
+        attributes = self.__dict__.get("LAZYATTRIBUTES", {})
+        if name not in attributes:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        moduleName, attribute = attributes[name]
+        module = importlib.import_module(moduleName, self.__name__)
+        value = module if attribute is None else getattr(module, attribute)
+
+        # Cached on the Package, later Accesses don't come back here
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value):
+        # Importing a Submodule Binds it on its Package, it must not hide the Class of the same Name (qchem.Molecule is the Class)
+        attribute = self.__dict__.get("LAZYATTRIBUTES", {}).get(name)
+        if isinstance(value, types.ModuleType) and attribute is not None and attribute[1] is not None:
+            return
+
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__dict__.get("LAZYATTRIBUTES", {})))
+
+
+def makeLazy(name: str, attributes: dict[str, tuple[str, str]]):
+    """Turns an Imported Package into a LazyPackage, called at the end of the Packages __init__
+
+    ## Parameters : \n
+        name : str - Name of the Package (__name__) \n
+        attributes : dict[str, tuple[str, str]] - Module (Relative to the Package) and Name in it of each Public Symbol (None = The Module itself)
+
+    ## Returns : \n
+        None - No Return Value
+    """
+    package = sys.modules[name]
+    package.__dict__["LAZYATTRIBUTES"] = attributes
+    package.__class__ = LazyPackage
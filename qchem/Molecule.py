@@ -253,6 +253,33 @@ class Molecule:
             self.XYZCoordinates.loc[atomIndex, "Y"] = newPosition[1]
             self.XYZCoordinates.loc[atomIndex, "Z"] = newPosition[2]
 
+    def displaceAtoms(self, displacement: np.ndarray, maxDisplacement: float = None):
+        """Moves every Atom of the Molecule along a Displacement Vector (Ex. a Normal Mode)
+
+        ## Parameters : \n
+            self : Molecule - Default Parameter for the Class Instance \n
+            displacement : np.ndarray - Displacement of each Atom in Angstroms, either of shape (atomCount, 3) or flattened as x1, y1, z1, x2, ... \n
+            maxDisplacement : float - If specified the Displacement is Scaled so that the Atom Moving the most moves by this many Angstroms
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        displacement = np.asarray(displacement, dtype=float).reshape(-1, 3)
+
+        if len(displacement) != self.atomCount:
+            raise ValueError(
+                f"Displacement has {len(displacement)} Atoms but the Molecule has {self.atomCount}"
+            )
+
+        if maxDisplacement is not None:
+            largest = np.max(np.linalg.norm(displacement, axis=1))
+            if largest == 0:
+                raise ValueError("Displacement cannot be Scaled, it doesn't move any Atom")
+            displacement = displacement * (maxDisplacement / largest)
+
+        positions = self.XYZCoordinates[["X", "Y", "Z"]].astype(float).to_numpy()
+        self.XYZCoordinates[["X", "Y", "Z"]] = positions + displacement
+
     def getConformers(self, atomIndex1: int, atomIndex2: int, steps: int):
         """Generates a List of Conformer Molecules with each Conformers specified bond rotated by (2pi / steps) radians
 
@@ -390,6 +417,45 @@ class Molecule:
             }
         )
 
+    def getEquivalentAtoms(self) -> list[int]:
+        """Groups the Atoms that are Chemically Equivalent from the Bond Graph (Ex. the 3 Hydrogens of a Methyl Group). Labels start as the Atomic Symbol and are Refined with the Labels of the Bonded Atoms until no Group Splits anymore. Only the Connectivity is used, so Atoms only told apart by their Geometry (Ex. Diastereotopic Hydrogens) share a Group
+
+        ## Parameters : \n
+            self : Molecule - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            list[int] - Group of each Atom, Groups are Numbered in Order of their First Atom
+        """
+        neighbours = self.bonds["Bonds"].values
+        labels = self.relabel(list(self.XYZCoordinates["Atom"].values))
+
+        while True:
+            refined = self.relabel(
+                [
+                    (labels[i], tuple(sorted(labels[j] for j in neighbours[i])))
+                    for i in range(self.atomCount)
+                ]
+            )
+
+            # Refinement only ever Splits Groups, the same Count means it has Converged
+            if len(set(refined)) == len(set(labels)):
+                return refined
+
+            labels = refined
+
+    @staticmethod
+    def relabel(labels: list) -> list[int]:
+        """Replaces Labels with Integers, Numbered in Order of their First Appearance
+
+        ## Parameters : \n
+            labels : list - Hashable Label of each Atom
+
+        ## Returns : \n
+            list[int] - Integer Label of each Atom
+        """
+        numbers = {}
+        return [numbers.setdefault(label, len(numbers)) for label in labels]
+
     def getAtomPosition(self, atomIndex: int):
         """Returns a Numpy Array with the XYZ Position of the Specified Atom
 
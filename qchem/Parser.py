@@ -1,19 +1,25 @@
 import pandas as pd
+import numpy as np
 import re
 import os
 from qchem.Molecule import Molecule
 from qchem.XYZFile import XYZFile
+from qchem.Compression import openCompressed, getUncompressedPath
+from qchem.Instrumentation import traced, addAttributes
 
 class OrcaOutput:
+    @traced("parse", "OrcaOutput.parse")
     def __init__(self, filePath: str):
         """Initialize OrcaOutput with ORCA output file path and extract all data."""
         # Store file path and read contents
         self.filePath = filePath
-        with open(self.filePath, "r") as file:
+        # Output Files may be Compressed (.gz / .zst) to save Space
+        with openCompressed(self.filePath, "r") as file:
             self.lines = file.readlines()
 
         # Extract filename without path/extension using regex
-        self.name =  os.path.splitext(os.path.basename(self.filePath))[0]
+        self.name =  os.path.splitext(os.path.basename(getUncompressedPath(self.filePath)))[0]
+        addAttributes(output=self.name, lines=len(self.lines))
 
         # Determine calculation types (FREQ, NMR, OPT, GOAT)
         self.determineCalculationType()
@@ -92,6 +98,66 @@ class OrcaOutput:
                     file.write(f"Sconf at 298.15 K: {self.GOATSummary['sconf']} cal/(molK)\n")
                     file.write(f"Gconf at 298.15 K: {self.GOATSummary['gconf']} kcal/mol\n\n")
 
+    def getTables(self) -> dict[str, pd.DataFrame]:
+        """Collect every parsed block as a long format table, each row keyed by the output name (and step for repeated blocks), ready for columnar export."""
+        gibbs = self.getGibbsEnergy()
+        dipole = self.dipole if self.dipole else (np.nan, np.nan, np.nan)
+        summary = self.GOATSummary if self.GOATSummary else {}
+
+        tables = {
+            "summary": pd.DataFrame(
+                {
+                    "filePath": [self.filePath],
+                    "calculationTypes": [",".join(self.calculationTypes)],
+                    "energy": [self.energy],
+                    "gibbsEnergy": [gibbs[0] if gibbs else np.nan],
+                    "dipoleX": [dipole[0]],
+                    "dipoleY": [dipole[1]],
+                    "dipoleZ": [dipole[2]],
+                    "dipoleMagnitude": [self.absolutedipole],
+                    "conformersBelow3KCal": [summary.get("conformersBelow3KCal", -1)],
+                    "lowestEnergy": [summary.get("lowestEnergy", np.nan)],
+                    "sconf": [summary.get("sconf", np.nan)],
+                    "gconf": [summary.get("gconf", np.nan)],
+                }
+            ).astype({"energy": float, "dipoleMagnitude": float}),
+            "scf": pd.DataFrame(
+                {"step": np.arange(len(self.SCFEnergies)), "energy": np.array(self.SCFEnergies, dtype=float)}
+            ),
+            "timings": pd.DataFrame(columns=["Timing", "Time"]),
+            "mayer": self.stackSteps(
+                [step.assign(atomIndex=np.arange(len(step))) for step in self.mayerPopulation]
+            ),
+            "loewdin": self.stackSteps(self.loedwin),
+            "frequencies": self.vibrationalFrequencies,
+            "ir": self.IRFrequencies,
+            "shifts": self.chemicalShifts,
+            "conformers": self.conformers,
+        }
+
+        if isinstance(self.finalTimings, pd.DataFrame):
+            tables["timings"] = pd.DataFrame(
+                {
+                    "Timing": self.finalTimings["Timing"].str.strip(),
+                    "Time": self.finalTimings["Time"].astype(float),
+                }
+            )
+
+        # Skip blocks this calculation didn't produce, and key every row by the output
+        return {
+            key: table.assign(output=self.name)[["output", *table.columns]].reset_index(drop=True)
+            for key, table in tables.items()
+            if isinstance(table, pd.DataFrame) and not table.empty
+        }
+
+    @staticmethod
+    def stackSteps(steps: list[pd.DataFrame]) -> pd.DataFrame:
+        """Stack per step DataFrames (e.g. charges at every optimization step) into one table with a step column."""
+        if len(steps) == 0:
+            return None
+        stacked = pd.concat([step.assign(step=i) for i, step in enumerate(steps)], ignore_index=True)
+        return stacked[["step", *stacked.columns[:-1]]]
+
     def readXYZFile(self, path: str) -> pd.DataFrame:
         """Read XYZ format atomic coordinates."""
         return pd.read_csv(path, sep=r"\s+", skiprows=1, names=["Atom", "X", "Y", "Z"], engine="python")
@@ -212,6 +278,41 @@ class OrcaOutput:
             return pd.DataFrame(columns=["mode", "frequency"])
         return pd.DataFrame(freqs)
 
+    def getNormalModes(self) -> np.ndarray:
+        """Extract normal mode displacement vectors (one column per mode, rows are x, y, z of each atom)."""
+        modes = {}
+        for i, line in enumerate(self.lines):
+            if line.strip() == "NORMAL MODES":
+                # Later blocks (e.g. after a restart) replace earlier ones
+                modes = {}
+                idx = i + 1
+
+                # Skip the explanation until the first header of mode indices
+                while idx < len(self.lines) and not self.isModeHeader(self.lines[idx]):
+                    idx += 1
+
+                # Each block holds up to 6 modes
+                while idx < len(self.lines) and self.isModeHeader(self.lines[idx]):
+                    modeIndices = [int(part) for part in self.lines[idx].split()]
+                    idx += 1
+                    while idx < len(self.lines):
+                        parts = self.lines[idx].split()
+                        if len(parts) != len(modeIndices) + 1 or "." not in parts[1]:
+                            break
+                        for modeIndex, value in zip(modeIndices, parts[1:]):
+                            modes.setdefault(modeIndex, []).append(float(value))
+                        idx += 1
+
+        if not modes:
+            return np.empty((0, 0))
+        return np.array([modes[modeIndex] for modeIndex in sorted(modes)]).T
+
+    @staticmethod
+    def isModeHeader(line: str) -> bool:
+        """Check if a line is the header of mode indices in the normal modes block."""
+        parts = line.split()
+        return len(parts) > 0 and all(part.isdigit() for part in parts)
+
     def getGibbsEnergy(self) -> tuple:
         """Extract Gibbs free energy and units."""
         for i, line in enumerate(self.lines):
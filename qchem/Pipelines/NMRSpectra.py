@@ -0,0 +1,399 @@
+import os
+import time
+import pandas as pd
+from typing import Callable
+from qchem.Molecule import Molecule
+from qchem.Calculation.GOAT import GOAT
+from qchem.Calculation.NMR import NMR
+from qchem.Calculation.GeoOpt import GeoOpt
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Data.Enums import OrcaInputTemplate, CalculationStatus
+from qchem.Calculation.BaseOrcaCalculation import BaseOrcaCalculation
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+from qchem.Parser import OrcaOutput
+from qchem.Pipelines.Workflow import Workflow
+from qchem.Instrumentation import traced
+from qchem.Spectroscopy.NMRSpectrum import (
+    EnsembleShielding,
+    NMRNUCLEI,
+    TMSSHIELDINGS,
+    broadenShifts,
+    getReferenceShieldings,
+)
+
+
+class NMRSpectra(BaseOrcaCalculation):
+    """Performs a NMR Spectra Analysis Calculation on a Molecule. Runs a NMR Calculation on every Conformer found by GOAT, Averages the Shieldings over the Ensemble and Provides the Chemical Shifts and the 1H and 13C NMR Spectra of the Molecule"""
+
+    calculationType: str = "NMRSpectra"
+    """The Keyword for the Calculation to run on the Molecule (For Pipelines replace with name)"""
+
+    reference: dict[str, float] | Molecule
+    """Shielding (ppm) of each Element in the Reference Compound, or the Reference Molecule (Ex. TMS) to Compute them with the same Settings"""
+
+    weighting: str
+    """How Conformers are Weighted ("contribution" = GOAT Contribution, "energy" = Boltzmann Weight from the NMR Calculations Energy)"""
+
+    shifts: pd.DataFrame
+    """DataFrame with the Group, Ensemble Averaged Shielding and Chemical Shift of every Atom"""
+
+    NMRSpectra: dict[str, pd.DataFrame]
+    """Broadened NMR Spectrum of each Nucleus ("1H", "13C")"""
+
+    ensembleShielding: EnsembleShielding
+    """Accumulates the Weighted Shieldings of the Conformers as each NMR Calculation Finishes"""
+
+    def __init__(
+        self,
+        molecule: str | Molecule,
+        template: str | OrcaInputTemplate = "",
+        index: int = 1,
+        cores: int = 1,
+        isLocal: bool = False,
+        name: str = "Molecule",
+        stdout: bool = True,
+        reference: dict[str, float] | str | Molecule = TMSSHIELDINGS,
+        weighting: str = "contribution",
+        **variables,
+    ):
+        # Make a Super Call (Use the Base Class Init for some Boilerplate Setup)
+        super().__init__(
+            name, molecule, template, index, cores, isLocal, stdout, **variables
+        )
+
+        # Check if the Calculation has a Basis Set and a Functional Defined (Specific to Certain Calculations)
+        self.basisSetFunctionalCompliant()
+
+        if weighting not in ("contribution", "energy"):
+            raise ValueError('Weighting must be "contribution" or "energy"')
+
+        if not isinstance(reference, (dict, str, Molecule)):
+            raise ValueError("Reference must be a Dictionary of Shieldings, a Molecule or a Path to a XYZ File")
+
+        # Load the Reference Molecule so it is Pasted into the Template like the Conformers
+        if isinstance(reference, str):
+            reference = Molecule(os.path.splitext(os.path.basename(reference))[0], reference)
+
+        self.reference = reference
+        self.weighting = weighting
+
+        # Delete Cores from Variables cause it causes Issues
+        self.variables.pop("cores")
+
+        # Check if the Parallel Calculations are Defined
+        if not ("parallelCalcs" in self.variables) or not isinstance(self.variables["parallelCalcs"], int) or self.variables["parallelCalcs"] < 1:
+            self.variables["parallelCalcs"] = 1
+
+    @traced("pipeline")
+    def runCalculation(self):
+        """Runs the NMR Spectra Calculation and Saves the Chemical Shifts and NMR Spectra
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Timer
+        startTime = time.time()
+
+        # Make Cache Folder if it doesn't Exist
+        self.createDirectories()
+
+        print("\nRunning GeoOpt!\n")
+
+        # Run the GeoOptimization on the Molecule
+        geoOptCalc = self.createGeoOpt()
+        geoOptCalc.runCalculation()
+
+        print("\nFinished GeoOpt!\n")
+        print("\nRunning GOAT!\n")
+
+        # Run the GOAT Calculation
+        goatCalc = self.createGOAT(geoOptCalc.optMolecule)
+        goatCalc.runCalculation()
+
+        print("\nFinished GOAT!\n")
+        print("\nRunning NMR Analysis!\n")
+
+        # Create a NMR Calculation for every Conformer, and the Reference last
+        nmrCalcs = self.createNMRs(goatCalc)
+        referenceCalc = self.createReferenceNMR()
+        if referenceCalc is not None:
+            nmrCalcs.append(referenceCalc)
+
+        cluster = ClusterCalculation(
+            [nmrCalc.inputFile for nmrCalc in nmrCalcs],
+            self.cores,
+            "NMRCluster",
+            self.isLocal,
+            False,
+            self.scratch,
+        )
+
+        cluster.runCalculations()
+
+        outputFilePaths = [calculation.outputFilePath for calculation in cluster.completedCalculations]
+
+        if referenceCalc is not None:
+            self.reference = getReferenceShieldings(
+                OrcaOutput(outputFilePaths.pop()).getChemicalShifts()
+            )
+
+        # Combine the Conformers Shieldings into the Ensemble Shifts
+        self.ensembleShielding = EnsembleShielding()
+        for i, outputFilePath in enumerate(outputFilePaths):
+            outputFile = OrcaOutput(outputFilePath)
+            self.addConformerShielding(
+                goatCalc, i, outputFile.getChemicalShifts(), outputFile.getFinalEnergy()
+            )
+
+        self.saveSpectra(goatCalc)
+
+        # Get Total Time for Spectra
+        calcTime = time.time() - startTime
+
+        print(f"\nFinished Making {self.name} NMR Spectra! ({self.clockTime(calcTime)})\n")
+
+    @traced("pipeline")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the NMR Spectra as a Workflow, the NMR Calculations of all Conformers run concurrently, sharing the Core Budget
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = A Budget of this Calculations Cores) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Timer
+        startTime = time.time()
+
+        workflow = Workflow(max(1, self.cores), self.name)
+        self.addToWorkflow(workflow)
+        await workflow.runAsync(coreBudget, progress)
+
+        # Get Total Time for Spectra
+        calcTime = time.time() - startTime
+
+        print(f"\nFinished Making {self.name} NMR Spectra! ({self.clockTime(calcTime)})\n")
+
+    def addToWorkflow(self, workflow: Workflow, dependencies: list[str] = None) -> str:
+        """Adds the Steps of the NMR Spectra (GeoOpt -> GOAT -> NMR for every Conformer -> Shifts and Spectra) to a Workflow. The Reference Molecule, if any, runs alongside the GeoOpt
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            workflow : Workflow - The Workflow to add the Steps to \n
+            dependencies : list[str] - Names of Steps that have to Finish before the NMR Spectra Starts
+
+        ## Returns: \n
+            str - Name of the Final Step, its Result is the Chemical Shifts DataFrame
+        """
+        # Make Cache Folder if it doesn't Exist
+        self.createDirectories()
+
+        geoOptStep = workflow.addCalculation(
+            f"{self.name}_GEOOPT", lambda results: self.createGeoOpt(), dependencies
+        )
+
+        goatStep = workflow.addCalculation(
+            f"{self.name}_GOAT",
+            lambda results: self.createGOAT(results[geoOptStep].optMolecule),
+            [geoOptStep],
+        )
+
+        nmrCalcs: list[NMR] = []
+
+        def createNMRs(results):
+            self.ensembleShielding = EnsembleShielding()
+            nmrCalcs.extend(self.createNMRs(results[goatStep]))
+            return nmrCalcs
+
+        # Each Conformer is Added to the Ensemble as soon as its NMR Calculation Finishes
+        def addConformer(nmrCalc: NMR):
+            goatCalc = workflow.getResult(goatStep)
+            self.addConformerShielding(
+                goatCalc, nmrCalcs.index(nmrCalc), nmrCalc.chemicalShifts, nmrCalc.energy
+            )
+
+        nmrStep = workflow.addCalculation(
+            f"{self.name}_NMR", createNMRs, [goatStep], onComplete=addConformer
+        )
+
+        spectraDependencies = [goatStep, nmrStep]
+
+        if isinstance(self.reference, Molecule):
+            referenceStep = workflow.addCalculation(
+                f"{self.name}_NMR_REFERENCE",
+                lambda results: self.createReferenceNMR(),
+                dependencies,
+            )
+            spectraDependencies.append(referenceStep)
+
+        def combineSpectra(results):
+            if isinstance(self.reference, Molecule):
+                self.reference = getReferenceShieldings(results[referenceStep].chemicalShifts)
+
+            self.saveSpectra(results[goatStep])
+            return self.shifts
+
+        return workflow.addCalculation(
+            f"{self.name}_NMRSPECTRA", combineSpectra, spectraDependencies
+        )
+
+    def createGeoOpt(self) -> GeoOpt:
+        """Creates the GeoOpt Calculation that Optimizes the Molecule before the Conformer Search
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns: \n
+            GeoOpt - The GeoOpt Calculation Object
+        """
+        return self.inheritExecutor(GeoOpt(
+            self.molecule,
+            True,
+            self.template,
+            self.index,
+            self.cores,
+            self.isLocal,
+            f"{self.name}_GEOOPT",
+            False,
+            **self.variables,
+        ))
+
+    def createGOAT(self, molecule: Molecule) -> GOAT:
+        """Creates the GOAT Calculation that finds the Conformers of the Optimized Molecule
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            molecule : Molecule - The Optimized Molecule
+
+        ## Returns: \n
+            GOAT - The GOAT Calculation Object
+        """
+        return self.inheritExecutor(GOAT(
+            molecule,
+            self.template,
+            self.index,
+            self.cores,
+            self.isLocal,
+            f"{self.name}_GOAT",
+            False,
+            **self.variables,
+        ))
+
+    def createNMRs(self, goatCalc: GOAT) -> list[NMR]:
+        """Creates a NMR Calculation for every Conformer found by GOAT
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation
+
+        ## Returns: \n
+            list[NMR] - The NMR Calculation Objects, in Conformer Order
+        """
+        return [
+            self.inheritExecutor(NMR(
+                conformer,
+                self.template,
+                self.index,
+                self.cores // self.variables["parallelCalcs"],
+                self.isLocal,
+                f"{self.name}_NMR_{i}",
+                False,
+                **self.variables,
+            ))
+            for i, conformer in enumerate(goatCalc.conformers)
+        ]
+
+    def createReferenceNMR(self) -> NMR:
+        """Creates the NMR Calculation of the Reference Molecule, run with the same Settings as the Conformers
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns: \n
+            NMR - The NMR Calculation Object (None if the Reference Shieldings are Given)
+        """
+        if not isinstance(self.reference, Molecule):
+            return None
+
+        return self.inheritExecutor(NMR(
+            self.reference,
+            self.template,
+            self.index,
+            self.cores // self.variables["parallelCalcs"],
+            self.isLocal,
+            f"{self.name}_NMR_REFERENCE",
+            False,
+            **self.variables,
+        ))
+
+    @traced("pipeline")
+    def addConformerShielding(
+        self, goatCalc: GOAT, conformerIndex: int, chemicalShifts: pd.DataFrame, energy: float
+    ):
+        """Adds the Shieldings of a Conformer to the Ensemble, Weighted by its Contribution or its Energy
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation \n
+            conformerIndex : int - Index of the Conformer in the GOAT Ensemble \n
+            chemicalShifts : pd.DataFrame - Shieldings of the Conformer as returned by OrcaOutput.getChemicalShifts \n
+            energy : float - Energy of the Conformer in Hartree
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Save Individual Shieldings
+        chemicalShifts.to_csv(
+            os.path.join(self.orcaCachePath, f"{self.name}_Shielding_{conformerIndex}.csv"),
+            index=False,
+        )
+
+        if self.weighting == "energy":
+            self.ensembleShielding.addConformer(chemicalShifts["isotropic"].values, energy=energy)
+        else:
+            self.ensembleShielding.addConformer(
+                chemicalShifts["isotropic"].values,
+                weight=goatCalc.conformerContribution[conformerIndex],
+            )
+
+    @traced("pipeline")
+    def saveSpectra(self, goatCalc: GOAT):
+        """Saves the Chemical Shifts (Averaged over the Ensemble and over Equivalent Atoms) and the NMR Spectrum of each Nucleus
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        print("\nFinished NMR Analysis!\n")
+        print("\nMaking Final Touches\n")
+
+        # Every Conformer shares the Atom Order and Bonds of the first one
+        molecule = goatCalc.conformers[0]
+
+        self.shifts = self.ensembleShielding.getShifts(
+            list(molecule.XYZCoordinates["Atom"].values),
+            self.reference,
+            molecule.getEquivalentAtoms(),
+        )
+
+        self.shifts.to_csv(os.path.join(self.orcaCachePath, f"{self.name}_Shifts.csv"), index=False)
+
+        self.NMRSpectra = {}
+        for nucleus in NMRNUCLEI:
+            self.NMRSpectra[nucleus] = broadenShifts(self.shifts, nucleus)
+            self.NMRSpectra[nucleus].to_csv(
+                os.path.join(self.orcaCachePath, f"{self.name}_{nucleus}_NMRSpectrum.csv"),
+                index=False,
+            )
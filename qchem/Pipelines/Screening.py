@@ -0,0 +1,305 @@
+import os
+import csv
+import time
+import asyncio
+import pandas as pd
+from typing import Callable
+from qchem.Molecule import Molecule
+from qchem.Parser import OrcaOutput
+from qchem.Pipelines.Spectra import Spectra
+from qchem.Pipelines.Workflow import Workflow
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Calculation.OrcaCalculation import clockTime
+from qchem.Data.Enums import OrcaInputTemplate, CalculationStatus
+
+
+class Screening:
+    """Runs the Spectra Pipeline (GeoOpt -> GOAT -> Frequency) on many Molecules at once. All Molecules share a single Core Budget so that one Molecules single core stages overlap with the other Molecules Calculations. A Results Table is written as each Molecule Finishes"""
+
+    name: str
+    """Name of the Screening, used for the Folder the Results Table is saved to"""
+
+    molecules: list[Molecule]
+    """The Molecules being Screened"""
+
+    cores: int
+    """Total Number of Cores shared by all the Molecules Calculations"""
+
+    calculationCores: int
+    """Number of Cores each GeoOpt and GOAT Calculation uses (Frequency Calculations use calculationCores // parallelCalcs, or the Cores a CoreAllocator Chooses without parallelCalcs)"""
+
+    template: str | OrcaInputTemplate
+    """Template for the Input Files of the Calculations"""
+
+    isLocal: bool
+    """Boolean flag to indicate if the calculations run locally or in Docker (True = Local, False = Docker)"""
+
+    variables: dict
+    """Additional Variables that will be pasted into the Input File Templates (basis, functional, parallelCalcs, ...)"""
+
+    orcaCachePath: str
+    """The path to the folder that stores the Results Table"""
+
+    resultsFilePath: str
+    """Path to the CSV Results Table"""
+
+    results: list[dict]
+    """One Row per Finished Molecule, in the Order they Finished"""
+
+    calculationTime: float
+    """The resulting total time for the Screening in seconds."""
+
+    resultColumns: list[str] = [
+        "Name",
+        "Status",
+        "Failure",
+        "AtomCount",
+        "Energy",
+        "GibbsEnergy",
+        "Conformers",
+        "SpectraPath",
+        "FinishedAt",
+    ]
+    """Columns of the Results Table"""
+
+    pipelineSteps: list[str] = ["GEOOPT", "GOAT", "FREQ", "SPECTRA"]
+    """Suffixes of the Workflow Steps of each Molecules Pipeline, in the Order they Run"""
+
+    def __init__(
+        self,
+        molecules: str | list[str | Molecule],
+        cores: int = 1,
+        calculationCores: int = 1,
+        template: str | OrcaInputTemplate = "",
+        isLocal: bool = False,
+        name: str = "Screening",
+        **variables,
+    ):
+        if not isinstance(cores, int) or cores < 1:
+            raise ValueError("Cores must be a positive integer")
+
+        if not isinstance(calculationCores, int) or calculationCores < 1:
+            raise ValueError("Calculation Cores must be a positive integer")
+
+        if not ("basis" in variables) or not ("functional" in variables):
+            raise ValueError("BasisSet and Functional must be defined! Provide them as Strings")
+
+        self.name = name
+        self.cores = cores
+        self.calculationCores = min(calculationCores, cores)
+        self.template = template
+        self.isLocal = isLocal
+        self.variables = variables
+        self.molecules = self.loadMolecules(molecules)
+        self.results = []
+
+        self.orcaCachePath = os.path.join(os.getcwd(), "OrcaCache", self.name)
+        self.resultsFilePath = os.path.join(self.orcaCachePath, f"{self.name}_Results.csv")
+
+    @staticmethod
+    def loadMolecules(molecules: str | list[str | Molecule]) -> list[Molecule]:
+        """Loads the Molecules to Screen from a Directory of XYZ Files or a List of XYZ File Paths and Molecule Objects
+
+        ## Parameters : \n
+            molecules : str | list[str | Molecule] - Path to a Directory of XYZ Files, or a List of XYZ File Paths and Molecule Objects
+
+        ## Returns : \n
+            list[Molecule] - The Loaded Molecules, named after their XYZ Files
+        """
+        # Expand a Directory into its XYZ Files
+        if isinstance(molecules, str):
+            if not os.path.isdir(molecules):
+                raise ValueError("Molecules must be a Directory of XYZ Files or a List")
+
+            molecules = [
+                os.path.join(molecules, file)
+                for file in sorted(os.listdir(molecules))
+                if file.lower().endswith(".xyz")
+            ]
+
+        loaded: list[Molecule] = []
+
+        for molecule in molecules:
+            if isinstance(molecule, Molecule):
+                loaded.append(molecule)
+            elif isinstance(molecule, str):
+                name = os.path.splitext(os.path.basename(molecule))[0]
+                loaded.append(Molecule(name, molecule))
+            else:
+                raise ValueError("Molecules must be XYZ File Paths or Molecule Objects")
+
+        if len(loaded) == 0:
+            raise ValueError("No Molecules were provided to Screen")
+
+        # Molecule Names are used for the Calculation Folders so they must be Unique
+        names = [molecule.name for molecule in loaded]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Molecule Names must be Unique, Duplicates : {duplicates}")
+
+        return loaded
+
+    def runCalculation(self, progress: Callable[[str, CalculationStatus], None] = None):
+        """Runs the Screening on all Molecules. Blocking wrapper around runCalculationAsync
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        asyncio.run(self.runCalculationAsync(progress=progress))
+
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Runs the Screening on all Molecules. Every Molecules Pipeline is added to one Workflow, a Failing Molecule doesn't stop the others
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = A Budget of the Screenings Cores) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        startTime = time.time()
+
+        print(f"Running Screening {self.name} on {len(self.molecules)} Molecules...")
+
+        # Start a Fresh Results Table
+        os.makedirs(self.orcaCachePath, exist_ok=True)
+        self.results = []
+        with open(self.resultsFilePath, "w", newline="") as file:
+            csv.writer(file).writerow(self.resultColumns)
+
+        workflow = Workflow(self.cores, self.name)
+        spectras: dict[str, Spectra] = {}
+
+        for i, molecule in enumerate(self.molecules):
+            spectra = Spectra(
+                molecule,
+                self.template,
+                i + 1,
+                self.calculationCores,
+                self.isLocal,
+                molecule.name,
+                False,
+                **self.variables,
+            )
+            spectras[molecule.name] = spectra
+
+            spectraStep = spectra.addToWorkflow(workflow)
+
+            # Record the Molecule as soon as its own Pipeline is done
+            workflow.addCalculation(
+                f"{molecule.name}_RESULT",
+                lambda results, spectra=spectra: self.recordResult(spectra, workflow),
+                [spectraStep],
+            )
+
+        await workflow.runAsync(coreBudget, progress, raiseOnError=False)
+
+        # Record the Molecules whose Pipeline didn't reach its Results Step
+        recorded = {result["Name"] for result in self.results}
+        for name, spectra in spectras.items():
+            if name not in recorded:
+                self.recordResult(spectra, workflow, finished=False)
+
+        self.calculationTime = time.time() - startTime
+
+        failedCount = sum(result["Status"] != CalculationStatus.COMPLETED.value for result in self.results)
+        print(
+            f"Finished Screening {self.name}! {len(self.results) - failedCount}/{len(self.results)} Molecules Completed ({clockTime(self.calculationTime)})"
+        )
+
+    def recordResult(self, spectra: Spectra, workflow: Workflow, finished: bool = True) -> dict:
+        """Adds a Molecules Row to the Results Table and Appends it to the CSV File. The Status comes from the Outcome of the Molecules Calculations, a Molecule Failed if any of its Orca Runs Failed
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spectra : Spectra - The Molecules Spectra Pipeline \n
+            workflow : Workflow - The Workflow the Pipeline ran in \n
+            finished : bool - Flag indicating the Molecules Pipeline reached its Results Step (False = Cancelled unless a Calculation Failed)
+
+        ## Returns : \n
+            dict - The Row added to the Results Table
+        """
+        name = spectra.name
+        failures = self.getFailures(name, workflow)
+
+        if failures:
+            status = CalculationStatus.FAILED
+        elif finished:
+            status = CalculationStatus.COMPLETED
+        else:
+            status = CalculationStatus.CANCELLED
+
+        row = dict.fromkeys(self.resultColumns, None)
+        row["Name"] = name
+        row["Status"] = status.value
+        row["Failure"] = "; ".join(failures) if failures else None
+        row["AtomCount"] = spectra.molecule.atomCount
+        row["FinishedAt"] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Energies come from the Optimized Structure
+        geoOpt = workflow.nodes[f"{name}_GEOOPT"].result
+        if geoOpt is not None and hasattr(geoOpt, "calculation"):
+            outputFile = OrcaOutput(geoOpt.calculation.outputFilePath)
+            row["Energy"] = outputFile.energy
+            gibbs = outputFile.getGibbsEnergy()
+            row["GibbsEnergy"] = gibbs[0] if gibbs else None
+
+        goat = workflow.nodes[f"{name}_GOAT"].result
+        if goat is not None:
+            row["Conformers"] = len(goat.conformers)
+
+        if status == CalculationStatus.COMPLETED:
+            row["SpectraPath"] = os.path.join(spectra.orcaCachePath, f"{name}_Spectra.csv")
+
+        # Append the Row right away so that Results are available while the Screening Runs
+        self.results.append(row)
+        with open(self.resultsFilePath, "a", newline="") as file:
+            csv.writer(file).writerow([row[column] for column in self.resultColumns])
+
+        return row
+
+    def getFailures(self, name: str, workflow: Workflow) -> list[str]:
+        """Gives why a Molecules Pipeline Failed, from the Failure of each Calculation it Ran (Steps that Failed outside of Orca give their Error)
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Molecule \n
+            workflow : Workflow - The Workflow the Pipeline ran in
+
+        ## Returns : \n
+            list[str] - One Entry per Failed Step (Ex. GEOOPT: SCFNotConverged), Empty if Nothing Failed
+        """
+        failures: list[str] = []
+
+        for step in self.pipelineSteps:
+            node = workflow.nodes[f"{name}_{step}"]
+            calculationFailures = sorted(
+                {calculation.failure.value for calculation in node.calculations if calculation.failure is not None}
+            )
+
+            if calculationFailures:
+                failures.append(f"{step}: {', '.join(calculationFailures)}")
+            elif node.error is not None:
+                failures.append(f"{step}: {node.error}")
+
+        return failures
+
+    def getResults(self) -> pd.DataFrame:
+        """Gives the Results Table as a DataFrame
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            pd.DataFrame - One Row per Finished Molecule
+        """
+        return pd.DataFrame(self.results, columns=self.resultColumns)
@@ -2,15 +2,21 @@ import os
 import time
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from typing import Callable
 from qchem.Molecule import Molecule
 from qchem.Calculation.GOAT import GOAT
 from qchem.Calculation.GeoOpt import GeoOpt
-from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Calculation.CoreAllocator import CoreAllocator
+from qchem.Data.Enums import OrcaInputTemplate, CalculationStatus, LineShape
 from qchem.Calculation.Frequency import Frequency
 from qchem.Calculation.BaseOrcaCalculation import BaseOrcaCalculation
 from qchem.Calculation.ClusterCalculation import ClusterCalculation
 from qchem.Parser import OrcaOutput
+from qchem.Pipelines.Workflow import Workflow
+from qchem.Spectroscopy.Broadening import broadenSpectrum, createGrid, FWHMTOSIGMA
+from qchem.Spectroscopy.EnsembleSpectrum import EnsembleSpectrum
+from qchem.Instrumentation import traced
 
 
 class Spectra(BaseOrcaCalculation):
@@ -22,6 +28,12 @@ class Spectra(BaseOrcaCalculation):
     IRSpectra: pd.DataFrame
     """DataFrame the IR Frequencies of the Molecule and their Intensities"""
 
+    ensembleSpectrum: EnsembleSpectrum
+    """Accumulates the Contribution Weighted Spectra of the Conformers on a Grid as each Frequency Calculation Finishes, the Broadened Spectra is made from it"""
+
+    conformerSticks: dict[int, pd.DataFrame]
+    """Exact Wavenumbers and Contribution Weighted IR Intensities of each Conformer Added so far, by Conformer Index"""
+
     def __init__(
         self,
         molecule: str | Molecule,
@@ -44,10 +56,13 @@ class Spectra(BaseOrcaCalculation):
         # Delete Cores from Variables cause it causes Issues
         self.variables.pop("cores")
 
-        # Check if the Parallel Calculations are Defined
-        if not ("parallelCalcs" in self.variables) or not isinstance(self.variables["parallelCalcs"], int) or self.variables["parallelCalcs"] < 1:
+        # Check if the Parallel Calculations are Defined (None = Allocate the Cores of each Frequency Calculation from its Predicted Speedup)
+        if self.variables.get("parallelCalcs") is None:
+            self.variables["parallelCalcs"] = None
+        elif not isinstance(self.variables["parallelCalcs"], int) or self.variables["parallelCalcs"] < 1:
             self.variables["parallelCalcs"] = 1
 
+    @traced("pipeline")
     def runCalculation(self):
         """Runs the Spectra Calculation and Saves the Infra Red Spectra
 
@@ -65,8 +80,133 @@ class Spectra(BaseOrcaCalculation):
 
         print("\nRunning GeoOpt!\n")
 
-        # Create a Geo Opt Calculation Object
-        geoOptCalc = GeoOpt(
+        # Run the GeoOptimization on the Molecule
+        geoOptCalc = self.createGeoOpt()
+        geoOptCalc.runCalculation()
+
+        print("\nFinished GeoOpt!\n")
+        print("\nRunning GOAT!\n")
+
+        # Run the GOAT Calculation
+        goatCalc = self.createGOAT(geoOptCalc.optMolecule)
+        goatCalc.runCalculation()
+
+        print("\nFinished GOAT!\n")
+        print("\nRunning Frequency Analysis!\n")
+
+        # Save the Contributions and Create a Frequency Calculation for every Conformer
+        self.saveContributions(goatCalc)
+        freqCalcs = self.createFrequencies(goatCalc)
+
+        cluster = ClusterCalculation(
+            [freqCalc.inputFile for freqCalc in freqCalcs],
+            self.cores,
+            "FrequencyCluster",
+            self.isLocal,
+            False,
+        )
+
+        cluster.runCalculations()
+
+        # Combine the Conformers Spectra into the Ensemble Spectra
+        self.combineSpectra(
+            goatCalc,
+            [calculation.outputFilePath for calculation in cluster.completedCalculations],
+        )
+
+        # Get Total Time for Spectra
+        calcTime = time.time() - startTime
+
+        print(f"\nFinished Making {self.name} Spectra! ({self.clockTime(calcTime)})\n")
+
+    @traced("pipeline")
+    async def runCalculationAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+    ):
+        """Async counterpart of runCalculation. Runs the Spectra as a Workflow, the Frequency Calculations of all Conformers run concurrently, sharing the Core Budget
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = A Budget of this Calculations Cores) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns: \n
+            None - No Return Value
+        """
+        # Start the Timer
+        startTime = time.time()
+
+        workflow = Workflow(max(1, self.cores), self.name)
+        self.addToWorkflow(workflow)
+        await workflow.runAsync(coreBudget, progress)
+
+        # Get Total Time for Spectra
+        calcTime = time.time() - startTime
+
+        print(f"\nFinished Making {self.name} Spectra! ({self.clockTime(calcTime)})\n")
+
+    def addToWorkflow(self, workflow: Workflow, dependencies: list[str] = None) -> str:
+        """Adds the Steps of the Spectra (GeoOpt -> GOAT -> Frequency for every Conformer -> Ensemble Spectra) to a Workflow. Adding several Spectra to the same Workflow lets the Molecules Calculations interleave
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            workflow : Workflow - The Workflow to add the Steps to \n
+            dependencies : list[str] - Names of Steps that have to Finish before the Spectra Starts
+
+        ## Returns: \n
+            str - Name of the Final Step, its Result is the IR Spectra DataFrame
+        """
+        # Make Cache Folder if it doesn't Exist
+        self.createDirectories()
+
+        geoOptStep = workflow.addCalculation(
+            f"{self.name}_GEOOPT", lambda results: self.createGeoOpt(), dependencies
+        )
+
+        goatStep = workflow.addCalculation(
+            f"{self.name}_GOAT",
+            lambda results: self.createGOAT(results[geoOptStep].optMolecule),
+            [geoOptStep],
+        )
+
+        frequencies: list[Frequency] = []
+
+        def createFrequencies(results):
+            self.saveContributions(results[goatStep])
+            self.ensembleSpectrum = EnsembleSpectrum()
+            self.conformerSticks = {}
+            frequencies.extend(self.createFrequencies(results[goatStep]))
+            return frequencies
+
+        # Each Conformer is Added to the Ensemble as soon as its Frequency Calculation Finishes
+        def addConformer(freqCalc: Frequency):
+            goatCalc = workflow.getResult(goatStep)
+            self.addConformerSpectra(goatCalc, frequencies.index(freqCalc), freqCalc.outputFilePath)
+
+        freqStep = workflow.addCalculation(
+            f"{self.name}_FREQ", createFrequencies, [goatStep], onComplete=addConformer
+        )
+
+        def combineSpectra(results):
+            self.saveSpectra()
+            return self.IRSpectra
+
+        return workflow.addCalculation(
+            f"{self.name}_SPECTRA", combineSpectra, [goatStep, freqStep]
+        )
+
+    def createGeoOpt(self) -> GeoOpt:
+        """Creates the GeoOpt Calculation that Optimizes the Molecule before the Conformer Search
+
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns: \n
+            GeoOpt - The GeoOpt Calculation Object
+        """
+        return self.inheritExecutor(GeoOpt(
             self.molecule,
             True,
             self.template,
@@ -76,17 +216,20 @@ class Spectra(BaseOrcaCalculation):
             f"{self.name}_GEOOPT",
             False,
             **self.variables,
-        )
+        ))
 
-        # Run the GeoOptimization on the Molecule
-        geoOptCalc.runCalculation()
+    def createGOAT(self, molecule: Molecule) -> GOAT:
+        """Creates the GOAT Calculation that finds the Conformers of the Optimized Molecule
 
-        print("\nFinished GeoOpt!\n")
-        print("\nRunning GOAT!\n")
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            molecule : Molecule - The Optimized Molecule
 
-        # Create GOAT Calculation Object
-        goatCalc = GOAT(
-            geoOptCalc.optMolecule,
+        ## Returns: \n
+            GOAT - The GOAT Calculation Object
+        """
+        return self.inheritExecutor(GOAT(
+            molecule,
             self.template,
             self.index,
             self.cores,
@@ -94,20 +237,55 @@ class Spectra(BaseOrcaCalculation):
             f"{self.name}_GOAT",
             False,
             **self.variables,
-        )
+        ))
 
-        # Run the GOAT Calculation
-        goatCalc.runCalculation()
+    def createFrequencies(self, goatCalc: GOAT) -> list[Frequency]:
+        """Creates a Frequency Calculation for every Conformer found by GOAT. Each gets cores // parallelCalcs Cores, or without parallelCalcs the Cores a CoreAllocator Chooses for the Conformers
 
-        print("\nFinished GOAT!\n")
-        print("\nRunning Frequency Analysis!\n")
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation
+
+        ## Returns: \n
+            list[Frequency] - The Frequency Calculation Objects, in Conformer Order
+        """
+        if self.variables["parallelCalcs"] is None:
+            cores = CoreAllocator(max(1, self.cores)).allocateMolecules(
+                goatCalc.conformers,
+                Frequency.calculationType,
+                self.variables.get("basis"),
+                self.variables.get("functional"),
+            )
+        else:
+            cores = [self.cores // self.variables["parallelCalcs"]] * len(goatCalc.conformers)
+
+        return [
+            self.inheritExecutor(Frequency(
+                conformer,
+                self.template,
+                self.index,
+                cores[i],
+                self.isLocal,
+                f"{self.name}_FREQ_{i}",
+                False,
+                **self.variables,
+            ))
+            for i, conformer in enumerate(goatCalc.conformers)
+        ]
+
+    def saveContributions(self, goatCalc: GOAT):
+        """Saves the Contribution of each Conformer to the Ensemble to a CSV File
 
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation
+
+        ## Returns: \n
+            None - No Return Value
+        """
         # Get the Number of Conformers Created
         conformersNum = len(goatCalc.conformers)
 
-        # Create Blank DataFrame
-        self.IRSpectra = pd.DataFrame({"Wavenumber": [], "IRIntensity": []})
-
         # Load the IR Contributions
         IRContribution = pd.DataFrame(
             {
@@ -122,77 +300,95 @@ class Spectra(BaseOrcaCalculation):
             index=False,
         )
 
-        freqInputFiles = []
+    @traced("pipeline")
+    def combineSpectra(self, goatCalc: GOAT, outputFilePaths: list[str]):
+        """Loads the IR Frequencies of every Conformer, weights them by their Contribution and Saves the Ensemble Spectra
 
-        # Loop through all the Conformers and Run a Frequency Calculation
-        for i in range(conformersNum):
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation \n
+            outputFilePaths : list[str] - Paths to the Frequency Output Files, in Conformer Order
 
-            # Create the Frequency Calculation
-            freqCalc = Frequency(
-                goatCalc.conformers[i],
-                self.template,
-                self.index,
-                self.cores // self.variables["parallelCalcs"],
-                self.isLocal,
-                f"{self.name}_FREQ_{i}",
-                False,
-                **self.variables,
-            )
+        ## Returns: \n
+            None - No Return Value
+        """
+        self.ensembleSpectrum = EnsembleSpectrum()
+        self.conformerSticks = {}
 
-            freqInputFiles.append(freqCalc.inputFile)
+        for i, outputFilePath in enumerate(outputFilePaths):
+            self.addConformerSpectra(goatCalc, i, outputFilePath)
 
-        cluster = ClusterCalculation(
-            freqInputFiles, self.cores, "FrequencyCluster", self.isLocal, False
-        )
+        self.saveSpectra()
 
-        cluster.runCalculations()
+    @traced("pipeline")
+    def addConformerSpectra(self, goatCalc: GOAT, conformerIndex: int, outputFilePath: str):
+        """Adds the IR Frequencies of a Conformer to the Ensemble Spectrum, Weighted by its Contribution
 
-        for i in range(conformersNum):
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance \n
+            goatCalc : GOAT - The Completed GOAT Calculation \n
+            conformerIndex : int - Index of the Conformer in the GOAT Ensemble \n
+            outputFilePath : str - Path to the Conformers Frequency Output File
 
-            outputFile = OrcaOutput(cluster.completedCalculations[i].outputFilePath)
+        ## Returns: \n
+            None - No Return Value
+        """
+        IRFrequencies = OrcaOutput(outputFilePath).getIRFrequencies()
 
-            IRFrequencies = outputFile.getIRFrequencies()
+        # Save Individual Spectra
+        pd.DataFrame(
+            {
+                "Wavenumber": IRFrequencies["frequency"].values,
+                "IRIntensity": IRFrequencies["IRIntensity"].values,
+            }
+        ).to_csv(
+            os.path.join(self.orcaCachePath, f"{self.name}_IRIntensity_{conformerIndex}.csv"),
+            index=False,
+        )
 
-            # Load Individual Spectra Results
-            FreqSpectra = pd.DataFrame(
-                {
-                    "Wavenumber": IRFrequencies["frequency"].values,
-                    "IRIntensity": IRFrequencies["IRIntensity"].values,
-                }
-            )
+        weight = goatCalc.conformerContribution[conformerIndex]
 
-            # Save Individual Spectra
-            FreqSpectra.to_csv(
-                os.path.join(self.orcaCachePath, f"{self.name}_IRIntensity_{i}.csv"),
-                index=False,
-            )
+        # Multiply Spectra by Contribution
+        self.conformerSticks[conformerIndex] = pd.DataFrame(
+            {
+                "Wavenumber": IRFrequencies["frequency"].values,
+                "IRIntensity": IRFrequencies["IRIntensity"].values * weight,
+            }
+        )
 
-            # Multiply Spectra by Contribution
-            FreqSpectra["IRIntensity"] = (
-                FreqSpectra["IRIntensity"].values * goatCalc.conformerContribution[i]
-            )
+        self.ensembleSpectrum.addConformer(
+            IRFrequencies["frequency"].values,
+            IRFrequencies["IRIntensity"].values,
+            weight=weight,
+        )
 
-            # This Method Works, no need for a Dictionary and all that
-            self.IRSpectra = pd.concat([self.IRSpectra, FreqSpectra], ignore_index=True)
+    @traced("pipeline")
+    def saveSpectra(self):
+        """Saves the Ensemble Spectra (the Contribution Weighted Sticks of every Conformer) and its Broadened Spectra, Broadened from the Grid the Conformers were Accumulated on
 
+        ## Parameters: \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns: \n
+            None - No Return Value
+        """
         print("\nFinished Frequency Analysis!\n")
         print("\nMaking Final Touches\n")
 
-        # Group Common Wavenumbers and Sum their Values
-        self.IRSpectra.groupby("Wavenumber", as_index=False).agg({"IRIntensity": "sum"})
-
-        # Sort Wavenumbers from Largest Wavenumber -> Lowest Wavenumber
-        self.IRSpectra = self.IRSpectra.sort_values(by="Wavenumber", ascending=False)
+        # Sort Wavenumbers from Largest Wavenumber -> Lowest Wavenumber, in Conformer Order whichever Finished first
+        self.IRSpectra = pd.concat(
+            [self.conformerSticks[i] for i in sorted(self.conformerSticks)], ignore_index=True
+        ).sort_values(by="Wavenumber", ascending=False, kind="stable")
 
         # Save Full Spectra
         self.IRSpectra.to_csv(
             os.path.join(self.orcaCachePath, f"{self.name}_Spectra.csv"), index=False
         )
 
-        # Get Total Time for Spectra
-        calcTime = time.time() - startTime
-
-        print(f"\nFinished Making {self.name} Spectra! ({self.clockTime(calcTime)})\n")
+        # Save the Broadened Spectra, the Grid holds at most one Line per Point whatever the Number of Conformers
+        Spectra.broadenSpectra(self.ensembleSpectrum.getSticks(average=False)).to_csv(
+            os.path.join(self.orcaCachePath, f"{self.name}_BroadenedSpectra.csv"), index=False
+        )
 
     @staticmethod
     def gaussianBlur(data: list[float], sigma: float):
@@ -273,44 +469,72 @@ class Spectra(BaseOrcaCalculation):
             # Return a Copy so that Original isn't destroyed
             return spectra.copy()
 
+    @staticmethod
+    def broadenSpectra(
+        spectra: str | pd.DataFrame,
+        sigma: float = 10,
+        maxWaveNum: float = 4000,
+        spacing: float = 1,
+        lineShape: str | LineShape = LineShape.GAUSSIAN,
+    ) -> pd.DataFrame:
+        """Broadens the Stick IR Spectra into a Continuous Spectrum on a Uniform Wavenumber Grid
+
+        ## Parameters : \n
+            spectra : str | pd.DataFrame - Path to the CSV File or the Pandas DataFrame Object \n
+            sigma : float - Standard Deviation of each Line in Wavenumbers, defines the broadness of the Line Shape \n
+            maxWaveNum : float - Upper bound WaveNumber of the Spectrum \n
+            spacing : float - Spacing in Wavenumbers between each Point of the Spectrum \n
+            lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt)
+
+        ## Returns : \n
+            pd.DataFrame - Broadened Spectrum with Wavenumber (Largest -> Smallest) and IRIntensity
+        """
+        # Load the Spectra
+        IRSpectra = Spectra.loadSpectra(spectra)
+
+        grid = createGrid(0, maxWaveNum, spacing)
+
+        intensities = broadenSpectrum(
+            IRSpectra["Wavenumber"].values,
+            IRSpectra["IRIntensity"].values,
+            grid,
+            sigma / FWHMTOSIGMA,
+            lineShape,
+        )
+
+        # Sort the Columns from Largest Wavenumber -> Smallest Wavenumber
+        return pd.DataFrame({"Wavenumber": grid[::-1], "IRIntensity": intensities[::-1]})
+
     @staticmethod
     def plotSpectra(
         spectra: str | pd.DataFrame,
         plotName: str = "Spectra",
-        sigma: float = 5,
+        sigma: float = 10,
         maxWaveNum: float = 4000,
-        spacing: float = 10,
+        spacing: float = 1,
         showPlot: bool = True,
+        lineShape: str | LineShape = LineShape.GAUSSIAN,
     ):
         """Plots an IR Spectra and opens a MatPlotLib window to Display it
 
         ## Parameters : \n
             spectra : str | pd.DataFrame - Path to the CSV File or the Pandas DataFrame Object \n
             plotName : str - Name of the Plot, used for the Title and Name of the File Saved \n
-            sigma : float - Standard Deviation of the Gaussian Kernel, defines the broadness of the Gaussian Profile \n
+            sigma : float - Standard Deviation of each Line in Wavenumbers, defines the broadness of the Line Shape \n
             maxWaveNum : float - Upper bound WaveNumber Plotted on the Spectrum  \n
-            spacing : float - Spacing between each fake DataPoint added to the Graph to smoothen results \n
-            showPlot : bool - Boolean flag determining if the MatPlotLib window displaying the Spectrum will be shown
+            spacing : float - Spacing in Wavenumbers between each Point of the Plotted Spectrum \n
+            showPlot : bool - Boolean flag determining if the MatPlotLib window displaying the Spectrum will be shown \n
+            lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt)
 
         ## Returns : \n
             None - No Return Value
         """
 
-        # Load the Spectra
-        IRSpectra = Spectra.loadSpectra(spectra)
-
-        # Add a bunch of Dummy Data
-        for i in range(0, maxWaveNum, spacing):
-            IRSpectra.loc[len(IRSpectra)] = [i, 0]
-
-        # Group Duplicate Wavenumbers if they Appear
-        IRSpectra.groupby("Wavenumber", as_index=False).agg({"IRIntensity": "sum"})
+        # pyplot is Slow to Import, only Loaded when Plotting
+        import matplotlib.pyplot as plt
 
-        # Sort the Columns from Largest Wavenumber -> Smallest Wavenumber
-        IRSpectra = IRSpectra.sort_values(by="Wavenumber", ascending=False)
-
-        # Apply a Gaussian Blurring to the Intensities
-        IRSpectra["IRIntensity"] = Spectra.gaussianBlur(IRSpectra["IRIntensity"], sigma)
+        # Broaden the Sticks into a Continuous Spectrum
+        IRSpectra = Spectra.broadenSpectra(spectra, sigma, maxWaveNum, spacing, lineShape)
 
         # Normalize and Inverse Intensity
         IRSpectra["IRIntensity"] = 1 - (
@@ -318,7 +542,7 @@ class Spectra(BaseOrcaCalculation):
         )
 
         # Plots the Spectra
-        plt.figure()
+        figure = plt.figure()
         plt.plot(IRSpectra["Wavenumber"], IRSpectra["IRIntensity"])
         plt.xlabel("Wavenumber (1/cm)")
         plt.ylabel("IR Intensity")
@@ -327,3 +551,6 @@ class Spectra(BaseOrcaCalculation):
 
         if showPlot:
             plt.show()
+
+        # Release the Figure, pyplot keeps every open Figure alive (Use SpectrumRenderer for many Spectra)
+        plt.close(figure)
@@ -0,0 +1,304 @@
+import time
+import asyncio
+from typing import Any, Callable
+from qchem.Data.Enums import CalculationStatus
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Calculation.BaseOrcaCalculation import BaseOrcaCalculation
+
+
+class WorkflowNode:
+    """A Single Step of a Workflow. Either a Calculation that is ready to Run, or a Function that receives the Results of its Dependencies and returns the Calculation(s) to Run (or any other Value)"""
+
+    name: str
+    """Unique Name of the Step in the Workflow"""
+
+    task: BaseOrcaCalculation | Callable[[dict[str, Any]], Any]
+    """The Calculation to Run, or the Function that Creates it from the Dependency Results"""
+
+    dependencies: list[str]
+    """Names of the Steps that have to Finish before this Step can Start"""
+
+    status: CalculationStatus
+    """Current Status of the Step"""
+
+    result: Any
+    """Result of the Step. The Completed Calculation(s) or the Value returned by the Function"""
+
+    error: BaseException
+    """The Exception raised by the Step if it Failed"""
+
+    calculations: list[BaseOrcaCalculation]
+    """The Calculations the Step Ran, kept when the Step Failed so that the Failure of each can be Inspected"""
+
+    onComplete: Callable[[BaseOrcaCalculation], None]
+    """Optional Callback receiving each Calculation of the Step as soon as it Finishes"""
+
+    def __init__(
+        self,
+        name: str,
+        task: BaseOrcaCalculation | Callable[[dict[str, Any]], Any],
+        dependencies: list[str],
+        onComplete: Callable[[BaseOrcaCalculation], None] = None,
+    ):
+        self.name = name
+        self.task = task
+        self.dependencies = dependencies
+        self.onComplete = onComplete
+        self.status = CalculationStatus.QUEUED
+        self.result = None
+        self.error = None
+        self.calculations = []
+
+
+class Workflow:
+    """Runs a Dependency Graph of Calculations. Every Step starts as soon as all of its Dependencies have Finished, and all Running Calculations share a single Core Budget so that Independent Branches (and Independent Molecules) Run in Parallel
+
+    ## Example:
+
+    workflow = Workflow(cores=16)
+    workflow.addCalculation("opt", GeoOpt(mol, basis="def2-SVP", functional="B3LYP", cores=4))
+    workflow.addCalculation("goat", lambda results: GOAT(results["opt"].optMolecule, cores=4), ["opt"])
+    workflow.addCalculation("freq", lambda results: [Frequency(conf, ...) for conf in results["goat"].conformers], ["goat"])
+    workflow.run()
+    """
+
+    name: str
+    """Name of the Workflow"""
+
+    cores: int
+    """Total Number of Cores shared by all Calculations in the Workflow"""
+
+    nodes: dict[str, WorkflowNode]
+    """All the Steps of the Workflow, by Name, in the Order they were Added"""
+
+    calculationTime: float
+    """The resulting total time for the Workflow in seconds."""
+
+    def __init__(self, cores: int = 1, name: str = "Workflow"):
+        if not isinstance(cores, int) or cores < 1:
+            raise ValueError("Cores must be a positive integer")
+
+        self.name = name
+        self.cores = cores
+        self.nodes = {}
+
+    def addCalculation(
+        self,
+        name: str,
+        task: BaseOrcaCalculation | Callable[[dict[str, Any]], Any],
+        dependencies: list[str] = None,
+        onComplete: Callable[[BaseOrcaCalculation], None] = None,
+    ) -> str:
+        """Adds a Step to the Workflow. Dependencies must already be part of the Workflow, which guarantees the Graph has no Cycles. Steps can be Added while the Workflow is Running (From inside a Function Step) to expand the Graph
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Unique Name of the Step \n
+            task : BaseOrcaCalculation | Callable[[dict[str, Any]], Any] - The Calculation to Run, or a Function receiving a Dictionary of the Dependency Results (by Name) that returns a Calculation, a List of Calculations or any other Value \n
+            dependencies : list[str] - Names of the Steps that have to Finish first \n
+            onComplete : Callable[[BaseOrcaCalculation], None] - Optional Callback receiving each Calculation of the Step as soon as it Finishes, so Results can be used before the whole Step is done
+
+        ## Returns : \n
+            str - The Name of the Step, to be used as a Dependency of later Steps
+        """
+        dependencies = list(dependencies) if dependencies else []
+
+        if not isinstance(name, str) or name == "":
+            raise ValueError("Name of the Step must be specified")
+
+        if name in self.nodes:
+            raise ValueError(f"A Step named {name} already exists in the Workflow")
+
+        if not (isinstance(task, BaseOrcaCalculation) or callable(task)):
+            raise ValueError("Task must be a Calculation Object or a Function")
+
+        for dependency in dependencies:
+            if dependency not in self.nodes:
+                raise ValueError(
+                    f"Dependency {dependency} of {name} must be added to the Workflow first"
+                )
+
+        self.nodes[name] = WorkflowNode(name, task, dependencies, onComplete)
+
+        return name
+
+    def getResult(self, name: str) -> Any:
+        """Gives the Result of a Finished Step
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            name : str - Name of the Step
+
+        ## Returns : \n
+            Any - The Completed Calculation(s) or the Value returned by the Step
+        """
+        return self.nodes[name].result
+
+    def run(
+        self,
+        progress: Callable[[str, CalculationStatus], None] = None,
+        raiseOnError: bool = True,
+    ):
+        """Runs the Workflow until every Step has Finished. Blocking wrapper around runAsync
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status \n
+            raiseOnError : bool - Raise an Error at the end if any Step Failed (False = Inspect the Failed Steps through nodes)
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        asyncio.run(self.runAsync(progress=progress, raiseOnError=raiseOnError))
+
+    async def runAsync(
+        self,
+        coreBudget: CoreBudget = None,
+        progress: Callable[[str, CalculationStatus], None] = None,
+        raiseOnError: bool = True,
+    ):
+        """Runs the Workflow until every Step has Finished. Steps start as soon as their Dependencies are done, Steps depending on a Failed Step are Cancelled while Independent Steps keep Running
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from (None = A Budget of the Workflows Cores) \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status \n
+            raiseOnError : bool - Raise an Error at the end if any Step Failed (False = Inspect the Failed Steps through nodes)
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        startTime = time.time()
+
+        if coreBudget is None:
+            coreBudget = CoreBudget(self.cores)
+
+        tasks: dict[str, asyncio.Task] = {}
+
+        try:
+            # Keep Scheduling until no Step is Left, Steps can add new Steps while Running
+            while True:
+                for name, node in list(self.nodes.items()):
+                    if name not in tasks and node.status == CalculationStatus.QUEUED:
+                        tasks[name] = asyncio.create_task(
+                            self.runNode(node, tasks, coreBudget, progress)
+                        )
+
+                pending = [task for task in tasks.values() if not task.done()]
+
+                if not pending:
+                    break
+
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # Cancel all Running Steps (Kills their Orca Processes)
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self.calculationTime = time.time() - startTime
+
+        failed = [node for node in self.nodes.values() if node.status == CalculationStatus.FAILED]
+
+        if raiseOnError and failed:
+            raise RuntimeError(
+                f"Workflow {self.name} had {len(failed)} Failed Step(s): "
+                + ", ".join(f"{node.name} ({node.error!r})" for node in failed)
+            ) from failed[0].error
+
+    async def runNode(
+        self,
+        node: WorkflowNode,
+        tasks: dict[str, asyncio.Task],
+        coreBudget: CoreBudget,
+        progress: Callable[[str, CalculationStatus], None],
+    ):
+        """Waits for the Dependencies of a Step, then Runs it
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            node : WorkflowNode - The Step to Run \n
+            tasks : dict[str, asyncio.Task] - The Tasks of all Scheduled Steps \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        # Dependencies are always Scheduled before the Steps that need them (Or Finished in an earlier Run)
+        await asyncio.gather(
+            *[tasks[dependency] for dependency in node.dependencies if dependency in tasks]
+        )
+
+        # Skip the Step if any Dependency didn't Complete
+        if any(
+            self.nodes[dependency].status != CalculationStatus.COMPLETED
+            for dependency in node.dependencies
+        ):
+            node.status = CalculationStatus.CANCELLED
+            return
+
+        node.status = CalculationStatus.RUNNING
+
+        try:
+            task = node.task
+
+            # Function Steps Create their Calculation from the Dependency Results
+            if not isinstance(task, BaseOrcaCalculation):
+                task = task({dependency: self.nodes[dependency].result for dependency in node.dependencies})
+
+            # Run the Calculation(s) the Step produced
+            if isinstance(task, BaseOrcaCalculation):
+                node.calculations = [task]
+                await self.runCalculation(node, task, coreBudget, progress)
+            elif isinstance(task, (list, tuple)) and task and all(
+                isinstance(calculation, BaseOrcaCalculation) for calculation in task
+            ):
+                node.calculations = list(task)
+                results = await asyncio.gather(
+                    *[self.runCalculation(node, calculation, coreBudget, progress) for calculation in task],
+                    return_exceptions=True,
+                )
+
+                # Let every Calculation Finish before reporting the first Failure
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+
+            node.result = task
+            node.status = CalculationStatus.COMPLETED
+        except asyncio.CancelledError:
+            node.status = CalculationStatus.CANCELLED
+            raise
+        except Exception as error:
+            node.error = error
+            node.status = CalculationStatus.FAILED
+
+    async def runCalculation(
+        self,
+        node: WorkflowNode,
+        calculation: BaseOrcaCalculation,
+        coreBudget: CoreBudget,
+        progress: Callable[[str, CalculationStatus], None],
+    ):
+        """Runs one Calculation of a Step and hands it to the Steps Callback once it Finishes. A Calculation whose Orca Run Failed raises an Error, which Fails the Step and Cancels the Steps depending on it
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            node : WorkflowNode - The Step the Calculation belongs to \n
+            calculation : BaseOrcaCalculation - The Calculation to Run \n
+            coreBudget : CoreBudget - Shared Budget the Calculations Cores are Reserved from \n
+            progress : Callable[[str, CalculationStatus], None] - Optional Callback notified as each Calculation changes Status
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        await calculation.runCalculationAsync(coreBudget, progress)
+
+        # Calculations that Record the Failure instead of Raising still Fail the Step
+        if calculation.failure is not None:
+            raise RuntimeError(f"{calculation.calculationType} on {calculation.name} Failed ({calculation.failure.value})")
+
+        if node.onComplete is not None:
+            node.onComplete(calculation)
@@ -1 +1,15 @@
-from .Spectra import Spectra
\ No newline at end of file
+from ..LazyLoading import makeLazy
+
+# Pipelines are Imported the first time they are used (Spectra Loads pandas and the Calculations)
+LAZYATTRIBUTES = {
+    "Workflow": (".Workflow", "Workflow"),
+    "WorkflowNode": (".Workflow", "WorkflowNode"),
+    "Spectra": (".Spectra", "Spectra"),
+    "NMRSpectra": (".NMRSpectra", "NMRSpectra"),
+    "Screening": (".Screening", "Screening"),
+}
+"""Module and Name in it of each Public Symbol"""
+
+__all__ = ["Workflow", "WorkflowNode", "Spectra", "NMRSpectra", "Screening"]
+
+makeLazy(__name__, LAZYATTRIBUTES)
@@ -0,0 +1,265 @@
+import numpy as np
+from qchem.Data.Enums import LineShape
+
+FWHMTOSIGMA = 1 / (2 * np.sqrt(2 * np.log(2)))
+"""Converts the Full Width at Half Maximum of a Gaussian to its Standard Deviation"""
+
+FFTTHRESHOLD = 2_000_000
+"""Number of Grid Points x Stick Lines above which Broadening switches from Direct Evaluation to FFT Convolution"""
+
+DIRECTCHUNKSIZE = 4096
+"""Maximum Number of Stick Lines Evaluated at once during Direct Evaluation, bounds the Memory used"""
+
+
+def createGrid(minWaveNum: float = 0, maxWaveNum: float = 4000, spacing: float = 1) -> np.ndarray:
+    """Creates a Uniform Wavenumber Grid to Evaluate Spectra on
+
+    ## Parameters : \n
+        minWaveNum : float - Lowest Wavenumber of the Grid \n
+        maxWaveNum : float - Highest Wavenumber of the Grid (Included) \n
+        spacing : float - Distance between Grid Points
+
+    ## Returns : \n
+        np.ndarray - The Wavenumbers of the Grid in Ascending Order
+    """
+    if spacing <= 0:
+        raise ValueError("Spacing must be a positive number")
+
+    if maxWaveNum <= minWaveNum:
+        raise ValueError("Max Wavenumber must be larger than Min Wavenumber")
+
+    pointCount = int(np.floor((maxWaveNum - minWaveNum) / spacing + 1e-9)) + 1
+
+    return minWaveNum + spacing * np.arange(pointCount)
+
+
+def gaussianProfile(offsets: np.ndarray, fwhm: float) -> np.ndarray:
+    """Evaluates an Area Normalized Gaussian Line Shape
+
+    ## Parameters : \n
+        offsets : np.ndarray - Distance from the Center of the Line \n
+        fwhm : float - Full Width at Half Maximum of the Line
+
+    ## Returns : \n
+        np.ndarray - The Line Shape at each Offset
+    """
+    sigma = fwhm * FWHMTOSIGMA
+    return np.exp(-0.5 * (offsets / sigma) ** 2) / (sigma * np.sqrt(2 * np.pi))
+
+
+def lorentzianProfile(offsets: np.ndarray, fwhm: float) -> np.ndarray:
+    """Evaluates an Area Normalized Lorentzian Line Shape
+
+    ## Parameters : \n
+        offsets : np.ndarray - Distance from the Center of the Line \n
+        fwhm : float - Full Width at Half Maximum of the Line
+
+    ## Returns : \n
+        np.ndarray - The Line Shape at each Offset
+    """
+    gamma = fwhm / 2
+    return gamma / (np.pi * (offsets**2 + gamma**2))
+
+
+def voigtProfile(offsets: np.ndarray, fwhm: float, eta: float = 0.5) -> np.ndarray:
+    """Evaluates an Area Normalized Pseudo-Voigt Line Shape, a Weighted Sum of a Gaussian and a Lorentzian with the same Width
+
+    ## Parameters : \n
+        offsets : np.ndarray - Distance from the Center of the Line \n
+        fwhm : float - Full Width at Half Maximum of the Line \n
+        eta : float - Fraction of the Lorentzian in the Line Shape (0 = Gaussian, 1 = Lorentzian)
+
+    ## Returns : \n
+        np.ndarray - The Line Shape at each Offset
+    """
+    if not 0 <= eta <= 1:
+        raise ValueError("Eta must be between 0 and 1")
+
+    return eta * lorentzianProfile(offsets, fwhm) + (1 - eta) * gaussianProfile(offsets, fwhm)
+
+
+def getProfile(offsets: np.ndarray, fwhm: float, lineShape: str | LineShape, eta: float = 0.5) -> np.ndarray:
+    """Evaluates the Requested Line Shape
+
+    ## Parameters : \n
+        offsets : np.ndarray - Distance from the Center of the Line \n
+        fwhm : float - Full Width at Half Maximum of the Line \n
+        lineShape : str | LineShape - The Line Shape to Evaluate \n
+        eta : float - Fraction of the Lorentzian in a Voigt Line Shape
+
+    ## Returns : \n
+        np.ndarray - The Line Shape at each Offset
+    """
+    lineShape = LineShape(lineShape.capitalize()) if isinstance(lineShape, str) else lineShape
+
+    if lineShape == LineShape.GAUSSIAN:
+        return gaussianProfile(offsets, fwhm)
+    elif lineShape == LineShape.LORENTZIAN:
+        return lorentzianProfile(offsets, fwhm)
+
+    return voigtProfile(offsets, fwhm, eta)
+
+
+def broadenSpectrum(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    grid: np.ndarray,
+    fwhm: float = 20,
+    lineShape: str | LineShape = LineShape.GAUSSIAN,
+    eta: float = 0.5,
+    method: str = "auto",
+) -> np.ndarray:
+    """Broadens a Stick Spectrum onto a Wavenumber Grid. Every Stick becomes a Line Shape of the given Width, so the Result is independent of the Number of Sticks and the Grid Spacing
+
+    ## Parameters : \n
+        wavenumbers : np.ndarray - Wavenumbers of the Sticks \n
+        intensities : np.ndarray - Intensities of the Sticks, the Area under each Broadened Line \n
+        grid : np.ndarray - Wavenumbers to Evaluate the Spectrum at (Uniform and Ascending for the FFT Method) \n
+        fwhm : float - Full Width at Half Maximum of each Line in Wavenumbers \n
+        lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt) \n
+        eta : float - Fraction of the Lorentzian in a Voigt Line Shape \n
+        method : str - "direct" Evaluates every Line at every Grid Point, "fft" Bins the Sticks and Convolves with the Line Shape, "auto" picks FFT for large Problems
+
+    ## Returns : \n
+        np.ndarray - Intensity of the Spectrum at each Grid Point
+    """
+    wavenumbers = np.asarray(wavenumbers, dtype=float).ravel()
+    intensities = np.asarray(intensities, dtype=float).ravel()
+    grid = np.asarray(grid, dtype=float).ravel()
+
+    if wavenumbers.shape != intensities.shape:
+        raise ValueError("Wavenumbers and Intensities must have the same Length")
+
+    if fwhm <= 0:
+        raise ValueError("FWHM must be a positive number")
+
+    if method not in ("auto", "direct", "fft"):
+        raise ValueError('Method must be "auto", "direct" or "fft"')
+
+    if len(wavenumbers) == 0 or len(grid) == 0:
+        return np.zeros(len(grid))
+
+    if method == "auto":
+        method = "fft" if (len(grid) * len(wavenumbers) > FFTTHRESHOLD and isUniformGrid(grid)) else "direct"
+
+    if method == "fft":
+        return broadenFFT(wavenumbers, intensities, grid, fwhm, lineShape, eta)
+
+    return broadenDirect(wavenumbers, intensities, grid, fwhm, lineShape, eta)
+
+
+def broadenDirect(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    grid: np.ndarray,
+    fwhm: float,
+    lineShape: str | LineShape,
+    eta: float,
+) -> np.ndarray:
+    """Broadens a Stick Spectrum by Evaluating every Line at every Grid Point, in Chunks of Lines to bound the Memory used
+
+    ## Parameters : \n
+        wavenumbers : np.ndarray - Wavenumbers of the Sticks \n
+        intensities : np.ndarray - Intensities of the Sticks \n
+        grid : np.ndarray - Wavenumbers to Evaluate the Spectrum at \n
+        fwhm : float - Full Width at Half Maximum of each Line \n
+        lineShape : str | LineShape - Line Shape of each Line \n
+        eta : float - Fraction of the Lorentzian in a Voigt Line Shape
+
+    ## Returns : \n
+        np.ndarray - Intensity of the Spectrum at each Grid Point
+    """
+    spectrum = np.zeros(len(grid))
+
+    for start in range(0, len(wavenumbers), DIRECTCHUNKSIZE):
+        stop = start + DIRECTCHUNKSIZE
+        offsets = grid[:, np.newaxis] - wavenumbers[np.newaxis, start:stop]
+        spectrum += getProfile(offsets, fwhm, lineShape, eta) @ intensities[start:stop]
+
+    return spectrum
+
+
+def broadenFFT(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    grid: np.ndarray,
+    fwhm: float,
+    lineShape: str | LineShape,
+    eta: float,
+) -> np.ndarray:
+    """Broadens a Stick Spectrum by Binning the Sticks onto the Grid and Convolving with the Line Shape through an FFT. Sticks outside the Grid are Dropped
+
+    ## Parameters : \n
+        wavenumbers : np.ndarray - Wavenumbers of the Sticks \n
+        intensities : np.ndarray - Intensities of the Sticks \n
+        grid : np.ndarray - Uniform Ascending Wavenumbers to Evaluate the Spectrum at \n
+        fwhm : float - Full Width at Half Maximum of each Line \n
+        lineShape : str | LineShape - Line Shape of each Line \n
+        eta : float - Fraction of the Lorentzian in a Voigt Line Shape
+
+    ## Returns : \n
+        np.ndarray - Intensity of the Spectrum at each Grid Point
+    """
+    if not isUniformGrid(grid):
+        raise ValueError("FFT Broadening requires a Uniform Ascending Grid")
+
+    pointCount = len(grid)
+
+    if pointCount == 1:
+        return broadenDirect(wavenumbers, intensities, grid, fwhm, lineShape, eta)
+
+    spacing = grid[1] - grid[0]
+    binned = binSticks(wavenumbers, intensities, grid)
+
+    # Line Shape at every Offset the Grid can hold, centered at index pointCount - 1
+    kernel = getProfile(spacing * np.arange(-(pointCount - 1), pointCount), fwhm, lineShape, eta)
+
+    # Zero Padded so the Circular Convolution equals the Linear one
+    size = 1 << int(np.ceil(np.log2(len(binned) + len(kernel) - 1)))
+    convolved = np.fft.irfft(np.fft.rfft(binned, size) * np.fft.rfft(kernel, size), size)
+
+    return convolved[pointCount - 1 : 2 * pointCount - 1]
+
+
+def binSticks(wavenumbers: np.ndarray, intensities: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """Deposits Stick Intensities onto the two nearest Points of a Uniform Grid, split Linearly so that the Position of each Stick is kept between Grid Points
+
+    ## Parameters : \n
+        wavenumbers : np.ndarray - Wavenumbers of the Sticks \n
+        intensities : np.ndarray - Intensities of the Sticks \n
+        grid : np.ndarray - Uniform Ascending Grid
+
+    ## Returns : \n
+        np.ndarray - Intensity Deposited on each Grid Point
+    """
+    spacing = grid[1] - grid[0]
+    binned = np.zeros(len(grid))
+
+    position = (wavenumbers - grid[0]) / spacing
+    inside = (position >= 0) & (position <= len(grid) - 1)
+    position = position[inside]
+    intensities = intensities[inside]
+
+    lower = np.minimum(np.floor(position).astype(int), len(grid) - 2)
+    fraction = position - lower
+
+    np.add.at(binned, lower, intensities * (1 - fraction))
+    np.add.at(binned, lower + 1, intensities * fraction)
+
+    return binned
+
+
+def isUniformGrid(grid: np.ndarray) -> bool:
+    """Checks if a Grid is Ascending with a constant Spacing
+
+    ## Parameters : \n
+        grid : np.ndarray - The Grid to Check
+
+    ## Returns : \n
+        bool - True if the Grid is Uniform and Ascending
+    """
+    if len(grid) < 2:
+        return True
+
+    steps = np.diff(grid)
+    return bool(steps[0] > 0 and np.allclose(steps, steps[0], rtol=1e-6, atol=0))
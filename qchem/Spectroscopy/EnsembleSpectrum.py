@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from qchem.Data.Enums import LineShape
+from qchem.Spectroscopy.Broadening import broadenSpectrum, binSticks, createGrid
+
+BOLTZMANNHARTREE = 3.166811563e-6
+"""Boltzmann Constant in Hartree per Kelvin"""
+
+
+class EnsembleSpectrum:
+    """Accumulates the Stick Spectra of the Conformers of an Ensemble into a fixed Wavenumber Grid as each Conformer Finishes. Every Conformer is Weighted by its Population (Given directly or Boltzmann Weighted from its Energy), Memory stays the Size of the Grid no matter how many Conformers or Modes are Added
+
+    ## Example:
+
+    ensemble = EnsembleSpectrum(maxWaveNum=4000, spacing=1)
+    ensemble.addConformer(wavenumbers, intensities, energy=-76.42)
+    ensemble.getSticks()
+    """
+
+    grid: np.ndarray
+    """Wavenumbers of the Grid the Spectrum is Accumulated on"""
+
+    intensities: np.ndarray
+    """Weighted Sum of the Conformer Intensities Binned onto the Grid (Divide by totalWeight for the Ensemble Average)"""
+
+    totalWeight: float
+    """Sum of the Weights of the Conformers Added so far"""
+
+    conformerCount: int
+    """Number of Conformers Added so far"""
+
+    temperature: float
+    """Temperature in Kelvin used to Boltzmann Weight Conformers by their Energy"""
+
+    referenceEnergy: float
+    """Lowest Energy (Hartree) Added so far, Boltzmann Weights are relative to it"""
+
+    def __init__(
+        self,
+        minWaveNum: float = 0,
+        maxWaveNum: float = 4000,
+        spacing: float = 1,
+        temperature: float = 298.15,
+    ):
+        if temperature <= 0:
+            raise ValueError("Temperature must be a positive number")
+
+        self.grid = createGrid(minWaveNum, maxWaveNum, spacing)
+        self.intensities = np.zeros(len(self.grid))
+        self.totalWeight = 0.0
+        self.conformerCount = 0
+        self.temperature = temperature
+        self.referenceEnergy = None
+
+    def addConformer(
+        self,
+        wavenumbers: np.ndarray,
+        intensities: np.ndarray,
+        weight: float = None,
+        energy: float = None,
+    ):
+        """Adds the Stick Spectrum of a Conformer to the Ensemble
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            wavenumbers : np.ndarray - Wavenumbers of the Conformers Vibrational Modes \n
+            intensities : np.ndarray - IR Intensities of the Conformers Vibrational Modes \n
+            weight : float - Population of the Conformer (Ex. GOAT Percentage Contribution) \n
+            energy : float - Energy of the Conformer in Hartree, used for a Boltzmann Weight when no Weight is Given
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if (weight is None) == (energy is None):
+            raise ValueError("Either a Weight or an Energy must be provided")
+
+        # Weights and Energies can't be mixed, they are on different Scales
+        if self.conformerCount > 0 and (energy is not None) != (self.referenceEnergy is not None):
+            raise ValueError("All Conformers must be Weighted the same way (Weight or Energy)")
+
+        if energy is not None:
+            weight = self.getBoltzmannWeight(energy)
+
+        if weight < 0:
+            raise ValueError("Weight must be positive")
+
+        wavenumbers = np.asarray(wavenumbers, dtype=float)
+        intensities = np.asarray(intensities, dtype=float)
+
+        self.intensities += weight * binSticks(wavenumbers, intensities, self.grid)
+        self.totalWeight += weight
+        self.conformerCount += 1
+
+    def getBoltzmannWeight(self, energy: float) -> float:
+        """Gives the Boltzmann Weight of a Conformer relative to the Lowest Energy so far. A new Lowest Energy Rescales what was Accumulated so the Weights never Overflow
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            energy : float - Energy of the Conformer in Hartree
+
+        ## Returns : \n
+            float - Boltzmann Weight of the Conformer
+        """
+        kT = BOLTZMANNHARTREE * self.temperature
+
+        if self.referenceEnergy is None:
+            self.referenceEnergy = energy
+        elif energy < self.referenceEnergy:
+            rescale = np.exp((energy - self.referenceEnergy) / kT)
+            self.intensities *= rescale
+            self.totalWeight *= rescale
+            self.referenceEnergy = energy
+
+        return float(np.exp(-(energy - self.referenceEnergy) / kT))
+
+    def getSpectrum(self) -> np.ndarray:
+        """Gives the Population Weighted Average Spectrum of the Conformers Added so far, Binned onto the Grid
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            np.ndarray - Intensity at each Grid Point
+        """
+        if self.totalWeight == 0:
+            return np.zeros(len(self.grid))
+
+        return self.intensities / self.totalWeight
+
+    def getSticks(self, average: bool = True) -> pd.DataFrame:
+        """Gives the Non Zero Points of the Ensemble Spectrum as a Stick Spectrum, in the Format used by Spectra. Lines are Binned onto the Grid, Modes outside it are Dropped
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            average : bool - Divide by the Total Weight (False = Weighted Sum, on the Scale of Intensities Multiplied by their Weight)
+
+        ## Returns : \n
+            pd.DataFrame - Wavenumber (Largest -> Smallest) and IRIntensity of every Non Zero Grid Point
+        """
+        spectrum = self.getSpectrum() if average else self.intensities
+        nonZero = np.nonzero(spectrum)[0][::-1]
+
+        return pd.DataFrame(
+            {"Wavenumber": self.grid[nonZero], "IRIntensity": spectrum[nonZero]}
+        )
+
+    def broaden(
+        self, fwhm: float = 20, lineShape: str | LineShape = LineShape.GAUSSIAN, eta: float = 0.5
+    ) -> np.ndarray:
+        """Broadens the Ensemble Spectrum on its own Grid, the Sticks already sit on the Grid so FFT Convolution is used
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            fwhm : float - Full Width at Half Maximum of each Line in Wavenumbers \n
+            lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt) \n
+            eta : float - Fraction of the Lorentzian in a Voigt Line Shape
+
+        ## Returns : \n
+            np.ndarray - Intensity of the Broadened Spectrum at each Grid Point
+        """
+        return broadenSpectrum(self.grid, self.getSpectrum(), self.grid, fwhm, lineShape, eta, "fft")
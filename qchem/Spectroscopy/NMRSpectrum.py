@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+from qchem.Data.Enums import LineShape
+from qchem.Spectroscopy.Broadening import broadenSpectrum, createGrid
+from qchem.Spectroscopy.EnsembleSpectrum import BOLTZMANNHARTREE
+
+TMSSHIELDINGS: dict[str, float] = {"H": 31.88, "C": 184.10}
+"""Approximate Isotropic Shielding (ppm) of the Hydrogens and Carbons of TMS (Tetramethylsilane) with B3LYP and a Triple Zeta Basis Set. Shieldings depend on the Level of Theory, Compute the Reference with the same Settings for Accurate Shifts"""
+
+NMRNUCLEI: dict[str, dict] = {
+    "1H": {"element": "H", "minPPM": -1, "maxPPM": 12, "spacing": 0.001, "fwhm": 0.02},
+    "13C": {"element": "C", "minPPM": -10, "maxPPM": 220, "spacing": 0.01, "fwhm": 0.5},
+}
+"""Element, Plotted Range, Grid Spacing and Line Width (ppm) of the Nuclei NMR Spectra are made for"""
+
+
+class EnsembleShielding:
+    """Accumulates the Isotropic Shielding of every Atom over the Conformers of an Ensemble as each Conformer Finishes. Every Conformer is Weighted by its Population (Given directly or Boltzmann Weighted from its Energy). Conformers must list their Atoms in the same Order
+
+    ## Example:
+
+    ensemble = EnsembleShielding()
+    ensemble.addConformer(nmrCalc.chemicalShifts["isotropic"].values, energy=nmrCalc.energy)
+    ensemble.getShifts(elements, TMSSHIELDINGS, molecule.getEquivalentAtoms())
+    """
+
+    shieldings: np.ndarray
+    """Weighted Sum of the Conformer Shieldings of each Atom (Divide by totalWeight for the Ensemble Average)"""
+
+    totalWeight: float
+    """Sum of the Weights of the Conformers Added so far"""
+
+    conformerCount: int
+    """Number of Conformers Added so far"""
+
+    temperature: float
+    """Temperature in Kelvin used to Boltzmann Weight Conformers by their Energy"""
+
+    referenceEnergy: float
+    """Lowest Energy (Hartree) Added so far, Boltzmann Weights are relative to it"""
+
+    def __init__(self, temperature: float = 298.15):
+        if temperature <= 0:
+            raise ValueError("Temperature must be a positive number")
+
+        self.shieldings = None
+        self.totalWeight = 0.0
+        self.conformerCount = 0
+        self.temperature = temperature
+        self.referenceEnergy = None
+
+    def addConformer(self, shieldings: np.ndarray, weight: float = None, energy: float = None):
+        """Adds the Isotropic Shielding of every Atom of a Conformer to the Ensemble
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            shieldings : np.ndarray - Isotropic Shielding (ppm) of each Atom of the Conformer \n
+            weight : float - Population of the Conformer (Ex. GOAT Percentage Contribution) \n
+            energy : float - Energy of the Conformer in Hartree, used for a Boltzmann Weight when no Weight is Given
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if (weight is None) == (energy is None):
+            raise ValueError("Either a Weight or an Energy must be provided")
+
+        # Weights and Energies can't be mixed, they are on different Scales
+        if self.conformerCount > 0 and (energy is not None) != (self.referenceEnergy is not None):
+            raise ValueError("All Conformers must be Weighted the same way (Weight or Energy)")
+
+        shieldings = np.asarray(shieldings, dtype=float)
+
+        if self.shieldings is not None and shieldings.shape != self.shieldings.shape:
+            raise ValueError("All Conformers must have the same Number of Atoms")
+
+        if energy is not None:
+            weight = self.getBoltzmannWeight(energy)
+
+        if weight < 0:
+            raise ValueError("Weight must be positive")
+
+        if self.shieldings is None:
+            self.shieldings = np.zeros(len(shieldings))
+
+        self.shieldings += weight * shieldings
+        self.totalWeight += weight
+        self.conformerCount += 1
+
+    def getBoltzmannWeight(self, energy: float) -> float:
+        """Gives the Boltzmann Weight of a Conformer relative to the Lowest Energy so far. A new Lowest Energy Rescales what was Accumulated so the Weights never Overflow
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            energy : float - Energy of the Conformer in Hartree
+
+        ## Returns : \n
+            float - Boltzmann Weight of the Conformer
+        """
+        kT = BOLTZMANNHARTREE * self.temperature
+
+        if self.referenceEnergy is None:
+            self.referenceEnergy = energy
+        elif energy < self.referenceEnergy:
+            rescale = np.exp((energy - self.referenceEnergy) / kT)
+            if self.shieldings is not None:
+                self.shieldings *= rescale
+            self.totalWeight *= rescale
+            self.referenceEnergy = energy
+
+        return float(np.exp(-(energy - self.referenceEnergy) / kT))
+
+    def getShieldings(self) -> np.ndarray:
+        """Gives the Population Weighted Average Shielding of each Atom over the Conformers Added so far
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            np.ndarray - Isotropic Shielding (ppm) of each Atom
+        """
+        if self.totalWeight == 0:
+            raise ValueError("No Conformers have been Added to the Ensemble")
+
+        return self.shieldings / self.totalWeight
+
+    def getShifts(
+        self,
+        elements: list[str],
+        reference: dict[str, float] = TMSSHIELDINGS,
+        groups: list[int] = None,
+    ) -> pd.DataFrame:
+        """Gives the Chemical Shift of each Atom, the Reference Shielding of its Element minus its Average Shielding. Shieldings are Averaged within each Group of Equivalent Atoms first
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            elements : list[str] - Atomic Symbol of each Atom \n
+            reference : dict[str, float] - Shielding (ppm) of each Element in the Reference Compound, Atoms of other Elements get no Shift \n
+            groups : list[int] - Group of Equivalent Atoms of each Atom (Ex. Molecule.getEquivalentAtoms, None = Every Atom on its own)
+
+        ## Returns : \n
+            pd.DataFrame - Atom Index, Element, Group, Shielding and Shift (ppm) of each Atom
+        """
+        shieldings = self.getShieldings()
+
+        if len(elements) != len(shieldings):
+            raise ValueError("There must be one Element per Atom")
+
+        if groups is None:
+            groups = list(range(len(shieldings)))
+
+        if len(groups) != len(shieldings):
+            raise ValueError("There must be one Group per Atom")
+
+        # Average the Shieldings within each Group of Equivalent Atoms
+        groups = np.asarray(groups)
+        groupSums = np.bincount(groups, weights=shieldings)
+        groupCounts = np.bincount(groups)
+        shieldings = groupSums[groups] / groupCounts[groups]
+
+        referenceShieldings = np.array([reference.get(element, np.nan) for element in elements])
+
+        return pd.DataFrame(
+            {
+                "Atom": np.arange(len(shieldings)),
+                "Element": list(elements),
+                "Group": groups,
+                "Shielding": shieldings,
+                "Shift": referenceShieldings - shieldings,
+            }
+        )
+
+
+def getReferenceShieldings(chemicalShifts: pd.DataFrame) -> dict[str, float]:
+    """Gives the Average Shielding of each Element of a Reference Compound (Ex. TMS), to Reference Shifts Computed with the same Settings
+
+    ## Parameters : \n
+        chemicalShifts : pd.DataFrame - Shieldings of the Reference as returned by OrcaOutput.getChemicalShifts
+
+    ## Returns : \n
+        dict[str, float] - Average Isotropic Shielding (ppm) of each Element
+    """
+    return chemicalShifts.groupby("nucleus")["isotropic"].mean().to_dict()
+
+
+def broadenShifts(
+    shifts: pd.DataFrame,
+    nucleus: str = "1H",
+    fwhm: float = None,
+    lineShape: str | LineShape = LineShape.LORENTZIAN,
+    spacing: float = None,
+) -> pd.DataFrame:
+    """Broadens the Chemical Shifts of a Nucleus into an NMR Spectrum. Every Atom contributes a Line of the same Area, so Peak Areas Integrate to the Number of Atoms. Couplings between Nuclei are not Modelled
+
+    ## Parameters : \n
+        shifts : pd.DataFrame - Shifts as returned by EnsembleShielding.getShifts \n
+        nucleus : str - Nucleus to make the Spectrum of ("1H" or "13C") \n
+        fwhm : float - Full Width at Half Maximum of each Line in ppm (None = Nucleus Default) \n
+        lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt) \n
+        spacing : float - Spacing in ppm between each Point of the Spectrum (None = Nucleus Default)
+
+    ## Returns : \n
+        pd.DataFrame - Spectrum with Shift (Largest -> Smallest ppm, as NMR Spectra are Drawn) and Intensity
+    """
+    if nucleus not in NMRNUCLEI:
+        raise ValueError(f"Nucleus must be one of {list(NMRNUCLEI)}")
+
+    settings = NMRNUCLEI[nucleus]
+    grid = createGrid(
+        settings["minPPM"], settings["maxPPM"], settings["spacing"] if spacing is None else spacing
+    )
+
+    atoms = shifts[(shifts["Element"] == settings["element"]) & shifts["Shift"].notna()]
+
+    intensities = broadenSpectrum(
+        atoms["Shift"].values,
+        np.ones(len(atoms)),
+        grid,
+        settings["fwhm"] if fwhm is None else fwhm,
+        lineShape,
+    )
+
+    return pd.DataFrame({"Shift": grid[::-1], "Intensity": intensities[::-1]})
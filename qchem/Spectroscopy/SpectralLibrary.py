@@ -0,0 +1,274 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from qchem.Spectroscopy.Broadening import broadenSpectrum, createGrid
+
+SIMILARITYMETRICS = ("cosine", "pearson", "angle")
+"""Similarity Metrics a Library can be Searched with ("angle" is the Spectral Contrast Angle in Radians, smaller is more Similar)"""
+
+
+class SpectralLibrary:
+    """Index of Reference IR Spectra (Ex. Experimental Libraries) for Similarity Searches. Every Reference is Resampled onto a common Wavenumber Grid and Stored in a single Memory Mapped Matrix on Disk, Searches are Batched Matrix Products over Blocks of the Matrix so the Library never has to fit in Memory
+
+    ## Example:
+
+    library = SpectralLibrary.create("IRLibrary", {"Ethane": "Ethane_Spectra.csv", ...})
+    library = SpectralLibrary("IRLibrary")
+    library.query(spectra.IRSpectra, k=5, metric="cosine")
+    """
+
+    path: str
+    """Path to the Folder the Library is Stored in"""
+
+    names: list[str]
+    """Name of each Reference, in the Order of the Rows of the Matrix"""
+
+    grid: np.ndarray
+    """Wavenumbers every Reference is Resampled onto"""
+
+    spectra: np.ndarray
+    """Memory Mapped Matrix with one Resampled Reference per Row"""
+
+    norms: np.ndarray
+    """Euclidean Norm of each Reference"""
+
+    sums: np.ndarray
+    """Sum of the Intensities of each Reference"""
+
+    referenceFWHM: float
+    """Width the References were Broadened with (None = References were Interpolated as Continuous Spectra)"""
+
+    matrixFileName: str = "spectra.npy"
+    """Name of the File Storing the Matrix of Spectra"""
+
+    statisticsFileName: str = "statistics.npy"
+    """Name of the File Storing the Norm and Sum of each Reference"""
+
+    indexFileName: str = "library.json"
+    """Name of the File Storing the Names and the Grid"""
+
+    def __init__(self, path: str):
+        indexFilePath = os.path.join(path, self.indexFileName)
+
+        if not os.path.exists(indexFilePath):
+            raise ValueError(f"No Spectral Library found at {path}")
+
+        with open(indexFilePath, "r") as file:
+            index = json.load(file)
+
+        self.path = path
+        self.names = index["names"]
+        self.grid = createGrid(index["minWaveNum"], index["maxWaveNum"], index["spacing"])
+        self.referenceFWHM = index["referenceFWHM"]
+        self.spectra = np.load(os.path.join(path, self.matrixFileName), mmap_mode="r")
+        self.norms, self.sums = np.load(os.path.join(path, self.statisticsFileName))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def create(
+        path: str,
+        references: dict[str, str | pd.DataFrame] | list[str],
+        minWaveNum: float = 400,
+        maxWaveNum: float = 4000,
+        spacing: float = 2,
+        referenceFWHM: float = None,
+    ):
+        """Creates a Library on Disk from Reference Spectra, Resampling them one at a time straight into the Memory Mapped Matrix
+
+        ## Parameters : \n
+            path : str - Folder to Store the Library in \n
+            references : dict[str, str | pd.DataFrame] | list[str] - Reference Spectra by Name (CSV File Path or DataFrame), or a List of CSV File Paths named after their Files \n
+            minWaveNum : float - Lowest Wavenumber of the Grid \n
+            maxWaveNum : float - Highest Wavenumber of the Grid \n
+            spacing : float - Spacing in Wavenumbers between Grid Points \n
+            referenceFWHM : float - Broaden the References as Stick Spectra with this Width (None = Interpolate them as Continuous Spectra)
+
+        ## Returns : \n
+            SpectralLibrary - The Created Library
+        """
+        if isinstance(references, list):
+            references = {
+                os.path.splitext(os.path.basename(reference))[0]: reference
+                for reference in references
+            }
+
+        if len(references) == 0:
+            raise ValueError("A Library needs at least one Reference Spectra")
+
+        os.makedirs(path, exist_ok=True)
+        grid = createGrid(minWaveNum, maxWaveNum, spacing)
+
+        matrix = np.lib.format.open_memmap(
+            os.path.join(path, SpectralLibrary.matrixFileName),
+            mode="w+",
+            dtype=np.float32,
+            shape=(len(references), len(grid)),
+        )
+
+        for i, spectra in enumerate(references.values()):
+            matrix[i] = resampleSpectra(spectra, grid, referenceFWHM)
+
+        # Statistics in Double Precision, used to turn Dot Products into Similarities
+        statistics = np.zeros((2, len(references)))
+        for start in range(0, len(references), 8192):
+            block = np.asarray(matrix[start : start + 8192], dtype=np.float64)
+            statistics[0, start : start + len(block)] = np.linalg.norm(block, axis=1)
+            statistics[1, start : start + len(block)] = block.sum(axis=1)
+
+        matrix.flush()
+        del matrix
+
+        np.save(os.path.join(path, SpectralLibrary.statisticsFileName), statistics)
+
+        with open(os.path.join(path, SpectralLibrary.indexFileName), "w") as file:
+            json.dump(
+                {
+                    "names": list(references),
+                    "minWaveNum": minWaveNum,
+                    "maxWaveNum": maxWaveNum,
+                    "spacing": spacing,
+                    "referenceFWHM": referenceFWHM,
+                },
+                file,
+            )
+
+        return SpectralLibrary(path)
+
+    def query(
+        self,
+        spectra: str | pd.DataFrame,
+        k: int = 5,
+        metric: str = "cosine",
+        fwhm: float = 20,
+    ) -> pd.DataFrame:
+        """Finds the References most Similar to a Spectra
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spectra : str | pd.DataFrame - The Spectra to Search for (CSV File Path or DataFrame) \n
+            k : int - Number of References to Return \n
+            metric : str - Similarity Metric ("cosine", "pearson" or "angle") \n
+            fwhm : float - Broaden the Spectra as a Stick Spectrum with this Width (None = Interpolate it as a Continuous Spectrum)
+
+        ## Returns : \n
+            pd.DataFrame - Name and Score of the k most Similar References, most Similar first
+        """
+        return self.search([spectra], k, metric, fwhm)[0]
+
+    def search(
+        self,
+        spectra: list[str | pd.DataFrame],
+        k: int = 5,
+        metric: str = "cosine",
+        fwhm: float = 20,
+        blockSize: int = 8192,
+    ) -> list[pd.DataFrame]:
+        """Finds the References most Similar to each of many Spectra at once. The Library is read in Blocks of Rows, each Block is Compared to every Query with one Matrix Product
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spectra : list[str | pd.DataFrame] - The Spectra to Search for (CSV File Paths or DataFrames) \n
+            k : int - Number of References to Return for each Spectra \n
+            metric : str - Similarity Metric ("cosine", "pearson" or "angle") \n
+            fwhm : float - Broaden the Spectra as Stick Spectra with this Width (None = Interpolate them as Continuous Spectra) \n
+            blockSize : int - Number of References Compared at once, bounds the Memory used
+
+        ## Returns : \n
+            list[pd.DataFrame] - For each Spectra, the Name and Score of the k most Similar References, most Similar first
+        """
+        if metric not in SIMILARITYMETRICS:
+            raise ValueError(f"Metric must be one of {SIMILARITYMETRICS}")
+
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("K must be a positive integer")
+
+        k = min(k, len(self))
+        queries = np.array([resampleSpectra(spectrum, self.grid, fwhm) for spectrum in spectra])
+        queryNorms = np.linalg.norm(queries, axis=1)
+        querySums = queries.sum(axis=1)
+        pointCount = len(self.grid)
+
+        # Best Scores and their Rows so far, for each Query
+        bestScores = np.full((len(queries), 0), -np.inf)
+        bestRows = np.zeros((len(queries), 0), dtype=int)
+
+        for start in range(0, len(self), blockSize):
+            block = np.asarray(self.spectra[start : start + blockSize], dtype=np.float64)
+            rows = np.arange(start, start + len(block))
+            dots = queries @ block.T
+
+            if metric == "pearson":
+                covariance = dots - np.outer(querySums, self.sums[rows]) / pointCount
+                queryDeviation = np.sqrt(np.maximum(queryNorms**2 - querySums**2 / pointCount, 0))
+                referenceDeviation = np.sqrt(
+                    np.maximum(self.norms[rows] ** 2 - self.sums[rows] ** 2 / pointCount, 0)
+                )
+                scores = divideSafely(covariance, np.outer(queryDeviation, referenceDeviation))
+            else:
+                scores = divideSafely(dots, np.outer(queryNorms, self.norms[rows]))
+
+            # Keep only the k Best of the Previous Best and this Block
+            candidateScores = np.concatenate([bestScores, scores], axis=1)
+            candidateRows = np.concatenate([bestRows, np.broadcast_to(rows, scores.shape)], axis=1)
+            if candidateScores.shape[1] > k:
+                keep = np.argpartition(-candidateScores, k - 1, axis=1)[:, :k]
+            else:
+                keep = np.argsort(-candidateScores, axis=1)
+            bestScores = np.take_along_axis(candidateScores, keep, axis=1)
+            bestRows = np.take_along_axis(candidateRows, keep, axis=1)
+
+        results = []
+        for scores, rows in zip(bestScores, bestRows):
+            order = np.argsort(-scores, kind="stable")
+            scores, rows = scores[order], rows[order]
+
+            if metric == "angle":
+                scores = np.arccos(np.clip(scores, -1, 1))
+
+            results.append(
+                pd.DataFrame({"Name": [self.names[row] for row in rows], "Score": scores})
+            )
+
+        return results
+
+
+def resampleSpectra(spectra: str | pd.DataFrame, grid: np.ndarray, fwhm: float = None) -> np.ndarray:
+    """Resamples a Spectra onto a Grid. Stick Spectra are Broadened, Continuous Spectra are Linearly Interpolated (Zero outside their Range)
+
+    ## Parameters : \n
+        spectra : str | pd.DataFrame - Path to the CSV File or the Pandas DataFrame Object \n
+        grid : np.ndarray - Wavenumbers to Resample onto \n
+        fwhm : float - Broaden the Spectra as a Stick Spectrum with this Width (None = Interpolate it as a Continuous Spectrum)
+
+    ## Returns : \n
+        np.ndarray - Intensity at each Grid Point
+    """
+    # Imported here since the Spectra Pipeline imports this Package
+    from qchem.Pipelines.Spectra import Spectra
+
+    IRSpectra = Spectra.loadSpectra(spectra)
+    wavenumbers = IRSpectra["Wavenumber"].values.astype(float)
+    intensities = IRSpectra["IRIntensity"].values.astype(float)
+
+    if fwhm is not None:
+        return broadenSpectrum(wavenumbers, intensities, grid, fwhm)
+
+    # Interpolation needs Ascending Wavenumbers
+    order = np.argsort(wavenumbers, kind="stable")
+    return np.interp(grid, wavenumbers[order], intensities[order], left=0, right=0)
+
+
+def divideSafely(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divides Element wise, giving 0 where the Denominator is 0 (Ex. an Empty Spectrum)
+
+    ## Parameters : \n
+        numerator : np.ndarray - Values to Divide \n
+        denominator : np.ndarray - Values to Divide by
+
+    ## Returns : \n
+        np.ndarray - The Quotient
+    """
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
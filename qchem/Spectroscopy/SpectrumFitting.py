@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+from qchem.Data.Enums import LineShape
+from qchem.Spectroscopy.Broadening import binSticks, broadenSpectrum, createGrid, getProfile
+from qchem.Spectroscopy.SpectralLibrary import resampleSpectra
+
+FITCOLUMNS = ["Name", "Scale", "FWHM", "Amplitude", "Baseline", "RMSE", "R2"]
+"""Columns of the Table returned by fitSpectra"""
+
+
+def loadSticks(spectra: str | pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Loads a Computed Stick Spectrum, either in the Spectra Format (Wavenumber, IRIntensity) or as returned by OrcaOutput.getIRFrequencies (frequency, IRIntensity)
+
+    ## Parameters : \n
+        spectra : str | pd.DataFrame - Path to the CSV File or the Pandas DataFrame Object
+
+    ## Returns : \n
+        tuple[np.ndarray, np.ndarray] - Wavenumbers and Intensities of the Sticks
+    """
+    if isinstance(spectra, pd.DataFrame) and "frequency" in spectra:
+        spectra = spectra.rename(columns={"frequency": "Wavenumber"})
+
+    # Imported here since the Spectra Pipeline imports this Package
+    from qchem.Pipelines.Spectra import Spectra
+
+    sticks = Spectra.loadSpectra(spectra)
+
+    return sticks["Wavenumber"].values.astype(float), sticks["IRIntensity"].values.astype(float)
+
+
+def fitSpectrum(
+    computed: str | pd.DataFrame,
+    experimental: str | pd.DataFrame,
+    **settings,
+) -> dict:
+    """Fits a Computed Stick Spectrum to an Experimental Spectrum, finding the Frequency Scale Factor, Line Width, Amplitude and Baseline. Takes the same Settings as fitSpectra
+
+    ## Parameters : \n
+        computed : str | pd.DataFrame - The Computed Stick Spectrum (CSV File Path or DataFrame) \n
+        experimental : str | pd.DataFrame - The Experimental Spectrum, Absorbance like (Peaks pointing up) \n
+        settings - Keyword Arguments passed to fitSpectra
+
+    ## Returns : \n
+        dict - The Fitted Scale, FWHM, Amplitude, Baseline and the Quality of the Fit (RMSE, R2)
+    """
+    return fitSpectra({"Spectrum": computed}, experimental, **settings).iloc[0].to_dict()
+
+
+def fitSpectra(
+    computed: dict[str, str | pd.DataFrame],
+    experimental: str | pd.DataFrame | dict[str, str | pd.DataFrame],
+    scaleRange: tuple[float, float] = (0.9, 1.05),
+    fwhmRange: tuple[float, float] = (4, 60),
+    scaleSteps: int = 31,
+    fwhmSteps: int = 15,
+    refinements: int = 2,
+    minWaveNum: float = 400,
+    maxWaveNum: float = 4000,
+    spacing: float = 2,
+    lineShape: str | LineShape = LineShape.LORENTZIAN,
+    batchSize: int = 4,
+) -> pd.DataFrame:
+    """Fits many Computed Stick Spectra to Experimental Spectra at once. Every Combination of Scale Factor and Line Width on a Grid is Evaluated in one Batched FFT Convolution, the Amplitude and Baseline of each Combination are Solved in Closed Form, and the Grid is then Refined around the Best Combination
+
+    ## Parameters : \n
+        computed : dict[str, str | pd.DataFrame] - Computed Stick Spectra by Name (CSV File Path or DataFrame) \n
+        experimental : str | pd.DataFrame | dict[str, str | pd.DataFrame] - One Experimental Spectrum for all, or one per Name, Absorbance like (Peaks pointing up) \n
+        scaleRange : tuple[float, float] - Range of Frequency Scale Factors Searched first \n
+        fwhmRange : tuple[float, float] - Range of Line Widths (FWHM in Wavenumbers) Searched first \n
+        scaleSteps : int - Number of Scale Factors Evaluated per Search \n
+        fwhmSteps : int - Number of Line Widths Evaluated per Search \n
+        refinements : int - Number of Finer Searches around the Best Combination \n
+        minWaveNum : float - Lowest Wavenumber Compared \n
+        maxWaveNum : float - Highest Wavenumber Compared \n
+        spacing : float - Spacing in Wavenumbers of the Grid the Spectra are Compared on \n
+        lineShape : str | LineShape - Line Shape of each Line (Gaussian, Lorentzian or Voigt) \n
+        batchSize : int - Number of Molecules Evaluated together, bounds the Memory used
+
+    ## Returns : \n
+        pd.DataFrame - One Row per Molecule with the Fitted Scale, FWHM, Amplitude, Baseline, RMSE and R2
+    """
+    if scaleSteps < 2 or fwhmSteps < 2:
+        raise ValueError("At least 2 Scale and FWHM Steps are needed")
+
+    if scaleRange[0] <= 0 or fwhmRange[0] <= 0:
+        raise ValueError("Scale Factors and Line Widths must be positive")
+
+    grid = createGrid(minWaveNum, maxWaveNum, spacing)
+    names = list(computed)
+
+    if not isinstance(experimental, dict):
+        experimental = dict.fromkeys(names, experimental)
+
+    missing = [name for name in names if name not in experimental]
+    if missing:
+        raise ValueError(f"No Experimental Spectrum for {missing}")
+
+    sticks = [loadSticks(computed[name]) for name in names]
+    targets = np.array([resampleSpectra(experimental[name], grid) for name in names])
+
+    rows = []
+    for start in range(0, len(names), batchSize):
+        batch = slice(start, start + batchSize)
+        scaleLow = np.full(len(sticks[batch]), float(scaleRange[0]))
+        scaleHigh = np.full(len(sticks[batch]), float(scaleRange[1]))
+        fwhmLow = np.full(len(sticks[batch]), float(fwhmRange[0]))
+        fwhmHigh = np.full(len(sticks[batch]), float(fwhmRange[1]))
+
+        for _ in range(refinements + 1):
+            scales = np.linspace(scaleLow, scaleHigh, scaleSteps, axis=1)
+            fwhms = np.linspace(fwhmLow, fwhmHigh, fwhmSteps, axis=1)
+
+            best = evaluateGrid(sticks[batch], targets[batch], grid, scales, fwhms, lineShape)
+
+            # Zoom in around the Best Combination, keeping the Values positive
+            scaleStep = scales[:, 1] - scales[:, 0]
+            fwhmStep = fwhms[:, 1] - fwhms[:, 0]
+            scaleLow = np.maximum(best["Scale"] - scaleStep, scaleStep / 2)
+            scaleHigh = best["Scale"] + scaleStep
+            fwhmLow = np.maximum(best["FWHM"] - fwhmStep, fwhmStep / 2)
+            fwhmHigh = best["FWHM"] + fwhmStep
+
+        for i, name in enumerate(names[batch]):
+            rows.append({"Name": name, **{key: float(values[i]) for key, values in best.items()}})
+
+    return pd.DataFrame(rows, columns=FITCOLUMNS)
+
+
+def evaluateGrid(
+    sticks: list[tuple[np.ndarray, np.ndarray]],
+    targets: np.ndarray,
+    grid: np.ndarray,
+    scales: np.ndarray,
+    fwhms: np.ndarray,
+    lineShape: str | LineShape,
+) -> dict[str, np.ndarray]:
+    """Evaluates every Combination of Scale Factor and Line Width for a Batch of Molecules and gives the Best one of each Molecule
+
+    ## Parameters : \n
+        sticks : list[tuple[np.ndarray, np.ndarray]] - Wavenumbers and Intensities of each Molecules Sticks \n
+        targets : np.ndarray - Experimental Spectra on the Grid, one Row per Molecule \n
+        grid : np.ndarray - Uniform Wavenumber Grid \n
+        scales : np.ndarray - Scale Factors to Evaluate, one Row per Molecule \n
+        fwhms : np.ndarray - Line Widths to Evaluate, one Row per Molecule \n
+        lineShape : str | LineShape - Line Shape of each Line
+
+    ## Returns : \n
+        dict[str, np.ndarray] - Best Scale, FWHM, Amplitude, Baseline, RMSE and R2 of each Molecule
+    """
+    pointCount = len(grid)
+    spacing = grid[1] - grid[0]
+    size = 1 << int(np.ceil(np.log2(3 * pointCount - 2)))
+
+    # Sticks Scaled by every Factor, Binned onto the Grid : (Molecule, Scale, Grid)
+    binned = np.array(
+        [
+            [binSticks(wavenumbers * scale, intensities, grid) for scale in moleculeScales]
+            for (wavenumbers, intensities), moleculeScales in zip(sticks, scales)
+        ]
+    )
+
+    # Line Shape of every Width : (Molecule, FWHM, Offset)
+    offsets = spacing * np.arange(-(pointCount - 1), pointCount)
+    kernels = getProfile(offsets[np.newaxis, np.newaxis, :], fwhms[:, :, np.newaxis], lineShape)
+
+    # Every Combination in one Convolution : (Molecule, FWHM, Scale, Grid)
+    spectra = np.fft.irfft(
+        np.fft.rfft(binned, size)[:, np.newaxis, :, :]
+        * np.fft.rfft(kernels, size)[:, :, np.newaxis, :],
+        size,
+    )[..., pointCount - 1 : 2 * pointCount - 1]
+
+    # Least Squares Amplitude and Baseline of every Combination, in Closed Form
+    y = targets[:, np.newaxis, np.newaxis, :]
+    sumModel = spectra.sum(axis=-1)
+    sumModelSquared = (spectra**2).sum(axis=-1)
+    sumModelTarget = (spectra * y).sum(axis=-1)
+    sumTarget = targets.sum(axis=-1)[:, np.newaxis, np.newaxis]
+    sumTargetSquared = (targets**2).sum(axis=-1)[:, np.newaxis, np.newaxis]
+
+    determinant = pointCount * sumModelSquared - sumModel**2
+    amplitude = np.divide(
+        pointCount * sumModelTarget - sumModel * sumTarget,
+        determinant,
+        out=np.zeros_like(determinant),
+        where=determinant > 0,
+    )
+
+    # A Negative Amplitude would Fit an Inverted Spectrum, use the Baseline alone
+    amplitude = np.maximum(amplitude, 0)
+    baseline = (sumTarget - amplitude * sumModel) / pointCount
+
+    residual = (
+        sumTargetSquared
+        - 2 * amplitude * sumModelTarget
+        - 2 * baseline * sumTarget
+        + amplitude**2 * sumModelSquared
+        + 2 * amplitude * baseline * sumModel
+        + pointCount * baseline**2
+    )
+
+    # Best Combination of each Molecule
+    moleculeCount = len(sticks)
+    flat = residual.reshape(moleculeCount, -1).argmin(axis=1)
+    fwhmIndex, scaleIndex = np.unravel_index(flat, residual.shape[1:])
+    molecules = np.arange(moleculeCount)
+
+    bestResidual = np.maximum(residual[molecules, fwhmIndex, scaleIndex], 0)
+    totalVariance = sumTargetSquared[:, 0, 0] - sumTarget[:, 0, 0] ** 2 / pointCount
+
+    return {
+        "Scale": scales[molecules, scaleIndex],
+        "FWHM": fwhms[molecules, fwhmIndex],
+        "Amplitude": amplitude[molecules, fwhmIndex, scaleIndex],
+        "Baseline": baseline[molecules, fwhmIndex, scaleIndex],
+        "RMSE": np.sqrt(bestResidual / pointCount),
+        "R2": 1
+        - np.divide(
+            bestResidual, totalVariance, out=np.zeros_like(bestResidual), where=totalVariance > 0
+        ),
+    }
+
+
+def applyFit(
+    computed: str | pd.DataFrame,
+    fit: dict,
+    grid: np.ndarray,
+    lineShape: str | LineShape = LineShape.LORENTZIAN,
+) -> np.ndarray:
+    """Evaluates a Fitted Model of a Computed Spectrum, to Compare or Plot against the Experimental Spectrum
+
+    ## Parameters : \n
+        computed : str | pd.DataFrame - The Computed Stick Spectrum (CSV File Path or DataFrame) \n
+        fit : dict - A Fit from fitSpectrum (Or a Row of fitSpectra) \n
+        grid : np.ndarray - Wavenumbers to Evaluate the Model at \n
+        lineShape : str | LineShape - Line Shape the Fit was made with
+
+    ## Returns : \n
+        np.ndarray - Intensity of the Fitted Model at each Grid Point
+    """
+    wavenumbers, intensities = loadSticks(computed)
+
+    return fit["Amplitude"] * broadenSpectrum(
+        wavenumbers * fit["Scale"], intensities, grid, fit["FWHM"], lineShape
+    ) + fit["Baseline"]
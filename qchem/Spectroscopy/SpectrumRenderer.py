@@ -0,0 +1,204 @@
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from qchem.Data.Enums import LineShape
+
+
+class SpectrumRenderer:
+    """Renders IR Spectra to Image Files without a Display. Uses the Object Oriented Agg API and reuses a single Figure for every Spectrum, so Rendering hundreds of Spectra neither leaks Figures nor goes through the pyplot State Machine
+
+    ## Example:
+
+    with SpectrumRenderer(format="svg") as renderer:
+        renderer.renderMany({"Ethane": "Ethane_Spectra.csv", "Propane": propaneSpectra}, "Plots", processes=4)
+    """
+
+    sigma: float
+    """Standard Deviation of each Line in Wavenumbers"""
+
+    maxWaveNum: float
+    """Upper bound WaveNumber Rendered"""
+
+    spacing: float
+    """Spacing in Wavenumbers between each Point of the Rendered Spectrum"""
+
+    lineShape: str | LineShape
+    """Line Shape of each Line (Gaussian, Lorentzian or Voigt)"""
+
+    width: float
+    """Width of the Image in Inches"""
+
+    height: float
+    """Height of the Image in Inches"""
+
+    dpi: int
+    """Resolution of the Image in Dots per Inch"""
+
+    format: str
+    """Image Format to Save ("png" or "svg")"""
+
+    figure: Figure
+    """The Figure reused for every Spectrum (None once Closed)"""
+
+    def __init__(
+        self,
+        sigma: float = 10,
+        maxWaveNum: float = 4000,
+        spacing: float = 1,
+        lineShape: str | LineShape = LineShape.GAUSSIAN,
+        width: float = 6.4,
+        height: float = 4.8,
+        dpi: int = 100,
+        format: str = "png",
+    ):
+        if format not in ("png", "svg"):
+            raise ValueError('Format must be "png" or "svg"')
+
+        self.sigma = sigma
+        self.maxWaveNum = maxWaveNum
+        self.spacing = spacing
+        self.lineShape = lineShape
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.format = format
+
+        # Figure with its own Agg Canvas, never registered with pyplot
+        self.figure = Figure(figsize=(width, height), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        (self.line,) = self.axes.plot([], [])
+        self.axes.set_xlabel("Wavenumber (1/cm)")
+        self.axes.set_ylabel("IR Intensity")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        """Releases the Figure, the Renderer can't be used afterwards
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            None - No Return Value
+        """
+        if self.figure is not None:
+            self.figure.clear()
+            self.figure = None
+
+    def render(self, spectra: str | pd.DataFrame, outputPath: str, title: str = "") -> str:
+        """Renders a single Stick IR Spectra (Broadened and Normalized like Spectra.plotSpectra) to an Image File
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spectra : str | pd.DataFrame - Path to the CSV File or the Pandas DataFrame Object \n
+            outputPath : str - Path of the Image File to Save \n
+            title : str - Title of the Plot
+
+        ## Returns : \n
+            str - Path of the Saved Image File
+        """
+        if self.figure is None:
+            raise ValueError("The Renderer has been Closed")
+
+        # Imported here since the Spectra Pipeline imports this Package
+        from qchem.Pipelines.Spectra import Spectra
+
+        IRSpectra = Spectra.broadenSpectra(
+            spectra, self.sigma, self.maxWaveNum, self.spacing, self.lineShape
+        )
+
+        # Normalize and Inverse Intensity
+        intensities = IRSpectra["IRIntensity"].values
+        if intensities.max() > 0:
+            intensities = intensities / intensities.max()
+
+        self.line.set_data(IRSpectra["Wavenumber"].values, 1 - intensities)
+        self.axes.set_xlim(self.maxWaveNum, 0)
+        self.axes.set_ylim(-0.05, 1.05)
+        self.axes.set_title(title)
+
+        self.figure.savefig(outputPath, format=self.format)
+
+        return outputPath
+
+    def renderMany(
+        self,
+        spectra: dict[str, str | pd.DataFrame],
+        outputDirectory: str,
+        processes: int = 1,
+    ) -> dict[str, str]:
+        """Renders many IR Spectra to Image Files named after each Spectra, optionally split across a Pool of Processes
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance \n
+            spectra : dict[str, str | pd.DataFrame] - The Spectra to Render by Name (CSV File Path or DataFrame) \n
+            outputDirectory : str - Folder to Save the Images to \n
+            processes : int - Number of Processes Rendering at the same Time (1 = Render in this Process)
+
+        ## Returns : \n
+            dict[str, str] - Path of the Saved Image File for each Spectra
+        """
+        if not isinstance(processes, int) or processes < 1:
+            raise ValueError("Processes must be a positive integer")
+
+        os.makedirs(outputDirectory, exist_ok=True)
+
+        jobs = [
+            (name, spectrum, os.path.join(outputDirectory, f"{name}.{self.format}"))
+            for name, spectrum in spectra.items()
+        ]
+
+        if processes == 1 or len(jobs) <= 1:
+            return {name: self.render(spectrum, path, name) for name, spectrum, path in jobs}
+
+        # One Chunk per Process so each Process only Creates one Figure
+        chunks = [jobs[i::processes] for i in range(min(processes, len(jobs)))]
+        settings = self.getSettings()
+
+        paths = {}
+        with ProcessPoolExecutor(len(chunks)) as executor:
+            for chunkPaths in executor.map(renderChunk, chunks, [settings] * len(chunks)):
+                paths.update(chunkPaths)
+
+        return {name: paths[name] for name, _, _ in jobs}
+
+    def getSettings(self) -> dict:
+        """Gives the Settings needed to Create an identical Renderer in another Process
+
+        ## Parameters : \n
+            self - Default Parameter for the Class Instance
+
+        ## Returns : \n
+            dict - The Renderers Constructor Arguments
+        """
+        return {
+            "sigma": self.sigma,
+            "maxWaveNum": self.maxWaveNum,
+            "spacing": self.spacing,
+            "lineShape": self.lineShape,
+            "width": self.width,
+            "height": self.height,
+            "dpi": self.dpi,
+            "format": self.format,
+        }
+
+
+def renderChunk(jobs: list[tuple[str, str | pd.DataFrame, str]], settings: dict) -> dict[str, str]:
+    """Renders a Chunk of Spectra in a Worker Process with its own Renderer
+
+    ## Parameters : \n
+        jobs : list[tuple[str, str | pd.DataFrame, str]] - Name, Spectra and Output Path of each Spectra \n
+        settings : dict - The Renderers Constructor Arguments
+
+    ## Returns : \n
+        dict[str, str] - Path of the Saved Image File for each Spectra
+    """
+    with SpectrumRenderer(**settings) as renderer:
+        return {name: renderer.render(spectrum, path, name) for name, spectrum, path in jobs}
@@ -0,0 +1,30 @@
+from ..LazyLoading import makeLazy
+
+# Spectroscopy Modules are Imported the first time they are used (SpectrumRenderer Loads matplotlib)
+LAZYATTRIBUTES = {
+    "broadenSpectrum": (".Broadening", "broadenSpectrum"),
+    "createGrid": (".Broadening", "createGrid"),
+    "EnsembleSpectrum": (".EnsembleSpectrum", "EnsembleSpectrum"),
+    "SpectrumRenderer": (".SpectrumRenderer", "SpectrumRenderer"),
+    "SpectralLibrary": (".SpectralLibrary", "SpectralLibrary"),
+    "fitSpectrum": (".SpectrumFitting", "fitSpectrum"),
+    "fitSpectra": (".SpectrumFitting", "fitSpectra"),
+    "EnsembleShielding": (".NMRSpectrum", "EnsembleShielding"),
+    "broadenShifts": (".NMRSpectrum", "broadenShifts"),
+}
+"""Module and Name in it of each Public Symbol"""
+
+# Expose all Classes when importing with star (*)
+__all__ = [
+    "broadenSpectrum",
+    "createGrid",
+    "EnsembleSpectrum",
+    "SpectrumRenderer",
+    "SpectralLibrary",
+    "fitSpectrum",
+    "fitSpectra",
+    "EnsembleShielding",
+    "broadenShifts",
+]
+
+makeLazy(__name__, LAZYATTRIBUTES)
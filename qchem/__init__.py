@@ -1,21 +1,53 @@
-from .Parser import OrcaOutput
-from .XYZFile import XYZFile
-from .Molecule import Molecule
-from .Data.Constants import CovalentRadiiConstants, AtomicMassConstants
-from .Calculation import OrcaCalculation, ClusterCalculation, OrcaInputFile, GeoOpt
-from .Data.Enums import OrcaBasisSet, OrcaDensityFunctional, OrcaCalculationType, OrcaInputTemplate
-from .Pipelines.Spectra import Spectra
+from .LazyLoading import makeLazy
 
-# Optionally, you can also expose submodules as needed
-#from . import Enums
-from . import Data
-from . import Pipelines
-from . import Calculation
+# Symbols are Imported the first time they are used (import qchem stays fast, Worker Processes and Scripts only Load what they need)
+LAZYATTRIBUTES = {
+    "Data": (".Data", None),
+    "Pipelines": (".Pipelines", None),
+    "Spectroscopy": (".Spectroscopy", None),
+    "Calculation": (".Calculation", None),
+    "Parser": (".Parser", None),
+    "Enums": (".Data.Enums", None),
+    "OrcaCalculation": (".Calculation.OrcaCalculation", None),
+    "OrcaOutput": (".Parser", "OrcaOutput"),
+    "XYZFile": (".XYZFile", "XYZFile"),
+    "Molecule": (".Molecule", "Molecule"),
+    "CovalentRadiiConstants": (".Data.Constants", "CovalentRadiiConstants"),
+    "AtomicMassConstants": (".Data.Constants", "AtomicMassConstants"),
+    "AtomicNumberConstants": (".Data.Constants", "AtomicNumberConstants"),
+    "ClusterCalculation": (".Calculation.ClusterCalculation", "ClusterCalculation"),
+    "OrcaInputFile": (".Calculation.OrcaInputFile", "OrcaInputFile"),
+    "InputSweep": (".Calculation.InputSweep", "InputSweep"),
+    "OrcaScratch": (".Calculation.OrcaScratch", "OrcaScratch"),
+    "SchedulerClient": (".Calculation.Scheduler", "SchedulerClient"),
+    "RemoteExecutor": (".Calculation.Executors", "RemoteExecutor"),
+    "BatchQueueExecutor": (".Calculation.Executors", "BatchQueueExecutor"),
+    "RetryPolicy": (".Calculation.Failures", "RetryPolicy"),
+    "ResultsDatabase": (".Calculation.ResultsDatabase", "ResultsDatabase"),
+    "RuntimeEstimator": (".Calculation.RuntimeEstimator", "RuntimeEstimator"),
+    "CoreAllocator": (".Calculation.CoreAllocator", "CoreAllocator"),
+    "GeoOpt": (".Calculation.GeoOpt", "GeoOpt"),
+    "OrcaBasisSet": (".Data.Enums", "OrcaBasisSet"),
+    "OrcaDensityFunctional": (".Data.Enums", "OrcaDensityFunctional"),
+    "OrcaCalculationType": (".Data.Enums", "OrcaCalculationType"),
+    "OrcaInputTemplate": (".Data.Enums", "OrcaInputTemplate"),
+    "FailureType": (".Data.Enums", "FailureType"),
+    "Spectra": (".Pipelines.Spectra", "Spectra"),
+    "NMRSpectra": (".Pipelines.NMRSpectra", "NMRSpectra"),
+    "Workflow": (".Pipelines.Workflow", "Workflow"),
+    "Screening": (".Pipelines.Screening", "Screening"),
+    "exportResults": (".Export", "exportResults"),
+    "readResults": (".Export", "readResults"),
+    "Tracer": (".Instrumentation", "Tracer"),
+    "span": (".Instrumentation", "span"),
+}
+"""Module and Name in it of each Public Symbol (None = The Module itself)"""
 
 # List of publicly available symbols for easier access when using `import *`
 __all__ = [
     "Data",
     "Pipelines",
+    "Spectroscopy",
     "Parser",
     "OrcaDensityFunctional",
     "OrcaBasisSet",
@@ -26,11 +58,31 @@ __all__ = [
     "ClusterCalculation",
     "CovalentRadiiConstants",
     "AtomicMassConstants",
+    "AtomicNumberConstants",
     "Enums",
     "GeoOpt",
     "OrcaInputFile",
+    "InputSweep",
+    "OrcaScratch",
+    "SchedulerClient",
+    "RemoteExecutor",
+    "BatchQueueExecutor",
+    "RetryPolicy",
+    "ResultsDatabase",
+    "RuntimeEstimator",
+    "CoreAllocator",
     "OrcaInputTemplate",
+    "FailureType",
     "OrcaOutput",
     "Spectra",
+    "NMRSpectra",
+    "Workflow",
+    "Screening",
+    "exportResults",
+    "readResults",
+    "Tracer",
+    "span",
     "Calculation"
-]
\ No newline at end of file
+]
+
+makeLazy(__name__, LAZYATTRIBUTES)
@@ -0,0 +1,5 @@
+import sys
+from qchem.CLI import main
+
+# python -m qchem runs the qchem Command
+sys.exit(main())
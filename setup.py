@@ -16,4 +16,7 @@ setup(
         'pandas>=2.2.2',
 
     ],
+    entry_points={
+        'console_scripts': ['qchem=qchem.CLI:main'],
+    },
 )
\ No newline at end of file
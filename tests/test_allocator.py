@@ -0,0 +1,70 @@
+import os
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.OrcaCalculation import createCalcResult
+from qchem.Calculation.CoreAllocator import CoreAllocator
+from qchem.Calculation.ResultsDatabase import ResultsDatabase
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+
+
+def createInput(molecule: str, cores: int = 1, template: OrcaInputTemplate = OrcaInputTemplate.BASICXYZPARALLEL) -> OrcaInputFile:
+    """Creates a Frequency Input File for a Molecule of the Test Files"""
+    return OrcaInputFile(
+        template,
+        calculation="FREQ",
+        basis="DEF2-SVP",
+        functional="B3LYP",
+        cores=cores,
+        xyz=Molecule(molecule, os.path.join(TEST_FILES_DIR, f"{molecule.lower()}.xyz")).XYZBody(),
+    )
+
+
+def testLargerMoleculesGetMoreCores():
+    """Test Cores follow the Size of the Molecules, stay within the Budget and Efficiency Floor"""
+    allocator = CoreAllocator(16)
+    ethane, caffeine = allocator.allocate([createInput("Ethane"), createInput("Caffeine")])
+
+    assert 1 <= ethane < caffeine
+    assert ethane + caffeine <= 16
+    assert allocator.getSpeedup(18, ethane, "FREQ") / ethane >= allocator.minEfficiency
+
+    # Small Molecules leave Cores Idle rather than Run Inefficiently
+    assert sum(CoreAllocator(64).allocate([createInput("Ethane")])) < 64
+
+    # More Calculations than Cores Run on one Core each
+    assert CoreAllocator(2).allocate([createInput("Caffeine")] * 3) == [1, 1, 1]
+
+
+def testClusterAllocatesCores():
+    """Test the Cluster Rewrites the Cores of Templates with a Cores Placeholder, and leaves the Others"""
+    calculations = [createInput("Caffeine"), createInput("Ethane", template=OrcaInputTemplate.BASICXYZ)]
+    cluster = ClusterCalculation(calculations, maxCores=8, STDOut=False, recordResults=False, allocateCores=True)
+    cluster.orderCalculations()
+
+    caffeine, ethane = calculations
+    assert caffeine.variables["cores"] > 1
+    assert f"%pal nprocs {caffeine.variables['cores']} end" in caffeine.inputFileContents
+    assert ethane.variables["cores"] == 1
+
+
+def testMeasuredSerialFraction(tmp_path):
+    """Test the Serial Fraction is Measured from the same Input Recorded on different Cores"""
+    database = ResultsDatabase(str(tmp_path / "Results.db"))
+
+    # Runtimes of a 10% Serial Calculation
+    for cores in (1, 2, 4, 8):
+        orcaCachePath = tmp_path / f"Caffeine_{cores}"
+        orcaCachePath.mkdir()
+        (orcaCachePath / f"Caffeine_{cores}.out").write_text("****ORCA TERMINATED NORMALLY****\n")
+        wallTime = 100 * (0.1 + 0.9 / cores)
+        database.record(createCalcResult(f"Caffeine_{cores}", str(orcaCachePath), 0, 0, wallTime, 0), createInput("Caffeine", cores))
+
+    allocator = CoreAllocator(8)
+    fractions = allocator.measureSerialFractions(database)
+
+    assert abs(allocator.getSerialFraction(102, "FREQ") - 0.1) < 1e-3
+    assert set(fractions) == {"FREQ"}
+    database.close()
@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Calculation.OrcaCalculation import runProcessAsync
+
+
+def testCoreBudgetLimitsConcurrency():
+    """Test that Calculations never use more Cores than the Budget"""
+    budget = CoreBudget(4)
+    running = []
+    peak = []
+
+    async def job(cores):
+        async with budget.reserve(cores):
+            running.append(cores)
+            peak.append(sum(running))
+            await asyncio.sleep(0.01)
+            running.remove(cores)
+
+    async def main():
+        await asyncio.gather(*[job(c) for c in [2, 2, 3, 1, 4, 1]])
+
+    asyncio.run(main())
+    assert max(peak) <= 4
+    assert budget.usedCores == 0
+
+
+def testCoreBudgetClampsOversizedRequests():
+    """Test that a Calculation asking for more Cores than the Budget still Runs"""
+    budget = CoreBudget(2)
+
+    async def main():
+        async with budget.reserve(16):
+            assert budget.usedCores == 2
+
+    asyncio.run(main())
+    assert budget.usedCores == 0
+
+
+def testCoreBudgetCancelledWaiterReleases():
+    """Test that Cancelling a Waiting Calculation doesn't leak Cores"""
+    budget = CoreBudget(2)
+
+    async def main():
+        await budget.acquire(2)
+        waiter = asyncio.create_task(budget.acquire(1))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        budget.release(2)
+
+    asyncio.run(main())
+    assert budget.usedCores == 0
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Process Groups are POSIX only")
+def testCancellationKillsProcessTree(tmp_path):
+    """Test that Cancelling a Running Process also Kills the Processes it Spawned"""
+    pidFile = tmp_path / "child.pid"
+    script = (
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        f"open(r'{pidFile}', 'w').write(str(child.pid))\n"
+        "time.sleep(60)\n"
+    )
+
+    async def main():
+        task = asyncio.create_task(runProcessAsync([sys.executable, "-c", script], str(tmp_path)))
+        while not pidFile.exists() or pidFile.read_text() == "":
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    childPid = int(pidFile.read_text())
+    time.sleep(0.2)
+
+    # The Child is either Gone or a Zombie waiting to be Reaped by init
+    try:
+        os.kill(childPid, 0)
+        with open(f"/proc/{childPid}/stat") as stat:
+            assert stat.read().split()[2] == "Z"
+    except (ProcessLookupError, FileNotFoundError):
+        pass
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from qchem.Data.Enums import LineShape
+from qchem.Pipelines.Spectra import Spectra
+from qchem.Spectroscopy.Broadening import broadenSpectrum, createGrid, binSticks
+
+
+@pytest.mark.parametrize("lineShape", list(LineShape))
+def testBroadeningKeepsArea(lineShape):
+    """Test that each Line Integrates to its Stick Intensity"""
+    grid = createGrid(0, 4000, 0.5)
+    spectrum = broadenSpectrum([1000, 2500], [3, 1], grid, fwhm=10, lineShape=lineShape)
+
+    # Lorentzian Tails reach past the Grid
+    tolerance = 0.01 if lineShape == LineShape.GAUSSIAN else 0.05
+    assert np.trapz(spectrum, grid) == pytest.approx(4, rel=tolerance)
+    assert grid[np.argmax(spectrum)] == pytest.approx(1000)
+
+
+def testBroadeningIndependentOfStickCount():
+    """Test that Splitting a Stick into many doesn't change the Spectrum"""
+    grid = createGrid(0, 2000, 1)
+    single = broadenSpectrum([1200.0], [6.0], grid, fwhm=15)
+    split = broadenSpectrum([1200.0] * 6, [1.0] * 6, grid, fwhm=15)
+
+    assert np.allclose(single, split)
+
+
+@pytest.mark.parametrize("lineShape", ["gaussian", "lorentzian", "voigt"])
+def testFFTMatchesDirect(lineShape):
+    """Test that FFT Convolution reproduces Direct Evaluation"""
+    rng = np.random.default_rng(0)
+    wavenumbers = rng.uniform(100, 3900, 300)
+    intensities = rng.uniform(0, 100, 300)
+    grid = createGrid(0, 4000, 1)
+
+    direct = broadenSpectrum(wavenumbers, intensities, grid, 20, lineShape, method="direct")
+    fft = broadenSpectrum(wavenumbers, intensities, grid, 20, lineShape, method="fft")
+
+    assert np.allclose(direct, fft, atol=5e-3 * direct.max())
+
+
+def testBinningKeepsIntensityAndPosition():
+    """Test that Binning splits a Stick between its Neighbouring Grid Points"""
+    grid = createGrid(0, 10, 1)
+    binned = binSticks(np.array([2.25]), np.array([4.0]), grid)
+
+    assert binned.sum() == pytest.approx(4)
+    assert binned[2] == pytest.approx(3)
+    assert binned[3] == pytest.approx(1)
+
+
+def testBroadenSpectraDataFrame():
+    """Test that the Broadened Spectra is Independent of Stick Order and sorted Largest -> Smallest"""
+    sticks = pd.DataFrame({"Wavenumber": [3000.0, 1500.0, 800.0], "IRIntensity": [1.0, 2.0, 0.5]})
+    broadened = Spectra.broadenSpectra(sticks, sigma=10, maxWaveNum=4000, spacing=2)
+    shuffled = Spectra.broadenSpectra(sticks.iloc[::-1], sigma=10, maxWaveNum=4000, spacing=2)
+
+    assert broadened["Wavenumber"].is_monotonic_decreasing
+    assert len(broadened) == 2001
+    assert np.allclose(broadened["IRIntensity"], shuffled["IRIntensity"])
@@ -0,0 +1,91 @@
+import os
+import sys
+import json
+import subprocess
+from qchem.CLI import main
+from qchem.Export import readResults
+from qchem.Calculation.OrcaCalculation import createCalcResult
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.ResultsDatabase import ResultsDatabase
+from qchem.Data.Enums import OrcaInputTemplate
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+OUTPUT_FILES_DIR = os.path.join(TEST_FILES_DIR, "output_files")
+
+
+def testStartsWithoutHeavyImports():
+    """Test the Command Starts without Loading pandas or matplotlib"""
+    code = "import sys, qchem.CLI; sys.exit(int(any(module in sys.modules for module in ('pandas', 'matplotlib'))))"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    result = subprocess.run([sys.executable, "-m", "qchem", "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "parse" in result.stdout and "cache" in result.stdout
+
+
+def testParseStreamsSummaries(capsys):
+    """Test every Output of the Folder is Streamed as a line of JSON, in Name Order"""
+    assert main(["parse", OUTPUT_FILES_DIR, "--workers", "2"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["output"] for record in records] == ["CPDMSA_goat", "CPDMSA_nmr", "CPDMSA_opt (2)", "aspirin_ftir"]
+    assert records[3]["calculationTypes"] == "FREQ"
+    assert records[1]["gibbsEnergy"] is None
+
+
+def testParseExportsInBatches(tmp_path, capsys):
+    """Test Exporting in Batches Writes every Output once"""
+    dataset = str(tmp_path / "Results")
+    assert main(["parse", OUTPUT_FILES_DIR, "--format", "parquet", "--output", dataset, "--batch-size", "3"]) == 0
+
+    assert len(capsys.readouterr().out.splitlines()) == 4
+    assert len(readResults(dataset, "summary")) == 4
+
+    # Replacing doesn't Duplicate the Rows
+    assert main(["parse", OUTPUT_FILES_DIR, "--format", "parquet", "--output", dataset, "--replace"]) == 0
+    assert len(readResults(dataset, "summary")) == 4
+
+
+def testSpectraReportsFailures(tmp_path, capsys):
+    """Test Spectra are Rendered from CSV and Frequency Outputs, and an Output without IR Spectrum Fails on its own"""
+    spectra = [
+        os.path.join(TEST_FILES_DIR, "Spectra", "Ethane_Spectra.csv"),
+        os.path.join(OUTPUT_FILES_DIR, "aspirin_ftir.out"),
+        os.path.join(OUTPUT_FILES_DIR, "CPDMSA_nmr.out"),
+    ]
+    assert main(["spectra", *spectra, "--output", str(tmp_path), "--spacing", "4"]) == 1
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [str(tmp_path / "Ethane_Spectra.png"), str(tmp_path / "aspirin_ftir.png")]
+    assert "CPDMSA_nmr" in captured.err
+    assert all(os.path.getsize(path) > 0 for path in captured.out.splitlines())
+
+
+def testCacheCleanRemovesFailed(tmp_path, capsys):
+    """Test only the Folders of Failed Calculations are Removed, and nothing with a Dry Run"""
+    cache = tmp_path / "OrcaCache"
+    database = ResultsDatabase(str(cache / "Results.db"))
+    inputFile = OrcaInputFile(OrcaInputTemplate.BASIC, calculation="OPT", basis="DEF2-SVP", functional="B3LYP", xyzfile="ethane.xyz")
+
+    for name, output in (("Completed", "****ORCA TERMINATED NORMALLY****\n"), ("Failed", "ABORTING THE RUN\n")):
+        orcaCachePath = cache / name
+        orcaCachePath.mkdir()
+        (orcaCachePath / f"{name}.out").write_text(output)
+        database.record(createCalcResult(name, str(orcaCachePath), 0, 0, 1, 0), inputFile)
+    database.close()
+
+    arguments = ["cache", "clean", "--cache", str(cache)]
+    assert main([*arguments, "--dry-run"]) == 0
+    assert (cache / "Failed").exists()
+
+    assert main(arguments) == 0
+    removed = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record["name"], record["removed"]) for record in removed] == [("Failed", False), ("Failed", True)]
+    assert not (cache / "Failed").exists() and (cache / "Completed").exists()
+
+
+def testRunRequiresEveryPlaceholder(capsys):
+    """Test a Template with Placeholders left without a Value is Refused before anything Runs"""
+    molecule = os.path.join(TEST_FILES_DIR, "ethane.xyz")
+    assert main(["run", molecule, "--template", "BASICXYZ", "--calculation", "OPT", "--no-record"]) == 2
+    assert "basis, functional" in capsys.readouterr().err
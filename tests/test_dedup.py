@@ -0,0 +1,166 @@
+import os
+import asyncio
+import importlib
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.OrcaCalculation import createCalcResult, runOrcaCalculation, runOrcaCalculationAsync
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+from qchem.Calculation.ResultsDatabase import ResultsDatabase, getInputHash
+
+# The Packages give the Classes of the same Name, the Modules are Patched
+OrcaCalculation = importlib.import_module("qchem.Calculation.OrcaCalculation")
+ClusterModule = importlib.import_module("qchem.Calculation.ClusterCalculation")
+
+
+def createInput(basis: str, cores: int = 1) -> OrcaInputFile:
+    """Creates an Optimization Input of Ethane at a Basis Set"""
+    return OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation="OPT",
+        basis=basis,
+        functional="B3LYP",
+        cores=cores,
+        xyz="C 0 0 0\nC 0 0 1.54",
+    )
+
+
+def testClusterRunsDuplicatesOnce(tmp_path, monkeypatch):
+    """Test Identical Inputs (even on different Cores) Run once and every Submission gets a Result in Order"""
+    runs = tmp_path / "runs"
+    runs.mkdir()
+
+    # Stands in for Orca, Leaves a File per Run (Worker Processes are Forked with the Patch)
+    def fakeCalculation(name, inputFile, index, isLocal, STDOut, cachePath, scratch, recordResults, executor=None, timeout=None):
+        (runs / name).write_text(inputFile.inputFileContents)
+        orcaCachePath = os.path.join(cachePath, name)
+        os.makedirs(orcaCachePath, exist_ok=True)
+        return createCalcResult(name, orcaCachePath, 0, 0, 0.1, 0)
+
+    monkeypatch.setattr(ClusterModule, "runOrcaCalculation", fakeCalculation)
+
+    calculations = [createInput("DEF2-SVP"), createInput("DEF2-TZVP"), createInput("DEF2-SVP", 2), createInput("DEF2-SVP")]
+    completed = []
+    monkeypatch.chdir(tmp_path)
+    cluster = ClusterCalculation(calculations, maxCores=2, name="Dedup", STDOut=False, recordResults=False, onComplete=completed.append)
+    cluster.runCalculations()
+
+    assert len(os.listdir(runs)) == 2
+    assert [result.index for result in cluster.completedCalculations] == [0, 1, 2, 3]
+    assert len(completed) == 4
+
+    svp = [cluster.completedCalculations[i] for i in (0, 2, 3)]
+    assert len({result.outputFilePath for result in svp}) == 1
+    assert sorted(result.deduplicated for result in svp) == [False, True, True]
+    assert cluster.inFlight == {} and cluster.duplicates == {}
+
+
+def testAsyncDuplicatesAwaitRunningCalculation(tmp_path, monkeypatch):
+    """Test Identical Coroutines Await the Running Calculation, and Run it themselves if it Stops without a Result"""
+    runs = []
+    monkeypatch.chdir(tmp_path)
+
+    async def fakeExecute(name, inputFile, *arguments):
+        runs.append(name)
+        await asyncio.sleep(0.05)
+        if name == "Cancelled":
+            raise asyncio.CancelledError
+        return createCalcResult(name, "OrcaCache", 0, 0, 0.05, 0)
+
+    monkeypatch.setattr(OrcaCalculation, "executeOrcaCalculationAsync", fakeExecute)
+
+    async def main():
+        first = await asyncio.gather(
+            runOrcaCalculationAsync("A", createInput("DEF2-SVP")),
+            runOrcaCalculationAsync("B", createInput("DEF2-SVP", 4)),
+            runOrcaCalculationAsync("C", createInput("DEF2-TZVP")),
+            runOrcaCalculationAsync("D", createInput("DEF2-SVP"), deduplicate=False),
+        )
+        second = await asyncio.gather(
+            runOrcaCalculationAsync("Cancelled", createInput("MINI")),
+            runOrcaCalculationAsync("Retry", createInput("MINI")),
+            return_exceptions=True,
+        )
+        return first, second
+
+    (a, b, c, d), (cancelled, retry) = asyncio.run(main())
+
+    assert sorted(runs) == ["A", "C", "Cancelled", "D", "Retry"]
+    assert b.name == "A" and b.deduplicated and not a.deduplicated
+    assert not d.deduplicated
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert retry.name == "Retry" and not retry.deduplicated
+    assert OrcaCalculation.inFlightCalculations == {}
+
+
+def testCompletedResultsAreReused(tmp_path, monkeypatch):
+    """Test an Input that Completed in another Process and was Recorded gives that Result without Running once Reuse is Turned on, in both the Async and the Blocking Path"""
+    runs = []
+
+    async def fakeExecute(name, inputFile, *arguments):
+        runs.append(name)
+        return createCalcResult(name, "OrcaCache", 0, 0, 0.05, 0)
+
+    monkeypatch.setattr(OrcaCalculation, "executeOrcaCalculationAsync", fakeExecute)
+    monkeypatch.chdir(tmp_path)
+
+    # Recorded by an Earlier Run
+    database = ResultsDatabase(str(tmp_path / "Results.db"))
+    orcaCachePath = tmp_path / "OrcaCache" / "Earlier"
+    orcaCachePath.mkdir(parents=True)
+    (orcaCachePath / "Earlier.out").write_text("****ORCA TERMINATED NORMALLY****\n")
+    database.record(createCalcResult("Earlier", str(orcaCachePath), 0, 0, 1, 0), createInput("DEF2-SVP"))
+    database.flush()
+
+    async def main():
+        return await asyncio.gather(
+            runOrcaCalculationAsync("Cached", createInput("DEF2-SVP", 4), database=database, reuseResults=True),
+            runOrcaCalculationAsync("Rerun", createInput("DEF2-SVP"), database=database, deduplicate=False, reuseResults=True),
+        )
+
+    cached, rerun = asyncio.run(main())
+    # Reuse is Off by Default
+    forced = asyncio.run(runOrcaCalculationAsync("Forced", createInput("DEF2-SVP", 2), database=database))
+
+    assert sorted(runs) == ["Forced", "Rerun"]
+    assert cached.name == "Earlier" and cached.deduplicated and cached.outputFilePath == str(orcaCachePath / "Earlier.out")
+    assert not forced.deduplicated
+
+    blocking = runOrcaCalculation("Blocking", createInput("DEF2-SVP", 2), database=database, reuseResults=True)
+    assert blocking.name == "Earlier" and blocking.deduplicated
+
+    completed = []
+    cluster = ClusterCalculation([createInput("DEF2-SVP"), createInput("DEF2-TZVP")], name="Reuse", STDOut=False, database=database, onComplete=completed.append, reuseResults=True)
+    cluster.orderCalculations()
+    cluster.calculations = [calculation for calculation in cluster.calculations if not cluster.completeCached(calculation)]
+
+    assert [calculation.variables["basis"] for calculation in cluster.calculations] == ["DEF2-TZVP"]
+    assert [(result.index, result.name, result.deduplicated) for result in completed] == [(0, "Earlier", True)]
+
+
+def testReferencedFilesAreHashed(tmp_path, monkeypatch):
+    """Test an Input Reading an XYZ File is only Reused while the File is Unchanged, and Inputs Reading Files that can't be Found never are"""
+    monkeypatch.chdir(tmp_path)
+    xyzFile = tmp_path / "ethane.xyz"
+    xyzFile.write_text("2\n\nC 0 0 0\nC 0 0 1.54\n")
+    inputFile = OrcaInputFile(OrcaInputTemplate.BASIC, calculation="OPT", basis="DEF2-SVP", functional="B3LYP", xyzfile=str(xyzFile))
+
+    database = ResultsDatabase(str(tmp_path / "Results.db"))
+    orcaCachePath = tmp_path / "OrcaCache" / "Earlier"
+    orcaCachePath.mkdir(parents=True)
+    (orcaCachePath / "Earlier.out").write_text("****ORCA TERMINATED NORMALLY****\n")
+    database.record(createCalcResult("Earlier", str(orcaCachePath), 0, 0, 1, 0), inputFile)
+    assert database.findCached(inputFile)["name"] == "Earlier"
+
+    # Editing the Molecule in Place Changes the Hash
+    previousHash = getInputHash(inputFile)
+    xyzFile.write_text("2\n\nC 0 0 0\nC 0 0 1.34\n")
+    assert getInputHash(inputFile) != previousHash
+    assert database.findCached(inputFile) is None
+
+    # The Orbitals are Read from the Calculations own Folder, the Hash can't tell what they were
+    orbitals = OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLELMOREAD, calculation="OPT", basis="DEF2-SVP", functional="B3LYP", cores=1, xyz="C 0 0 0\nC 0 0 1.54", moinp="Earlier.gbw"
+    )
+    database.record(createCalcResult("Earlier", str(orcaCachePath), 0, 0, 1, 0), orbitals)
+    assert database.findCached(orbitals) is None
+    database.close()
@@ -0,0 +1,92 @@
+import os
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import pytest
+from qchem.Molecule import Molecule
+from qchem.Parser import OrcaOutput
+from qchem.Pipelines.Spectra import Spectra
+from qchem.Spectroscopy.EnsembleSpectrum import EnsembleSpectrum, BOLTZMANNHARTREE
+
+
+def testWeightedAverage():
+    """Test that Conformers are Averaged by their Weights"""
+    ensemble = EnsembleSpectrum(maxWaveNum=100, spacing=1)
+    ensemble.addConformer([10.0], [2.0], weight=75)
+    ensemble.addConformer([20.0], [4.0], weight=25)
+
+    spectrum = ensemble.getSpectrum()
+    assert spectrum[10] == pytest.approx(1.5)
+    assert spectrum[20] == pytest.approx(1.0)
+    assert ensemble.conformerCount == 2
+
+    sticks = ensemble.getSticks()
+    assert list(sticks["Wavenumber"]) == [20.0, 10.0]
+
+
+def testBoltzmannWeightsIndependentOfOrder():
+    """Test that Energies give the same Ensemble whichever Conformer Arrives first"""
+    conformers = [([500.0], [1.0], -100.0), ([800.0], [1.0], -100.001), ([900.0], [1.0], -99.99)]
+
+    forward = EnsembleSpectrum(maxWaveNum=1000)
+    backward = EnsembleSpectrum(maxWaveNum=1000)
+    for wavenumbers, intensities, energy in conformers:
+        forward.addConformer(wavenumbers, intensities, energy=energy)
+    for wavenumbers, intensities, energy in reversed(conformers):
+        backward.addConformer(wavenumbers, intensities, energy=energy)
+
+    assert np.allclose(forward.getSpectrum(), backward.getSpectrum())
+
+    # Population Ratio of the two Lowest Conformers
+    kT = BOLTZMANNHARTREE * 298.15
+    ratio = forward.getSpectrum()[800] / forward.getSpectrum()[500]
+    assert ratio == pytest.approx(np.exp(0.001 / kT))
+
+
+def testMemoryDoesNotGrowWithConformers():
+    """Test that the Accumulator only holds the Grid"""
+    ensemble = EnsembleSpectrum(maxWaveNum=4000)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        ensemble.addConformer(rng.uniform(0, 4000, 60), rng.uniform(0, 50, 60), weight=1)
+
+    assert ensemble.intensities.shape == ensemble.grid.shape
+    assert ensemble.getSpectrum().sum() == pytest.approx(ensemble.intensities.sum() / 200)
+
+
+def testWeightsAndEnergiesCannotMix():
+    """Test that a Conformer needs exactly one way of being Weighted"""
+    ensemble = EnsembleSpectrum()
+    with pytest.raises(ValueError):
+        ensemble.addConformer([100.0], [1.0])
+
+    ensemble.addConformer([100.0], [1.0], weight=1)
+    with pytest.raises(ValueError):
+        ensemble.addConformer([100.0], [1.0], energy=-1.0)
+
+
+def testSpectraSavesExactWeightedSticks(tmp_path):
+    """Test the Saved Spectra holds every Conformers Modes at their Exact Wavenumbers Weighted by Contribution, and only the Broadened Spectra comes from the Grid"""
+    outputFilePath = os.path.join("tests", "test_files", "output_files", "aspirin_ftir.out")
+    imaginaryPath = tmp_path / "imaginary.out"
+    with open(outputFilePath) as file:
+        imaginaryPath.write_text(file.read().replace("  6:     38.41   0.000190", "  6:    -38.41   0.000190"))
+
+    spectra = Spectra(Molecule("aspirin", "tests/test_files/aspirin_raw.xyz"), basis="DEF2-SVP", functional="B3LYP", name="aspirin")
+    spectra.orcaCachePath = str(tmp_path)
+    goatCalc = SimpleNamespace(conformerContribution=[75.0, 25.0])
+
+    spectra.combineSpectra(goatCalc, [outputFilePath, str(imaginaryPath)])
+
+    IRFrequencies = OrcaOutput(outputFilePath).getIRFrequencies()
+    saved = pd.read_csv(tmp_path / "aspirin_Spectra.csv")
+    assert len(saved) == 2 * len(IRFrequencies)
+    assert list(saved["Wavenumber"]) == sorted(saved["Wavenumber"], reverse=True)
+    assert -38.41 in saved["Wavenumber"].values and 38.41 in saved["Wavenumber"].values
+
+    mode = IRFrequencies["frequency"].values[10]
+    intensity = IRFrequencies["IRIntensity"].values[10]
+    assert sorted(saved[saved["Wavenumber"] == mode]["IRIntensity"]) == pytest.approx([25 * intensity, 75 * intensity])
+
+    broadened = pd.read_csv(tmp_path / "aspirin_BroadenedSpectra.csv")
+    assert len(broadened) == len(spectra.ensembleSpectrum.grid)
@@ -0,0 +1,143 @@
+import os
+import asyncio
+import pytest
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.OrcaCalculation import runOrcaCalculation, runOrcaCalculationAsync
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+from qchem.Calculation.Executors import RemoteExecutor, FakeRemoteExecutor, BatchQueueExecutor
+
+# Stands in for Orca, Reports where it Ran and Leaves a Scratch File next to the Output
+FAKEORCA = """#!/bin/sh
+sleep 0.2
+echo "Ran in $(pwd)"
+cat "$1"
+echo scratch > "${1%.inp}.tmp"
+echo "****ORCA TERMINATED NORMALLY****"
+"""
+
+
+@pytest.fixture
+def orcaPath(tmp_path):
+    """Writes the Fake Orca Executable"""
+    path = tmp_path / "orca"
+    path.write_text(FAKEORCA)
+    path.chmod(0o755)
+    return str(path)
+
+
+def createInput(basis: str = "DEF2-SVP", cores: int = 1) -> OrcaInputFile:
+    """Creates an Optimization Input of Ethane at a Basis Set"""
+    return OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation="OPT",
+        basis=basis,
+        functional="B3LYP",
+        cores=cores,
+        xyz="C 0 0 0\nC 0 0 1.54",
+    )
+
+
+def testFakeRemoteStagesThereAndBack(tmp_path, orcaPath):
+    """Test the Work Folder is Copied to the Worker, Orca Runs there, and every File comes back while the Worker is Cleaned"""
+    worker = tmp_path / "worker"
+    executor = FakeRemoteExecutor(str(worker), orcaPath=orcaPath)
+
+    result = runOrcaCalculation("Ethane", createInput(), STDOut=False, cachePath=str(tmp_path / "OrcaCache"), recordResults=False, executor=executor)
+
+    with open(result.outputFilePath) as outputFile:
+        output = outputFile.read()
+
+    assert result.returnCode == 0
+    assert f"Ran in {worker}" in output and "DEF2-SVP" in output
+    assert os.path.exists(os.path.join(result.orcaCachePath, "Ethane.tmp"))
+    assert os.listdir(worker) == []
+
+
+def testAsyncRemoteAndBatchQueue(tmp_path, orcaPath):
+    """Test the Async Calculations Run on a Fake Remote and through a Submit Script with the Directives Filled"""
+    cachePath = str(tmp_path / "OrcaCache")
+    remote = FakeRemoteExecutor(str(tmp_path / "worker"), orcaPath=orcaPath)
+    queue = BatchQueueExecutor(["sh"], "#QUEUE cores=&{cores}", orcaPath)
+
+    async def main():
+        return await asyncio.gather(
+            runOrcaCalculationAsync("Remote", createInput(), STDOut=False, cachePath=cachePath, recordResults=False, executor=remote),
+            runOrcaCalculationAsync("Queued", createInput("DEF2-TZVP", 4), STDOut=False, cachePath=cachePath, recordResults=False, executor=queue),
+        )
+
+    remoteResult, queuedResult = asyncio.run(main())
+
+    assert remoteResult.returnCode == 0 and queuedResult.returnCode == 0
+    with open(os.path.join(queuedResult.orcaCachePath, "Queued.job.sh")) as script:
+        assert "#QUEUE cores=4" in script.read()
+    with open(queuedResult.outputFilePath) as outputFile:
+        assert f"Ran in {queuedResult.orcaCachePath}" in outputFile.read()
+
+
+def testClusterSpreadsAcrossExecutors(tmp_path, orcaPath, monkeypatch):
+    """Test the Cluster Starts each Calculation on an Executor with Free Cores and gets every Output back"""
+    workers = [tmp_path / "node1", tmp_path / "node2"]
+    executors = [FakeRemoteExecutor(str(worker), 1, orcaPath) for worker in workers]
+    calculations = [createInput(basis) for basis in ("DEF2-SVP", "DEF2-TZVP", "MINI")]
+
+    monkeypatch.chdir(tmp_path)
+    cluster = ClusterCalculation(calculations, maxCores=4, name="Spread", STDOut=False, recordResults=False, executors=executors)
+    cluster.runCalculations()
+
+    outputs = []
+    for result in cluster.completedCalculations:
+        with open(result.outputFilePath) as outputFile:
+            outputs.append(outputFile.read())
+
+    assert [result.returnCode for result in cluster.completedCalculations] == [0, 0, 0]
+    assert all(any(f"Ran in {worker}" in output for output in outputs) for worker in workers)
+    assert cluster.executorCores == [0, 0]
+
+    with pytest.raises(ValueError):
+        ClusterCalculation([createInput(cores=2)], maxCores=4, STDOut=False, recordResults=False, executors=executors).orderCalculations()
+
+
+def testSharedFileSystemPaths(tmp_path):
+    """Test Work Folders are Mapped under the Remote Root of a Shared File System, and the SSH Command Quotes them"""
+    executor = RemoteExecutor("node1", localRoot=str(tmp_path), remoteRoot="/mnt/project")
+    workPath = str(tmp_path / "OrcaCache" / "My Molecule")
+
+    remotePath = executor.getRemotePath("My Molecule", workPath)
+    assert remotePath == "/mnt/project/OrcaCache/My Molecule"
+    host, command = executor.getCommand(executor.getOrcaCommand("My Molecule", remotePath))[-2:]
+    assert host == "node1" and command.startswith("cd '/mnt/project/OrcaCache/My Molecule' || exit 1;")
+    assert "/Orca/orca 'My Molecule.inp' > 'My Molecule.out' & echo $! > 'My Molecule.pid';" in command
+
+    with pytest.raises(ValueError):
+        executor.getRemotePath("Outside", "/elsewhere/Outside")
+
+
+def testCancelledRemoteStopsOrca(tmp_path):
+    """Test Cancelling a Remote Calculation Kills Orca on the Worker and Removes the Folder it was Copied to"""
+    worker = tmp_path / "worker"
+    pidPath = tmp_path / "orca.pid"
+    orcaPath = tmp_path / "orca"
+    # Over SSH the Client holds the Pipe to Standard Error, here Orca would keep it Open until it Ends
+    orcaPath.write_text(f'#!/bin/sh\necho $$ > "{pidPath}"\nexec sleep 30 2> /dev/null\n')
+    orcaPath.chmod(0o755)
+    executor = FakeRemoteExecutor(str(worker), orcaPath=str(orcaPath))
+
+    async def main():
+        task = asyncio.ensure_future(
+            runOrcaCalculationAsync("Slow", createInput(), STDOut=False, cachePath=str(tmp_path / "OrcaCache"), recordResults=False, executor=executor)
+        )
+        while not pidPath.exists():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    # Orca is gone (or a Zombie nothing Reaped yet)
+    statusPath = f"/proc/{pidPath.read_text().strip()}/status"
+    if os.path.exists(statusPath):
+        with open(statusPath) as status:
+            assert "zombie" in status.read()
+    assert os.listdir(worker) == []
@@ -0,0 +1,60 @@
+import os
+import pytest
+from qchem.Parser import OrcaOutput
+from qchem.Export import RESULTTABLES, exportResults, readResults
+
+TEST_OUTPUT_DIR = os.path.join("tests", "test_files", "output_files")
+ASPIRIN_FTIR = os.path.join(TEST_OUTPUT_DIR, "aspirin_ftir.out")
+CPDMSA_NMR = os.path.join(TEST_OUTPUT_DIR, "CPDMSA_nmr.out")
+CPDMSA_GOAT = os.path.join(TEST_OUTPUT_DIR, "CPDMSA_goat.out")
+CPDMSA_OPT = os.path.join(TEST_OUTPUT_DIR, "CPDMSA_opt (2).out")
+
+
+def testTablesKeyedByOutput():
+    """Test that every Parsed Block becomes a Table keyed by the Output, with Steps for repeated Blocks"""
+    output = OrcaOutput(CPDMSA_OPT)
+    tables = output.getTables()
+
+    assert set(tables) <= set(RESULTTABLES)
+    assert {"summary", "scf", "mayer", "loewdin", "frequencies", "ir"} <= set(tables)
+    assert "shifts" not in tables
+
+    for table in tables.values():
+        assert list(table["output"].unique()) == [output.name]
+
+    # Charges of both Optimization Steps are Stacked
+    assert sorted(tables["loewdin"]["step"].unique()) == [0, 1]
+    assert len(tables["loewdin"]) == sum(len(step) for step in output.loedwin)
+    assert tables["summary"]["energy"][0] == output.energy
+
+
+@pytest.mark.parametrize("format", ["parquet", "hdf5"])
+def testExportAppendAndFilter(tmp_path, format):
+    """Test that Outputs Appended over several Exports can be Read back with Filters"""
+    pytest.importorskip("pyarrow" if format == "parquet" else "tables")
+
+    path = str(tmp_path / ("results" if format == "parquet" else "results.h5"))
+
+    written = exportResults([ASPIRIN_FTIR, CPDMSA_NMR], path, format)
+    assert written["summary"] == 2
+    exportResults(OrcaOutput(CPDMSA_GOAT), path, format)
+
+    summary = readResults(path, "summary")
+    assert sorted(summary["output"]) == ["CPDMSA_goat", "CPDMSA_nmr", "aspirin_ftir"]
+
+    shifts = readResults(path, "shifts", [("nucleus", "==", "H"), ("isotropic", "<", 31.3)])
+    assert len(shifts) > 0
+    assert (shifts["nucleus"] == "H").all() and (shifts["isotropic"] < 31.3).all()
+
+    energies = readResults(
+        path, "summary", [("output", "in", ["aspirin_ftir", "CPDMSA_nmr"])], ["output", "energy"]
+    )
+    assert list(energies.columns) == ["output", "energy"]
+    assert len(energies) == 2
+
+    # Replacing the Dataset keeps only the latest Export
+    exportResults([CPDMSA_NMR], path, format, append=False)
+    assert list(readResults(path, "summary")["output"]) == ["CPDMSA_nmr"]
+
+    with pytest.raises(ValueError):
+        readResults(path, "summary", [("energy", "~", 0)])
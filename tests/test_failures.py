@@ -0,0 +1,165 @@
+import os
+import time
+import importlib
+import pytest
+from qchem.Data.Enums import OrcaInputTemplate, FailureType
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.OrcaCalculation import createCalcResult, runOrcaCalculation
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+from qchem.Calculation.Executors import LocalExecutor
+from qchem.Calculation.Failures import RetryPolicy, classifyFailure, getSetting
+from qchem.Calculation.ResultsDatabase import getTemplateName
+
+# The Package gives the Class of the same Name, the Module is Patched
+ClusterModule = importlib.import_module("qchem.Calculation.ClusterCalculation")
+
+# Stands in for an Orca that Hangs
+SLEEPINGORCA = """#!/bin/sh
+echo "Starting"
+sleep 30
+"""
+
+
+def createInput(basis: str = "DEF2-SVP") -> OrcaInputFile:
+    """Creates an Optimization Input of Ethane at a Basis Set"""
+    return OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation="OPT",
+        basis=basis,
+        functional="B3LYP",
+        cores=1,
+        xyz="C 0 0 0\nC 0 0 1.54",
+    )
+
+
+@pytest.mark.parametrize(
+    "output, returnCode, stderr, failure",
+    [
+        ("FINAL SINGLE POINT ENERGY -79.8\n****ORCA TERMINATED NORMALLY****\n", 0, "", None),
+        ("SCF NOT CONVERGED AFTER 125 CYCLES\nABORTING THE RUN\n", 1, "", FailureType.SCFNOTCONVERGED),
+        ("The optimization did not converge but reached the maximum number of\noptimization cycles.\n", 1, "", FailureType.GEOMETRYNOTCONVERGED),
+        ("Error (ORCA_SCF): Not enough memory available!\nPlease increase MaxCore\n", 1, "", FailureType.OUTOFMEMORY),
+        ("", 127, "sh: 1: /Orca/orca: not found\n", FailureType.MISSINGEXECUTABLE),
+        ("Starting\n", 124, "Timed Out after 10 seconds\n", FailureType.TIMEOUT),
+        ("Starting\n", -9, "", FailureType.ABORTED),
+        ("Starting\n", 1, "", FailureType.UNKNOWN),
+        ("****ORCA TERMINATED NORMALLY****\n", 2, "", FailureType.UNKNOWN),
+    ],
+)
+def testClassifyFailure(tmp_path, output, returnCode, stderr, failure):
+    """Test Failures are Classified from the Return Code, the End of the Output and Standard Error"""
+    outputFilePath = tmp_path / "Ethane.out"
+    outputFilePath.write_text("x" * 100000 + "\n" + output)
+
+    assert classifyFailure(str(outputFilePath), returnCode, stderr) == failure
+
+
+def testRetryRemedies(tmp_path):
+    """Test each Failure Type Changes the Input its own way, later Retries Building on Earlier ones while Keeping the Clusters Attributes"""
+    inputFile = createInput()
+    inputFile.index = 7
+    policy = RetryPolicy()
+    result = createCalcResult("Ethane", str(tmp_path), 0, 0)
+
+    slow = policy.createRetry(inputFile, result, FailureType.SCFNOTCONVERGED, 1)
+    slower = policy.createRetry(slow, result, FailureType.SCFNOTCONVERGED, 2)
+    assert slow.inputFileContents.startswith("! SlowConv\n%scf MaxIter 500 end\n")
+    assert slower.inputFileContents.startswith("! VerySlowConv\n") and getSetting(slower.inputFileContents, "scf", "Guess") == "HCore"
+    assert getSetting(slower.inputFileContents, "scf", "MaxIter") == "1000"
+    assert "DEF2-SVP" in slower.inputFileContents and "SlowConv" not in inputFile.inputFileContents
+    assert slower.index == 7 and getTemplateName(slower.sourceTemplate) == "BASICXYZPARALLEL"
+
+    memory = policy.createRetry(policy.createRetry(inputFile, result, FailureType.OUTOFMEMORY, 1), result, FailureType.OUTOFMEMORY, 2)
+    assert getSetting(memory.inputFileContents, "maxcore") == "16000"
+
+    (tmp_path / "Ethane.xyz").write_text("2\nLast Cycle\nC 0 0 0.1\nC 0 0 1.4\n")
+    geometry = policy.createRetry(inputFile, result, FailureType.GEOMETRYNOTCONVERGED, 1)
+    assert "%geom MaxIter 400 end" in geometry.inputFileContents
+    assert "C 0 0 1.4" in geometry.inputFileContents and "C 0 0 1.54" not in geometry.inputFileContents
+
+    assert policy.shouldRetry(FailureType.SCFNOTCONVERGED, [FailureType.SCFNOTCONVERGED])
+    assert not policy.shouldRetry(FailureType.SCFNOTCONVERGED, [FailureType.SCFNOTCONVERGED] * 2)
+    assert not policy.shouldRetry(FailureType.TIMEOUT, []) and not policy.shouldRetry(None, [])
+
+
+def testRemediesOverrideTemplateSettings(tmp_path):
+    """Test Retries Replace the Memory, Cycles and SCF Settings of the Template, Doubling the Values Orca Actually Used"""
+    template = "! &{calculation} &{basis} &{functional}\n%maxcore 3000\n%scf MaxIter 150 end\n%geom\n  MaxIter 100\nend\n* xyz 0 1\n&{xyz}\n*\n"
+    inputFile = OrcaInputFile(template, calculation="OPT", basis="DEF2-SVP", functional="B3LYP", xyz="C 0 0 0\nC 0 0 1.54")
+    policy = RetryPolicy()
+    result = createCalcResult("Ethane", str(tmp_path), 0, 0)
+
+    first = policy.createRetry(inputFile, result, FailureType.OUTOFMEMORY, 1)
+    second = policy.createRetry(first, result, FailureType.OUTOFMEMORY, 2)
+    assert getSetting(first.inputFileContents, "maxcore") == "6000"
+    assert getSetting(second.inputFileContents, "maxcore") == "12000"
+    assert second.inputFileContents.count("%maxcore") == 1
+
+    cycles = policy.createRetry(second, result, FailureType.GEOMETRYNOTCONVERGED, 1)
+    more = policy.createRetry(cycles, result, FailureType.GEOMETRYNOTCONVERGED, 2)
+    assert getSetting(cycles.inputFileContents, "geom", "MaxIter") == "400"
+    assert getSetting(more.inputFileContents, "geom", "MaxIter") == "800"
+    assert "MaxIter 100" not in more.inputFileContents and getSetting(more.inputFileContents, "maxcore") == "12000"
+
+    scf = policy.createRetry(more, result, FailureType.SCFNOTCONVERGED, 2)
+    assert getSetting(scf.inputFileContents, "scf", "MaxIter") == "1000"
+    assert getSetting(scf.inputFileContents, "scf", "Guess") == "HCore" and getSetting(scf.inputFileContents, "geom", "MaxIter") == "800"
+
+
+def testSCFRetriesKeepReadOrbitals(tmp_path):
+    """Test SCF Retries of an Input Reading Orbitals (MORead) keep Starting from them instead of a HCore Guess"""
+    inputFile = OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLELMOREAD, calculation="OPT", basis="DEF2-SVP", functional="B3LYP", cores=1, xyz="C 0 0 0\nC 0 0 1.54", moinp="Ethane.gbw"
+    )
+    policy = RetryPolicy()
+    result = createCalcResult("Ethane", str(tmp_path), 0, 0)
+
+    slower = policy.createRetry(policy.createRetry(inputFile, result, FailureType.SCFNOTCONVERGED, 1), result, FailureType.SCFNOTCONVERGED, 2)
+    assert slower.inputFileContents.startswith("! VerySlowConv\n") and getSetting(slower.inputFileContents, "scf", "MaxIter") == "1000"
+    assert getSetting(slower.inputFileContents, "scf", "Guess") is None
+    assert "MORead" in slower.inputFileContents and '%moinp "Ethane.gbw"' in slower.inputFileContents
+
+
+def testTimeoutKillsCalculation(tmp_path):
+    """Test a Calculation that Runs past its Timeout is Killed and Fails with a Timeout"""
+    orcaPath = tmp_path / "orca"
+    orcaPath.write_text(SLEEPINGORCA)
+    orcaPath.chmod(0o755)
+
+    start = time.time()
+    result = runOrcaCalculation("Hang", createInput(), STDOut=False, cachePath=str(tmp_path / "OrcaCache"), recordResults=False, executor=LocalExecutor(str(orcaPath)), timeout=0.5)
+
+    assert time.time() - start < 10
+    assert result.returnCode == 124 and result.failure == FailureType.TIMEOUT
+
+
+def testClusterRetriesWithoutBlocking(tmp_path, monkeypatch):
+    """Test a Calculation that Failed to Converge is Retried with a Slower SCF, while the other Calculation Runs"""
+    runs = tmp_path / "runs"
+    runs.mkdir()
+
+    # Stands in for Orca, the SCF only Converges with SlowConv (Worker Processes are Forked with the Patch)
+    def fakeCalculation(name, inputFile, index, isLocal, STDOut, cachePath, scratch, recordResults, executor=None, timeout=None):
+        attempt = len([run for run in os.listdir(runs) if run.startswith(name)])
+        (runs / f"{name}_{attempt}").write_text(inputFile.inputFileContents)
+        orcaCachePath = os.path.join(cachePath, name)
+        os.makedirs(orcaCachePath, exist_ok=True)
+
+        result = createCalcResult(name, orcaCachePath, 0, 0, 0.1, 0)
+        if "TZVP" in inputFile.inputFileContents and "SlowConv" not in inputFile.inputFileContents:
+            result.returnCode = 1
+            result.failure = FailureType.SCFNOTCONVERGED
+        return result
+
+    monkeypatch.setattr(ClusterModule, "runOrcaCalculation", fakeCalculation)
+    monkeypatch.chdir(tmp_path)
+
+    calculations = [createInput("DEF2-TZVP"), createInput("DEF2-SVP")]
+    cluster = ClusterCalculation(calculations, maxCores=2, name="Retry", STDOut=False, recordResults=False, retryPolicy=RetryPolicy())
+    cluster.runCalculations()
+
+    assert sorted(os.listdir(runs)) == ["Retry_0_0", "Retry_0_1", "Retry_1_0"]
+    assert "SlowConv" in (runs / "Retry_0_1").read_text()
+    assert [result.index for result in cluster.completedCalculations] == [0, 1]
+    assert [result.failure for result in cluster.completedCalculations] == [None, None]
+    assert cluster.failures[0] == [FailureType.SCFNOTCONVERGED] and cluster.inFlight == {}
@@ -0,0 +1,52 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from qchem.Parser import OrcaOutput
+from qchem.Spectroscopy.Broadening import broadenSpectrum, createGrid
+from qchem.Spectroscopy.SpectrumFitting import fitSpectrum, fitSpectra, applyFit
+
+ASPIRIN_FTIR = os.path.join("tests", "test_files", "output_files", "aspirin_ftir.out")
+
+
+def makeExperimental(sticks: pd.DataFrame, scale: float, fwhm: float, amplitude: float, baseline: float):
+    """Creates a Synthetic Experimental Spectrum with known Parameters"""
+    grid = createGrid(400, 4000, 2)
+    intensity = amplitude * broadenSpectrum(
+        sticks["frequency"].values * scale, sticks["IRIntensity"].values, grid, fwhm, "lorentzian"
+    ) + baseline
+    return pd.DataFrame({"Wavenumber": grid, "IRIntensity": intensity})
+
+
+def testFitRecoversParameters():
+    """Test that the Fit finds the Scale, Width, Amplitude and Baseline a Spectrum was made with"""
+    sticks = OrcaOutput(ASPIRIN_FTIR).getIRFrequencies()
+    experimental = makeExperimental(sticks, 0.962, 18, 0.5, 3)
+
+    fit = fitSpectrum(sticks, experimental)
+
+    assert fit["Scale"] == pytest.approx(0.962, abs=2e-3)
+    assert fit["FWHM"] == pytest.approx(18, rel=0.1)
+    assert fit["Amplitude"] == pytest.approx(0.5, rel=0.1)
+    assert fit["Baseline"] == pytest.approx(3, abs=0.1)
+    assert fit["R2"] > 0.99
+
+    model = applyFit(sticks, fit, experimental["Wavenumber"].values)
+    assert np.corrcoef(model, experimental["IRIntensity"])[0, 1] > 0.99
+
+
+def testBatchFitMatchesSingleFits():
+    """Test that Fitting Molecules together gives each Molecule its own Parameters"""
+    sticks = OrcaOutput(ASPIRIN_FTIR).getIRFrequencies()
+    computed = {"A": sticks, "B": sticks, "C": sticks}
+    experimental = {
+        "A": makeExperimental(sticks, 0.95, 12, 1, 0),
+        "B": makeExperimental(sticks, 0.98, 30, 2, 1),
+        "C": makeExperimental(sticks, 1.0, 8, 1, 0.5),
+    }
+
+    fits = fitSpectra(computed, experimental, batchSize=2)
+
+    assert list(fits["Name"]) == ["A", "B", "C"]
+    assert np.allclose(fits["Scale"], [0.95, 0.98, 1.0], atol=3e-3)
+    assert (fits["R2"] > 0.98).all()
@@ -0,0 +1,122 @@
+import os
+import shutil
+import numpy as np
+import pytest
+from qchem.Molecule import Molecule
+from qchem.Parser import OrcaOutput
+from qchem.Calculation.GeoOpt import GeoOpt
+from qchem.Calculation.OrcaCalculation import OrcaCalcResult
+from qchem.Data.Enums import FailureType, OrcaInputTemplate
+
+ASPIRIN_FTIR = os.path.join("tests", "test_files", "output_files", "aspirin_ftir.out")
+
+
+def makeIteration(tmp_path, imaginary: bool) -> OrcaCalcResult:
+    """Creates the Cache Folder of a Finished Optimization Iteration"""
+    calculation = OrcaCalcResult("aspirin", str(tmp_path / "aspirin"))
+    os.makedirs(calculation.orcaCachePath)
+
+    with open(ASPIRIN_FTIR) as file:
+        text = file.read()
+    if imaginary:
+        text = text.replace("     6:      38.41 cm**-1", "     6:     -38.41 cm**-1 ***imaginary mode***")
+    with open(calculation.outputFilePath, "w") as file:
+        file.write(text)
+
+    shutil.copy("tests/test_files/aspirin_raw.xyz", os.path.join(calculation.orcaCachePath, "aspirin.xyz"))
+    with open(os.path.join(calculation.orcaCachePath, "aspirin.gbw"), "w") as file:
+        file.write("orbitals")
+
+    return calculation
+
+
+def makeGeoOpt(**kwargs) -> GeoOpt:
+    molecule = Molecule("aspirin", "tests/test_files/aspirin_raw.xyz")
+    return GeoOpt(molecule, basis="def2-SVP", functional="B3LYP", name="aspirin", **kwargs)
+
+
+def testNextIterationReadsPreviousOrbitals(tmp_path):
+    """Test that the next Iteration starts from a Copy of the previous Orbitals"""
+    calculation = makeIteration(tmp_path, imaginary=False)
+    geoOpt = makeGeoOpt()
+
+    geoOpt.prepareNextIteration(calculation, OrcaOutput(calculation.outputFilePath), 2)
+
+    assert geoOpt.template == OrcaInputTemplate.BASICXYZPARALLELMOREAD
+    assert os.path.exists(tmp_path / "aspirin_2" / "aspirin.gbw")
+    inputText = geoOpt.inputFile.generateInputFile()
+    assert "MORead" in inputText
+    assert '%moinp "aspirin.gbw"' in inputText
+
+
+def testNextIterationWithoutOrbitalReuse(tmp_path):
+    """Test that Orbital Reuse can be turned off"""
+    calculation = makeIteration(tmp_path, imaginary=False)
+    geoOpt = makeGeoOpt(reuseOrbitals=False)
+
+    geoOpt.prepareNextIteration(calculation, OrcaOutput(calculation.outputFilePath), 2)
+
+    assert geoOpt.template == OrcaInputTemplate.BASICXYZPARALLEL
+    assert not os.path.exists(tmp_path / "aspirin_2")
+
+
+def testImaginaryModeDisplacesGeometry(tmp_path):
+    """Test that a Saddle Point is left along the Imaginary Mode"""
+    calculation = makeIteration(tmp_path, imaginary=True)
+    outputFile = OrcaOutput(calculation.outputFilePath)
+    geoOpt = makeGeoOpt(displacementStep=0.2)
+
+    original = Molecule("aspirin", os.path.join(calculation.orcaCachePath, "aspirin.xyz"))
+    molecule = original.copy()
+    assert geoOpt.displaceAlongImaginaryMode(molecule, outputFile)
+
+    moved = (
+        molecule.XYZCoordinates[["X", "Y", "Z"]].astype(float).to_numpy()
+        - original.XYZCoordinates[["X", "Y", "Z"]].astype(float).to_numpy()
+    )
+    assert np.linalg.norm(moved, axis=1).max() == pytest.approx(0.2)
+
+    # The Displacement follows the Mode
+    mode = outputFile.getNormalModes()[:, 6].reshape(-1, 3)
+    assert np.allclose(np.cross(moved, mode), 0, atol=1e-6)
+
+
+def testRealFrequenciesAreNotDisplaced(tmp_path):
+    """Test that a Molecule without Imaginary Modes isn't Moved"""
+    calculation = makeIteration(tmp_path, imaginary=False)
+    geoOpt = makeGeoOpt()
+    molecule = Molecule("aspirin", os.path.join(calculation.orcaCachePath, "aspirin.xyz"))
+
+    assert not geoOpt.displaceAlongImaginaryMode(molecule, OrcaOutput(calculation.outputFilePath))
+
+
+def testNextIterationKeepsRetryRemedies(tmp_path):
+    """Test that the Remedies a Retried Iteration needed still Apply to the next Iteration"""
+    calculation = makeIteration(tmp_path, imaginary=False)
+    geoOpt = makeGeoOpt()
+
+    geoOpt.retryIteration(calculation, FailureType.SCFNOTCONVERGED, [], 2)
+    geoOpt.retryIteration(calculation, FailureType.OUTOFMEMORY, [], 3)
+    geoOpt.prepareNextIteration(calculation, OrcaOutput(calculation.outputFilePath), 4)
+
+    inputText = geoOpt.inputFile.inputFileContents
+    assert "! SlowConv" in inputText
+    assert "MaxIter 500" in inputText
+    assert "%maxcore 8000" in inputText
+    assert '%moinp "aspirin.gbw"' in inputText
+
+
+def testRetriedIterationKeepsReadOrbitals(tmp_path):
+    """Test that Retrying an Iteration which Reads Orbitals Copies them for the Retry and never Combines them with a HCore Guess"""
+    calculation = makeIteration(tmp_path, imaginary=False)
+    geoOpt = makeGeoOpt()
+    geoOpt.prepareNextIteration(calculation, OrcaOutput(calculation.outputFilePath), 2)
+
+    failures = []
+    geoOpt.retryIteration(calculation, FailureType.SCFNOTCONVERGED, failures, 3)
+    geoOpt.retryIteration(calculation, FailureType.SCFNOTCONVERGED, failures, 4)
+
+    inputText = geoOpt.inputFile.inputFileContents
+    assert "! VerySlowConv" in inputText and "MORead" in inputText
+    assert "HCore" not in inputText
+    assert os.path.exists(tmp_path / "aspirin_4" / "aspirin.gbw")
@@ -0,0 +1,36 @@
+import sys
+import subprocess
+
+
+def runPython(code: str) -> str:
+    """Runs Code in a Fresh Interpreter and gives its Output"""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def testImportIsLazy():
+    """Test importing the Package Loads no Heavy Dependency, and Plotting Modules are only Loaded when Plotting"""
+    loaded = runPython(
+        "import sys, qchem\n"
+        "print([module for module in ('pandas', 'matplotlib', 'multiprocessing') if module in sys.modules])\n"
+        "qchem.Spectra\n"
+        "print('pandas' in sys.modules, 'matplotlib' in sys.modules)"
+    )
+    assert loaded.splitlines() == ["[]", "True False"]
+
+
+def testLazySymbols():
+    """Test Symbols Resolve to the Classes even once their Modules are Imported directly"""
+    import qchem
+    import qchem.Molecule
+    import qchem.Calculation.GeoOpt
+    from qchem.Molecule import Molecule
+    from qchem.Calculation.GeoOpt import GeoOpt
+
+    assert qchem.Molecule is Molecule
+    assert qchem.GeoOpt is GeoOpt
+    assert qchem.Calculation.GeoOpt is GeoOpt
+    assert "Spectra" in dir(qchem)
+
+    namespace = {}
+    exec("from qchem import *", namespace)
+    assert all(name in namespace for name in qchem.__all__)
@@ -0,0 +1,71 @@
+import os
+import time
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import OrcaInputTemplate, OrcaCalculationType, OrcaBasisSet
+from qchem.Calculation.Frequency import Frequency
+from qchem.Calculation.InputSweep import InputSweep
+from qchem.Calculation.OrcaInputFile import OrcaInputFile, compileTemplate
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+
+
+def testRenderMatchesReplace():
+    """Test Rendering the Compiled Template gives the same Input File as Replacing each Placeholder"""
+    variables = {"calculation": "OPT FREQ", "basis": "DEF2-SVP", "functional": "B3LYP", "cores": 4, "xyz": "C 0 0 0\nH 0 0 1.09"}
+    expected = OrcaInputTemplate.BASICXYZPARALLEL.value
+    for key, value in variables.items():
+        expected = expected.replace(f"&{{{key}}}", str(value))
+
+    assert OrcaInputFile(OrcaInputTemplate.BASICXYZPARALLEL, **variables).inputFileContents == expected
+    assert compileTemplate(OrcaInputTemplate.BASICXYZPARALLEL) is compileTemplate(OrcaInputTemplate.BASICXYZPARALLEL.value)
+
+
+def testMissingAndUnusedVariables():
+    """Test Placeholders without a Value are Kept and Reported, and Variables without a Placeholder are Reported"""
+    inputFile = OrcaInputFile("!&{calculation} &{basis} &{functional}\n&{calculation}", calculation="SP", basis="MINI", charge=0)
+
+    assert inputFile.inputFileContents == "!SP MINI &{functional}\nSP"
+    assert inputFile.getMissingVariables() == ["functional"]
+    assert inputFile.getUnusedVariables() == ["charge"]
+
+
+def testTemplateFileReadAgainOnceChanged(tmp_path):
+    """Test a Template File is Compiled once, and again once it is Edited"""
+    template = tmp_path / "template.inp"
+    template.write_text("!&{calculation} &{basis}\n")
+
+    first = compileTemplate(str(template))
+    assert compileTemplate(str(template)) is first
+
+    template.write_text("!&{calculation} &{basis} &{functional}\n")
+    # Give the File a newer Modification Time even on Filesystems with a coarse Clock
+    os.utime(template, ns=(time.time_ns(), os.stat(template).st_mtime_ns + 1_000_000_000))
+
+    inputFile = OrcaInputFile(str(template), calculation="SP", basis="MINI", functional="PBE")
+    assert inputFile.inputFileContents == "!SP MINI PBE\n"
+    assert not inputFile.setCores(4)
+
+
+def testSweepCreatesEveryCombination(tmp_path):
+    """Test a Sweep gives one Input per Molecule and Level of Theory, matching the Inputs of a Calculation Object"""
+    ethane = Molecule("Ethane", os.path.join(TEST_FILES_DIR, "ethane.xyz"))
+    sweep = InputSweep(
+        [ethane, os.path.join(TEST_FILES_DIR, "propane.xyz")],
+        ["OPT", OrcaCalculationType.FREQUENCY],
+        [OrcaBasisSet.DEF2_SVP],
+        ["B3LYP", "PBE"],
+        cores=2,
+    )
+    inputs = sweep.createInputs()
+    combinations = sweep.getCombinations()
+
+    assert len(inputs) == len(sweep) == 8
+    assert combinations[3]["name"] == "Ethane_FREQ_DEF2-SVP_PBE"
+    assert inputs[3].inputFileContents == Frequency(ethane, cores=2, basis="DEF2-SVP", functional="PBE", stdout=False).inputFile.inputFileContents
+    assert sweep.getMissingVariables() == []
+
+    # Written Inputs are the same as the Created ones
+    paths = sweep.saveInputs(str(tmp_path))
+    assert [os.path.basename(path) for path in paths] == [f"{combination['name']}.inp" for combination in combinations]
+    with open(paths[-1], "r") as file:
+        assert file.read() == inputs[-1].inputFileContents
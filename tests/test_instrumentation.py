@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import asyncio
+from qchem.Parser import OrcaOutput
+from qchem.Instrumentation import Tracer, span, traced, addAttributes
+
+ASPIRIN_FTIR = os.path.join("tests", "test_files", "output_files", "aspirin_ftir.out")
+
+
+@traced("test")
+async def waitInQueue(seconds: float):
+    """Coroutine that Waits, Recording how long as an Attribute"""
+    await asyncio.sleep(seconds)
+    addAttributes(queueWait=seconds)
+
+
+def testNestedSpans():
+    """Test Spans Nest, Parsing is Traced and nothing is Recorded without a Tracer"""
+    with span("untraced"):
+        OrcaOutput(ASPIRIN_FTIR)
+
+    with Tracer() as tracer:
+        with span("pipeline", "test", molecule="Aspirin") as outer:
+            OrcaOutput(ASPIRIN_FTIR)
+            time.sleep(0.01)
+
+    spans = tracer.getSpans()
+    assert list(spans["name"]) == ["pipeline", "OrcaOutput.parse"]
+
+    parse = spans.iloc[1]
+    assert parse["parentID"] == outer.ID
+    assert parse["attributes"]["output"] == "aspirin_ftir"
+    assert parse["CPUTime"] > 0
+    assert outer.wallTime >= parse["wallTime"] + 0.01
+    assert outer.attributes == {"molecule": "Aspirin"}
+
+
+def testAsyncSpansAndExport(tmp_path):
+    """Test Concurrent Tasks get their own Spans, and both Trace Formats hold every Span"""
+
+    async def runAll():
+        with span("gather", "test"):
+            await asyncio.gather(waitInQueue(0.02), waitInQueue(0.01))
+
+    with Tracer() as tracer:
+        asyncio.run(runAll())
+
+    spans = tracer.getSpans()
+    gather = spans[spans["name"] == "gather"].iloc[0]
+    waits = spans[spans["name"] == "waitInQueue"]
+    assert len(waits) == 2
+    assert (waits["parentID"] == gather["ID"]).all()
+    assert sorted(attributes["queueWait"] for attributes in waits["attributes"]) == [0.01, 0.02]
+
+    tracer.exportJSONLines(str(tmp_path / "trace.jsonl"))
+    with open(tmp_path / "trace.jsonl") as file:
+        assert [json.loads(line)["name"] for line in file] == list(spans["name"])
+
+    tracer.exportChromeTrace(str(tmp_path / "trace.json"))
+    with open(tmp_path / "trace.json") as file:
+        events = json.load(file)["traceEvents"]
+    assert {event["ph"] for event in events} == {"X"}
+    assert max(event["dur"] for event in events) >= 2e4
+
+    summary = tracer.getSummary()
+    assert summary.set_index("name").loc["waitInQueue", "count"] == 2
@@ -0,0 +1,67 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from qchem.Spectroscopy.SpectralLibrary import SpectralLibrary, resampleSpectra
+from qchem.Spectroscopy.Broadening import createGrid
+
+ETHANE = os.path.join("tests", "test_files", "Spectra", "Ethane_Spectra.csv")
+
+
+def makeReferences(count: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(2)
+    return {
+        f"Reference_{i}": pd.DataFrame(
+            {"Wavenumber": rng.uniform(500, 3900, 12), "IRIntensity": rng.uniform(1, 100, 12)}
+        )
+        for i in range(count)
+    }
+
+
+def testQueryFindsItself(tmp_path):
+    """Test that a Reference is its own closest Match for every Metric"""
+    references = makeReferences(50)
+    library = SpectralLibrary.create(str(tmp_path / "library"), references, referenceFWHM=20)
+
+    for metric in ["cosine", "pearson"]:
+        result = library.query(references["Reference_7"], k=3, metric=metric, fwhm=20)
+        assert result["Name"][0] == "Reference_7"
+        assert result["Score"][0] == pytest.approx(1, abs=1e-5)
+        assert result["Score"].is_monotonic_decreasing
+
+    angle = library.query(references["Reference_7"], k=3, metric="angle", fwhm=20)
+    assert angle["Name"][0] == "Reference_7"
+    assert angle["Score"][0] == pytest.approx(0, abs=1e-2)
+    assert angle["Score"].is_monotonic_increasing
+
+
+def testBlockedSearchMatchesFullSearch(tmp_path):
+    """Test that Searching in small Blocks gives the same Top K as one Block"""
+    references = makeReferences(40)
+    library = SpectralLibrary.create(str(tmp_path / "library"), references, referenceFWHM=20)
+    queries = [references["Reference_3"], references["Reference_30"], ETHANE]
+
+    full = library.search(queries, k=5, metric="pearson", blockSize=1000)
+    blocked = library.search(queries, k=5, metric="pearson", blockSize=7)
+
+    for fullResult, blockedResult in zip(full, blocked):
+        assert list(fullResult["Name"]) == list(blockedResult["Name"])
+        assert np.allclose(fullResult["Score"], blockedResult["Score"])
+
+
+def testLibraryReopensMemoryMapped(tmp_path):
+    """Test that a Library is Stored on Disk and Reopened as a Memory Map"""
+    SpectralLibrary.create(str(tmp_path / "library"), [ETHANE], spacing=4)
+    library = SpectralLibrary(str(tmp_path / "library"))
+
+    assert library.names == ["Ethane_Spectra"]
+    assert isinstance(library.spectra, np.memmap)
+    assert library.spectra.shape == (1, len(createGrid(400, 4000, 4)))
+
+
+def testInterpolationOfContinuousSpectra():
+    """Test that Continuous Spectra are Interpolated and Zero outside their Range"""
+    spectra = pd.DataFrame({"Wavenumber": [2000.0, 1000.0], "IRIntensity": [2.0, 0.0]})
+    resampled = resampleSpectra(spectra, createGrid(0, 3000, 500))
+
+    assert list(resampled) == [0, 0, 0, 1, 2, 0, 0]
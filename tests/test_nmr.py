@@ -0,0 +1,95 @@
+import os
+import numpy as np
+import pytest
+from qchem.Molecule import Molecule
+from qchem.Parser import OrcaOutput
+from qchem.Spectroscopy.EnsembleSpectrum import BOLTZMANNHARTREE
+from qchem.Spectroscopy.NMRSpectrum import (
+    EnsembleShielding,
+    NMRNUCLEI,
+    broadenShifts,
+    getReferenceShieldings,
+)
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+CPDMSA_NMR = os.path.join(TEST_FILES_DIR, "output_files", "CPDMSA_nmr.out")
+
+
+def testEquivalentAtoms():
+    """Test that Atoms with the same Bonded Environment share a Group"""
+    ethane = Molecule("Ethane", os.path.join(TEST_FILES_DIR, "ethane.xyz"))
+    assert ethane.getEquivalentAtoms() == [0, 0, 1, 1, 1, 1, 1, 1]
+
+    propane = Molecule("Propane", os.path.join(TEST_FILES_DIR, "propane.xyz"))
+    groups = propane.getEquivalentAtoms()
+    elements = list(propane.XYZCoordinates["Atom"].values)
+
+    # 2 Kinds of Carbon (CH3 and CH2) and 2 Kinds of Hydrogen (6 Methyl and 2 Methylene)
+    carbonGroups = [group for group, element in zip(groups, elements) if element == "C"]
+    hydrogenGroups = [group for group, element in zip(groups, elements) if element == "H"]
+    assert sorted(carbonGroups.count(group) for group in set(carbonGroups)) == [1, 2]
+    assert sorted(hydrogenGroups.count(group) for group in set(hydrogenGroups)) == [2, 6]
+
+
+def testWeightedShieldings():
+    """Test that Conformer Shieldings are Averaged by their Weights, in any Order of Energies"""
+    ensemble = EnsembleShielding()
+    ensemble.addConformer([30.0, 180.0], weight=75)
+    ensemble.addConformer([34.0, 160.0], weight=25)
+    assert np.allclose(ensemble.getShieldings(), [31.0, 175.0])
+
+    forward = EnsembleShielding()
+    backward = EnsembleShielding()
+    conformers = [([30.0], -100.0), ([32.0], -100.001), ([40.0], -99.99)]
+    for shieldings, energy in conformers:
+        forward.addConformer(shieldings, energy=energy)
+    for shieldings, energy in reversed(conformers):
+        backward.addConformer(shieldings, energy=energy)
+    assert forward.getShieldings() == pytest.approx(backward.getShieldings())
+
+    kT = BOLTZMANNHARTREE * 298.15
+    weights = np.exp(-(np.array([-100.0, -100.001, -99.99]) + 100.001) / kT)
+    expected = np.dot(weights, [30.0, 32.0, 40.0]) / weights.sum()
+    assert forward.getShieldings()[0] == pytest.approx(expected)
+
+    with pytest.raises(ValueError):
+        forward.addConformer([30.0], weight=1)
+
+    with pytest.raises(ValueError):
+        forward.addConformer([30.0, 31.0], energy=-100.0)
+
+
+def testShiftsFromReference():
+    """Test that Shifts are the Reference minus the Shielding Averaged over Equivalent Atoms"""
+    chemicalShifts = OrcaOutput(CPDMSA_NMR).getChemicalShifts()
+    reference = getReferenceShieldings(chemicalShifts)
+    assert reference["H"] == pytest.approx(
+        chemicalShifts[chemicalShifts["nucleus"] == "H"]["isotropic"].mean()
+    )
+
+    ensemble = EnsembleShielding()
+    ensemble.addConformer([31.0, 33.0, 150.0, 300.0], weight=1)
+    shifts = ensemble.getShifts(["H", "H", "C", "Si"], {"H": 32.0, "C": 184.0}, [0, 0, 1, 2])
+
+    assert np.allclose(shifts["Shielding"], [32.0, 32.0, 150.0, 300.0])
+    assert np.allclose(shifts["Shift"][:3], [0.0, 0.0, 34.0])
+    assert np.isnan(shifts["Shift"][3])
+
+
+def testBroadenedPeaksIntegrateToAtomCount():
+    """Test that the Area of each Peak is the Number of Atoms with that Shift"""
+    ensemble = EnsembleShielding()
+    ensemble.addConformer([30.0, 30.0, 30.0, 27.0, 150.0], weight=1)
+    shifts = ensemble.getShifts(["H", "H", "H", "H", "C"], {"H": 32.0, "C": 184.0})
+
+    spectrum = broadenShifts(shifts, "1H", fwhm=0.05)
+    assert spectrum["Shift"].is_monotonic_decreasing
+
+    spacing = NMRNUCLEI["1H"]["spacing"]
+    methyl = spectrum[(spectrum["Shift"] > 1.5) & (spectrum["Shift"] < 2.5)]
+    single = spectrum[(spectrum["Shift"] > 4.5) & (spectrum["Shift"] < 5.5)]
+    assert methyl["Intensity"].sum() * spacing == pytest.approx(3, rel=0.05)
+    assert single["Intensity"].sum() * spacing == pytest.approx(1, rel=0.05)
+
+    with pytest.raises(ValueError):
+        broadenShifts(shifts, "19F")
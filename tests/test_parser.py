@@ -92,3 +92,15 @@ def testDipoleMoments():
     assert len(vector) == 3
     assert all(isinstance(x, float) for x in vector)
     assert isinstance(magnitude, float)
+
+
+def testNormalModes():
+    """Test Normal Mode extraction, one normalized column per vibrational mode"""
+    output = OrcaOutput(ASPIRIN_FTIR)
+    modes = output.getNormalModes()
+
+    assert modes.shape == (63, 63)
+    assert modes[0, 6] == pytest.approx(-0.013526)
+    # Translations and rotations are printed as zero vectors
+    assert not modes[:, :6].any()
+    assert (abs(modes[:, 6:]).sum(axis=0) > 0).all()
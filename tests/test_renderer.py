@@ -0,0 +1,52 @@
+import os
+import pandas as pd
+import matplotlib.pyplot as plt
+from qchem.Pipelines.Spectra import Spectra
+from qchem.Spectroscopy.SpectrumRenderer import SpectrumRenderer
+
+
+def makeSpectra(count: int) -> dict[str, pd.DataFrame]:
+    return {
+        f"Molecule_{i}": pd.DataFrame(
+            {"Wavenumber": [3000.0 - 100 * i, 1700.0, 900.0], "IRIntensity": [1.0, 5.0 + i, 2.0]}
+        )
+        for i in range(count)
+    }
+
+
+def testRenderManyReusesFigure(tmp_path):
+    """Test that Batch Rendering writes every Image without opening pyplot Figures"""
+    openFigures = len(plt.get_fignums())
+
+    with SpectrumRenderer(spacing=2) as renderer:
+        paths = renderer.renderMany(makeSpectra(4), str(tmp_path))
+
+    assert list(paths) == [f"Molecule_{i}" for i in range(4)]
+    assert all(os.path.getsize(path) > 0 and path.endswith(".png") for path in paths.values())
+    assert len(plt.get_fignums()) == openFigures
+    assert renderer.figure is None
+
+
+def testRenderManyInProcessPool(tmp_path):
+    """Test that Rendering across Processes gives an Image for every Spectra, in Order"""
+    spectra = makeSpectra(5)
+    spectra["FromFile"] = os.path.join("tests", "test_files", "Spectra", "Ethane_Spectra.csv")
+
+    with SpectrumRenderer(spacing=2, format="svg") as renderer:
+        paths = renderer.renderMany(spectra, str(tmp_path), processes=2)
+
+    assert list(paths) == list(spectra)
+    for path in paths.values():
+        with open(path) as file:
+            assert "<svg" in file.read()
+
+
+def testPlotSpectraClosesFigure(tmp_path, monkeypatch):
+    """Test that plotSpectra doesn't leave its Figure open"""
+    monkeypatch.chdir(tmp_path)
+    openFigures = len(plt.get_fignums())
+
+    Spectra.plotSpectra(makeSpectra(1)["Molecule_0"], "Leak", showPlot=False)
+
+    assert os.path.exists(tmp_path / "Leak.png")
+    assert len(plt.get_fignums()) == openFigures
@@ -0,0 +1,91 @@
+import os
+import shutil
+import sqlite3
+import pickle
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.OrcaCalculation import createCalcResult
+from qchem.Calculation.ResultsDatabase import ResultsDatabase, getInputFormula, getInputHash
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+ASPIRIN_FTIR = os.path.join(TEST_FILES_DIR, "output_files", "aspirin_ftir.out")
+
+
+def createInput(cores: int = 1, basis: str = "DEF2-SVP") -> OrcaInputFile:
+    """Creates a Frequency Input File for Ethane"""
+    ethane = Molecule("Ethane", os.path.join(TEST_FILES_DIR, "ethane.xyz"))
+    return OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation="FREQ",
+        basis=basis,
+        functional="B3LYP",
+        cores=cores,
+        xyz=ethane.XYZBody(),
+    )
+
+
+def createResult(tmp_path, name: str, returnCode: int = 0):
+    """Creates a Completed Calculation whose Output is a Copy of the Aspirin Frequency Output"""
+    orcaCachePath = tmp_path / name
+    orcaCachePath.mkdir()
+    shutil.copy(ASPIRIN_FTIR, orcaCachePath / f"{name}.out")
+    return createCalcResult(name, str(orcaCachePath), 0, 0, 12.5, returnCode)
+
+
+def countRows(path: str) -> int:
+    """Counts the Rows Inserted, through a separate Connection"""
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM calculations").fetchone()[0]
+
+
+def testFormulaAndHash():
+    """Test the Formula is in Hill Order and the Hash Ignores the Number of Cores"""
+    assert getInputFormula(createInput()) == ("C2H6", 8)
+    assert getInputHash(createInput(1)) == getInputHash(createInput(4))
+    assert getInputHash(createInput(1)) != getInputHash(createInput(1, "DEF2-TZVP"))
+
+
+def testBatchedRecordsAndLookups(tmp_path):
+    """Test Records are Inserted in Batches and found by Molecule, Level of Theory and Input"""
+    path = str(tmp_path / "Results.db")
+    database = ResultsDatabase(path, batchSize=2, flushInterval=3600)
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    database.record(createResult(tmp_path, "Ethane_FREQ"), createInput(4))
+    assert countRows(path) == 0
+
+    database.record(createResult(tmp_path, "Ethane_FAILED", 1), createInput(1, "DEF2-TZVP"))
+    assert countRows(path) == 2
+
+    records = database.query(formula="C2H6", basis="DEF2-SVP", functional="B3LYP")
+    assert list(records["name"]) == ["Ethane_FREQ"]
+    assert records["cores"][0] == 4
+    assert records["wallTime"][0] == 12.5
+    assert records["status"][0] == "Completed"
+    assert records["energy"][0] < 0
+
+    assert list(database.query(status="Failed")["name"]) == ["Ethane_FAILED"]
+
+    # Same Input on different Cores is a Cache Hit, a Failed or Deleted Calculation isn't
+    assert database.findCached(createInput(8))["name"] == "Ethane_FREQ"
+    assert database.findCached(createInput(1, "DEF2-TZVP")) is None
+    shutil.rmtree(tmp_path / "Ethane_FREQ")
+    assert database.findCached(createInput(8)) is None
+
+    database.close()
+
+
+def testBufferedRecordsSurviveClose(tmp_path):
+    """Test Closing Inserts Buffered Records, and a Copy sent to another Process Reconnects"""
+    path = str(tmp_path / "Results.db")
+
+    with ResultsDatabase(path, batchSize=100, flushInterval=3600) as database:
+        database.record(createResult(tmp_path, "Ethane_FREQ"), createInput())
+        copy = pickle.loads(pickle.dumps(database))
+
+    assert countRows(path) == 1
+    assert len(copy.query()) == 1
+    copy.close()
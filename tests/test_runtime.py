@@ -0,0 +1,71 @@
+import os
+import time
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import OrcaInputTemplate
+from qchem.Calculation.OrcaInputFile import OrcaInputFile
+from qchem.Calculation.ClusterCalculation import ClusterCalculation
+from qchem.Calculation.RuntimeEstimator import RuntimeEstimator
+from qchem.Calculation.ResultsDatabase import getInputElectrons
+
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+
+
+def createInput(molecule: str, cores: int = 1, calculation: str = "FREQ") -> OrcaInputFile:
+    """Creates an Input File for a Molecule of the Test Files"""
+    return OrcaInputFile(
+        OrcaInputTemplate.BASICXYZPARALLEL,
+        calculation=calculation,
+        basis="DEF2-SVP",
+        functional="B3LYP",
+        cores=cores,
+        xyz=Molecule(molecule, os.path.join(TEST_FILES_DIR, f"{molecule.lower()}.xyz")).XYZBody(),
+    )
+
+
+def testFitLearnsScaling():
+    """Test the Fit Recovers the Scaling of Runtimes following a Power Law, and Falls back on the Prior without Data"""
+    estimator = RuntimeEstimator()
+    prior = estimator.predictFeatures(100, 10, 1)
+    assert estimator.predictFeatures(200, 20, 1) > 7 * prior
+    assert estimator.predictFeatures(100, 10, 4) < prior
+
+    # Runtimes Quadratic in the Electrons, twice as long for Frequencies and Ideal Parallel Scaling
+    for electrons in (20, 40, 80, 160):
+        for cores in (1, 2, 4):
+            for calculation, factor in (("OPT", 1), ("FREQ", 2)):
+                wallTime = factor * 0.01 * electrons**2 / cores
+                estimator.addObservation(electrons, electrons // 4, cores, "DEF2-SVP", "B3LYP", calculation, wallTime)
+
+    predicted = estimator.predictFeatures(120, 30, 2, "DEF2-SVP", "B3LYP", "FREQ")
+    assert abs(predicted / (2 * 0.01 * 120**2 / 2) - 1) < 0.1
+    assert estimator.predictFeatures(120, 30, 2, "DEF2-SVP", "B3LYP", "OPT") < predicted
+
+
+def testLongestCalculationsStartFirst():
+    """Test the Cluster Queues the Largest Molecules first and Numbers Calculations in Submission Order"""
+    assert getInputElectrons(createInput("Ethane")) == 18
+
+    calculations = [createInput("Ethane"), createInput("Caffeine"), createInput("Ethane", calculation="OPT")]
+    cluster = ClusterCalculation(calculations, maxCores=2, STDOut=False, recordResults=False)
+    cluster.orderCalculations()
+
+    assert [calculation.index for calculation in cluster.calculations][0] == 1
+    assert sorted(calculation.index for calculation in cluster.calculations) == [0, 1, 2]
+
+
+def testETA():
+    """Test the ETA Simulates the Queue on the Free Cores, Counting the Time Running Calculations have Left"""
+    cluster = ClusterCalculation([], maxCores=2, STDOut=False, recordResults=False)
+
+    running = createInput("Ethane")
+    running.index, running.predictedRuntime = 0, 100
+    cluster.submittedCalculations[0] = running
+    cluster.startTimes[0] = time.time() - 40
+
+    for index, predictedRuntime in ((1, 50), (2, 30)):
+        calculation = createInput("Ethane")
+        calculation.index, calculation.predictedRuntime = index, predictedRuntime
+        cluster.calculations.append(calculation)
+
+    # One Core Runs 50 then 30 while the Running Calculation has about 60 Left
+    assert abs(cluster.getETA() - 80) < 1
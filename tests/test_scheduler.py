@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import stat
+import socket
+import asyncio
+import threading
+import pytest
+from contextlib import contextmanager
+from qchem.Calculation.CoreBudget import CoreBudget
+from qchem.Calculation.Scheduler import SchedulerDaemon, SchedulerClient, SchedulerBudget, SchedulerJob
+
+
+@contextmanager
+def runDaemon(socketPath: str, **settings):
+    """Runs a 4 Core Scheduler in a Thread until the Block Exits"""
+    scheduler = SchedulerDaemon(4, socketPath, **settings)
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    client = SchedulerClient(scheduler.socketPath)
+    while not client.isRunning():
+        time.sleep(0.01)
+
+    try:
+        yield scheduler
+    finally:
+        scheduler.stop()
+        thread.join(5)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Runs a 4 Core Scheduler in a Thread on a Temporary Socket"""
+    with runDaemon(str(tmp_path / "scheduler.sock")) as scheduler:
+        yield scheduler
+
+
+def testLeasesNeverOversubscribe(daemon):
+    """Test Clients in many Threads never Hold more Cores than the Scheduler Owns, and every Lease Ends"""
+    client = SchedulerClient(daemon.socketPath)
+    lock = threading.Lock()
+    held = [0, 0]
+
+    def runJob(cores: int):
+        with client.lease(cores, name=f"Job{cores}") as grant:
+            with lock:
+                held[0] += grant["cores"]
+                held[1] = max(held[1], held[0])
+            time.sleep(0.05)
+            with lock:
+                held[0] -= grant["cores"]
+
+    threads = [threading.Thread(target=runJob, args=(cores,)) for cores in (2, 3, 1, 2, 4, 1, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert held[1] <= 4
+    status = client.getStatus()
+    assert status["freeCores"] == 4 and status["running"] == [] and status["pending"] == []
+
+
+def testClosedConnectionReleasesCores(daemon):
+    """Test a Client that Disconnects without Ending its Lease (Crashed) gives its Cores back"""
+    client = SchedulerClient(daemon.socketPath)
+    connection = client.connect()
+    connection.sendall(client.createRequest(3, 0, "Crashed"))
+    assert b"granted" in connection.makefile("rb").readline()
+    assert client.getStatus()["freeCores"] == 1
+
+    connection.shutdown(socket.SHUT_RDWR)
+    connection.close()
+    while client.getStatus()["freeCores"] != 4:
+        time.sleep(0.01)
+
+
+def testDispatchOrder():
+    """Test Waiting Jobs are Ordered by Priority, then the Load of their User for their Share, then Submission"""
+    scheduler = SchedulerDaemon(4, shares={"bob": 4})
+    scheduler.usage = {"alice": 100, "bob": 200, "carol": 10}
+    scheduler.pending = [
+        SchedulerJob(1, "carol", 1, submitted=1),
+        SchedulerJob(2, "alice", 1, submitted=2),
+        SchedulerJob(3, "bob", 1, submitted=3),
+        SchedulerJob(4, "alice", 1, priority=1, submitted=4),
+        SchedulerJob(5, "carol", 1, submitted=0),
+    ]
+
+    assert [job.ID for job in scheduler.orderPending()] == [4, 5, 1, 3, 2]
+
+    # The Head of the Queue Waits for Cores rather than being Overtaken
+    scheduler.pending.append(SchedulerJob(6, "dave", 4, priority=2))
+    scheduler.freeCores = 3
+    scheduler.dispatch()
+    assert scheduler.freeCores == 3 and len(scheduler.pending) == 6
+
+
+def testBudgetSharesDaemonCores(daemon):
+    """Test the Scheduler Budget Limits Coroutines like a Core Budget of the Machine"""
+    client = SchedulerClient(daemon.socketPath)
+    held = [0, 0]
+
+    async def runJob(budget: CoreBudget, cores: int):
+        async with budget.reserve(cores):
+            held[0] += budget.clampCores(cores)
+            held[1] = max(held[1], held[0])
+            await asyncio.sleep(0.02)
+            held[0] -= budget.clampCores(cores)
+
+    async def main():
+        budget = SchedulerBudget(client)
+        await asyncio.gather(*(runJob(budget, cores) for cores in (2, 2, 3, 1, 16)))
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+    assert held[1] <= 4
+    assert client.getStatus()["freeCores"] == 4
+
+
+def testSecondDaemonRefusesSocket(daemon):
+    """Test a Daemon doesn't Start on the Socket of a Running one"""
+    with pytest.raises(FileExistsError):
+        SchedulerDaemon(2, daemon.socketPath).removeStaleSocket()
+
+
+def testSocketSharedOnlyOnRequest(tmp_path, daemon):
+    """Test only the User running the Scheduler can Connect unless it is Shared"""
+    assert stat.S_IMODE(os.stat(daemon.socketPath).st_mode) == 0o600
+
+    with runDaemon(str(tmp_path / "shared.sock"), shared=True) as shared:
+        assert stat.S_IMODE(os.stat(shared.socketPath).st_mode) == 0o666
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_PEERCRED"), reason="Peer Credentials are Linux only")
+def testDaemonLimitsPriorityAndStampsSubmission(tmp_path):
+    """Test the Scheduler Lowers a Priority to what the Kernel Identified User may Request, and Times Jobs itself"""
+    import pwd
+
+    user = pwd.getpwuid(os.getuid()).pw_name
+    with runDaemon(str(tmp_path / "scheduler.sock"), maxPriorities={user: 2}) as scheduler:
+        client = SchedulerClient(scheduler.socketPath, user="somebody-else")
+        start = time.time()
+
+        # A Client can neither Claim a High Priority, an Early Submission nor another Users Name
+        with client.connect() as connection, connection.makefile("rb") as replies:
+            request = {"op": "acquire", "user": "somebody-else", "cores": 1, "priority": 9, "name": "Greedy", "submitted": 0}
+            connection.sendall((json.dumps(request) + "\n").encode())
+            assert json.loads(replies.readline())["priority"] == 2
+
+            job = client.getStatus()["running"][0]
+            assert job["user"] == user and job["priority"] == 2 and job["submitted"] >= start
+
+        with client.lease(1, priority=-1) as grant:
+            assert grant["priority"] == -1
+
+    # Without a Limit, or without knowing the User, nobody Jumps the Queue
+    assert SchedulerDaemon(4).limitPriority(user, 5) == 0
+    assert SchedulerDaemon(4, maxPriorities={user: 5}).limitPriority(None, 5) == 0
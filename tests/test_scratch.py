@@ -0,0 +1,78 @@
+import os
+import gzip
+import shutil
+import pytest
+from qchem.Parser import OrcaOutput
+from qchem.Compression import findCompressedFile
+from qchem.Calculation.OrcaScratch import OrcaScratch
+from qchem.Calculation.OrcaCalculation import OrcaCalcResult
+
+ASPIRIN_FTIR = os.path.join("tests", "test_files", "output_files", "aspirin_ftir.out")
+
+
+def writeFile(path, size: int):
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+
+
+def testParserReadsCompressedOutput(tmp_path):
+    """Test that a gzipped Output File is Parsed the same as the Original"""
+    compressedPath = tmp_path / "aspirin_ftir.out.gz"
+    with open(ASPIRIN_FTIR, "rb") as source, gzip.open(compressedPath, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+
+    original = OrcaOutput(ASPIRIN_FTIR)
+    compressed = OrcaOutput(str(compressedPath))
+
+    assert compressed.name == "aspirin_ftir"
+    assert compressed.energy == original.energy
+    assert compressed.vibrationalFrequencies.equals(original.vibrationalFrequencies)
+
+
+def testScratchKeepsOnlyWhitelistedFiles(tmp_path):
+    """Test that only Kept Files come back from Scratch, and Scratch is Cleaned up"""
+    cachePath = tmp_path / "OrcaCache" / "ethane"
+    os.makedirs(cachePath)
+    (cachePath / "ethane.inp").write_text("! B3LYP def2-SVP")
+
+    scratch = OrcaScratch(str(tmp_path / "scratch"), compression="gzip")
+    workPath = scratch.stage("ethane", str(cachePath))
+    assert os.path.exists(os.path.join(workPath, "ethane.inp"))
+
+    # Files Orca would Write
+    shutil.copy(ASPIRIN_FTIR, os.path.join(workPath, "ethane.out"))
+    writeFile(os.path.join(workPath, "ethane.tmp"), 5000)
+    writeFile(os.path.join(workPath, "ethane.densities"), 5000)
+    writeFile(os.path.join(workPath, "ethane.gbw"), 100)
+
+    bytesWritten, bytesRetained = scratch.collect(workPath, str(cachePath))
+
+    assert not os.path.exists(workPath)
+    assert sorted(os.listdir(cachePath)) == ["ethane.gbw", "ethane.inp", "ethane.out.gz"]
+    assert bytesRetained == sum(os.path.getsize(cachePath / file) for file in os.listdir(cachePath))
+    assert bytesWritten > bytesRetained
+
+    result = OrcaCalcResult("ethane", str(cachePath))
+    assert result.outputFilePath == str(cachePath / "ethane.out.gz")
+    assert OrcaOutput(result.outputFilePath).energy == OrcaOutput(ASPIRIN_FTIR).energy
+
+
+def testCompactInPlace(tmp_path):
+    """Test that without a Scratch Path the Cache Folder is Compacted where it is"""
+    cachePath = tmp_path / "ethane"
+    os.makedirs(cachePath)
+    (cachePath / "ethane.out").write_text("output")
+    writeFile(cachePath / "ethane.tmp", 100)
+
+    scratch = OrcaScratch(keep=["*.out"])
+    workPath = scratch.stage("ethane", str(cachePath))
+    scratch.collect(workPath, str(cachePath))
+
+    assert os.listdir(cachePath) == ["ethane.out"]
+    assert findCompressedFile(str(cachePath / "ethane.out")) == str(cachePath / "ethane.out")
+
+
+def testInvalidCompressionRejected():
+    """Test that unknown Compressions are Rejected before anything Runs"""
+    with pytest.raises(ValueError):
+        OrcaScratch(compression="rar")
@@ -0,0 +1,192 @@
+import os
+import asyncio
+import importlib
+import pytest
+from qchem.Molecule import Molecule
+from qchem.Data.Enums import CalculationStatus, FailureType
+from qchem.Calculation.BaseOrcaCalculation import BaseOrcaCalculation
+from qchem.Calculation.Frequency import Frequency
+from qchem.Calculation.GeoOpt import GeoOpt
+from qchem.Calculation.Executors import LocalExecutor
+from qchem.Calculation.Failures import RetryPolicy
+from qchem.Pipelines.Workflow import Workflow
+from qchem.Pipelines.Screening import Screening
+
+# The Package gives the Function of the same Name, the Module is Patched
+OrcaCalculationModule = importlib.import_module("qchem.Calculation.OrcaCalculation")
+
+ETHANE = os.path.abspath(os.path.join("tests", "test_files", "ethane.xyz"))
+
+# Stands in for an Orca whose SCF never Converges
+FAILINGORCA = """#!/bin/sh
+echo "SCF NOT CONVERGED AFTER 125 CYCLES"
+echo "ABORTING THE RUN"
+exit 1
+"""
+
+
+class FakeCalculation(BaseOrcaCalculation):
+    """Calculation that Sleeps instead of Running Orca, records when it Ran"""
+
+    calculationType: str = "FAKE"
+
+    def __init__(self, name: str, cores: int = 1, duration: float = 0.02, log: list = None, fail: bool = False):
+        super().__init__(name, "fake.xyz", "", 1, cores, True, False)
+        self.duration = duration
+        self.log = log if log is not None else []
+        self.fail = fail
+
+    def runCalculation(self):
+        pass
+
+    async def runCalculationAsync(self, coreBudget=None, progress=None):
+        async with coreBudget.reserve(self.cores):
+            self.log.append(("start", self.name, coreBudget.usedCores))
+            await asyncio.sleep(self.duration)
+            if self.fail:
+                raise RuntimeError(f"{self.name} failed")
+            self.log.append(("end", self.name, coreBudget.usedCores))
+
+
+def testDependenciesRunInOrder():
+    """Test that a Step only Starts once its Dependencies have Finished"""
+    log = []
+    workflow = Workflow(cores=4)
+    workflow.addCalculation("opt", FakeCalculation("opt", log=log))
+    workflow.addCalculation(
+        "freq",
+        lambda results: [FakeCalculation(f"freq_{i}", log=log) for i in range(3)],
+        ["opt"],
+    )
+    workflow.addCalculation("sum", lambda results: len(results["freq"]), ["freq"])
+    workflow.run()
+
+    order = [(event, name) for event, name, _ in log]
+    assert order.index(("end", "opt")) < min(order.index(("start", f"freq_{i}")) for i in range(3))
+    assert workflow.getResult("sum") == 3
+
+
+def testIndependentBranchesShareCores():
+    """Test that Independent Steps Run in Parallel without exceeding the Core Budget"""
+    log = []
+    workflow = Workflow(cores=4)
+    for i in range(6):
+        workflow.addCalculation(f"mol_{i}", FakeCalculation(f"mol_{i}", cores=2, log=log))
+    workflow.run()
+
+    usage = [used for event, _, used in log if event == "start"]
+    assert max(usage) == 4
+    assert all(node.status == CalculationStatus.COMPLETED for node in workflow.nodes.values())
+
+
+def testFailedStepCancelsDependents():
+    """Test that a Failure only skips the Steps that depend on it"""
+    workflow = Workflow(cores=2)
+    workflow.addCalculation("bad", FakeCalculation("bad", fail=True))
+    workflow.addCalculation("after", FakeCalculation("after"), ["bad"])
+    workflow.addCalculation("other", FakeCalculation("other"))
+
+    with pytest.raises(RuntimeError):
+        workflow.run()
+
+    assert workflow.nodes["bad"].status == CalculationStatus.FAILED
+    assert workflow.nodes["after"].status == CalculationStatus.CANCELLED
+    assert workflow.nodes["other"].status == CalculationStatus.COMPLETED
+
+
+def testUnknownDependencyRejected():
+    """Test that Dependencies have to exist, which keeps the Graph Acyclic"""
+    workflow = Workflow()
+    with pytest.raises(ValueError):
+        workflow.addCalculation("freq", FakeCalculation("freq"), ["opt"])
+
+
+def testScreeningLoadsDirectory(tmp_path):
+    """Test that a Directory of XYZ Files is loaded as Molecules named after their Files"""
+    import shutil
+
+    for name in ["ethane", "propane"]:
+        shutil.copy(f"tests/test_files/{name}.xyz", tmp_path / f"{name}.xyz")
+    (tmp_path / "notes.txt").write_text("not a molecule")
+
+    molecules = Screening.loadMolecules(str(tmp_path))
+    assert [molecule.name for molecule in molecules] == ["ethane", "propane"]
+
+    with pytest.raises(ValueError):
+        Screening.loadMolecules([str(tmp_path / "ethane.xyz"), str(tmp_path / "ethane.xyz")])
+
+
+def testStepCallbackReceivesEachCalculation():
+    """Test that a Steps Callback sees each Calculation as soon as it Finishes"""
+    finished = []
+    workflow = Workflow(cores=1)
+    workflow.addCalculation(
+        "freq",
+        lambda results: [FakeCalculation(f"freq_{i}", duration=0.01 * (3 - i)) for i in range(3)],
+        onComplete=lambda calculation: finished.append(calculation.name),
+    )
+    workflow.run()
+
+    # One Core, so Calculations Finish in the Order they Start
+    assert finished == ["freq_0", "freq_1", "freq_2"]
+
+
+def testFailedOrcaRunFailsStep(tmp_path, monkeypatch):
+    """Test a Calculation whose Orca Run Failed Fails its Step and Cancels its Dependents, an Optimization once its Retries are used up"""
+    orcaPath = tmp_path / "orca"
+    orcaPath.write_text(FAILINGORCA)
+    orcaPath.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+
+    molecule = Molecule("ethane", ETHANE)
+    frequency = Frequency(molecule, basis="def2-SVP", functional="B3LYP", name="ethane_freq", stdout=False)
+    optimization = GeoOpt(
+        molecule, basis="def2-SVP", functional="B3LYP", name="ethane_opt", stdout=False,
+        retryPolicy=RetryPolicy({FailureType.SCFNOTCONVERGED: 1}),
+    )
+    frequency.executor = optimization.executor = LocalExecutor(str(orcaPath))
+
+    workflow = Workflow(cores=2)
+    workflow.addCalculation("freq", frequency)
+    workflow.addCalculation("opt", optimization)
+    workflow.addCalculation("after", lambda results: FakeCalculation("after"), ["freq", "opt"])
+    workflow.addCalculation("other", FakeCalculation("other"))
+
+    with pytest.raises(RuntimeError, match="freq"):
+        workflow.run()
+
+    statuses = {name: node.status for name, node in workflow.nodes.items()}
+    assert statuses == {
+        "freq": CalculationStatus.FAILED,
+        "opt": CalculationStatus.FAILED,
+        "after": CalculationStatus.CANCELLED,
+        "other": CalculationStatus.COMPLETED,
+    }
+    assert frequency.failure == optimization.failure == FailureType.SCFNOTCONVERGED
+
+    # The Optimization was Retried once before Failing
+    assert os.path.exists(tmp_path / "OrcaCache" / "ethane_opt_2" / "ethane_opt_2.out")
+
+
+def testScreeningStatusFromCalculations(tmp_path, monkeypatch):
+    """Test a Molecule whose Orca Runs Failed is Recorded as Failed with the Failure of its Calculations"""
+    orcaPath = tmp_path / "orca"
+    orcaPath.write_text(FAILINGORCA)
+    orcaPath.chmod(0o755)
+    monkeypatch.setattr(OrcaCalculationModule, "ORCAPATH", str(orcaPath))
+    monkeypatch.chdir(tmp_path)
+
+    screening = Screening([ETHANE], cores=2, isLocal=True, name="Failing", basis="def2-SVP", functional="B3LYP")
+    screening.runCalculation()
+
+    results = screening.getResults()
+    assert results[["Name", "Status", "Failure"]].values.tolist() == [
+        ["ethane", CalculationStatus.FAILED.value, "GEOOPT: SCFNotConverged"]
+    ]
+    assert results["SpectraPath"].isna().all()
+
+    # The Table on Disk matches, the Optimization was Retried and nothing after it Ran
+    with open(screening.resultsFilePath) as file:
+        assert "GEOOPT: SCFNotConverged" in file.read()
+    assert os.path.exists(tmp_path / "OrcaCache" / "ethane_GEOOPT_3")
+    assert not os.path.exists(tmp_path / "OrcaCache" / "ethane_GOAT")